@@ -171,6 +171,8 @@ from .bdf_interface.write_mesh_file import WriteMeshs
 from .bdf_interface.uncross_reference import UnXrefMesh
 from .bdf_interface.verify_validate import verify_bdf, validate_bdf
 from .bdf_interface.stats import get_bdf_stats
+from .bdf_interface.lazy_cards import LazyCards
+from .bdf_interface.array_store import NodeStore, ElementStore
 
 from .errors import (CrossReferenceError, DuplicateIDsError,
                                   CardParseSyntaxError, UnsupportedCard, DisabledCardError,
@@ -263,6 +265,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         # flag that allows for OpenMDAO-style optimization syntax to be used
         self._is_dynamic_syntax = False
 
+        # the unparsed cards for read_bdf(lazy=True)
+        self._is_lazy = False
+        self._lazy_cards = None  # type: Optional[LazyCards]
+
+        # the number of processes for read_bdf(nworkers=N)
+        self._nworkers = 1
+
         # lines that were rejected b/c they were for a card that isnt supported
         self.reject_lines = []  # type: List[List[str]]
 
@@ -613,14 +622,99 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             msg = 'mode=%r is not supported; modes=[msc, nx, zona]' % self._nastran_format
             raise NotImplementedError(msg)
 
+    def __getattr__(self, name: str) -> Any:
+        """parses the lazy cards (see ``read_bdf(lazy=True)``) that fill ``name``"""
+        lazy_cards = self.__dict__.get('_lazy_cards')
+        if lazy_cards is not None and name in lazy_cards.slot_card_names:
+            self.load_lazy_cards(list(lazy_cards.slot_card_names[name]))
+            return getattr(self, name)
+        raise AttributeError('%r object has no attribute %r' % (
+            self.__class__.__name__, name))
+
+    def __dir__(self) -> List[str]:
+        """includes the dictionaries that have lazy cards"""
+        names = list(super().__dir__())
+        lazy_cards = self.__dict__.get('_lazy_cards')
+        if lazy_cards is not None:
+            names += [name for name in lazy_cards.slot_card_names if name not in names]
+        return names
+
+    def load_lazy_cards(self, card_types: Optional[Union[str, List[str]]]=None) -> None:
+        """
+        Parses the cards that were skipped by ``read_bdf(lazy=True)``
+
+        Parameters
+        ----------
+        card_types : str / List[str]; default=None -> all
+            the card types to parse (e.g., ['GRID', 'CQUAD4'])
+
+        The dictionary of a card type (e.g., model.elements) is parsed the
+        first time it's used, so this is only required to parse a subset
+        of the cards in a dictionary (e.g., the CQUAD4s, but not the CTRIA3s).
+        The subset is then first in the dictionary.
+
+        """
+        lazy_cards = getattr(self, '_lazy_cards', None)
+        if lazy_cards is None:
+            return
+        if card_types is None:
+            card_types = list(lazy_cards.card_icards)
+        elif isinstance(card_types, str):
+            card_types = [card_types]
+        card_types = [card_type for card_type in card_types
+                      if card_type in lazy_cards.card_icards]
+        if not card_types:
+            return
+
+        # the add methods fill the partially loaded dictionaries
+        slots = {lazy_cards.card_slot[card_type] for card_type in card_types}
+        for slot in slots:
+            self.__dict__[slot] = lazy_cards.slot_objects.pop(slot)
+
+        icards = lazy_cards.pop_icards(card_types)
+        try:
+            self._parse_cards_list(lazy_cards.cards_list, icards=icards)
+        finally:
+            for slot in slots:
+                if slot in lazy_cards.slot_card_names:
+                    lazy_cards.slot_objects[slot] = self.__dict__.pop(slot)
+            if not lazy_cards.card_icards:
+                self._lazy_cards = None
+        self.pop_parse_errors()
+
+    def build_array_store(self) -> None:
+        """
+        Stores the GRIDs and the CQUAD4/CTRIA3/CTETRA/CHEXA elements as
+        arrays, so the array methods (e.g., ``get_displacement_index_xyz_cp_cd``,
+        ``get_elements_properties_nodes_by_element_type``) don't loop over
+        the cards.  ``model.nodes`` and ``model.elements`` are still
+        dictionaries, which return proxy cards (see ``array_store.py``).
+
+        .. code-block:: python
+
+           >>> model.build_array_store()
+           >>> model.nodes.xyz
+           >>> model.elements.tables['CQUAD4']['nodes']
+
+           # gets the card objects back
+           >>> model.nodes = model.nodes.to_dict()
+
+        """
+        if not isinstance(self.nodes, NodeStore):
+            self.nodes = NodeStore(self.nodes)
+        if not isinstance(self.elements, ElementStore):
+            self.elements = ElementStore(self.elements)
+
     def __getstate__(self):
         """clears out a few variables in order to pickle the object"""
+        self.load_lazy_cards()
         # Copy the object's state from self.__dict__ which contains
         # all our instance attributes. Always use the dict.copy()
         # method to avoid modifying the original state.
         state = self.__dict__.copy()
         # Remove the unpicklable entries.
         del state['_card_parser'], state['log']
+        state['_adjacency'] = None
         if hasattr(self, '_card_parser_b'):
             del state['_card_parser_b']
         if hasattr(self, '_card_parser_prepare'):
@@ -763,6 +857,43 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         for model in self.superelement_models.values():
             model.log = self.log
 
+    def save_snapshot(self, snapshot_filename: str='model.snap', unxref: bool=True) -> None:
+        """
+        Saves a binary snapshot, which stores the GRIDs and the
+        CQUAD4/CTRIA3/CTETRA/CHEXA elements as arrays
+        (see ``bdf_interface/snapshot.py``)
+
+        Parameters
+        ----------
+        snapshot_filename : str; default='model.snap'
+            the path to the snapshot
+        unxref : bool; default=True
+            uncross-reference the model first
+
+        """
+        from pyNastran.bdf.bdf_interface.snapshot import save_snapshot
+        if unxref:
+            self.uncross_reference()
+        save_snapshot(self, snapshot_filename)
+
+    def load_snapshot(self, snapshot_filename: str='model.snap', mmap: bool=True) -> None:
+        """
+        Loads a binary snapshot from ``save_snapshot``
+
+        Parameters
+        ----------
+        snapshot_filename : str; default='model.snap'
+            the path to the snapshot
+        mmap : bool; default=True
+            memory-map the GRID/element arrays (copy-on-write)
+
+        .. note:: the nodes/elements are loaded into an array store
+                  (see ``build_array_store``)
+
+        """
+        from pyNastran.bdf.bdf_interface.snapshot import load_snapshot
+        load_snapshot(snapshot_filename, self, mmap=mmap)
+
     def replace_cards(self, replace_model) -> None:
         """
         Replaces the common cards from the current (self) model from the
@@ -778,25 +909,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         cards one-to-one...not sure what to do
 
         """
-        for nid, node in replace_model.nodes.items():
-            self.nodes[nid] = node
-        for eid, elem in self.elements.items():
-            self.elements[eid] = elem
-        for eid, elem in replace_model.rigid_elements.items():
-            self.rigid_elements[eid] = elem
-        for pid, prop in replace_model.properties.items():
-            self.properties[pid] = prop
-        for mid, mat in replace_model.materials.items():
-            self.materials[mid] = mat
-
-        for dvid, desvar in replace_model.desvars.items():
-            self.desvars[dvid] = desvar
-        for dvid, dvprel in replace_model.dvprels.items():
-            self.dvprels[dvid] = dvprel
-        for dvid, dvmrel in replace_model.dvmrels.items():
-            self.dvmrels[dvid] = dvmrel
-        for dvid, dvgrid in replace_model.dvgrids.items():
-            self.dvgrids[dvid] = dvgrid
+        card_groups = [
+            'nodes', 'elements', 'rigid_elements', 'properties', 'materials',
+            'desvars', 'dvprels', 'dvmrels', 'dvgrids',
+        ]
+        for card_group in card_groups:
+            cards = getattr(self, card_group)
+            for key, card in getattr(replace_model, card_group).items():
+                cards[key] = card
+                self._mark_xref_dirty(card_group, key)
+        self._adjacency = None
 
     def disable_cards(self, cards: Sequence[str]) -> None:
         """
@@ -952,7 +1074,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 lazy: bool=False,
+                 nworkers: int=1,
+                 array_store: bool=False) -> None:
         """
         Read method for the bdf files
 
@@ -972,6 +1097,18 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        lazy : bool; default=False
+            indexes the nodes, elements, properties, materials, masses,
+            rigid_elements, coords, loads and spcs by card type, so they're
+            parsed when the dictionary (e.g., model.elements) is first used
+            or the card type is requested (see ``load_lazy_cards``);
+            use validate=False and xref=False to not parse them now
+        nworkers : int; default=1
+            the number of processes that parse the nodes, elements,
+            properties, ...; the model is the same as a serial read
+        array_store : bool; default=False
+            stores the GRIDs and the CQUAD4/CTRIA3/CTETRA/CHEXA elements
+            as arrays (see ``build_array_store``)
 
         .. code-block:: python
 
@@ -990,7 +1127,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
            etc.
 
         """
+        if lazy and save_file_structure:
+            raise NotImplementedError('lazy=True does not support save_file_structure=True')
+        if array_store and save_file_structure:
+            raise NotImplementedError('array_store=True does not support save_file_structure=True')
         self.save_file_structure = save_file_structure
+        self._is_lazy = lazy
+        self._nworkers = nworkers
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
@@ -1023,11 +1166,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 raise
 
             self.clear_attributes()
+            self._lazy_cards = None
             self.log.error('Attempting to use is_superelements=True.')
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, lazy=lazy, nworkers=nworkers,
+                          array_store=array_store)
             return
 
         if superelement_lines:
@@ -1035,6 +1180,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.pop_parse_errors()
         fill_dmigs(self)
+        if array_store:
+            self.build_array_store()
 
         if validate:
             self.validate()
@@ -1071,7 +1218,18 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
-        self._parse_cards(cards_list, cards_dict, card_count)
+
+        icards = None
+        if self._is_lazy and cards_list:
+            self._lazy_cards = LazyCards(cards_list)
+            icards = self._lazy_cards.index_cards(self)
+            if not self._lazy_cards.card_icards:
+                self._lazy_cards = None
+            else:
+                # the dictionaries are loaded the first time they're used
+                for slot in self._lazy_cards.slot_card_names:
+                    self._lazy_cards.slot_objects[slot] = self.__dict__.pop(slot)
+        self._parse_cards(cards_list, cards_dict, card_count, icards=icards)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -1534,6 +1692,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         # update the card
         obj.update_field(ifield, value)
+        self._mark_xref_dirty(field_str, icard, replaced=False)
         return obj
 
     def set_dynamic_syntax(self, dict_of_vars: Dict[str, Union[int, float, str]]) -> None:
@@ -3122,6 +3281,22 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         [2]
 
         """
+        if isinstance(self.nodes, NodeStore):
+            self.nodes.compress()
+            if (not self.nodes.objects and not self.spoints and not self.epoints
+                    and not self.gridb and not self.ringaxs and len(self.nodes)):
+                # the arrays are already sorted
+                icd_transform, icp_transform = self.nodes.get_transforms()
+                xyz_cp = self.nodes.xyz.astype(fdtype, copy=False)
+                nid_cp_cd = self.nodes.nid_cp_cd.astype(idtype, copy=False)
+                if xyz_cp is self.nodes.xyz:
+                    xyz_cp = xyz_cp.view()
+                    xyz_cp.flags.writeable = False
+                if nid_cp_cd is self.nodes.nid_cp_cd:
+                    nid_cp_cd = nid_cp_cd.view()
+                    nid_cp_cd.flags.writeable = False
+                return icd_transform, icp_transform, xyz_cp, nid_cp_cd
+
         nids_cd_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
         nids_cp_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
 
@@ -3805,8 +3980,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             raise RuntimeError(card)
         return cards
 
-    def _parse_cards(self, cards_list, cards_dict, card_count):
-        # type: (List[List[str]], Dict[str, List[str]], Dict[str, int]) -> None
+    def _parse_cards(self, cards_list, cards_dict, card_count, icards=None):
+        # type: (List[List[str]], Dict[str, List[str]], Dict[str, int], Optional[List[int]]) -> None
         """creates card objects and adds the parsed cards to the deck"""
         # we don't want replication markers in the card_count
         card_names_to_remove = (card_name for card_name in list(card_count.keys())
@@ -3820,7 +3995,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         if cards_list:
             # this is the block that actually runs
-            self._parse_cards_list(cards_list)
+            if self._nworkers > 1 and icards is None and not self.save_file_structure:
+                from .bdf_interface.bdf_parallel import parse_cards_list_parallel
+                parse_cards_list_parallel(self, cards_list, self._nworkers)
+            else:
+                self._parse_cards_list(cards_list, icards=icards)
 
     def _parse_cards_dict(self, cards_dict: Dict[str, List[str]]) -> None:
         """parses the cards that are in dictionary format"""
@@ -3839,11 +4018,24 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
-    def _parse_cards_list(self, cards_list):
-        """parses the cards that are in list format"""
+    def _parse_cards_list(self, cards_list, icards=None):
+        """
+        parses the cards that are in list format
+
+        Parameters
+        ----------
+        cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+            the cards
+        icards : List[int]; default=None -> all
+            the cards to parse (e.g., the non-lazy cards)
+
+        """
+        if icards is None:
+            icards = range(len(cards_list))
         save_file_structure = self.save_file_structure
         if save_file_structure:
-            for icard, card in enumerate(cards_list):
+            for icard in icards:
+                card = cards_list[icard]
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 if card_name is None:
                     msg = 'card_name = %r\n' % card_name
@@ -3874,7 +4066,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                         is_list=False, has_none=False)
 
         else:
-            for icard, card in enumerate(cards_list):
+            for icard in icards:
+                card = cards_list[icard]
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_iline, card_lines[0])
                 if card_name is None:
@@ -4309,12 +4502,14 @@ class BDF(BDF_):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
+        self.load_lazy_cards()
         for key, value in self.__dict__.items():
             setattr(result, key, deepcopy(value, memo))
         return result
 
     def __copy__(self):
         """performs a copy"""
+        self.load_lazy_cards()
         newone = type(self)()
         newone.__dict__.update(self.__dict__)
         return newone
@@ -4359,7 +4554,8 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
              read_cards: Optional[List[str]]=None,
              encoding: Optional[str]=None,
              log=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             lazy: bool=False, nworkers: int=1, array_store: bool=False) -> BDF:
     # Optional[SimpleLogger]
     """
     Creates the BDF object
@@ -4395,6 +4591,14 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    lazy : bool; default=False
+        parses the nodes, elements, properties, ... when they're first
+        used (see ``BDF.read_bdf``)
+    nworkers : int; default=1
+        the number of processes that parse the cards (see ``BDF.read_bdf``)
+    array_store : bool; default=False
+        stores the GRIDs and the CQUAD4/CTRIA3/CTETRA/CHEXA elements as
+        arrays (see ``BDF.build_array_store``)
 
     Returns
     -------
@@ -4436,7 +4640,8 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, lazy=lazy, nworkers=nworkers,
+                   array_store=array_store)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -213,6 +213,7 @@ class AddMethods(BDFAttributes):
         else:
             assert key > 0, 'nid=%s node=%s' % (key, node)
             self.nodes[key] = node
+            self._mark_xref_dirty('nodes', key)
             self._type_to_id_map[node.type].append(key)
 
     def _add_gridb_object(self, node: GRIDB, allow_overwrites: bool=False) -> None:
@@ -269,6 +270,7 @@ class AddMethods(BDFAttributes):
         else:
             assert key > 0, 'nid=%s point=%s' % (key, point)
             self.points[key] = point
+            self._mark_xref_dirty('points', key)
             self._type_to_id_map[point.type].append(key)
 
     def _add_spoint_object(self, spoints: SPOINTs) -> None:
@@ -376,6 +378,7 @@ class AddMethods(BDFAttributes):
                 if not elem == self.plotels[key]:
                     assert elem.eid not in self.plotels, 'eid=%s\nold_element=\n%snew_element=\n%s' % (elem.eid, self.plotels[elem.eid], elem)
         self.plotels[key] = elem
+        self._mark_xref_dirty('plotels', key)
         self._type_to_id_map[elem.type].append(key)
 
     def _add_element_object(self, elem: Union[CELAS1, CELAS2, CELAS3, CELAS4,
@@ -408,6 +411,7 @@ class AddMethods(BDFAttributes):
                     self.pop_parse_errors()
         else:
             self.elements[key] = elem
+            self._mark_xref_dirty('elements', key)
             self._type_to_id_map[elem.type].append(key)
 
     def _add_ao_object(self, elem_flag: CBARAO, allow_overwrites: bool=False) -> None:
@@ -458,6 +462,7 @@ class AddMethods(BDFAttributes):
                 self._duplicate_masses.append(mass)
         else:
             self.masses[key] = mass
+            self._mark_xref_dirty('masses', key)
             self._type_to_id_map[mass.type].append(key)
 
     def _add_damper_object(self, elem, allow_overwrites: bool=False) -> None:
@@ -473,6 +478,7 @@ class AddMethods(BDFAttributes):
         if key in self.rigid_elements and not allow_overwrites:
             assert elem.eid not in self.rigid_elements, 'eid=%s\noldElement=\n%snewElement=\n%s' % (elem.eid, self.rigid_elements[elem.eid], elem)
         self.rigid_elements[key] = elem
+        self._mark_xref_dirty('rigid_elements', key)
         self._type_to_id_map[elem.type].append(key)
 
     def _add_thermal_element_object(self, elem: Union[CHBDYE, CHBDYG, CHBDYP]) -> None:
@@ -522,6 +528,7 @@ class AddMethods(BDFAttributes):
                     self.pop_parse_errors()
         else:
             self.properties[key] = prop
+            self._mark_xref_dirty('properties', key)
             self._type_to_id_map[prop.type].append(key)
 
     def _add_property_mass_object(self, prop: PMASS, allow_overwrites: bool=False) -> None:
@@ -534,6 +541,7 @@ class AddMethods(BDFAttributes):
         else:
             assert key > 0, 'pid=%s prop=%s' % (key, prop)
             self.properties_mass[key] = prop
+            self._mark_xref_dirty('properties_mass', key)
             self._type_to_id_map[prop.type].append(key)
 
     def _add_dtable_object(self, dtable: DTABLE, allow_overwrites: bool=False) -> None:
@@ -711,6 +719,7 @@ class AddMethods(BDFAttributes):
                 self._duplicate_materials.append(material)
         else:
             self.materials[key] = material
+            self._mark_xref_dirty('materials', key)
             self._type_to_id_map[material.type].append(key)
 
     def _add_thermal_material_object(self, material: Union[MAT4, MAT5],
@@ -724,6 +733,7 @@ class AddMethods(BDFAttributes):
                 self._duplicate_thermal_materials.append(material)
         else:
             self.thermal_materials[key] = material
+            self._mark_xref_dirty('thermal_materials', key)
             self._type_to_id_map[material.type].append(key)
 
     def _add_hyperelastic_material_object(self, material: Union[MATHE, MATHP],
@@ -736,6 +746,7 @@ class AddMethods(BDFAttributes):
                 assert key not in self.hyperelastic_materials, 'mid=%s\nold=\n%snew=\n%s' % (key, self.hyperelastic_materials[key], material)
         else:
             self.hyperelastic_materials[key] = material
+            self._mark_xref_dirty('hyperelastic_materials', key)
             self._type_to_id_map[material.type].append(key)
 
     def _add_material_dependence_object(self, material: Union[MATT1, MATT2, MATT3, MATT4, MATT5, MATT8, MATT9,
@@ -769,6 +780,7 @@ class AddMethods(BDFAttributes):
         else:
             assert key > 0, 'mid=%s material=\n%s' % (key, material)
             slot[key] = material
+            self._mark_xref_dirty(Type, key)
             self._type_to_id_map[material.type].append(key)
 
     def _add_creep_material_object(self, material: CREEP, allow_overwrites: bool=False) -> None:
@@ -787,6 +799,7 @@ class AddMethods(BDFAttributes):
         else:
             assert key > 0, 'mid=%s material=\n%s' % (key, material)
             self.creep_materials[key] = material
+            self._mark_xref_dirty('creep_materials', key)
             self._type_to_id_map[material.type].append(key)
 
     #def add_coord(self, coord, allow_overwrites: bool=False) -> None:
@@ -806,11 +819,13 @@ class AddMethods(BDFAttributes):
                 self._duplicate_coords.append(coord)
         else:
             self.coords[key] = coord
+            self._mark_xref_dirty('coords', key)
             self._type_to_id_map[coord.type].append(key)
 
     def _add_load_combination_object(self, load: Union[LOAD, CLOAD]) -> None:
         """adds a load object to a load case"""
         key = load.sid
+        self._mark_xref_dirty('load_combinations', key)
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
         else:
@@ -825,6 +840,7 @@ class AddMethods(BDFAttributes):
                                            GMLOAD]) -> None:
         """adds a load object to a load case"""
         key = load.sid
+        self._mark_xref_dirty('loads', key)
         if key in self.loads:
             self.loads[key].append(load)
         else:
@@ -834,6 +850,7 @@ class AddMethods(BDFAttributes):
     def _add_dload_object(self, load: DLOAD) -> None:
         """adds a dload object to a load case"""
         key = load.sid
+        self._mark_xref_dirty('dloads', key)
         if key in self.dloads:
             self.dloads[key].append(load)
         else:
@@ -845,6 +862,7 @@ class AddMethods(BDFAttributes):
                                             QVECT]) -> None:
         """adds a sub-dload object to a load case"""
         key = dload.sid
+        self._mark_xref_dirty('dload_entries', key)
         if key in self.dload_entries:
             self.dload_entries[key].append(dload)
         else:
@@ -854,6 +872,7 @@ class AddMethods(BDFAttributes):
     def _add_lseq_object(self, load: LSEQ) -> None:
         """adds a LSEQ object to a load case"""
         key = load.sid
+        self._mark_xref_dirty('load_combinations', key)
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
         else:
@@ -864,6 +883,7 @@ class AddMethods(BDFAttributes):
         # same function at the moment...
         key = load.sid
         assert key > 0, 'key=%s; load=%s\n' % (key, load)
+        self._mark_xref_dirty('loads', key)
         if key in self.loads:
             self.loads[key].append(load)
         else:
@@ -938,6 +958,7 @@ class AddMethods(BDFAttributes):
 
     def _add_constraint_mpc_object(self, constraint: MPC) -> None: # MPCAX
         key = constraint.conid
+        self._mark_xref_dirty('mpcs', key)
         if key in self.mpcs:
             self.mpcs[key].append(constraint)
         else:
@@ -946,6 +967,7 @@ class AddMethods(BDFAttributes):
 
     def _add_constraint_mpcadd_object(self, constraint: MPCADD) -> None:
         key = constraint.conid
+        self._mark_xref_dirty('mpcadds', key)
         if key in self.mpcadds:
             self.mpcadds[key].append(constraint)
         else:
@@ -954,6 +976,7 @@ class AddMethods(BDFAttributes):
 
     def _add_constraint_spc_object(self, constraint: Union[SPC, SPC1, SPCAX, GMSPC]) -> None:
         key = constraint.conid
+        self._mark_xref_dirty('spcs', key)
         if key in self.spcs:
             self.spcs[key].append(constraint)
         else:
@@ -962,6 +985,7 @@ class AddMethods(BDFAttributes):
 
     def _add_constraint_spcadd_object(self, constraint: SPCADD) -> None:
         key = constraint.conid
+        self._mark_xref_dirty('spcadds', key)
         if key in self.spcadds:
             self.spcadds[key].append(constraint)
         else:
@@ -1303,6 +1327,7 @@ class AddMethods(BDFAttributes):
             key, self.desvars[key], desvar)
         assert key > 0
         self.desvars[key] = desvar
+        self._mark_xref_dirty('desvars', key)
         self._type_to_id_map[desvar.type].append(key)
 
     def _add_topvar_object(self, topvar: TOPVAR) -> None:
@@ -1348,6 +1373,7 @@ class AddMethods(BDFAttributes):
             key, self.dresps[key], dresp)
         assert key > 0
         self.dresps[key] = dresp
+        self._mark_xref_dirty('dresps', key)
         self._type_to_id_map[dresp.type].append(key)
 
     def _add_dvcrel_object(self, dvcrel: Union[DVCREL1, DVCREL2]) -> None:
@@ -1357,6 +1383,7 @@ class AddMethods(BDFAttributes):
             key, self.dvcrels[key], dvcrel)
         assert key > 0
         self.dvcrels[key] = dvcrel
+        self._mark_xref_dirty('dvcrels', key)
         self._type_to_id_map[dvcrel.type].append(key)
 
     def _add_dvmrel_object(self, dvmrel: Union[DVMREL1, DVMREL2]) -> None:
@@ -1367,6 +1394,7 @@ class AddMethods(BDFAttributes):
         assert key not in self.dvmrels
         assert key > 0
         self.dvmrels[key] = dvmrel
+        self._mark_xref_dirty('dvmrels', key)
         self._type_to_id_map[dvmrel.type].append(key)
 
     def _add_dvprel_object(self, dvprel: Union[DVPREL1, DVPREL2]) -> None:
@@ -1376,6 +1404,7 @@ class AddMethods(BDFAttributes):
             key, self.dvprels[key], dvprel)
         assert key > 0
         self.dvprels[key] = dvprel
+        self._mark_xref_dirty('dvprels', key)
         self._type_to_id_map[dvprel.type].append(key)
 
     def _add_dvgrid_object(self, dvgrid: DVGRID) -> None:
@@ -0,0 +1,524 @@
+"""
+Defines the node/element adjacency index that's cached by
+``BDF.get_adjacency()``.  Defines:
+
+ - AdjacencyIndex(elements)
+
+The index is a set of CSR (compressed sparse row) arrays, so the elements
+of a node (or the edges of an element) are a slice:
+
+ - node -> elements
+ - element -> nodes
+ - element -> edges; edge -> elements (the 1d/2d/3d elements)
+ - element -> faces; face -> elements (the solid elements)
+ - element -> neighbors (by node, edge or face; built the first time
+   they're used)
+
+The elements are indexed in the order of the sorted element ids.  The
+edges and faces are numbered in the order that they're first used (e.g.,
+the first edge of the first element is edge 0), which is the order of
+the old dictionaries (e.g., ``_get_maps``).
+
+The CQUAD4/CTRIA3/CTETRA/CHEXA elements use the edge/face templates
+below, so the tables of an ElementStore (see ``array_store.py``) aren't
+looped over and the element objects are only looped over to get the
+nodes.  The other elements are looped over once to get the ``node_ids``,
+``get_edge_ids()`` and ``faces``.
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
+import scipy.sparse
+
+from pyNastran.bdf.bdf_interface.array_store import ElementStore, TABLE_NAMES
+
+#: the elements that have edges (see ``get_edge_ids``)
+EDGE_TYPES = {
+    'CROD', 'CONROD', 'CBAR', 'CBEAM', 'CBEAM3',
+    'CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
+    'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8', 'CSHEAR',
+    'CTETRA', 'CPENTA', 'CPYRAM', 'CHEXA',
+}
+
+#: the elements that have faces (see ``faces``)
+FACE_TYPES = {'CTETRA', 'CPENTA', 'CPYRAM', 'CHEXA'}
+
+#: the elements that aren't indexed
+SKIP_TYPES = {'CCONEAX'}
+
+#: the max number of nodes of a face (a CHEXA20 face)
+MAX_FACE_NODES = 8
+
+#: table name -> (element type, edges, faces); the columns of the nodes
+#: in the order of ``get_edge_ids`` and ``faces``
+TABLE_TEMPLATES = {
+    'CTRIA3' : ('CTRIA3', [(0, 1), (1, 2), (0, 2)], []),
+    'CQUAD4' : ('CQUAD4', [(0, 1), (1, 2), (2, 3), (0, 3)], []),
+    'CTETRA4' : (
+        'CTETRA',
+        [(0, 1), (1, 2), (0, 2), (0, 3), (1, 3), (2, 3)],
+        [[0, 1, 3], [0, 3, 2], [1, 2, 3], [0, 2, 1]]),
+    'CTETRA10' : (
+        'CTETRA',
+        [(0, 1), (1, 2), (0, 2), (0, 3), (1, 3), (2, 3)],
+        [[0, 1, 2, 4, 5, 6], [0, 1, 3, 4, 8, 7], [1, 2, 3, 5, 9, 8], [2, 0, 3, 6, 7, 9]]),
+    'CHEXA8' : (
+        'CHEXA',
+        [(0, 1), (1, 2), (2, 3), (0, 3), (4, 5), (5, 6), (6, 7), (4, 7),
+         (0, 4), (1, 5), (2, 6), (3, 7)],
+        [[0, 1, 2, 3], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7], [4, 5, 6, 7]]),
+    'CHEXA20' : (
+        'CHEXA',
+        [(0, 1), (1, 2), (2, 3), (0, 3), (4, 5), (5, 6), (6, 7), (4, 7),
+         (0, 4), (1, 5), (2, 6), (3, 7)],
+        [[0, 1, 2, 3, 8, 9, 10, 11], [0, 1, 5, 4, 8, 17, 12, 16],
+         [1, 2, 6, 5, 9, 18, 13, 17], [2, 3, 7, 6, 10, 9, 14, 18],
+         [3, 0, 4, 7, 11, 16, 15, 19], [4, 5, 6, 7, 12, 13, 14, 15]]),
+}
+
+
+class AdjacencyIndex:
+    """
+    The node/element adjacency of a model
+
+    Attributes
+    ----------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    etypes : (nelements, ) str ndarray
+        the element types (e.g., CQUAD4)
+    element_node_offsets, element_nodes : int ndarray
+        the node ids of element i are
+        element_nodes[element_node_offsets[i]:element_node_offsets[i+1]];
+        the blank nodes are skipped
+    nids, node_offsets, node_elements : int ndarray
+        the sorted node ids and the element indices of each node
+    edges : (nedges, 2) int ndarray
+        the sorted node ids of each edge
+    element_edge_offsets, element_edges : int ndarray
+        the edge indices of each element
+    edge_offsets, edge_elements : int ndarray
+        the element indices of each edge
+    faces : (nfaces, 8) int ndarray
+        the sorted node ids of each face; 0 is a blank
+    element_face_offsets, element_faces : int ndarray
+        the face indices of each element
+    element_face_nodes : (nelement_faces, 8) int ndarray
+        the node ids of each face of each element in the order of the
+        element (e.g., for the normal)
+    face_offsets, face_elements : int ndarray
+        the element indices of each face
+
+    """
+    def __init__(self, elements: Dict[int, Any]) -> None:
+        """
+        Parameters
+        ----------
+        elements : Dict[eid] = element / ElementStore
+            the elements (e.g., ``model.elements``)
+
+        """
+        #: the elements that were indexed; used to check if the index is current
+        self.elements = elements
+        self.nelements_indexed = len(elements)
+
+        pieces = _Pieces()
+        objects = elements
+        if isinstance(elements, ElementStore):
+            elements.compress()
+            for table_name, table in elements.tables.items():
+                if len(table['eid']):
+                    pieces.add_table(table_name, table)
+            objects = elements.objects
+        for eid, elem in objects.items():
+            pieces.add_element(eid, elem)
+        pieces.add_object_tables()
+
+        eids = pieces.get('eids')
+        etypes = pieces.get('etypes')
+        isort = np.argsort(eids, kind='stable')
+        self.eids = eids[isort]
+        self.etypes = etypes[isort]
+        nelements = len(self.eids)
+        self._neighbors = {}  # type: Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+        # element -> nodes; node -> elements
+        self.element_node_offsets, self.element_nodes = self._to_csr(
+            pieces.get('node_eids'), pieces.get('nids'))
+        self.nids, self.node_offsets, self.node_elements = _transpose(
+            self.element_node_offsets, self.element_nodes, nelements)
+
+        # element -> edges; edge -> elements
+        self.element_edge_offsets, instance_edges = self._to_csr(
+            pieces.get('edge_eids'), pieces.get('edges').reshape(-1, 2))
+        edge_keys = (instance_edges[:, 0] << 32) | instance_edges[:, 1]
+        iedge_first, self.element_edges = _get_unique_in_order(edge_keys)
+        self.edges = instance_edges[iedge_first]
+        unused_iedges, self.edge_offsets, self.edge_elements = _transpose(
+            self.element_edge_offsets, self.element_edges, nelements, nvalues=len(self.edges))
+
+        # element -> faces; face -> elements
+        self.element_face_offsets, self.element_face_nodes = self._to_csr(
+            pieces.get('face_eids'), pieces.get('faces').reshape(-1, MAX_FACE_NODES))
+        sorted_faces = np.sort(self.element_face_nodes, axis=1)
+        iface_first, self.element_faces = _get_unique_rows_in_order(sorted_faces)
+        self.faces = sorted_faces[iface_first]
+        unused_ifaces, self.face_offsets, self.face_elements = _transpose(
+            self.element_face_offsets, self.element_faces, nelements, nvalues=len(self.faces))
+
+    def __repr__(self) -> str:
+        return 'AdjacencyIndex(nelements=%s, nnodes=%s, nedges=%s, nfaces=%s)' % (
+            len(self.eids), len(self.nids), len(self.edges), len(self.faces))
+
+    @property
+    def nelements(self) -> int:
+        """the number of elements"""
+        return len(self.eids)
+
+    def _to_csr(self, row_eids: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """sorts the values by element and keeps the order of each element"""
+        irows = np.searchsorted(self.eids, row_eids)
+        isort = np.argsort(irows, kind='stable')
+        offsets = _get_offsets(np.bincount(irows, minlength=len(self.eids)))
+        return offsets, values[isort]
+
+    def is_current(self, elements: Dict[int, Any]) -> bool:
+        """is the index for these elements (i.e., no elements were added/removed)"""
+        return self.elements is elements and self.nelements_indexed == len(elements)
+
+    def get_element_indices(self, eids: Optional[List[int]]=None,
+                            etypes: Optional[List[str]]=None) -> np.ndarray:
+        """
+        Gets the indices of some elements
+
+        Parameters
+        ----------
+        eids : List[int]; default=None -> all
+            the element ids; a missing element raises a KeyError
+        etypes : List[str]; default=None -> all
+            only keep these element types (e.g., CQUAD4)
+
+        Returns
+        -------
+        ielements : (n, ) int ndarray
+            the element indices in the order of eids
+
+        """
+        if eids is None:
+            ielements = np.arange(len(self.eids))
+        else:
+            if isinstance(eids, int):
+                eids = [eids]
+            eids = np.asarray(eids, dtype='int64').ravel()
+            ielements = np.searchsorted(self.eids, eids)
+            imissing = ielements == len(self.eids)
+            imissing[~imissing] = self.eids[ielements[~imissing]] != eids[~imissing]
+            if imissing.any():
+                raise KeyError('eids=%s are not elements' % eids[imissing].tolist())
+        if etypes is not None:
+            ielements = ielements[np.isin(self.etypes[ielements], list(etypes))]
+        return ielements
+
+    def get_element_ids(self, nid: int) -> np.ndarray:
+        """gets the element ids of a node"""
+        i = np.searchsorted(self.nids, nid)
+        if i == len(self.nids) or self.nids[i] != nid:
+            return np.zeros(0, dtype=self.eids.dtype)
+        return self.eids[self.node_elements[self.node_offsets[i]:self.node_offsets[i+1]]]
+
+    def get_element_node_ids(self, eid: int) -> np.ndarray:
+        """gets the node ids of an element"""
+        i = self.get_element_indices([eid])[0]
+        return self.element_nodes[self.element_node_offsets[i]:self.element_node_offsets[i+1]]
+
+    def get_element_nodes(self, ielements: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the nodes of some elements
+
+        Parameters
+        ----------
+        ielements : (n, ) int ndarray
+            the element indices (see ``get_element_indices``)
+
+        Returns
+        -------
+        ielement : (nnodes, ) int ndarray
+            the element index of each node
+        nids : (nnodes, ) int ndarray
+            the node ids in the order of the elements
+
+        """
+        ielement, ivalues = _get_csr_rows(self.element_node_offsets, ielements)
+        return ielement, self.element_nodes[ivalues]
+
+    def get_element_edges(self, ielements: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the edges of some elements
+
+        Parameters
+        ----------
+        ielements : (n, ) int ndarray
+            the element indices (see ``get_element_indices``)
+
+        Returns
+        -------
+        ielement : (nedges, ) int ndarray
+            the element index of each edge
+        iedges : (nedges, ) int ndarray
+            the edge indices in the order of the elements
+
+        """
+        ielement, ivalues = _get_csr_rows(self.element_edge_offsets, ielements)
+        return ielement, self.element_edges[ivalues]
+
+    def get_element_faces(self, ielements: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets the faces of some elements
+
+        Parameters
+        ----------
+        ielements : (n, ) int ndarray
+            the element indices (see ``get_element_indices``)
+
+        Returns
+        -------
+        ielement : (nfaces, ) int ndarray
+            the element index of each face
+        ifaces : (nfaces, ) int ndarray
+            the face indices in the order of the elements
+        face_nodes : (nfaces, 8) int ndarray
+            the node ids of each face in the order of the element
+
+        """
+        ielement, ivalues = _get_csr_rows(self.element_face_offsets, ielements)
+        return ielement, self.element_faces[ivalues], self.element_face_nodes[ivalues]
+
+    def get_neighbors(self, by: str='edge') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the elements that share a node/edge/face with each element
+
+        Parameters
+        ----------
+        by : str; default='edge'
+            'node', 'edge', 'face'
+
+        Returns
+        -------
+        offsets : (nelements + 1, ) int ndarray
+            the neighbors of element i are
+            neighbors[offsets[i]:offsets[i+1]]
+        neighbors : (n, ) int ndarray
+            the sorted element indices of the neighbors
+
+        """
+        if by in self._neighbors:
+            return self._neighbors[by]
+
+        if by == 'node':
+            offsets, values = self.element_node_offsets, np.searchsorted(self.nids, self.element_nodes)
+            ncolumns = len(self.nids)
+        elif by == 'edge':
+            offsets, values, ncolumns = self.element_edge_offsets, self.element_edges, len(self.edges)
+        elif by == 'face':
+            offsets, values, ncolumns = self.element_face_offsets, self.element_faces, len(self.faces)
+        else:
+            raise ValueError("by=%r and must be 'node', 'edge', 'face'" % by)
+
+        nelements = len(self.eids)
+        incidence = scipy.sparse.csr_matrix(
+            (np.ones(len(values), dtype='int32'), values, offsets), shape=(nelements, ncolumns))
+        shared = (incidence @ incidence.T).tocsr()
+        shared.setdiag(0)
+        shared.eliminate_zeros()
+        shared.sort_indices()
+        neighbors = (shared.indptr.astype('int64'), shared.indices.astype('int64'))
+        self._neighbors[by] = neighbors
+        return neighbors
+
+    def get_neighbor_ids(self, eid: int, by: str='edge') -> np.ndarray:
+        """gets the ids of the elements that share a node/edge/face with an element"""
+        i = self.get_element_indices([eid])[0]
+        offsets, neighbors = self.get_neighbors(by=by)
+        return self.eids[neighbors[offsets[i]:offsets[i+1]]]
+
+
+class _Pieces:
+    """collects the nodes/edges/faces of the tables and the element objects"""
+    names = ['eids', 'etypes', 'node_eids', 'nids', 'edge_eids', 'edges', 'face_eids', 'faces']
+
+    def __init__(self) -> None:
+        #: the arrays of the tables
+        self.tables = {name: [] for name in self.names}  # type: Dict[str, List[np.ndarray]]
+        #: the values of the element objects
+        self.objects = {name: [] for name in self.names}  # type: Dict[str, List[Any]]
+        #: table name -> ([eid], [nodes]) for the element objects that
+        #: have a template (e.g., a CQUAD4 in a dictionary)
+        self.object_tables = {}  # type: Dict[str, Tuple[List[int], List[List[int]]]]
+
+    def add_table(self, table_name: str, table: Dict[str, np.ndarray]) -> None:
+        """adds an ElementStore table with the templates"""
+        etype, edges, faces = TABLE_TEMPLATES[table_name]
+        eids = table['eid'].astype('int64')
+        nodes = table['nodes'].astype('int64')
+        nelements = len(eids)
+        tables = self.tables
+        tables['eids'].append(eids)
+        tables['etypes'].append(np.full(nelements, etype, dtype='<U8'))
+
+        inode = nodes != 0
+        tables['node_eids'].append(np.repeat(eids, inode.sum(axis=1)))
+        tables['nids'].append(nodes[inode])
+
+        edge_nodes = nodes[:, np.array(edges)]
+        tables['edge_eids'].append(np.repeat(eids, len(edges)))
+        tables['edges'].append(np.sort(edge_nodes, axis=2).ravel())
+
+        if faces:
+            face_nodes = np.zeros((nelements, len(faces), MAX_FACE_NODES), dtype='int64')
+            for iface, face in enumerate(faces):
+                face_nodes[:, iface, :len(face)] = nodes[:, face]
+            tables['face_eids'].append(np.repeat(eids, len(faces)))
+            tables['faces'].append(face_nodes.ravel())
+
+    def add_element(self, eid: int, elem: Any) -> None:
+        """adds an element object"""
+        table_name = TABLE_NAMES.get(type(elem))
+        if table_name is not None:
+            # node_ids is slow for an element that isn't cross-referenced
+            nodes = elem.nodes if elem.nodes_ref is None else elem.node_ids
+            eids, rows = self.object_tables.setdefault(table_name, ([], []))
+            eids.append(eid)
+            if None in nodes:
+                nodes = [nid if nid else 0 for nid in nodes]
+            rows.append(nodes)
+            return
+
+        etype = elem.type
+        if etype in SKIP_TYPES:
+            return
+        objects = self.objects
+        objects['eids'].append(eid)
+        objects['etypes'].append(etype)
+        try:
+            # not supported for some 0-D elements
+            node_ids = elem.node_ids
+        except AttributeError:
+            return
+
+        nids = [nid for nid in node_ids if nid]
+        objects['node_eids'].extend([eid] * len(nids))
+        objects['nids'].extend(nids)
+        if etype in EDGE_TYPES:
+            for edge in elem.get_edge_ids():
+                objects['edge_eids'].append(eid)
+                objects['edges'].extend(edge)
+        if etype in FACE_TYPES:
+            for face in elem.faces.values():
+                objects['face_eids'].append(eid)
+                objects['faces'].extend([nid if nid else 0 for nid in face])
+                objects['faces'].extend([0] * (MAX_FACE_NODES - len(face)))
+
+    def add_object_tables(self) -> None:
+        """adds the element objects that have a template"""
+        for table_name, (eids, rows) in self.object_tables.items():
+            table = {
+                'eid' : np.array(eids, dtype='int64'),
+                'nodes' : np.array(rows, dtype='int64'),
+            }
+            self.add_table(table_name, table)
+        self.object_tables = {}
+
+    def get(self, name: str) -> np.ndarray:
+        """concatenates the table arrays and the element object values"""
+        dtype = '<U8' if name == 'etypes' else 'int64'
+        values = self.tables[name] + [np.array(self.objects[name], dtype=dtype)]
+        return np.hstack(values)
+
+
+def _get_offsets(counts: np.ndarray) -> np.ndarray:
+    """gets the CSR offsets from the number of values of each row"""
+    offsets = np.zeros(len(counts) + 1, dtype='int64')
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _transpose(offsets: np.ndarray, values: np.ndarray, nrows: int,
+               nvalues: Optional[int]=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Transposes a CSR (e.g., element -> nodes to node -> elements)
+
+    Returns
+    -------
+    uvalues : (n, ) int ndarray
+        the sorted unique values (e.g., the node ids)
+    value_offsets : (n + 1, ) int ndarray
+        the offsets of each unique value
+    rows : int ndarray
+        the rows of each unique value in the order of the rows
+
+    """
+    rows = np.repeat(np.arange(nrows, dtype='int64'), np.diff(offsets))
+    isort = np.argsort(values, kind='stable')
+    if nvalues is None:
+        uvalues, counts = np.unique(values, return_counts=True)
+    else:
+        uvalues = np.arange(nvalues, dtype='int64')
+        counts = np.bincount(values, minlength=nvalues)
+    return uvalues, _get_offsets(counts), rows[isort]
+
+
+def _get_unique_in_order(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Numbers the unique keys in the order that they're first used
+
+    Returns
+    -------
+    ifirst : (nunique, ) int ndarray
+        the index of the first use of each unique key
+    inverse : (n, ) int ndarray
+        the unique key number of each key
+
+    """
+    unused_ukeys, ifirst, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return _order_by_first_use(ifirst, inverse.ravel())
+
+
+def _get_unique_rows_in_order(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """``_get_unique_in_order`` for the rows of an array"""
+    if len(rows) == 0:
+        return np.zeros(0, dtype='int64'), np.zeros(0, dtype='int64')
+    rows = np.ascontiguousarray(rows)
+    keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+    return _get_unique_in_order(keys)
+
+
+def _order_by_first_use(ifirst: np.ndarray, inverse: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """renumbers the unique values by the first use"""
+    iorder = np.argsort(ifirst, kind='stable')
+    new_ids = np.empty(len(ifirst), dtype='int64')
+    new_ids[iorder] = np.arange(len(ifirst), dtype='int64')
+    return ifirst[iorder], new_ids[inverse]
+
+
+def _get_csr_rows(offsets: np.ndarray, irows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the positions of the values of some rows of a CSR
+
+    Returns
+    -------
+    irow : (n, ) int ndarray
+        the row of each value
+    ivalues : (n, ) int ndarray
+        the positions of the values in the order of irows
+
+    """
+    irows = np.asarray(irows, dtype='int64')
+    starts = offsets[irows]
+    counts = offsets[irows + 1] - starts
+    nvalues = counts.sum()
+    irow = np.repeat(irows, counts)
+    ivalues = np.arange(nvalues, dtype='int64') - np.repeat(np.cumsum(counts) - counts, counts)
+    ivalues += np.repeat(starts, counts)
+    return irow, ivalues
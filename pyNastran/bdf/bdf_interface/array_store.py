@@ -0,0 +1,950 @@
+"""
+Defines the array-backed node/element dictionaries that are used by
+``BDF.build_array_store()`` and ``read_bdf(array_store=True)``.  Defines:
+
+ - NodeStore(nodes)
+ - ElementStore(elements)
+ - GRIDProxy, CQUAD4Proxy, CTRIA3Proxy
+ - CTETRA4Proxy, CTETRA10Proxy, CHEXA8Proxy, CHEXA20Proxy
+
+The GRIDs are stored in a sorted nid_cp_cd/xyz array and the CQUAD4,
+CTRIA3, CTETRA and CHEXA elements in a sorted eid/pid/nodes table per
+card class, so ``get_displacement_index_xyz_cp_cd``,
+``get_elements_properties_nodes_by_element_type`` and
+``get_node_id_to_element_ids_map`` don't loop over the card objects.
+
+The stores are dictionaries (e.g., ``model.nodes[nid]``), which return a
+proxy card.  A proxy is a subclass of the card class (e.g., GRIDProxy is a
+GRID), which reads/writes its row of the arrays, so the card methods
+(e.g., ``write_card``, ``get_position``) work like normal.  A proxy is
+created the first time a card is used and is then cached, so the
+``*_ref`` attributes are kept.
+
+The other cards (e.g., CBAR, CPENTA) are stored as card objects in
+``store.objects``.  A card that is added (e.g., ``model.add_grid``) is
+also stored as an object until the arrays are used (see ``compress``),
+and then the card is a proxy.  The arrays are sorted by id, so the
+dictionaries are as well.
+
+"""
+from __future__ import annotations
+from collections.abc import MutableMapping
+from typing import List, Dict, Tuple, Optional, Iterator, Any
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types, float_types
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.bdf_interface.columnar_cards import get_columns_from_cards
+
+
+def _get_int_dtype(values: np.ndarray) -> str:
+    """int32 unless the ids are too big"""
+    if len(values) and (values.max() > 2147483647 or values.min() < -2147483648):
+        return 'int64'
+    return 'int32'
+
+
+def _read_only(values: np.ndarray, dtype: str) -> np.ndarray:
+    """gets a read-only view (or a copy if the type is different)"""
+    values = values.astype(dtype, copy=False)
+    if values.flags.writeable:
+        values = values.view()
+        values.flags.writeable = False
+    return values
+
+
+def _searchsorted(ids: np.ndarray, key: int) -> int:
+    """
+    Finds a key in the sorted ids; the key is cast to the dtype of the ids,
+    so numpy doesn't copy the ids
+    """
+    if ids.dtype.itemsize == 4 and not -2147483648 <= key <= 2147483647:
+        return len(ids)
+    return int(ids.searchsorted(ids.dtype.type(key)))
+
+
+def _get_store_card(store: Any, key: int) -> Any:
+    """unpickles a proxy"""
+    return store[key]
+
+
+class NodeStore(MutableMapping):
+    """stores the GRIDs as arrays and the other nodes as objects"""
+    def __init__(self, nodes: Optional[Dict[int, Any]]=None) -> None:
+        """
+        Parameters
+        ----------
+        nodes : Dict[nid] = node; default=None
+            the nodes to store (e.g., ``model.nodes``)
+
+        """
+        #: the sorted [nid, cp, cd] of the GRIDs
+        self.nid_cp_cd = np.zeros((0, 3), dtype='int32')
+        #: the xyz of the GRIDs in the cp frame
+        self.xyz = np.zeros((0, 3), dtype='float64')
+        #: the ps (e.g., 123 for '123') of the GRIDs
+        self.ps = np.zeros(0, dtype='int32')
+        self.seid = np.zeros(0, dtype='int32')
+
+        #: nid -> comment
+        self.comments = {}  # type: Dict[int, str]
+
+        #: nid -> node for the cards that aren't in the arrays
+        self.objects = {}  # type: Dict[int, Any]
+
+        #: nid -> GRIDProxy for the proxies that have been used
+        self._proxies = {}  # type: Dict[int, GRIDProxy]
+
+        #: the cached (icd_transform, icp_transform)
+        self._transforms = None  # type: Optional[Tuple[Dict[int, np.ndarray], Dict[int, np.ndarray]]]
+
+        #: the keys of the GRIDs after a GRIDProxy.nid was changed; the
+        #: dictionary is keyed by the old ids (like a dict of GRIDs)
+        #: until the arrays are sorted by the new ids (see ``compress``)
+        self._keys = None  # type: Optional[np.ndarray]
+        if nodes:
+            self.objects.update(nodes)
+            self.compress()
+
+    @property
+    def nids(self) -> np.ndarray:
+        """the sorted GRID ids (the keys) in the arrays"""
+        return self.nid_cp_cd[:, 0] if self._keys is None else self._keys
+
+    def _index(self, nid: int) -> int:
+        """gets the row of a GRID"""
+        if not isinstance(nid, integer_types):
+            raise KeyError(nid)
+        nids = self.nids
+        i = _searchsorted(nids, nid)
+        if i < len(nids) and nids[i] == nid:
+            return i
+        raise KeyError(nid)
+
+    def __getitem__(self, nid: int) -> Any:
+        proxy = self._proxies.get(nid)
+        if proxy is not None:
+            return proxy
+        node = self.objects.get(nid)
+        if node is not None:
+            return node
+        proxy = GRIDProxy.from_store(self, self._index(nid))
+        self._proxies[nid] = proxy
+        return proxy
+
+    def __setitem__(self, nid: int, node: Any) -> None:
+        if nid in self.objects:
+            self.objects[nid] = node
+            return
+        try:
+            i = self._index(nid)
+        except KeyError:
+            pass
+        else:
+            self._delete_rows([i])
+        self.objects[nid] = node
+
+    def __delitem__(self, nid: int) -> None:
+        if nid in self.objects:
+            del self.objects[nid]
+            return
+        self._delete_rows([self._index(nid)])
+
+    def __contains__(self, nid: Any) -> bool:
+        if nid in self._proxies or nid in self.objects:
+            return True
+        try:
+            self._index(nid)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self.nids.tolist()
+        yield from list(self.objects)
+
+    def __len__(self) -> int:
+        return len(self.nid_cp_cd) + len(self.objects)
+
+    def __repr__(self) -> str:
+        return 'NodeStore(ngrids=%s, nobjects=%s)' % (len(self.nid_cp_cd), len(self.objects))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """the proxies are recreated"""
+        state = self.__dict__.copy()
+        state['_proxies'] = {}
+        state['_transforms'] = None
+        return state
+
+    def _delete_rows(self, irows: List[int]) -> None:
+        """removes GRIDs from the arrays"""
+        for nid in self.nids[irows].tolist():
+            self._proxies.pop(nid, None)
+            self.comments.pop(nid, None)
+        if self._keys is not None:
+            self._keys = np.delete(self._keys, irows)
+        self.nid_cp_cd = np.delete(self.nid_cp_cd, irows, axis=0)
+        self.xyz = np.delete(self.xyz, irows, axis=0)
+        self.ps = np.delete(self.ps, irows)
+        self.seid = np.delete(self.seid, irows)
+        self._update_proxies()
+
+    def _update_proxies(self) -> None:
+        """the rows change when GRIDs are added/removed"""
+        self._transforms = None
+        for nid, proxy in self._proxies.items():
+            proxy._i = self._index(nid)
+
+    def _set_nid(self, i: int, nid: int) -> None:
+        """changes the id of the i-th GRID (see ``GRIDProxy.nid``)"""
+        if self._keys is None:
+            self._keys = self.nid_cp_cd[:, 0].copy()
+        if not -2147483648 <= nid <= 2147483647:
+            self.nid_cp_cd = self.nid_cp_cd.astype('int64')
+        self.nid_cp_cd[i, 0] = nid
+
+    def _sort_new_ids(self) -> None:
+        """re-keys and sorts the GRIDs that have a new id (see ``_set_nid``)"""
+        keys = self._keys
+        self._keys = None
+        nids = self.nid_cp_cd[:, 0]
+        isort = np.argsort(nids, kind='stable')
+        sorted_nids = nids[isort]
+        is_duplicate = sorted_nids[1:] == sorted_nids[:-1]
+        if is_duplicate.any():
+            self._keys = keys
+            raise ValueError('the GRIDs have duplicate ids; nids=%s' % (
+                np.unique(sorted_nids[1:][is_duplicate]).tolist()))
+
+        comments = self.comments
+        irows = np.searchsorted(keys, np.array(list(comments), dtype=keys.dtype))
+        self.comments = {
+            int(nids[irow]): comment for irow, comment in zip(irows.tolist(), comments.values())}
+        inew = np.empty(len(isort), dtype='int64')
+        inew[isort] = np.arange(len(isort))
+        proxies = list(self._proxies.values())
+        self._proxies = {}
+        for proxy in proxies:
+            proxy._i = int(inew[proxy._i])
+            self._proxies[proxy.nid] = proxy
+
+        self.nid_cp_cd = self.nid_cp_cd[isort]
+        self.xyz = self.xyz[isort]
+        self.ps = self.ps[isort]
+        self.seid = self.seid[isort]
+        self._transforms = None
+
+    def compress(self) -> None:
+        """
+        Moves the GRID objects into the arrays and sorts the GRIDs that
+        have a new id (see ``GRIDProxy.nid``)
+        """
+        if self._keys is not None:
+            self._sort_new_ids()
+        nids = [nid for nid, node in self.objects.items() if _is_array_grid(node)]
+        if not nids:
+            return
+        nodes = [self.objects.pop(nid) for nid in nids]
+        columns = get_columns_from_cards('GRID', nodes)
+        for node in nodes:
+            comment = node.comment
+            if comment:
+                self.comments[node.nid] = comment
+
+        nid_cp_cd = np.vstack([
+            self.nid_cp_cd.astype('int64'),
+            np.column_stack([columns['nid'], columns['cp'], columns['cd']])])
+        isort = np.argsort(nid_cp_cd[:, 0], kind='stable')
+        self.nid_cp_cd = nid_cp_cd[isort].astype(_get_int_dtype(nid_cp_cd), copy=False)
+        self.xyz = np.vstack([self.xyz, columns['xyz']])[isort]
+        self.ps = np.hstack([self.ps, columns['ps']])[isort].astype('int32')
+        seid = np.hstack([self.seid, columns['seid']])
+        self.seid = seid[isort].astype(_get_int_dtype(seid))
+        self._update_proxies()
+
+    def used_values(self) -> Iterator[Any]:
+        """
+        Gets the objects and the proxies that have been used; the other
+        GRIDs haven't been cross-referenced
+        """
+        yield from list(self._proxies.values())
+        yield from list(self.objects.values())
+
+    def to_dict(self) -> Dict[int, Any]:
+        """gets the nodes as card objects"""
+        nodes = {nid: self[nid] for nid in self}
+        for nid, node in nodes.items():
+            if isinstance(node, GRIDProxy):
+                nodes[nid] = node.to_card()
+        return nodes
+
+    def get_transforms(self) -> Tuple[Dict[int, np.ndarray], Dict[int, np.ndarray]]:
+        """
+        Gets the rows of the GRIDs that have a non-basic cd/cp
+
+        Returns
+        -------
+        icd_transform : Dict[cd] = (n,) int ndarray
+            the rows with cd (0 and -1 are skipped)
+        icp_transform : Dict[cp] = (n,) int ndarray
+            the rows with cp (-1 is skipped)
+
+        """
+        self.compress()
+        if self._transforms is None:
+            icd_transform = {}
+            icp_transform = {}
+            cp = self.nid_cp_cd[:, 1]
+            cd = self.nid_cp_cd[:, 2]
+            for cdi in np.unique(cd).tolist():
+                if cdi not in [0, -1]:
+                    icd_transform[cdi] = np.where(cd == cdi)[0]
+            for cpi in np.unique(cp).tolist():
+                if cpi != -1:
+                    icp_transform[cpi] = np.where(cp == cpi)[0]
+            self._transforms = (icd_transform, icp_transform)
+        icd_transform, icp_transform = self._transforms
+        return dict(icd_transform), dict(icp_transform)
+
+
+def _is_array_grid(node: Any) -> bool:
+    """can the GRID be stored in the arrays?"""
+    return (
+        type(node) is GRID and
+        isinstance(node.cp, integer_types) and isinstance(node.cd, integer_types) and
+        isinstance(node.seid, integer_types) and
+        isinstance(node.ps, str) and (node.ps == '' or (node.ps.isdigit() and '0' not in node.ps))
+    )
+
+
+class GRIDProxy(GRID):
+    """a GRID that reads/writes a row of a ``NodeStore``"""
+    __slots__ = ('_store', '_i')
+
+    @classmethod
+    def from_store(cls, store: NodeStore, i: int) -> GRIDProxy:
+        """creates the proxy of the i-th row"""
+        proxy = object.__new__(cls)
+        proxy._store = store
+        proxy._i = i
+        proxy.cp_ref = None
+        proxy.cd_ref = None
+        proxy.elements_ref = None
+        return proxy
+
+    def __reduce__(self):
+        return (_get_store_card, (self._store, int(self._store.nids[self._i])))
+
+    def to_card(self) -> GRID:
+        """gets the GRID as a card object"""
+        return GRID(self.nid, self.xyz.copy(), self.cp, self.cd, self.ps, self.seid,
+                    comment=self.comment)
+
+    @property
+    def nid(self) -> int:
+        return int(self._store.nid_cp_cd[self._i, 0])
+
+    @nid.setter
+    def nid(self, nid: int) -> None:
+        # the NodeStore is keyed by the old id until it's compressed
+        self._store._set_nid(self._i, nid)
+
+    @property
+    def cp(self) -> int:
+        return int(self._store.nid_cp_cd[self._i, 1])
+
+    @cp.setter
+    def cp(self, cp: int) -> None:
+        self._store.nid_cp_cd[self._i, 1] = cp
+        self._store._transforms = None
+
+    @property
+    def cd(self) -> int:
+        return int(self._store.nid_cp_cd[self._i, 2])
+
+    @cd.setter
+    def cd(self, cd: int) -> None:
+        self._store.nid_cp_cd[self._i, 2] = cd
+        self._store._transforms = None
+
+    @property
+    def xyz(self) -> np.ndarray:
+        return self._store.xyz[self._i]
+
+    @xyz.setter
+    def xyz(self, xyz: np.ndarray) -> None:
+        self._store.xyz[self._i] = xyz
+
+    @property
+    def ps(self) -> str:
+        ps = self._store.ps[self._i]
+        return str(ps) if ps else ''
+
+    @ps.setter
+    def ps(self, ps: str) -> None:
+        self._store.ps[self._i] = int(ps) if ps else 0
+
+    @property
+    def seid(self) -> int:
+        return int(self._store.seid[self._i])
+
+    @seid.setter
+    def seid(self, seid: int) -> None:
+        self._store.seid[self._i] = seid
+
+    @property
+    def _comment(self) -> str:
+        return self._store.comments.get(int(self._store.nids[self._i]), '')
+
+    @_comment.setter
+    def _comment(self, comment: str) -> None:
+        self._store.comments[int(self._store.nids[self._i])] = comment
+
+
+class ElementStore(MutableMapping):
+    """stores the CQUAD4/CTRIA3/CTETRA/CHEXA elements as arrays and the others as objects"""
+    def __init__(self, elements: Optional[Dict[int, Any]]=None) -> None:
+        """
+        Parameters
+        ----------
+        elements : Dict[eid] = element; default=None
+            the elements to store (e.g., ``model.elements``)
+
+        """
+        #: class name (e.g., CTETRA10) -> the columns sorted by eid
+        #:   eid, pid : (n, ) int ndarray
+        #:   nodes : (n, nnodes) int ndarray; 0 is a blank node
+        #:   theta, mcid, zoffset, tflag, thickness : the shell columns
+        #:   (see ``parse_card_columns``)
+        self.tables = {}  # type: Dict[str, Dict[str, np.ndarray]]
+
+        #: eid -> comment
+        self.comments = {}  # type: Dict[int, str]
+
+        #: eid -> element for the cards that aren't in the tables
+        self.objects = {}  # type: Dict[int, Any]
+
+        #: eid -> proxy for the proxies that have been used
+        self._proxies = {}  # type: Dict[int, Any]
+
+        # the sorted eids of the tables, the table and the row
+        self._eids = np.zeros(0, dtype='int32')
+        self._itable = np.zeros(0, dtype='int8')
+        self._irow = np.zeros(0, dtype='int32')
+        self._table_names = []  # type: List[str]
+
+        #: class name -> the keys of the elements after a proxy eid was
+        #: changed; the dictionary is keyed by the old ids until the
+        #: tables are sorted by the new ids (see ``compress``)
+        self._keys = None  # type: Optional[Dict[str, np.ndarray]]
+        if elements:
+            self.objects.update(elements)
+            self.compress()
+
+    def _locate(self, eid: int) -> Tuple[str, int]:
+        """gets the table and row of an element"""
+        if not isinstance(eid, integer_types):
+            raise KeyError(eid)
+        eids = self._eids
+        i = _searchsorted(eids, eid)
+        if i < len(eids) and eids[i] == eid:
+            return self._table_names[self._itable[i]], int(self._irow[i])
+        raise KeyError(eid)
+
+    def __getitem__(self, eid: int) -> Any:
+        proxy = self._proxies.get(eid)
+        if proxy is not None:
+            return proxy
+        elem = self.objects.get(eid)
+        if elem is not None:
+            return elem
+        table_name, i = self._locate(eid)
+        proxy = PROXY_CLASSES[table_name].from_store(self, i)
+        self._proxies[eid] = proxy
+        return proxy
+
+    def __setitem__(self, eid: int, elem: Any) -> None:
+        if eid in self.objects:
+            self.objects[eid] = elem
+            return
+        try:
+            table_name, i = self._locate(eid)
+        except KeyError:
+            pass
+        else:
+            self._delete_rows(table_name, [i])
+        self.objects[eid] = elem
+
+    def __delitem__(self, eid: int) -> None:
+        if eid in self.objects:
+            del self.objects[eid]
+            return
+        table_name, i = self._locate(eid)
+        self._delete_rows(table_name, [i])
+
+    def __contains__(self, eid: Any) -> bool:
+        if eid in self._proxies or eid in self.objects:
+            return True
+        try:
+            self._locate(eid)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._eids.tolist()
+        yield from list(self.objects)
+
+    def __len__(self) -> int:
+        return len(self._eids) + len(self.objects)
+
+    def __repr__(self) -> str:
+        ntables = {table_name: len(table['eid']) for table_name, table in self.tables.items()}
+        return 'ElementStore(tables=%s, nobjects=%s)' % (ntables, len(self.objects))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """the proxies are recreated"""
+        state = self.__dict__.copy()
+        state['_proxies'] = {}
+        return state
+
+    def _get_keys(self, table_name: str) -> np.ndarray:
+        """gets the element ids (the keys) of a table"""
+        if self._keys is None:
+            return self.tables[table_name]['eid']
+        return self._keys[table_name]
+
+    def _delete_rows(self, table_name: str, irows: List[int]) -> None:
+        """removes elements from a table"""
+        table = self.tables[table_name]
+        for eid in self._get_keys(table_name)[irows].tolist():
+            self._proxies.pop(eid, None)
+            self.comments.pop(eid, None)
+        if self._keys is not None:
+            self._keys[table_name] = np.delete(self._keys[table_name], irows)
+        for name, values in table.items():
+            table[name] = np.delete(values, irows, axis=0)
+        self._update_index()
+
+    def _set_eid(self, table_name: str, i: int, eid: int) -> None:
+        """changes the id of the i-th element of a table (see ``_ElementProxy.eid``)"""
+        if self._keys is None:
+            self._keys = {table_namei: table['eid'].copy()
+                          for table_namei, table in self.tables.items()}
+        table = self.tables[table_name]
+        if not -2147483648 <= eid <= 2147483647:
+            table['eid'] = table['eid'].astype('int64')
+        table['eid'][i] = eid
+
+    def _sort_new_ids(self) -> None:
+        """re-keys and sorts the elements that have a new id (see ``_set_eid``)"""
+        keys = self._keys
+        eids = np.hstack([table['eid'] for table in self.tables.values()] + [np.zeros(0, dtype='int64')])
+        ueids, counts = np.unique(eids, return_counts=True)
+        if (counts > 1).any():
+            raise ValueError('the elements have duplicate ids; eids=%s' % (
+                ueids[counts > 1].tolist()))
+        self._keys = None
+
+        comments = {}
+        proxies = {}
+        for table_name, table in self.tables.items():
+            keysi = keys[table_name]
+            eidsi = table['eid']
+            isort = np.argsort(eidsi, kind='stable')
+            inew = np.empty(len(isort), dtype='int64')
+            inew[isort] = np.arange(len(isort))
+            for i, key in enumerate(keysi.tolist()):
+                comment = self.comments.get(key)
+                if comment is not None:
+                    comments[int(eidsi[i])] = comment
+                proxy = self._proxies.get(key)
+                if proxy is not None:
+                    proxy._i = int(inew[i])
+                    proxies[int(eidsi[i])] = proxy
+            for name, values in table.items():
+                table[name] = values[isort]
+        self.comments = comments
+        self._proxies = proxies
+        self._update_index()
+
+    def _update_index(self) -> None:
+        """the rows change when elements are added/removed"""
+        self._table_names = [table_name for table_name, table in self.tables.items()
+                             if len(table['eid'])]
+        eids = [self._get_keys(table_name) for table_name in self._table_names]
+        if not eids:
+            self._eids = np.zeros(0, dtype='int32')
+            self._itable = np.zeros(0, dtype='int8')
+            self._irow = np.zeros(0, dtype='int32')
+        else:
+            itable = [np.full(len(eidsi), i, dtype='int8') for i, eidsi in enumerate(eids)]
+            irow = [np.arange(len(eidsi), dtype='int32') for eidsi in eids]
+            eids = np.hstack(eids)
+            isort = np.argsort(eids, kind='stable')
+            self._eids = eids[isort]
+            self._itable = np.hstack(itable)[isort]
+            self._irow = np.hstack(irow)[isort]
+
+        for eid, proxy in self._proxies.items():
+            unused_table_name, proxy._i = self._locate(eid)
+
+    def compress(self) -> None:
+        """
+        Moves the CQUAD4/CTRIA3/CTETRA/CHEXA objects into the tables and
+        sorts the elements that have a new id (see ``_ElementProxy.eid``)
+        """
+        if self._keys is not None:
+            self._sort_new_ids()
+        table_eids = {}  # type: Dict[str, List[int]]
+        for eid, elem in self.objects.items():
+            card_class = type(elem)
+            if card_class in TABLE_NAMES and _is_array_element(elem):
+                table_eids.setdefault(TABLE_NAMES[card_class], []).append(eid)
+        if not table_eids:
+            return
+
+        for table_name, eids in table_eids.items():
+            elements = [self.objects.pop(eid) for eid in eids]
+            for elem in elements:
+                comment = elem.comment
+                if comment:
+                    self.comments[elem.eid] = comment
+
+            columns = get_columns_from_cards(elements[0].type, elements)
+            nnodes = PROXY_CLASSES[table_name]._nnodes
+            columns['nodes'] = columns['nodes'][:, :nnodes]
+            for name, values in columns.items():
+                dtype = 'float64' if name in ('theta', 'zoffset', 'thickness') else 'int64'
+                columns[name] = np.asarray(values, dtype=dtype)
+
+            table = self.tables.get(table_name)
+            if table is not None:
+                columns = {name: np.concatenate([table[name], values])
+                           for name, values in columns.items()}
+            isort = np.argsort(columns['eid'], kind='stable')
+            table = {}
+            for name, values in columns.items():
+                values = np.asarray(values)[isort]
+                if values.dtype.kind == 'i':
+                    values = values.astype(_get_int_dtype(values))
+                table[name] = values
+            self.tables[table_name] = table
+        self._update_index()
+
+    def used_values(self) -> Iterator[Any]:
+        """
+        Gets the objects and the proxies that have been used; the other
+        elements haven't been cross-referenced
+        """
+        yield from list(self._proxies.values())
+        yield from list(self.objects.values())
+
+    def to_dict(self) -> Dict[int, Any]:
+        """gets the elements as card objects"""
+        elements = {eid: self[eid] for eid in self}
+        for eid, elem in elements.items():
+            if isinstance(elem, _ElementProxy):
+                elements[eid] = elem.to_card()
+        return elements
+
+    def get_object_types(self) -> List[str]:
+        """gets the card types (e.g., CBAR) of the elements that aren't in the tables"""
+        return list({elem.type for elem in self.objects.values()})
+
+    def get_element_type_arrays(self, etype: str, dtype: str,
+                                nnodes: Optional[Tuple[int, ...]]) -> Optional[Dict[str, List[np.ndarray]]]:
+        """
+        Gets the [eids, pids, nids] of an element type for
+        ``get_elements_properties_nodes_by_element_type``
+
+        Parameters
+        ----------
+        etype : str
+            the element type (e.g., CQUAD4, CTETRA)
+        dtype : str
+            the int type
+        nnodes : (nnodes_min, nnodes_max) / None
+            the number of nodes of a solid
+
+        Returns
+        -------
+        output : Dict[name] = [eids, pids, nids] / None
+            the read-only arrays of each table (e.g., CTETRA4, CTETRA10);
+            None if the element type isn't stored in tables
+
+        """
+        self.compress()
+        if etype in ('CQUAD4', 'CTRIA3'):
+            table_names = [etype]
+            pid_dtype = dtype
+        elif etype in SOLID_TABLE_NAMES and nnodes is not None and tuple(nnodes) == tuple(
+                PROXY_CLASSES[table_name]._nnodes for table_name in SOLID_TABLE_NAMES[etype]):
+            table_names = SOLID_TABLE_NAMES[etype]
+            pid_dtype = 'int32'
+        else:
+            return None
+        if etype in self.get_object_types():
+            return None
+
+        output = {}
+        for table_name in table_names:
+            table = self.tables.get(table_name)
+            if table is None or len(table['eid']) == 0:
+                continue
+            output[table_name] = [
+                _read_only(table['eid'], dtype),
+                _read_only(table['pid'], pid_dtype),
+                _read_only(table['nodes'], dtype),
+            ]
+        return output
+
+    def get_node_element_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the (nid, eid) of each node of the table elements
+
+        Returns
+        -------
+        nids : (n, ) int ndarray
+            the node ids; the blank nodes are skipped
+        eids : (n, ) int ndarray
+            the element ids
+
+        """
+        self.compress()
+        nids = []
+        eids = []
+        for table in self.tables.values():
+            nodes = table['nodes']
+            nnodes = nodes.shape[1]
+            nids.append(nodes.ravel().astype('int64'))
+            eids.append(np.repeat(table['eid'].astype('int64'), nnodes))
+        if not nids:
+            return np.zeros(0, dtype='int64'), np.zeros(0, dtype='int64')
+        nids = np.hstack(nids)
+        eids = np.hstack(eids)
+        inode = nids != 0
+        return nids[inode], eids[inode]
+
+
+def _is_array_element(elem: Any) -> bool:
+    """can the element be stored in the tables?"""
+    if not (isinstance(elem.eid, integer_types) and isinstance(elem.pid, integer_types)):
+        return False
+    nnodes = PROXY_CLASSES[TABLE_NAMES[type(elem)]]._nnodes_min
+    nodes = elem.nodes
+    if any(not isinstance(nid, integer_types) for nid in nodes[:nnodes]):
+        return False
+    if any(nid is not None and not isinstance(nid, integer_types) for nid in nodes[nnodes:]):
+        return False
+    if isinstance(elem, (CQUAD4, CTRIA3)):
+        thicknesses = [elem.T1, elem.T2, elem.T3] + ([elem.T4] if elem.type == 'CQUAD4' else [])
+        return (
+            isinstance(elem.theta_mcid, integer_types + float_types) and
+            isinstance(elem.zoffset, integer_types + float_types) and
+            isinstance(elem.tflag, integer_types) and
+            all(thickness is None or isinstance(thickness, float_types)
+                for thickness in thicknesses))
+    return True
+
+
+def _table_property(name: str, cast: Any, doc: str) -> property:
+    """an attribute that reads/writes a column of the table"""
+    def getter(self):
+        return cast(self._store.tables[self._table_name][name][self._i])
+    def setter(self, value):
+        self._store.tables[self._table_name][name][self._i] = value
+    return property(getter, setter, doc=doc)
+
+
+def _thickness_property(i: int) -> property:
+    """a T1-T4 attribute of a shell"""
+    def getter(self):
+        thickness = self._store.tables[self._table_name]['thickness'][self._i, i]
+        return None if np.isnan(thickness) else float(thickness)
+    def setter(self, thickness):
+        self._store.tables[self._table_name]['thickness'][self._i, i] = (
+            np.nan if thickness is None else thickness)
+    return property(getter, setter, doc='the thickness at node %i' % (i + 1))
+
+
+class _ElementProxy:
+    """the attributes of an element that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ()
+    _table_name = ''
+    _nnodes = 0
+    _nnodes_min = 0
+
+    @classmethod
+    def from_store(cls, store: ElementStore, i: int) -> Any:
+        """creates the proxy of the i-th row of the table"""
+        proxy = object.__new__(cls)
+        proxy._store = store
+        proxy._i = i
+        proxy.nodes_ref = None
+        proxy.pid_ref = None
+        return proxy
+
+    def __reduce__(self):
+        return (_get_store_card, (self._store, self._key))
+
+    @property
+    def _key(self) -> int:
+        """the id that the ElementStore is keyed by"""
+        return int(self._store._get_keys(self._table_name)[self._i])
+
+    @property
+    def eid(self) -> int:
+        """the element id"""
+        return int(self._store.tables[self._table_name]['eid'][self._i])
+
+    @eid.setter
+    def eid(self, eid: int) -> None:
+        # the ElementStore is keyed by the old id until it's compressed
+        self._store._set_eid(self._table_name, self._i, eid)
+    pid = _table_property('pid', int, 'the property id')
+
+    @property
+    def nodes(self) -> List[Optional[int]]:
+        nids = self._store.tables[self._table_name]['nodes'][self._i].tolist()
+        return [nid if nid else None for nid in nids]
+
+    @nodes.setter
+    def nodes(self, nids: List[Optional[int]]) -> None:
+        self._store.tables[self._table_name]['nodes'][self._i] = [
+            0 if nid is None else nid for nid in nids]
+
+    @property
+    def _comment(self) -> str:
+        return self._store.comments.get(self._key, '')
+
+    @_comment.setter
+    def _comment(self, comment: str) -> None:
+        self._store.comments[self._key] = comment
+
+
+class _ShellProxy(_ElementProxy):
+    """the attributes of a CQUAD4/CTRIA3 proxy"""
+    __slots__ = ()
+
+    @classmethod
+    def from_store(cls, store: ElementStore, i: int) -> Any:
+        proxy = super().from_store(store, i)
+        proxy.theta_mcid_ref = None
+        return proxy
+
+    @property
+    def theta_mcid(self) -> Any:
+        table = self._store.tables[self._table_name]
+        mcid = table['mcid'][self._i]
+        if mcid >= 0:
+            return int(mcid)
+        return float(table['theta'][self._i])
+
+    @theta_mcid.setter
+    def theta_mcid(self, theta_mcid: Any) -> None:
+        table = self._store.tables[self._table_name]
+        if isinstance(theta_mcid, integer_types):
+            table['mcid'][self._i] = theta_mcid
+            table['theta'][self._i] = 0.
+        else:
+            table['mcid'][self._i] = -1
+            table['theta'][self._i] = theta_mcid
+
+    zoffset = _table_property('zoffset', float, 'the offset')
+    tflag = _table_property('tflag', int, 'the thickness flag')
+    T1 = _thickness_property(0)
+    T2 = _thickness_property(1)
+    T3 = _thickness_property(2)
+
+    def to_card(self) -> Any:
+        """gets the element as a card object"""
+        card_class = self.__class__.__bases__[-1]
+        thicknesses = [getattr(self, 'T%i' % (i + 1)) for i in range(self._nnodes)]
+        return card_class(self.eid, self.pid, self.nodes, self.theta_mcid, self.zoffset,
+                          self.tflag, *thicknesses, comment=self.comment)
+
+
+class _SolidProxy(_ElementProxy):
+    """the attributes of a CTETRA/CHEXA proxy"""
+    __slots__ = ()
+
+    def to_card(self) -> Any:
+        """gets the element as a card object"""
+        card_class = self.__class__.__bases__[-1]
+        return card_class(self.eid, self.pid, self.nodes, comment=self.comment)
+
+
+class CQUAD4Proxy(_ShellProxy, CQUAD4):
+    """a CQUAD4 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CQUAD4'
+    _nnodes = _nnodes_min = 4
+    T4 = _thickness_property(3)
+
+
+class CTRIA3Proxy(_ShellProxy, CTRIA3):
+    """a CTRIA3 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CTRIA3'
+    _nnodes = _nnodes_min = 3
+
+
+class CTETRA4Proxy(_SolidProxy, CTETRA4):
+    """a CTETRA4 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CTETRA4'
+    _nnodes = _nnodes_min = 4
+
+
+class CTETRA10Proxy(_SolidProxy, CTETRA10):
+    """a CTETRA10 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CTETRA10'
+    _nnodes = 10
+    _nnodes_min = 4
+
+
+class CHEXA8Proxy(_SolidProxy, CHEXA8):
+    """a CHEXA8 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CHEXA8'
+    _nnodes = _nnodes_min = 8
+
+
+class CHEXA20Proxy(_SolidProxy, CHEXA20):
+    """a CHEXA20 that reads/writes a row of an ``ElementStore``"""
+    __slots__ = ('_store', '_i')
+    _table_name = 'CHEXA20'
+    _nnodes = 20
+    _nnodes_min = 8
+
+
+#: table name -> proxy class
+PROXY_CLASSES = {
+    'CQUAD4' : CQUAD4Proxy,
+    'CTRIA3' : CTRIA3Proxy,
+    'CTETRA4' : CTETRA4Proxy,
+    'CTETRA10' : CTETRA10Proxy,
+    'CHEXA8' : CHEXA8Proxy,
+    'CHEXA20' : CHEXA20Proxy,
+}
+
+#: card class -> table name
+TABLE_NAMES = {
+    CQUAD4 : 'CQUAD4',
+    CTRIA3 : 'CTRIA3',
+    CTETRA4 : 'CTETRA4',
+    CTETRA10 : 'CTETRA10',
+    CHEXA8 : 'CHEXA8',
+    CHEXA20 : 'CHEXA20',
+}
+
+#: solid card type -> the tables (for the min/max number of nodes)
+SOLID_TABLE_NAMES = {
+    'CTETRA' : ['CTETRA4', 'CTETRA10'],
+    'CHEXA' : ['CHEXA8', 'CHEXA20'],
+}
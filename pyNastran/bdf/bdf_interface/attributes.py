@@ -1,7 +1,7 @@
 """defines the BDF attributes"""
 from __future__ import annotations
 from collections import defaultdict
-from typing import List, Dict, Optional, Any, Union, TYPE_CHECKING
+from typing import List, Dict, Set, Optional, Any, Union, TYPE_CHECKING
 from numpy import array  # type: ignore
 
 from pyNastran.utils import object_attributes, object_methods, deprecated
@@ -157,6 +157,30 @@ class BDFAttributes:
         self.loads = {}  # type: Dict[int, List[Any]]
         self.load_combinations = {}  # type: Dict[int, List[Any]]
 
+    def _mark_xref_dirty(self, card_group: str, key: Any, replaced: bool=True) -> None:
+        """
+        Tracks a card that was added/updated after the model was cross
+        referenced (see ``cross_reference(dirty_only=True)``)
+
+        Parameters
+        ----------
+        card_group : str
+            the card group (e.g., 'properties')
+        key : int/str
+            the id of the card
+        replaced : bool; default=True
+            the card is a new object, so the cards that reference it need
+            to be relinked; False for cards that are updated in place
+
+        """
+        if card_group in ('nodes', 'elements'):
+            # the node/element adjacency (see ``get_adjacency``)
+            self._adjacency = None
+        if self._is_xref:
+            self._xref_dirty[card_group].add(key)
+            if replaced:
+                self._xref_replaced[card_group].add(key)
+
     def reset_errors(self) -> None:
         """removes the errors from the model"""
         self._ixref_errors = 0
@@ -172,6 +196,15 @@ class BDFAttributes:
           1.  http://www.mscsoftware.com/support/library/conf/wuc87/p02387.pdf
         """
         self.reset_errors()
+        #: is the model cross referenced
+        self._is_xref = False
+        #: the cards that were added/updated since the last cross_reference
+        #: {card_group : {key}}
+        self._xref_dirty = defaultdict(set)  # type: Dict[str, Set[Any]]
+        #: the subset of _xref_dirty that are new objects
+        self._xref_replaced = defaultdict(set)  # type: Dict[str, Set[Any]]
+        #: the cached node/element adjacency (see ``get_adjacency``)
+        self._adjacency = None
         self.bdf_filename = None
         self.punch = None
         self._encoding = None
@@ -0,0 +1,305 @@
+"""
+Defines the multi-process card parser that is used by
+``read_bdf(nworkers=N)``.  Defines:
+
+ - parse_cards_list_parallel(model, cards_list, nworkers)
+ - get_card_buckets(model, cards_list)
+ - split_buckets(card_buckets, nworkers)
+
+The cards that fill a single dictionary (e.g., GRID -> nodes,
+CQUAD4 -> elements; see ``lazy_cards.LAZY_ADD_METHODS``) are bucketed by
+card type and the buckets are parsed by a pool of worker processes.  The
+workers only create the card objects, so the model adds the objects (and
+parses the other cards) in the order of the deck.  The dictionaries,
+card_count, parsing errors and duplicate ID errors then match a serial read.
+
+The card objects are pickled back to the model, so this helps the most
+for cards that are expensive to parse (e.g., CQUAD4, CTETRA, PCOMP) and
+requires a core per worker.
+
+"""
+from __future__ import annotations
+import sys
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+from cpylog import get_logger
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.lazy_cards import LAZY_ADD_METHODS, get_lazy_slot
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF_
+
+
+class BDFWorker(BDF):
+    """creates the card objects, but doesn't add them to the model"""
+    def __init__(self, **kwargs: Any) -> None:
+        BDF.__init__(self, **kwargs)
+
+        #: [(add_method_name, obj), ...] of the current card
+        self.card_objects = []  # type: List[Tuple[str, Any]]
+
+        #: the parsing error of the current card
+        self.parse_exception = None  # type: Optional[Exception]
+
+    def parse_cards(self, cards: List[Tuple[int, str, str, List[str], int]]) -> Dict[int, Any]:
+        """
+        Parses a set of cards
+
+        Parameters
+        ----------
+        cards : List[(icard, card_name, comment, card_lines, ifile)]
+            the cards to parse
+
+        Returns
+        -------
+        results : Dict[icard, (card_objects, parse_error, exception)]
+            card_objects : List[(add_method_name, obj)]
+                the objects and the model method that adds them
+            parse_error : (card, var, exception) / None
+                the stored parsing error and the exception that was caught
+            exception : Exception / None
+                the error that the serial reader would raise; the
+                following cards aren't parsed
+
+        """
+        results = {}
+        for icard, card_name, comment, card_lines, ifile in cards:
+            self.card_objects = []
+            self.parse_exception = None
+            nerrors = len(self._stored_parse_errors)
+            try:
+                self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
+                              is_list=False, has_none=False)
+            except Exception as exception:
+                results[icard] = (self.card_objects, None, _get_picklable_exception(exception))
+                break
+            parse_error = None
+            if len(self._stored_parse_errors) > nerrors:
+                card, var = self._stored_parse_errors[-1]
+                parse_error = (card, var, _get_picklable_exception(self.parse_exception))
+            results[icard] = (self.card_objects, parse_error, None)
+        return results
+
+    def pop_parse_errors(self) -> None:
+        """
+        Stores the exception that is being handled, so the model can raise
+        it (nparse_errors=0 is used, so this is called for every error)
+        """
+        self.parse_exception = sys.exc_info()[1]
+
+
+def _make_add_method(add_method_name: str) -> Any:
+    """creates a BDFWorker method that stores the object instead of adding it"""
+    def add_object(self, obj: Any, allow_overwrites: bool=False) -> None:
+        self.card_objects.append((add_method_name, obj))
+    add_object.__name__ = add_method_name
+    return add_object
+
+for _add_method_name in LAZY_ADD_METHODS:
+    setattr(BDFWorker, _add_method_name, _make_add_method(_add_method_name))
+
+
+def _get_picklable_exception(exception: Exception) -> Exception:
+    """the exception is sent back to the model, so it must be picklable"""
+    try:
+        pickle.loads(pickle.dumps(exception))
+    except Exception:
+        var = ''.join(traceback.format_exception_only(type(exception), exception))
+        return RuntimeError(var)
+    return exception
+
+
+def get_card_buckets(model: BDF_, cards_list: List[List[Any]]) -> Dict[str, List[int]]:
+    """
+    Gets the cards that may be parsed by the workers
+
+    Parameters
+    ----------
+    model : BDF
+        the model, which defines the supported/rejected cards
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the unparsed cards
+
+    Returns
+    -------
+    card_buckets : Dict[card_name, List[icard]]
+        the cards of each type; replicated cards (e.g., '=') and the cards
+        they replicate are parsed by the model
+
+    """
+    card_slot = {}  # type: Dict[str, Any]
+    card_buckets = {}  # type: Dict[str, List[int]]
+    ncards = len(cards_list)
+    for icard, card in enumerate(cards_list):
+        card_name = card[0]
+        if card_name is None or '=' in card_name:
+            continue
+        if icard + 1 < ncards:
+            card_name_next = cards_list[icard + 1][0]
+            if card_name_next is not None and '=' in card_name_next:
+                continue
+
+        if card_name not in card_slot:
+            slot = None
+            if card_name in model.cards_to_read:
+                slot = get_lazy_slot(model, card_name)
+            card_slot[card_name] = slot
+        if card_slot[card_name] is None:
+            continue
+        card_buckets.setdefault(card_name, []).append(icard)
+    return card_buckets
+
+
+def split_buckets(card_buckets: Dict[str, List[int]], nworkers: int,
+                  nchunks_per_worker: int=4) -> List[List[int]]:
+    """
+    Splits the card buckets into chunks for the workers.  A chunk has a
+    single card type, so the large buckets (e.g., GRID, CQUAD4) are split
+    across the workers.
+
+    Parameters
+    ----------
+    card_buckets : Dict[card_name, List[icard]]
+        the cards of each type
+    nworkers : int
+        the number of workers
+    nchunks_per_worker : int; default=4
+        balances the work across the workers
+
+    Returns
+    -------
+    chunks : List[List[icard]]
+        the cards for each task in the order of the deck
+
+    """
+    ncards = sum(len(icards) for icards in card_buckets.values())
+    chunk_size = max(1, -(-ncards // (nworkers * nchunks_per_worker)))
+    chunks = []
+    for icards in card_buckets.values():
+        for i in range(0, len(icards), chunk_size):
+            chunks.append(icards[i:i+chunk_size])
+    chunks.sort(key=lambda chunk: chunk[0])
+    return chunks
+
+
+def get_worker_settings(model: BDF_) -> Dict[str, Any]:
+    """gets the model settings that the card parsers use"""
+    settings = {
+        'mode' : model._nastran_format,
+        'log_level' : getattr(model.log, 'level', 'warning'),
+        'cards_to_read' : model.cards_to_read,
+        'dict_of_vars' : model.dict_of_vars if model._is_dynamic_syntax else None,
+        'baror' : model.baror,
+        'beamor' : model.beamor,
+    }
+    return settings
+
+
+def _parse_cards(settings: Dict[str, Any],
+                 cards: List[Tuple[int, str, str, List[str], int]]) -> Dict[int, Any]:
+    """parses a chunk of cards (the worker process)"""
+    log = get_logger(level=settings['log_level'])
+    model = BDFWorker(log=log, debug=False, mode=settings['mode'])
+    if settings['mode'] == 'zona':
+        model.zona.update_for_zona()
+    model.cards_to_read = settings['cards_to_read']
+    if settings['dict_of_vars'] is not None:
+        model.set_dynamic_syntax(settings['dict_of_vars'])
+    model.baror = settings['baror']
+    model.beamor = settings['beamor']
+
+    # the model stores the errors
+    model.set_error_storage(nparse_errors=0, stop_on_parsing_error=True,
+                            nxref_errors=0, stop_on_xref_error=True)
+    return model.parse_cards(cards)
+
+
+def parse_cards_list_parallel(model: BDF_, cards_list: List[List[Any]],
+                              nworkers: int) -> None:
+    """
+    Parses the cards with a pool of worker processes.  This has the same
+    result as ``model._parse_cards_list(cards_list)``.
+
+    Parameters
+    ----------
+    model : BDF
+        the model to add the cards to
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the unparsed cards
+    nworkers : int
+        the number of worker processes
+
+    """
+    chunks = split_buckets(get_card_buckets(model, cards_list), nworkers)
+    if not chunks:
+        model._parse_cards_list(cards_list)
+        return
+
+    settings = get_worker_settings(model)
+    icard_to_ichunk = {}
+    for ichunk, icards in enumerate(chunks):
+        for icard in icards:
+            icard_to_ichunk[icard] = ichunk
+
+    model.log.debug('parsing %i of %i cards with %i workers' % (
+        len(icard_to_ichunk), len(cards_list), nworkers))
+    with ProcessPoolExecutor(max_workers=nworkers) as executor:
+        futures = []
+        for icards in chunks:
+            cards = []
+            for icard in icards:
+                card_name, comment, card_lines, ifile_iline = cards_list[icard]
+                cards.append((icard, card_name, comment, card_lines, int(ifile_iline[0])))
+            futures.append(executor.submit(_parse_cards, settings, cards))
+
+        # the cards are added in the order of the deck; the other cards
+        # are parsed by the model
+        try:
+            chunk_results = {}  # type: Dict[int, Dict[int, Any]]
+            icards_serial = []
+            for icard in range(len(cards_list)):
+                ichunk = icard_to_ichunk.get(icard)
+                if ichunk is None:
+                    icards_serial.append(icard)
+                    continue
+                if icards_serial:
+                    model._parse_cards_list(cards_list, icards=icards_serial)
+                    icards_serial = []
+
+                if ichunk not in chunk_results:
+                    chunk_results[ichunk] = futures[ichunk].result()
+                    futures[ichunk] = None
+                results = chunk_results[ichunk]
+                _add_card_objects(model, cards_list[icard][0], results.pop(icard))
+                if not results:
+                    del chunk_results[ichunk]
+            if icards_serial:
+                model._parse_cards_list(cards_list, icards=icards_serial)
+        except BaseException:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+            raise
+
+
+def _add_card_objects(model: BDF_, card_name: str, result: Tuple[Any, Any, Any]) -> None:
+    """adds the objects of a card like ``_add_card_helper``"""
+    card_objects, parse_error, exception = result
+    model.increase_card_count(card_name)
+    for add_method_name, obj in card_objects:
+        getattr(model, add_method_name)(obj)
+    if exception is not None:
+        raise exception
+
+    if parse_error is not None:
+        card, var, exception = parse_error
+        model._iparse_errors += 1
+        model._stored_parse_errors.append((card, var))
+        if model._iparse_errors > model._nparse_errors:
+            try:
+                raise exception
+            except Exception:
+                # pop_parse_errors re-raises the exception if nparse_errors=0
+                model.pop_parse_errors()
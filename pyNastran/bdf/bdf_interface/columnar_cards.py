@@ -0,0 +1,890 @@
+"""
+Defines the fast-path parsers that read the high-volume bulk data cards
+(GRID, CQUAD4, CTRIA3, CHEXA, CTETRA, CBAR, RBE2, FORCE, PLOAD4) straight
+into NumPy columns.  Defines:
+
+ - columns = parse_card_columns(card_name, cards_lines, baror=None)
+ - card_columns = read_card_columns(bdf_filename, card_types=None)
+ - cards_lines, baror = get_cards_lines(bdf_filename, card_types=None)
+ - columns = get_columns_from_cards(card_name, cards)
+ - fields = get_card_fields(cards_lines, card_name)
+
+The fixed small field and large field cards are split into fields with a
+single ``np.frombuffer`` per group of cards (free field and tabbed cards
+use ``to_fields``), so each field is converted for all the cards at once.
+A card that the fast path can't check (e.g., a blank required field,
+``1.0E+3``-style integers, a zero length CBAR x vector) is created by the
+card class (e.g., ``GRID.add_card``), so the columns and the errors match
+the standard reader.
+
+The columns are in the order of the cards.  Duplicate ids are not
+checked and the comments are not kept.  Blank integer fields are stored
+as 0 (or -1 for a coordinate system) and blank real fields are stored
+as nan.
+
+"""
+from __future__ import annotations
+from itertools import chain
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR, BAROR
+from pyNastran.bdf.cards.elements.rigid import RBE2
+from pyNastran.bdf.cards.loads.static_loads import FORCE, PLOAD4
+
+
+class CardFields:
+    """the (ncards, nfields) fields of a set of cards"""
+    def __init__(self, fields: np.ndarray) -> None:
+        """
+        Parameters
+        ----------
+        fields : (ncards, nfields) bytes ndarray
+            the unstripped fields; field 0 is the card name
+
+        """
+        self.fields = fields
+        ncards, nfields = fields.shape
+
+        #: the characters of the fields
+        self.chars = fields.view('uint8').reshape(ncards, nfields, fields.itemsize)
+
+        #: (ncards, nfields) the blank fields
+        self.is_blank = ((self.chars == 32) | (self.chars == 0)).all(axis=2)
+
+        #: (ncards, ) the cards that the fast path is valid for
+        self.is_valid = np.ones(ncards, dtype='bool')
+
+    @property
+    def ncards(self) -> int:
+        return self.fields.shape[0]
+
+    def subset(self, irows: np.ndarray, ifields: List[int]) -> CardFields:
+        """gets some of the fields of some of the cards; missing fields are blank"""
+        nfields = self.fields.shape[1]
+        fields = np.zeros((len(irows), len(ifields)), dtype=self.fields.dtype)
+        for j, ifield in enumerate(ifields):
+            if ifield < nfields:
+                fields[:, j] = self.fields[irows, ifield]
+        return CardFields(fields)
+
+    def check_nfields(self, nfields: int) -> None:
+        """the cards with more than nfields fields aren't valid"""
+        if self.fields.shape[1] > nfields:
+            self.is_valid &= self.is_blank[:, nfields:].all(axis=1)
+
+    def blank(self, ifield: int) -> np.ndarray:
+        """gets the blank fields of a column"""
+        if ifield >= self.fields.shape[1]:
+            return np.ones(self.ncards, dtype='bool')
+        return self.is_blank[:, ifield]
+
+    def integer(self, ifield: int, default: Any=None) -> np.ndarray:
+        """
+        Converts a column like ``integer``/``integer_or_blank``
+
+        Parameters
+        ----------
+        ifield : int
+            the field number
+        default : int / (ncards, ) int ndarray / None
+            the value of the blank fields; None -> blank isn't valid
+
+        """
+        values = np.zeros(self.ncards, dtype='int64')
+        is_blank = self.blank(ifield)
+        if default is None:
+            self.is_valid &= ~is_blank
+        elif isinstance(default, np.ndarray):
+            values[is_blank] = default[is_blank]
+        else:
+            values[is_blank] = default
+
+        inonblank = np.where(~is_blank)[0]
+        if len(inonblank) == 0:
+            return values
+        svalues = self.fields[inonblank, ifield]
+        try:
+            values[inonblank] = svalues.astype('int64')
+        except (ValueError, OverflowError):
+            for i, svalue in zip(inonblank, svalues.tolist()):
+                try:
+                    values[i] = int(svalue)
+                except (ValueError, OverflowError):
+                    self.is_valid[i] = False
+        return values
+
+    def double(self, ifield: int, default: Optional[float]=None) -> np.ndarray:
+        """
+        Converts a column like ``double``/``double_or_blank``
+
+        Parameters
+        ----------
+        ifield : int
+            the field number
+        default : float / None
+            the value of the blank fields; None -> blank isn't valid
+
+        """
+        values = np.full(self.ncards, np.nan, dtype='float64')
+        is_blank = self.blank(ifield)
+        if default is None:
+            self.is_valid &= ~is_blank
+        else:
+            values[is_blank] = default
+
+        inonblank = np.where(~is_blank)[0]
+        if len(inonblank) == 0:
+            return values
+
+        # integers (e.g., 1) aren't valid floats
+        chars = self.chars[inonblank, ifield, :]
+        is_space = (chars == 32) | (chars == 0)
+        is_integer = (((chars >= 48) & (chars <= 57)) | is_space).all(axis=1)
+        self.is_valid[inonblank[is_integer]] = False
+
+        svalues = self.fields[inonblank, ifield]
+        try:
+            values[inonblank] = svalues.astype('float64')
+        except ValueError:
+            # 1.0-3, 1.0D+3
+            for i, svalue in zip(inonblank, svalues.tolist()):
+                value = _to_nastran_float(svalue.decode('latin1'))
+                if value is None:
+                    self.is_valid[i] = False
+                else:
+                    values[i] = value
+        return values
+
+    def integer_double(self, ifield: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Converts a column like ``integer_double_or_blank`` with a default
+        of 0.0
+
+        Returns
+        -------
+        is_float : (ncards, ) bool ndarray
+            the fields that are floats (including the blank fields)
+        ivalues : (ncards, ) int ndarray
+            the integer values
+        fvalues : (ncards, ) float ndarray
+            the float values
+
+        """
+        ivalues = np.zeros(self.ncards, dtype='int64')
+        fvalues = np.zeros(self.ncards, dtype='float64')
+        if ifield >= self.fields.shape[1]:
+            return np.ones(self.ncards, dtype='bool'), ivalues, fvalues
+
+        # a '.' or a '+'/'-' after the first character is a float
+        chars = self.chars[:, ifield, :]
+        is_space = (chars == 32) | (chars == 0)
+        ifirst = (~is_space).argmax(axis=1)
+        is_sign = (chars == 43) | (chars == 45)
+        is_inner_sign = is_sign & (np.arange(chars.shape[1]) > ifirst[:, np.newaxis])
+        is_float = (chars == 46).any(axis=1) | is_inner_sign.any(axis=1) | self.is_blank[:, ifield]
+
+        iint = np.where(~is_float)[0]
+        ifloat = np.where(is_float)[0]
+        if len(iint):
+            sub = self.subset(iint, [ifield])
+            ivalues[iint] = sub.integer(0)
+            self.is_valid[iint] &= sub.is_valid
+        if len(ifloat):
+            sub = self.subset(ifloat, [ifield])
+            fvalues[ifloat] = sub.double(0, 0.0)
+            self.is_valid[ifloat] &= sub.is_valid
+        return is_float, ivalues, fvalues
+
+    def components(self, ifield: int) -> np.ndarray:
+        """
+        Converts a column like ``components_or_blank`` (e.g., '321' -> 123);
+        blank is 0
+        """
+        values = np.zeros(self.ncards, dtype='int64')
+        inonblank = np.where(~self.blank(ifield))[0]
+        if len(inonblank) == 0:
+            return values
+
+        # there are only a few unique components (e.g., 123456)
+        usvalues, inverse = np.unique(self.fields[inonblank, ifield], return_inverse=True)
+        uvalues = np.zeros(len(usvalues), dtype='int64')
+        uis_valid = np.ones(len(usvalues), dtype='bool')
+        for i, svalue in enumerate(usvalues.tolist()):
+            svalue = svalue.strip()
+            components = ''.join(sorted(svalue.decode('latin1')))
+            if (svalue.isdigit() and len(set(components)) == len(components)
+                    and set(components) <= set('0123456')
+                    and (components == '0' or '0' not in components)):
+                uvalues[i] = int(components)
+            else:
+                uis_valid[i] = False
+        values[inonblank] = uvalues[inverse]
+        self.is_valid[inonblank] &= uis_valid[inverse]
+        return values
+
+    def string(self, ifield: int, default: str) -> np.ndarray:
+        """Converts a column of uppercase words (e.g., 'GGG', 'SURF')"""
+        values = np.full(self.ncards, default, dtype='U%i' % max(len(default), 8))
+        inonblank = np.where(~self.blank(ifield))[0]
+        if len(inonblank) == 0:
+            return values
+
+        usvalues, inverse = np.unique(self.fields[inonblank, ifield], return_inverse=True)
+        uvalues = np.array([svalue.strip().decode('latin1') for svalue in usvalues.tolist()])
+        uis_valid = np.array([svalue.isalpha() and svalue.isupper() for svalue in uvalues])
+        values = values.astype(np.result_type(values, uvalues))
+        values[inonblank] = uvalues[inverse]
+        self.is_valid[inonblank] &= uis_valid[inverse]
+        return values
+
+
+def _to_nastran_float(svalue: str) -> Optional[float]:
+    """converts a 1.0-3 or 1.0D+3 float like ``double``; None is invalid"""
+    try:
+        return float(svalue)
+    except ValueError:
+        pass
+
+    svalue = svalue.strip().upper()
+    try:
+        if 'D' in svalue:
+            return float(svalue.replace('D', 'E'))
+        sign = ''
+        if svalue[0] in ('+', '-'):
+            sign = svalue[0]
+            svalue = svalue[1:]
+        if '+' in svalue:
+            svalue = sign + svalue.replace('+', 'E+')
+        elif '-' in svalue:
+            svalue = sign + svalue.replace('-', 'E-')
+        return float(svalue)
+    except (ValueError, IndexError):
+        return None
+
+
+def get_card_fields(cards_lines: List[List[str]], card_name: str) -> np.ndarray:
+    """
+    Splits the cards into fields like ``to_fields``
+
+    Parameters
+    ----------
+    cards_lines : List[card_lines]
+        the lines of each card
+    card_name : str
+        the card name (e.g., 'GRID')
+
+    Returns
+    -------
+    fields : (ncards, nfields) bytes ndarray
+        the unstripped fields; field 0 is the card name and the short
+        cards are padded with blank fields
+
+    """
+    ncards = len(cards_lines)
+    texts = list(map(''.join, cards_lines))
+    all_text = ''.join(texts)
+
+    # free field and tabbed cards are split by to_fields
+    is_fixed = np.ones(ncards, dtype='bool')
+    is_large = np.zeros(ncards, dtype='bool')
+    if ',' in all_text or '\t' in all_text or '=' in all_text or '*' in all_text:
+        for icard, text in enumerate(texts):
+            if ',' in text or '\t' in text or '=' in text:
+                is_fixed[icard] = False
+            elif '*' in text:
+                if all('*' in line for line in cards_lines[icard]):
+                    is_large[icard] = True
+                else:
+                    is_fixed[icard] = False
+    del texts, all_text
+
+    group_fields = []
+    nlines = np.fromiter(map(len, cards_lines), dtype='int64', count=ncards)
+    keys = 2 * nlines + is_large
+    for key in np.unique(keys[is_fixed]):
+        icards = np.where(is_fixed & (keys == key))[0]
+        fields = _get_fixed_fields(cards_lines, icards, key // 2, bool(key % 2))
+        group_fields.append((icards, fields))
+
+    generic_icards = np.where(~is_fixed)[0]
+    if len(generic_icards):
+        rows = [_to_free_fields(cards_lines[icard], card_name) for icard in generic_icards]
+        nfields = max(map(len, rows))
+        all_fields = list(chain.from_iterable(
+            row + [''] * (nfields - len(row)) for row in rows))
+        size = max(1, max(map(len, all_fields)))
+
+        # the characters that aren't latin1 are replaced by '?', so the
+        # card class checks those cards
+        text = (('%%-%is' % size) * len(all_fields)) % tuple(all_fields)
+        fields = np.frombuffer(text.encode('latin1', 'replace'), dtype='S%i' % size).reshape(
+            len(rows), nfields)
+        group_fields.append((generic_icards, fields))
+
+    if not group_fields:
+        return np.zeros((ncards, 1), dtype='S8')
+    if len(group_fields) == 1:
+        return np.ascontiguousarray(group_fields[0][1])
+
+    nfields = max(fields.shape[1] for unused_icards, fields in group_fields)
+    size = max(fields.itemsize for unused_icards, fields in group_fields)
+    all_fields = np.zeros((ncards, nfields), dtype='S%i' % size)
+    for icards, fields in group_fields:
+        all_fields[icards, :fields.shape[1]] = fields
+    return all_fields
+
+
+def _to_free_fields(card_lines: List[str], card_name: str) -> List[str]:
+    """splits a free field card like ``to_fields``"""
+    for line in card_lines:
+        if ',' not in line or '*' in line or '\t' in line or '=' in line:
+            return to_fields(card_lines, card_name)
+
+    fields = card_lines[0].split(',')[:9]
+    fields += [''] * (9 - len(fields))
+    for line in card_lines[1:]:
+        line_fields = line.split(',')[1:9]
+        fields += line_fields + [''] * (8 - len(line_fields))
+    return fields
+
+
+def _get_fixed_fields(cards_lines: List[List[str]], icards: np.ndarray,
+                      nlines: int, is_large: bool) -> np.ndarray:
+    """splits a set of small/large field cards with nlines lines into fields"""
+    if len(icards) == len(cards_lines):
+        lines = list(chain.from_iterable(cards_lines))
+    else:
+        lines = list(chain.from_iterable(cards_lines[icard] for icard in icards))
+
+    # the lines are padded/truncated to 72 characters in one call
+    text = ('%-72.72s' * len(lines)) % tuple(lines)
+    data = text.encode('latin1', 'replace')
+    if not is_large:
+        # drop the continuation markers
+        fields = np.frombuffer(data, dtype='S8').reshape(len(icards), 9 * nlines)
+        if nlines > 1:
+            fields = fields[:, [i for i in range(9 * nlines) if i < 9 or i % 9]]
+        return fields
+
+    line_fields = np.frombuffer(data, dtype=[('name', 'S8'), ('fields', 'S16', (4,))])
+    names = line_fields['name'].reshape(len(icards), nlines)[:, :1].astype('S16')
+    fields = line_fields['fields'].reshape(len(icards), 4 * nlines)
+    return np.hstack([names, fields])
+
+
+def _parse_grid(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """GRID: nid, cp, xyz, cd, ps, seid"""
+    card.check_nfields(9)
+    columns = {
+        'nid' : card.integer(1),
+        'cp' : card.integer(2, 0),
+        'xyz' : np.column_stack([card.double(3, 0.), card.double(4, 0.), card.double(5, 0.)]),
+        'cd' : card.integer(6, 0),
+        'ps' : card.components(7),
+        'seid' : card.integer(8, 0),
+    }
+    return columns
+
+
+def _parse_shell(card: CardFields, nnodes: int) -> Dict[str, np.ndarray]:
+    """CTRIA3/CQUAD4: eid, pid, nodes, theta, mcid, zoffset, tflag, thickness"""
+    ifield = 3 + nnodes
+    card.check_nfields(11 + nnodes)
+    eid = card.integer(1)
+    is_theta, mcid, theta = card.integer_double(ifield)
+    mcid[is_theta] = -1
+    for jfield in range(ifield + 2, 10):
+        card.is_valid &= card.blank(jfield)
+
+    columns = {
+        'eid' : eid,
+        'pid' : card.integer(2, eid),
+        'nodes' : np.column_stack([card.integer(3 + i) for i in range(nnodes)]),
+        'theta' : theta,
+        'mcid' : mcid,
+        'zoffset' : card.double(ifield + 1, 0.0),
+        'tflag' : card.integer(10, 0),
+        'thickness' : np.column_stack([card.double(11 + i, np.nan) for i in range(nnodes)]),
+    }
+    return columns
+
+
+def _parse_cquad4(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """CQUAD4: see ``_parse_shell``"""
+    return _parse_shell(card, 4)
+
+
+def _parse_ctria3(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """CTRIA3: see ``_parse_shell``"""
+    return _parse_shell(card, 3)
+
+
+def _parse_solid(card: CardFields, nnodes: int, nnodes_max: int) -> Dict[str, np.ndarray]:
+    """CTETRA/CHEXA: eid, pid, nodes (the blank midside nodes are 0)"""
+    card.check_nfields(3 + nnodes_max)
+    nodes = [card.integer(3 + i) for i in range(nnodes)]
+    nodes += [card.integer(3 + i, 0) for i in range(nnodes, nnodes_max)]
+    columns = {
+        'eid' : card.integer(1),
+        'pid' : card.integer(2),
+        'nodes' : np.column_stack(nodes),
+    }
+    return columns
+
+
+def _parse_ctetra(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """CTETRA: see ``_parse_solid``"""
+    return _parse_solid(card, 4, 10)
+
+
+def _parse_chexa(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """CHEXA: see ``_parse_solid``"""
+    return _parse_solid(card, 8, 20)
+
+
+def _parse_cbar(card: CardFields, baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """CBAR: eid, pid, nodes, x, g0, offt, pa, pb, wa, wb"""
+    card.check_nfields(17)
+    if baror is not None:
+        # the BAROR defaults are applied by CBAR.add_card
+        for ifield in [2, 5, 6, 7, 8]:
+            card.is_valid &= ~card.blank(ifield)
+
+    eid = card.integer(1)
+    card.is_valid &= ~card.blank(5)
+    is_x, g0, x1 = card.integer_double(5)
+    x = np.column_stack([x1, card.double(6, np.nan), card.double(7, np.nan)])
+    x[~is_x, :] = np.nan
+    g0[is_x] = 0
+    card.is_valid &= ~(is_x & (np.linalg.norm(x, axis=1) == 0.))
+
+    columns = {
+        'eid' : eid,
+        'pid' : card.integer(2, eid),
+        'nodes' : np.column_stack([card.integer(3), card.integer(4)]),
+        'x' : x,
+        'g0' : g0,
+        'offt' : card.string(8, 'GGG'),
+        'pa' : card.integer(9, 0),
+        'pb' : card.integer(10, 0),
+        'wa' : np.column_stack([card.double(11 + i, 0.0) for i in range(3)]),
+        'wb' : np.column_stack([card.double(14 + i, 0.0) for i in range(3)]),
+    }
+    return columns
+
+
+def _parse_rbe2(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """
+    RBE2: eid, gn, cm, alpha, ngm, gm
+
+    gm is the flattened dependent nodes and ngm is the number of
+    dependent nodes of each card
+    """
+    eid = card.integer(1)
+    gn = card.integer(2)
+    cm = card.components(3)
+
+    # the last field is alpha if it's a float
+    nfields = card.fields.shape[1]
+    ilast = nfields - 1 - (~card.is_blank[:, ::-1]).argmax(axis=1)
+    last = CardFields(np.ascontiguousarray(card.fields[np.arange(card.ncards), ilast][:, np.newaxis]))
+    is_alpha, unused_ivalues, alpha = last.integer_double(0)
+    card.is_valid &= last.is_valid
+    alpha[~is_alpha] = 0.0
+    ilast_gm = ilast - is_alpha
+
+    ifields = np.arange(nfields)
+    is_gm = (ifields >= 4) & (ifields <= ilast_gm[:, np.newaxis])
+    gm_fields = card.fields[is_gm]
+    gm = CardFields(np.ascontiguousarray(gm_fields[:, np.newaxis]))
+    gm_values = gm.integer(0)
+    irows = np.where(is_gm)[0]
+    card.is_valid[irows[~gm.is_valid]] = False
+
+    columns = {
+        'eid' : eid,
+        'gn' : gn,
+        'cm' : cm,
+        'alpha' : alpha,
+        'ngm' : is_gm.sum(axis=1),
+        'gm' : gm_values,
+    }
+    return columns
+
+
+def _parse_force(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """FORCE: sid, node, cid, mag, xyz"""
+    card.check_nfields(8)
+    columns = {
+        'sid' : card.integer(1),
+        'node' : card.integer(2),
+        'cid' : card.integer(3, 0),
+        'mag' : card.double(4),
+        'xyz' : np.column_stack([card.double(5, 0.0), card.double(6, 0.0), card.double(7, 0.0)]),
+    }
+    return columns
+
+
+def _parse_pload4(card: CardFields, unused_baror: Optional[BAROR]) -> Dict[str, np.ndarray]:
+    """
+    PLOAD4: sid, eid, eid2, pressures, g1, g34, cid, nvector, surf_or_line,
+    line_load_dir
+
+    eid2 is the last element of the THRU form (eid2=eid for a single
+    element) and a blank cid is -1
+    """
+    card.check_nfields(15)
+    eid = card.integer(2)
+    pressures = np.column_stack([card.double(3, 0.0)] +
+                                [card.double(4 + i, np.nan) for i in range(3)])
+
+    # alternate form: PLOAD4, sid, eid, p1, p2, p3, p4, THRU, eid2
+    is_thru = np.char.strip(card.subset(np.arange(card.ncards), [7]).fields[:, 0]) == b'THRU'
+    ithru = np.where(is_thru)[0]
+    istd = np.where(~is_thru)[0]
+    g1 = np.zeros(card.ncards, dtype='int64')
+    g34 = np.zeros(card.ncards, dtype='int64')
+    eid2 = eid.copy()
+    if len(istd):
+        std = card.subset(istd, [7, 8])
+        g1[istd] = std.integer(0, 0)
+        g34[istd] = std.integer(1, 0)
+        card.is_valid[istd] &= std.is_valid
+    if len(ithru):
+        thru = card.subset(ithru, [8])
+        eid2[ithru] = thru.integer(0)
+        card.is_valid[ithru] &= thru.is_valid & (eid2[ithru] >= eid[ithru])
+
+    surf_or_line = card.string(13, 'SURF')
+    is_surf = surf_or_line == 'SURF'
+    inan = np.isnan(pressures) & is_surf[:, np.newaxis]
+    pressures[inan] = np.broadcast_to(pressures[:, [0]], pressures.shape)[inan]
+    columns = {
+        'sid' : card.integer(1),
+        'eid' : eid,
+        'eid2' : eid2,
+        'pressures' : pressures,
+        'g1' : g1,
+        'g34' : g34,
+        'cid' : card.integer(9, -1),
+        'nvector' : np.column_stack([card.double(10 + i, 0.0) for i in range(3)]),
+        'surf_or_line' : surf_or_line,
+        'line_load_dir' : card.string(14, 'NORM'),
+    }
+    return columns
+
+
+CARD_PARSERS = {
+    'GRID' : _parse_grid,
+    'CQUAD4' : _parse_cquad4,
+    'CTRIA3' : _parse_ctria3,
+    'CHEXA' : _parse_chexa,
+    'CTETRA' : _parse_ctetra,
+    'CBAR' : _parse_cbar,
+    'RBE2' : _parse_rbe2,
+    'FORCE' : _parse_force,
+    'PLOAD4' : _parse_pload4,
+}
+
+
+def _add_card(card_name: str, card_lines: List[str], baror: Optional[BAROR]) -> Any:
+    """creates the card object like ``BDF.add_card``"""
+    card = BDFCard(wipe_empty_fields(to_fields(card_lines, card_name)), has_none=False)
+    if card_name == 'GRID':
+        obj = GRID.add_card(card)
+    elif card_name == 'CQUAD4':
+        obj = CQUAD4.add_card(card)
+    elif card_name == 'CTRIA3':
+        obj = CTRIA3.add_card(card)
+    elif card_name == 'CHEXA':
+        obj = CHEXA8.add_card(card) if len(card) == 11 else CHEXA20.add_card(card)
+    elif card_name == 'CTETRA':
+        obj = CTETRA4.add_card(card) if len(card) == 7 else CTETRA10.add_card(card)
+    elif card_name == 'CBAR':
+        obj = CBAR.add_card(card, baror=baror)
+    elif card_name == 'RBE2':
+        obj = RBE2.add_card(card)
+    elif card_name == 'FORCE':
+        obj = FORCE.add_card(card)
+    else:
+        assert card_name == 'PLOAD4', card_name
+        obj = PLOAD4.add_card(card)
+    return obj
+
+
+def _int_or_default(value: Optional[int], default: int) -> int:
+    return default if value is None else value
+
+
+def _float_or_nan(value: Optional[float]) -> float:
+    return np.nan if value is None else value
+
+
+def get_columns_from_cards(card_name: str, cards: List[Any]) -> Dict[str, np.ndarray]:
+    """
+    Gets the columns of a set of card objects (see ``parse_card_columns``)
+
+    Parameters
+    ----------
+    card_name : str
+        the card name (e.g., 'GRID', 'CHEXA')
+    cards : List[card]
+        the card objects (e.g., GRID, CHEXA8/CHEXA20)
+
+    Returns
+    -------
+    columns : Dict[name] = (ncards, ...) ndarray
+        the columns
+
+    """
+    if card_name not in CARD_PARSERS:
+        raise ValueError('card_name=%r is not supported; supported=%s' % (
+            card_name, list(CARD_PARSERS)))
+
+    if card_name == 'GRID':
+        columns = {
+            'nid' : [card.nid for card in cards],
+            'cp' : [card.cp for card in cards],
+            'xyz' : np.array([card.xyz for card in cards], dtype='float64').reshape(len(cards), 3),
+            'cd' : [card.cd for card in cards],
+            'ps' : [int(card.ps) if card.ps else 0 for card in cards],
+            'seid' : [card.seid for card in cards],
+        }
+    elif card_name in ('CQUAD4', 'CTRIA3'):
+        nnodes = 4 if card_name == 'CQUAD4' else 3
+        columns = {
+            'eid' : [card.eid for card in cards],
+            'pid' : [card.pid for card in cards],
+            'nodes' : np.array([card.nodes for card in cards], dtype='int64').reshape(
+                len(cards), nnodes),
+            'theta' : [0.0 if isinstance(card.theta_mcid, int) else card.theta_mcid
+                       for card in cards],
+            'mcid' : [card.theta_mcid if isinstance(card.theta_mcid, int) else -1
+                      for card in cards],
+            'zoffset' : [card.zoffset for card in cards],
+            'tflag' : [card.tflag for card in cards],
+            'thickness' : np.array([
+                [_float_or_nan(getattr(card, 'T%i' % (i + 1))) for i in range(nnodes)]
+                for card in cards], dtype='float64').reshape(len(cards), nnodes),
+        }
+    elif card_name in ('CHEXA', 'CTETRA'):
+        nnodes = 20 if card_name == 'CHEXA' else 10
+        nodes = np.zeros((len(cards), nnodes), dtype='int64')
+        for i, card in enumerate(cards):
+            nodes[i, :len(card.nodes)] = [_int_or_default(nid, 0) for nid in card.nodes]
+        columns = {
+            'eid' : [card.eid for card in cards],
+            'pid' : [card.pid for card in cards],
+            'nodes' : nodes,
+        }
+    elif card_name == 'CBAR':
+        columns = {
+            'eid' : [card.eid for card in cards],
+            'pid' : [card.pid for card in cards],
+            'nodes' : np.array([card.nodes for card in cards], dtype='int64').reshape(
+                len(cards), 2),
+            'x' : np.array([[np.nan] * 3 if card.x is None else card.x for card in cards],
+                           dtype='float64').reshape(len(cards), 3),
+            'g0' : [_int_or_default(card.g0, 0) for card in cards],
+            'offt' : np.array([card.offt for card in cards], dtype='U8'),
+            'pa' : [card.pa for card in cards],
+            'pb' : [card.pb for card in cards],
+            'wa' : np.array([card.wa for card in cards], dtype='float64').reshape(len(cards), 3),
+            'wb' : np.array([card.wb for card in cards], dtype='float64').reshape(len(cards), 3),
+        }
+    elif card_name == 'RBE2':
+        columns = {
+            'eid' : [card.eid for card in cards],
+            'gn' : [card.gn for card in cards],
+            'cm' : [int(card.cm) if card.cm else 0 for card in cards],
+            'alpha' : [card.alpha for card in cards],
+            'ngm' : [len(card.Gmi) for card in cards],
+            'gm' : [nid for card in cards for nid in card.Gmi],
+        }
+    elif card_name == 'FORCE':
+        columns = {
+            'sid' : [card.sid for card in cards],
+            'node' : [card.node for card in cards],
+            'cid' : [card.cid for card in cards],
+            'mag' : [card.mag for card in cards],
+            'xyz' : np.array([card.xyz for card in cards], dtype='float64').reshape(len(cards), 3),
+        }
+    else:
+        columns = {
+            'sid' : [card.sid for card in cards],
+            'eid' : [card.eids[0] for card in cards],
+            'eid2' : [card.eids[-1] for card in cards],
+            'pressures' : np.array([card.pressures for card in cards],
+                                   dtype='float64').reshape(len(cards), 4),
+            'g1' : [_int_or_default(card.g1, 0) for card in cards],
+            'g34' : [_int_or_default(card.g34, 0) for card in cards],
+            'cid' : [_int_or_default(card.cid, -1) for card in cards],
+            'nvector' : np.array([card.nvector for card in cards],
+                                 dtype='float64').reshape(len(cards), 3),
+            'surf_or_line' : np.array([card.surf_or_line for card in cards], dtype='U8'),
+            'line_load_dir' : np.array([card.line_load_dir for card in cards], dtype='U8'),
+        }
+
+    for name, values in columns.items():
+        if isinstance(values, list):
+            dtype = 'float64' if name in _FLOAT_COLUMNS else 'int64'
+            columns[name] = np.array(values, dtype=dtype)
+    return columns
+
+_FLOAT_COLUMNS = {'theta', 'zoffset', 'alpha', 'mag'}
+
+
+def parse_card_columns(card_name: str, cards_lines: List[List[str]],
+                       baror: Optional[BAROR]=None) -> Dict[str, np.ndarray]:
+    """
+    Parses a set of cards into columns
+
+    Parameters
+    ----------
+    card_name : str
+        the card name; see ``CARD_PARSERS``
+    cards_lines : List[card_lines]
+        the lines of each card (e.g., the ``card_lines`` of ``get_bdf_cards``)
+    baror : BAROR; default=None
+        the CBAR defaults
+
+    Returns
+    -------
+    columns : Dict[name] = (ncards, ...) ndarray
+        the columns (e.g., GRID: nid, cp, xyz, cd, ps, seid); see the
+        ``_parse_*`` functions
+
+    """
+    if card_name not in CARD_PARSERS:
+        raise ValueError('card_name=%r is not supported; supported=%s' % (
+            card_name, list(CARD_PARSERS)))
+    if len(cards_lines) == 0:
+        return get_columns_from_cards(card_name, [])
+
+    card = CardFields(get_card_fields(cards_lines, card_name))
+    columns = CARD_PARSERS[card_name](card, baror)
+
+    # the cards that the fast path can't check are created by the card class
+    iinvalid = np.where(~card.is_valid)[0]
+    if len(iinvalid) == 0:
+        return columns
+    cards = [_add_card(card_name, cards_lines[i], baror) for i in iinvalid]
+    card_columns = get_columns_from_cards(card_name, cards)
+    if card_name == 'RBE2':
+        return _set_rbe2_rows(columns, iinvalid, card_columns)
+
+    for name, values in card_columns.items():
+        column = columns[name]
+        if column.dtype.kind == 'U' and values.dtype.itemsize > column.dtype.itemsize:
+            column = columns[name] = column.astype(values.dtype)
+        column[iinvalid] = values
+    return columns
+
+
+def _set_rbe2_rows(columns: Dict[str, np.ndarray], irows: np.ndarray,
+                   row_columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """replaces the rows of the RBE2 columns"""
+    gms = np.split(columns['gm'], np.cumsum(columns['ngm'])[:-1])
+    row_gms = np.split(row_columns['gm'], np.cumsum(row_columns['ngm'])[:-1])
+    for irow, gm in zip(irows, row_gms):
+        gms[irow] = gm
+    for name in ['eid', 'gn', 'cm', 'alpha', 'ngm']:
+        columns[name][irows] = row_columns[name]
+    columns['gm'] = np.hstack(gms).astype('int64')
+    return columns
+
+
+def read_card_columns(bdf_filename: str, card_types: Optional[List[str]]=None,
+                      punch: bool=False, encoding: Optional[str]=None,
+                      log: Any=None, debug: bool=False) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Reads the high-volume cards of a BDF (including the INCLUDE files)
+    into columns without creating the card objects
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the BDF to read
+    card_types : List[str]; default=None -> all of CARD_PARSERS
+        the card types to read; the other cards are skipped
+    punch : bool; default=False
+        indicates whether the file is a punch file
+    encoding : str; default=None -> system default
+        the unicode encoding
+    log : logger; default=None
+        a logger
+    debug : bool; default=False
+        the debug flag for the logger
+
+    Returns
+    -------
+    card_columns : Dict[card_name] = Dict[name] = (ncards, ...) ndarray
+        the columns of the cards that are in the deck
+
+    .. note:: the superelement bulk data and the replicated ('=') cards
+              are skipped
+
+    """
+    cards_lines, baror = get_cards_lines(bdf_filename, card_types=card_types, punch=punch,
+                                         encoding=encoding, log=log, debug=debug)
+    card_columns = {}
+    for card_name, card_lines_list in cards_lines.items():
+        if card_lines_list:
+            card_columns[card_name] = parse_card_columns(card_name, card_lines_list,
+                                                         baror=baror)
+    return card_columns
+
+
+def get_cards_lines(bdf_filename: str, card_types: Optional[List[str]]=None,
+                    punch: bool=False, encoding: Optional[str]=None,
+                    log: Any=None, debug: bool=False) -> Tuple[Dict[str, List[List[str]]],
+                                                               Optional[BAROR]]:
+    """
+    Gets the unparsed high-volume cards of a BDF (see ``read_card_columns``)
+
+    Returns
+    -------
+    cards_lines : Dict[card_name] = List[card_lines]
+        the lines of each card
+    baror : BAROR / None
+        the CBAR defaults
+
+    """
+    from pyNastran.bdf.bdf import BDF
+    from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+    if card_types is None:
+        card_types = list(CARD_PARSERS)
+
+    model = BDF(log=log, debug=debug)
+    model._read_bdf_helper(bdf_filename, encoding, punch, read_includes=True)
+    model._parse_primary_file_header(bdf_filename)
+    obj = BDFInputPy(model.read_includes, model.dumplines, model._encoding,
+                     nastran_format=model.nastran_format,
+                     log=model.log, debug=model.debug)
+    out = obj.get_lines(bdf_filename, punch=model.punch, make_ilines=True)
+    bulk_data_lines, bulk_data_ilines = out[3], out[4]
+    cards_list, cards_dict, unused_card_count = model.get_bdf_cards(
+        bulk_data_lines, bulk_data_ilines)
+
+    if 'CBAR' in card_types:
+        for comment, card_lines, unused_ifile_iline in cards_dict.get('BAROR', []):
+            model.add_card(card_lines, 'BAROR', comment=comment, is_list=False, has_none=False)
+
+    nreplicated = 0
+    cards_lines = {card_type: [] for card_type in card_types}
+    for card_name, unused_comment, card_lines, unused_ifile_iline in cards_list:
+        if card_name in cards_lines:
+            cards_lines[card_name].append(card_lines)
+        elif card_name is not None and '=' in card_name:
+            nreplicated += 1
+    if nreplicated:
+        model.log.warning('skipping %i replicated cards' % nreplicated)
+    return cards_lines, model.baror
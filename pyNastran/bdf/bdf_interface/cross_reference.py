@@ -70,10 +70,51 @@ around the idea of cross-referencing, so it's recommended that you use it.
 # pylint: disable=R0902,R0904,R0914
 from collections import defaultdict
 import traceback
-from typing import List, Dict, Any
+from typing import List, Dict, Set, Any
 
-from numpy import zeros, argsort, arange, array_equal, array
+from numpy import zeros, argsort, arange, array_equal, array, isin
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.array_store import ElementStore
+
+XREF_ERRORS = (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError)
+
+MATERIAL_GROUPS = {
+    'materials', 'thermal_materials', 'hyperelastic_materials', 'creep_materials',
+    'MATS1', 'MATS3', 'MATS8',
+    'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9',
+}
+OPTIMIZATION_GROUPS = {'desvars', 'dresps', 'dvcrels', 'dvmrels', 'dvprels'}
+
+#: the xref groups (see ``cross_reference``) that are relinked when a card
+#: in the card group is replaced by a new object; the nodes and coords
+#: are referenced by most cards, so the full model is relinked
+XREF_DEPENDENT_GROUPS = {
+    'properties' : [],
+    'properties_mass' : [],
+    'elements' : ['loads', 'sets', 'optimization', 'contact'],
+    'masses' : ['loads', 'optimization'],
+    'rigid_elements' : [],
+    'plotels' : [],
+    'loads' : ['loads'],
+    'load_combinations' : ['loads'],
+    'dloads' : ['loads'],
+    'dload_entries' : ['loads'],
+    'spcs' : ['constraints'],
+    'spcadds' : ['constraints'],
+    'mpcs' : ['constraints'],
+    'mpcadds' : ['constraints'],
+}
+for _group in MATERIAL_GROUPS:
+    XREF_DEPENDENT_GROUPS[_group] = []
+for _group in OPTIMIZATION_GROUPS:
+    XREF_DEPENDENT_GROUPS[_group] = ['optimization']
+del _group
+
+#: elements that reference a material (rather than a property)
+MATERIAL_ELEMENT_TYPES = ['CONROD', 'CTRIAX6']
+
+#: the material id fields of the properties/elements
+MATERIAL_ID_NAMES = ['mid', 'mid1', 'mid2', 'mid3', 'mid4', 'mids']
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -104,7 +145,8 @@ class XrefMesh(BDFAttributes):
                         xref_aero: bool=True,
                         xref_sets: bool=True,
                         xref_optimization: bool=True,
-                        word: str='') -> None:
+                        word: str='',
+                        dirty_only: bool=False) -> None:
         """
         Links up all the cards to the cards they reference
 
@@ -132,6 +174,10 @@ class XrefMesh(BDFAttributes):
             set cross referencing of SETx
         word : str; default=''
             model flag
+        dirty_only : bool; default=False
+            only relink the cards that were added/updated/replaced since the
+            last cross_reference (and the cards that reference them);
+            the xref_* flags are ignored (see ``_cross_reference_dirty``)
 
         To only cross-reference nodes:
 
@@ -144,10 +190,26 @@ class XrefMesh(BDFAttributes):
                                             xref_aero=False, xref_masses=False,
                                             xref_sets=False)
 
+        To relink the cards of an optimization loop:
+
+        .. code-block:: python
+
+           model.read_bdf(bdf_filename, xref=True)
+           for pid, thickness in pid_to_thickness.items():
+               model.update_card('PSHELL', pid, 4, thickness)
+           model.cross_reference(dirty_only=True)
+
         .. warning:: be careful if you call this method with False values
         """
         if not xref:
             return
+        if dirty_only and self._is_xref:
+            self._cross_reference_dirty(word=word)
+            for super_id, superelement in sorted(self.superelement_models.items()):
+                superelement.cross_reference(
+                    dirty_only=True, word=' (Superelement %i)' % super_id)
+            return
+
         self.log.debug("Cross Referencing%s..." % word)
         if xref_nodes:
             self._cross_reference_nodes()
@@ -178,6 +240,9 @@ class XrefMesh(BDFAttributes):
         self._cross_reference_superelements()
         #self.case_control_deck.cross_reference(self)
         self.pop_xref_errors()
+        self._is_xref = True
+        self._xref_dirty.clear()
+        self._xref_replaced.clear()
 
         for super_id, superelement in sorted(self.superelement_models.items()):
             superelement.cross_reference(
@@ -189,6 +254,143 @@ class XrefMesh(BDFAttributes):
                 xref_sets=xref_sets, xref_optimization=xref_optimization,
                 word=' (Superelement %i)' % super_id)
 
+    def _cross_reference_dirty(self, word: str='') -> None:
+        """
+        Relinks the cards that were added/updated/replaced since the last
+        cross_reference and the cards that reference the replaced cards.
+
+        The changes are tracked by the ``_add_*_object`` methods,
+        ``update_card`` and ``replace_cards``.  Cards that are updated in
+        place (e.g., ``update_card``) keep their identity, so only the card is
+        relinked.  When a card is replaced by a new object, the cards that
+        reference it are relinked:
+
+         - the elements/masses/DVPRELs/DRESP1s of a replaced property are
+           relinked by property id
+         - the properties/elements/DVMRELs/MATTx/MATSx of a replaced
+           material are relinked by material id
+         - the other dependents (see ``XREF_DEPENDENT_GROUPS``) are relinked
+           by group (e.g., the loads for a replaced element)
+         - a replaced node/point/coord relinks the model
+
+        .. warning:: cards that are modified directly (e.g., ``prop.mid1 = 2``)
+                     or that are added to other card groups (e.g., aero) are
+                     not tracked; use cross_reference()
+        """
+        dirty = self._xref_dirty
+        replaced = self._xref_replaced
+        if not dirty and not replaced:
+            return
+        if any(group in replaced for group in ('nodes', 'points', 'coords')):
+            self.cross_reference(word=word)
+            return
+
+        self.log.debug("Cross Referencing%s (%i card groups)..." % (word, len(dirty)))
+        xref_groups = set()
+        for card_group in replaced:
+            xref_groups.update(XREF_DEPENDENT_GROUPS.get(card_group, []))
+
+        if 'coords' in dirty:
+            self._cross_reference_coordinates()
+        if 'properties' in replaced:
+            pids = replaced['properties']
+            self._cross_reference_dependent_cards(self.elements, pids)
+            self._cross_reference_property_optimization(pids)
+        if 'properties_mass' in replaced:
+            self._cross_reference_dependent_cards(self.masses, replaced['properties_mass'])
+        mids = set()
+        for card_group in MATERIAL_GROUPS.intersection(replaced):
+            mids.update(replaced[card_group])
+        if mids:
+            self._cross_reference_material_dependents(mids)
+
+        for card_group, keys in dirty.items():
+            if card_group == 'coords':
+                continue
+            cards = getattr(self, card_group)
+            for key in keys:
+                card = cards.get(key)
+                if card is None:
+                    continue
+                if isinstance(card, list):
+                    for cardi in card:
+                        self._cross_reference_card(cardi)
+                else:
+                    self._cross_reference_card(card)
+
+        xref_methods = [
+            ('properties', self._cross_reference_properties),
+            ('materials', self._cross_reference_materials),
+            ('constraints', self._cross_reference_constraints),
+            ('loads', self._cross_reference_loads),
+            ('sets', self._cross_reference_sets),
+            ('optimization', self._cross_reference_optimization),
+            ('contact', self._cross_reference_contact),
+        ]
+        for xref_group, xref_method in xref_methods:
+            if xref_group in xref_groups:
+                xref_method()
+        self.pop_xref_errors()
+        dirty.clear()
+        replaced.clear()
+
+    def _cross_reference_dependent_cards(self, cards: Dict[int, Any], pids: Set[int]) -> None:
+        """relinks the elements/masses that reference one of the properties"""
+        if isinstance(cards, ElementStore):
+            # only the proxies of the referencing rows are created
+            pids_array = array(sorted(pids), dtype='int64')
+            for table_name, table in cards.tables.items():
+                irows = isin(table['pid'], pids_array).nonzero()[0]
+                for eid in cards._get_keys(table_name)[irows].tolist():
+                    self._cross_reference_card(cards[eid])
+            cards = cards.objects
+        for card in cards.values():
+            if getattr(card, 'pid', None) in pids:
+                self._cross_reference_card(card)
+
+    def _cross_reference_property_optimization(self, pids: Set[int]) -> None:
+        """relinks the DVPRELs/DRESP1s that reference one of the properties"""
+        for dvprel in self.dvprels.values():
+            if dvprel.pid in pids:
+                self._cross_reference_card(dvprel)
+        for dresp in self.dresps.values():
+            if (dresp.type == 'DRESP1' and dresp.ptype.startswith('P') and
+                    not pids.isdisjoint(dresp.atti)):
+                self._cross_reference_card(dresp)
+
+    def _cross_reference_material_dependents(self, mids: Set[int]) -> None:
+        """
+        Relinks the properties, CONROD/CTRIAX6s, DVMRELs and MATTx/MATSx
+        that reference one of the materials
+        """
+        for prop in self.properties.values():
+            if not mids.isdisjoint(_get_material_ids(prop)):
+                self._cross_reference_card(prop)
+        for etype in MATERIAL_ELEMENT_TYPES:
+            for eid in self._type_to_id_map.get(etype, []):
+                elem = self.elements.get(eid)
+                if elem is not None and not mids.isdisjoint(_get_material_ids(elem)):
+                    self._cross_reference_card(elem)
+        for dvmrel in self.dvmrels.values():
+            if dvmrel.mid in mids:
+                self._cross_reference_card(dvmrel)
+        for card_group in sorted(MATERIAL_GROUPS):
+            materials = getattr(self, card_group)
+            for mid in mids:
+                material = materials.get(mid)
+                if material is not None:
+                    self._cross_reference_card(material)
+
+    def _cross_reference_card(self, card: Any) -> None:
+        """relinks a single card"""
+        try:
+            if card.type == 'GRID':
+                card.cross_reference(self, self.grdset)
+            else:
+                card.cross_reference(self)
+        except XREF_ERRORS as error:
+            self._store_xref_error(error, card)
+
     def _cross_reference_constraints(self) -> None:
         """
         Links the SPCADD, SPC, SPCAX, SPCD, MPCADD, MPC, SUPORT,
@@ -807,3 +1009,15 @@ class XrefMesh(BDFAttributes):
             # pyram elpr <= 0.5
             # pyram detj <= 0.
             # pyram warp <= 0.707
+
+
+def _get_material_ids(card: Any) -> List[int]:
+    """gets the material ids of a property/element (e.g., PSHELL mid1-mid4)"""
+    mids = []
+    for name in MATERIAL_ID_NAMES:
+        value = getattr(card, name, None)
+        if isinstance(value, list):
+            mids.extend(value)
+        elif value is not None:
+            mids.append(value)
+    return mids
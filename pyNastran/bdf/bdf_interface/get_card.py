@@ -17,6 +17,7 @@ defines various methods to access high level BDF data:
    - get_element_ids_list_with_pids(self, pids=None)
    - get_pid_to_node_ids_and_elements_array(self, pids=None, etypes=None, idtype='int32')
    - get_element_ids_dict_with_pids(self, pids=None, stop_if_no_eids=True)
+   - get_adjacency(self, rebuild=False)
    - get_node_id_to_element_ids_map(self)
    - get_node_id_to_elements_map(self)
    - get_property_id_to_element_ids_map(self)
@@ -29,12 +30,14 @@ defines various methods to access high level BDF data:
 # pylint: disable=C0103
 from copy import deepcopy
 from collections import defaultdict
-from typing import List, Dict, Set, Tuple, Optional, Union, Any
+from typing import List, Dict, Set, Tuple, Iterator, Optional, Union, Any
 
 import numpy as np
 
 from pyNastran.bdf.bdf_interface.get_methods import GetMethods
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.bdf_interface.array_store import ElementStore
+from pyNastran.bdf.bdf_interface.adjacency import AdjacencyIndex
 
 from pyNastran.bdf.mesh_utils.dvxrel import get_dvprel_ndarrays
 #from pyNastran.bdf.mesh_utils.forces_moments import (
@@ -106,6 +109,7 @@ class GetCard(GetMethods):
             card_types = [card_types]
         elif not isinstance(card_types, (list, tuple)):
             raise TypeError('card_types must be a list/tuple; type=%s' % type(card_types))
+        self.load_lazy_cards(card_types)
 
         #if reset_type_to_slot_map or self._type_to_slot_map is None:
             #self._type_to_slot_map = rslot_map
@@ -281,6 +285,7 @@ class GetCard(GetMethods):
         if not isinstance(card_types, (list, tuple)):
             raise TypeError(f'card_types={card_types!r} must be a list/tuple; '
                             f'type={type(card_types)}')
+        self.load_lazy_cards(card_types)
 
         #self._type_to_id_map = {
         #    'CQUAD4' : [1, 2, 3]
@@ -761,16 +766,6 @@ class GetCard(GetMethods):
                     msg = 'name=%r; allowed=%s' % (name, sorted(allowed_maps.keys()))
                     raise RuntimeError(msg)
 
-        eid_to_edge_map = {}
-        eid_to_nid_map = {}
-
-        edge_to_eid_map = defaultdict(set)
-        nid_to_edge_map = defaultdict(set)  #set() ???
-        nid_to_eid_map = defaultdict(set)
-
-        if eids is None:
-            eids = self.elements.keys()
-
         types_to_consider = []
         if consider_0d:
             types_to_consider += []
@@ -785,27 +780,25 @@ class GetCard(GetMethods):
         if consider_3d:
             types_to_consider += ['CTETRA', 'CPENTA', 'CPYRAM', 'CHEXA']
 
-        for eid in eids:
-            elem = self.elements[eid]
-            if elem.type not in types_to_consider:
-                continue
-            node_ids = elem.node_ids
-            edges = elem.get_edge_ids()
-            eid_to_edge_map[eid] = edges
-            eid_to_nid_map[eid] = node_ids
-
-            for nid in node_ids:
-                nid_to_eid_map[nid].add(eid)
-            for edge in edges:
-                assert not isinstance(edge, integer_types), 'edge=%s elem=\n%s' % (edge, elem)
-                assert edge[0] < edge[1], 'edge=%s elem=\n%s' % (edge, elem)
-                try:
-                    edge_to_eid_map[edge].add(eid)
-                except TypeError:
-                    print(elem)
-                    raise
-                for nid in edge:
-                    nid_to_edge_map[nid].add(tuple(edge))
+        adjacency = self.get_adjacency(rebuild=True)
+        ielements = adjacency.get_element_indices(eids, etypes=types_to_consider)
+        eid_to_edge_map = {eid: [] for eid in adjacency.eids[ielements].tolist()}
+        edge_to_eid_map = defaultdict(set)
+        nid_to_edge_map = defaultdict(set)  #set() ???
+        nid_to_eid_map = defaultdict(set)
+
+        ielement, iedges = adjacency.get_element_edges(ielements)
+        edge_eids = adjacency.eids[ielement].tolist()
+        edges = [tuple(edge) for edge in adjacency.edges[iedges].tolist()]
+        for eid, edge in zip(edge_eids, edges):
+            eid_to_edge_map[eid].append(edge)
+            edge_to_eid_map[edge].add(eid)
+            nid_to_edge_map[edge[0]].add(edge)
+            nid_to_edge_map[edge[1]].add(edge)
+
+        ielement, nids = adjacency.get_element_nodes(ielements)
+        for eid, nid in zip(adjacency.eids[ielement].tolist(), nids.tolist()):
+            nid_to_eid_map[nid].add(eid)
 
         out = {}
         allowed_maps = [
@@ -1011,6 +1004,13 @@ class GetCard(GetMethods):
             if not eids_list:
                 continue
             etypes_found.append(etype)
+            if isinstance(self.elements, ElementStore):
+                arrays = self.elements.get_element_type_arrays(
+                    etype, dtype, solids.get(etype))
+                if arrays is not None:
+                    output.update(arrays)
+                    continue
+
             eids = np.array(eids_list, dtype=dtype)
             neids = len(eids)
             eid0 = eids[0]
@@ -1084,7 +1084,7 @@ class GetCard(GetMethods):
                     etype_min = elem.type + str(nnodes_min)
                     ieids_min = np.array(ieids_min, dtype=dtype)
                     output[etype_min] = [eids[ieids_min], pids[ieids_min], nids[ieids_min, :nnodes_min]]
-        if stop_if_no_eids:
+        if not len(output) and stop_if_no_eids:
             msg = (
                 'get_elements_properties_nodes_by_element_type output is empty; '
                 'nelements=%s; etypes_found=%s' % (
@@ -1361,6 +1361,60 @@ class GetCard(GetMethods):
             self.log.warning('no elements with properties found%s' % msg)
         return pid_to_eids_map
 
+    def get_adjacency(self, rebuild: bool=False) -> AdjacencyIndex:
+        """
+        Gets the node/element adjacency index (e.g., node -> elements,
+        element -> edges, element -> neighbors)
+
+        The index is cached until a node/element is added, replaced or
+        updated (see ``_mark_xref_dirty``).
+
+        Parameters
+        ----------
+        rebuild : bool; default=False
+            rebuild the index; required if the nodes of an element were
+            changed in place (e.g., ``elem.nodes = [...]``)
+
+        Returns
+        -------
+        adjacency : AdjacencyIndex
+            the index (see ``adjacency.py``)
+
+        """
+        adjacency = getattr(self, '_adjacency', None)
+        if rebuild or adjacency is None or not adjacency.is_current(self.elements):
+            adjacency = AdjacencyIndex(self.elements)
+            self._adjacency = adjacency
+        return adjacency
+
+    def _get_node_id_to_element_ids(self, nid_to_eids_map: Dict[int, List[Any]]) -> Iterator[Tuple[int, List[int]]]:
+        """
+        Gets the element ids of each node in the order of ``self.elements``
+
+        The index is rebuilt because the nodes of an element may have
+        been changed in place.  A node that isn't in nid_to_eids_map
+        raises a KeyError.
+        """
+        adjacency = self.get_adjacency(rebuild=True)
+        # the position of each element in self.elements (e.g., a CCONEAX
+        # isn't indexed)
+        all_eids = np.array(list(self.elements.keys()), dtype='int64')
+        ielements = np.searchsorted(adjacency.eids, all_eids)
+        ielements[ielements == len(adjacency.eids)] = 0
+        is_indexed = adjacency.eids[ielements] == all_eids if len(adjacency.eids) else []
+        iorder = np.zeros(len(adjacency.eids), dtype='int64')
+        iorder[ielements[is_indexed]] = np.flatnonzero(is_indexed)
+
+        # sort the elements of each node by the element order
+        inodes = np.repeat(np.arange(len(adjacency.nids)), np.diff(adjacency.node_offsets))
+        isort = np.lexsort((iorder[adjacency.node_elements], inodes))
+        eids = adjacency.eids[adjacency.node_elements[isort]].tolist()
+        offsets = adjacency.node_offsets.tolist()
+        for nid, i0, i1 in zip(adjacency.nids.tolist(), offsets[:-1], offsets[1:]):
+            if nid not in nid_to_eids_map:
+                raise KeyError(nid)
+            yield nid, eids[i0:i1]
+
     def get_node_id_to_element_ids_map(self) -> Dict[int, List[int]]:
         """
         Returns a dictionary that maps node IDs to a list of elemnent IDs
@@ -1378,22 +1432,8 @@ class GetCard(GetMethods):
             for nid in sorted(self.spoints):  # SPOINTs
                 nid_to_eids_map[nid] = []
 
-        skip_cards = {
-            'CCONEAX',
-        }
-        for (eid, element) in self.elements.items():  # load the mapper
-            if element.type in skip_cards:
-                continue
-            try:
-                # not supported for 0-D and 1-D elements
-                nids = element.node_ids
-            except AttributeError:
-                print(element.type)
-            else:
-                for nid in nids:  # (e.g. CQUAD8 with missing node)
-                    if nid:
-                        nid_to_eids_map[nid].append(eid)
-
+        for nid, eids in self._get_node_id_to_element_ids(nid_to_eids_map):
+            nid_to_eids_map[nid] = eids
         return nid_to_eids_map
 
     def get_node_id_to_elements_map(self) -> Dict[int, List[int]]:
@@ -1419,23 +1459,9 @@ class GetCard(GetMethods):
         for nid in self.epoints:
             nid_to_elements_map[nid] = []
 
-        skip_cards = {
-            'CCONEAX',
-        }
-        for element in self.elements.values():  # load the mapper
-            if element.type in skip_cards:
-                continue
-
-            try:
-                # not supported for 0-D and 1-D elements
-                nids = element.node_ids
-            except AttributeError:
-                print(element.type)
-            else:
-                for nid in nids:  # (e.g. CQUAD8 with missing node)
-                    if nid:
-                        nid_to_elements_map[nid].append(element)
-
+        elements = self.elements
+        for nid, eids in self._get_node_id_to_element_ids(nid_to_elements_map):
+            nid_to_elements_map[nid] = [elements[eid] for eid in eids]
         return nid_to_elements_map
 
     def get_property_id_to_element_ids_map(self, msg: str='') -> Dict[int, List[int]]:
@@ -0,0 +1,155 @@
+"""
+Defines the card index that is used by ``read_bdf(lazy=True)``.  Defines:
+
+ - LazyCards(cards_list)
+   - index_cards(model)
+   - pop_icards(card_types)
+ - get_lazy_slot(model, card_name)
+
+The bulk data lines (including the INCLUDE files) are split into cards
+without parsing them.  The cards that fill the large dictionaries
+(e.g., nodes, elements, properties) are indexed by card name, so they may
+be parsed the first time the dictionary (e.g., ``model.elements``) is used
+or when the card type is requested (e.g., ``model.load_lazy_cards(['GRID'])``).
+The other cards are parsed like normal.
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Set, Optional, Any, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the add methods that only fill a single dictionary
+LAZY_ADD_METHODS = {
+    '_add_node_object' : 'nodes',
+    '_add_coord_object' : 'coords',
+    '_add_element_object' : 'elements',
+    '_add_damper_object' : 'elements',
+    '_add_thermal_element_object' : 'elements',
+    '_add_mass_object' : 'masses',
+    '_add_rigid_element_object' : 'rigid_elements',
+    '_add_property_object' : 'properties',
+    '_add_acoustic_property_object' : 'properties',
+    '_add_structural_material_object' : 'materials',
+    '_add_load_object' : 'loads',
+    '_add_constraint_spc_object' : 'spcs',
+}
+
+#: the cards with a _prepare_* method that only fill a single dictionary
+LAZY_PREPARE_CARDS = {
+    'CBAR' : 'elements',
+    'CBEAM' : 'elements',
+    'CTETRA' : 'elements',
+    'CPYRAM' : 'elements',
+    'CPENTA' : 'elements',
+    'CHEXA' : 'elements',
+}
+
+
+class LazyCards:
+    """stores the unparsed cards of a ``read_bdf(lazy=True)`` model"""
+    def __init__(self, cards_list: List[List[Any]]) -> None:
+        """
+        Parameters
+        ----------
+        cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+            the unparsed cards from ``get_bdf_cards``
+
+        """
+        self.cards_list = cards_list
+
+        #: card_name -> [icard, ...] of the unparsed cards
+        self.card_icards = {}  # type: Dict[str, List[int]]
+
+        #: card_name -> the dictionary (e.g., 'elements') that the card fills
+        self.card_slot = {}  # type: Dict[str, str]
+
+        #: slot -> {card_name, ...} of the unparsed cards
+        self.slot_card_names = {}  # type: Dict[str, Set[str]]
+
+        #: slot -> the partially loaded dictionary, which is removed from the
+        #: model, so the model loads the other cards when it's used
+        self.slot_objects = {}  # type: Dict[str, Dict[int, Any]]
+
+    def index_cards(self, model: BDF) -> List[int]:
+        """
+        Indexes the cards that may be parsed lazily
+
+        A dictionary (e.g., 'properties') is only loaded lazily if all the
+        cards that fill it (e.g., PSHELL, PELAS) may be parsed lazily, so
+        the dictionary has the same order as a normal read.
+
+        Parameters
+        ----------
+        model : BDF
+            the model, which defines the supported/rejected cards
+
+        Returns
+        -------
+        icards : List[int]
+            the cards that are parsed now; replicated cards (e.g., '=')
+            go with the card that they replicate
+
+        """
+        card_names = []
+        card_name0 = None
+        for card in self.cards_list:
+            card_name = card[0]
+            if card_name is not None and '=' in card_name:
+                card_name = card_name0
+            else:
+                card_name0 = card_name
+            card_names.append(card_name)
+
+        rslot_map = model.get_rslot_map()
+        blocked_slots = set()
+        for card_name in set(card_names):
+            if card_name not in model.cards_to_read:
+                continue
+            slot = get_lazy_slot(model, card_name)
+            slot_expected = rslot_map.get(card_name)
+            if slot == slot_expected:
+                self.card_slot[card_name] = slot
+            else:
+                blocked_slots.update({slot, slot_expected})
+
+        icards = []
+        for icard, card_name in enumerate(card_names):
+            slot = self.card_slot.get(card_name)
+            if slot is None or slot in blocked_slots:
+                icards.append(icard)
+                continue
+            self.card_icards.setdefault(card_name, []).append(icard)
+            self.slot_card_names.setdefault(slot, set()).add(card_name)
+        self.card_slot = {card_name: slot for card_name, slot in self.card_slot.items()
+                          if card_name in self.card_icards}
+        return icards
+
+    def pop_icards(self, card_types: List[str]) -> List[int]:
+        """removes the cards from the index and returns them in the order of the deck"""
+        icards = []
+        for card_type in card_types:
+            icards.extend(self.card_icards.pop(card_type))
+            slot = self.card_slot[card_type]
+            card_names = self.slot_card_names[slot]
+            card_names.remove(card_type)
+            if not card_names:
+                del self.slot_card_names[slot]
+        icards.sort()
+        return icards
+
+    def __repr__(self) -> str:
+        ncards = sum(len(icards) for icards in self.card_icards.values())
+        return 'LazyCards(ncards=%s, slots=%s)' % (ncards, sorted(self.slot_card_names))
+
+
+def get_lazy_slot(model: BDF, card_name: str) -> Optional[str]:
+    """
+    Gets the dictionary (e.g., 'elements') that a card fills if the card may
+    be parsed lazily.  Cards that fill multiple attributes or that the
+    following cards depend on (e.g., GRDSET, BAROR) are parsed like normal.
+    """
+    if card_name in model._card_parser:
+        unused_card_class, add_card_function = model._card_parser[card_name]
+        return LAZY_ADD_METHODS.get(getattr(add_card_function, '__name__', None))
+    return LAZY_PREPARE_CARDS.get(card_name)
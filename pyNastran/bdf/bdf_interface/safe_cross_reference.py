@@ -84,6 +84,9 @@ class SafeXrefMesh(XrefMesh):
         self._safe_cross_reference_superelements(create_superelement_geometry)
 
         self.pop_xref_errors()
+        self._is_xref = True
+        self._xref_dirty.clear()
+        self._xref_replaced.clear()
         for super_id, superelement in sorted(self.superelement_models.items()):
             superelement.safe_cross_reference(
                 xref=xref, xref_nodes=xref_nodes, xref_elements=xref_elements,
@@ -0,0 +1,189 @@
+"""
+Defines the binary snapshot format that's used by ``BDF.save_snapshot``
+and ``BDF.load_snapshot``.  Defines:
+
+ - save_snapshot(model, snapshot_filename)
+ - load_snapshot(snapshot_filename, model, mmap=True)
+
+A snapshot is a single file:
+
+ - the prefix: the magic bytes, the format version and the offset to the
+   header
+ - the arrays, each aligned to 64 bytes
+ - the header (JSON): the name/dtype/shape/offset of each array
+
+The GRIDs and the CQUAD4/CTRIA3/CTETRA/CHEXA elements are stored as the
+typed arrays of the array store (see ``array_store.py``), so they're not
+pickled.  The other cards (e.g., properties, loads, the case control
+deck) are a much smaller part of a big model and are pickled into the
+``records`` array.
+
+The arrays can be memory-mapped (copy-on-write), so a big model reopens
+without reading the GRID/element arrays; the pages are read when they're
+used.
+
+"""
+from __future__ import annotations
+import os
+import json
+import pickle
+import struct
+from copy import copy
+from typing import List, Dict, Any, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+SNAPSHOT_MAGIC = b'BDFSNAP\x00'
+SNAPSHOT_VERSION = 1
+
+#: magic, version, header offset
+_PREFIX = struct.Struct('<8sIQ')
+_ALIGNMENT = 64
+
+NODE_ARRAYS = ['nid_cp_cd', 'xyz', 'ps', 'seid']
+ELEMENT_ARRAYS = ['_eids', '_itable', '_irow']
+
+
+def save_snapshot(model: BDF, snapshot_filename: str) -> None:
+    """
+    Saves a model as a snapshot
+
+    Parameters
+    ----------
+    model : BDF
+        the model, which must not be cross-referenced
+    snapshot_filename : str
+        the path to the snapshot
+
+    """
+    nodes = model.nodes if isinstance(model.nodes, NodeStore) else NodeStore(model.nodes)
+    elements = (model.elements if isinstance(model.elements, ElementStore)
+                else ElementStore(model.elements))
+    nodes.compress()
+    elements.compress()
+
+    arrays = {}  # type: Dict[str, np.ndarray]
+    for name in NODE_ARRAYS:
+        arrays['nodes/' + name] = getattr(nodes, name)
+    for name in ELEMENT_ARRAYS:
+        arrays['elements/' + name] = getattr(elements, name)
+    for table_name, table in elements.tables.items():
+        for name, values in table.items():
+            arrays['elements/%s/%s' % (table_name, name)] = values
+
+    # the stores without the arrays
+    state = model.__getstate__()
+    state['nodes'] = _get_store_skeleton(nodes, NODE_ARRAYS)
+    element_skeleton = _get_store_skeleton(elements, ELEMENT_ARRAYS)
+    element_skeleton.tables = {}
+    state['elements'] = element_skeleton
+
+    # ZONA points back to the model
+    zona = copy(model.zona)
+    zona.model = None
+    state['zona'] = zona
+    records = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    arrays['records'] = np.frombuffer(records, dtype='uint8')
+
+    # the arrays may be memory-mapped from snapshot_filename, so the old
+    # file is replaced rather than overwritten
+    tmp_filename = snapshot_filename + '.tmp'
+    with open(tmp_filename, 'wb') as snapshot_file:
+        snapshot_file.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0))
+        array_headers = []
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            offset = _align(snapshot_file)
+            snapshot_file.write(values.tobytes())
+            array_headers.append([name, values.dtype.str, list(values.shape), offset])
+
+        header_offset = snapshot_file.tell()
+        header = {'version' : SNAPSHOT_VERSION, 'arrays' : array_headers}
+        snapshot_file.write(json.dumps(header).encode('utf8'))
+        snapshot_file.seek(0)
+        snapshot_file.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, header_offset))
+    os.replace(tmp_filename, snapshot_filename)
+
+
+def load_snapshot(snapshot_filename: str, model: BDF, mmap: bool=True) -> None:
+    """
+    Loads a snapshot into a model
+
+    Parameters
+    ----------
+    snapshot_filename : str
+        the path to the snapshot
+    model : BDF
+        the model to load the cards into
+    mmap : bool; default=True
+        memory-map the arrays (copy-on-write, so the arrays can be changed
+        without changing the file); False reads the arrays
+
+    """
+    header = _read_header(snapshot_filename)
+    arrays = {}  # type: Dict[str, np.ndarray]
+    with open(snapshot_filename, 'rb') as snapshot_file:
+        for name, dtype, shape, offset in header['arrays']:
+            shape = tuple(shape)
+            count = int(np.prod(shape))
+            if name == 'records' or not mmap or count == 0:
+                snapshot_file.seek(offset)
+                values = np.fromfile(snapshot_file, dtype=dtype, count=count).reshape(shape)
+            else:
+                values = np.asarray(np.memmap(snapshot_filename, dtype=dtype, mode='c',
+                                              offset=offset, shape=shape))
+            arrays[name] = values
+
+    state = pickle.loads(arrays.pop('records').tobytes())
+    nodes = state['nodes']
+    elements = state['elements']
+    for name in NODE_ARRAYS:
+        setattr(nodes, name, arrays.pop('nodes/' + name))
+    for name in ELEMENT_ARRAYS:
+        setattr(elements, name, arrays.pop('elements/' + name))
+    for key, values in arrays.items():
+        unused_elements, table_name, name = key.split('/')
+        elements.tables.setdefault(table_name, {})[name] = values
+
+    model.__dict__.update(state)
+    model.zona.model = model
+    if model.case_control_deck is not None:
+        model.case_control_deck.log = model.log
+    for super_model in model.superelement_models.values():
+        super_model.log = model.log
+
+
+def _read_header(snapshot_filename: str) -> Dict[str, Any]:
+    """reads the header of a snapshot"""
+    with open(snapshot_filename, 'rb') as snapshot_file:
+        prefix = snapshot_file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size or prefix[:8] != SNAPSHOT_MAGIC:
+            raise RuntimeError('%r is not a BDF snapshot' % snapshot_filename)
+        unused_magic, version, header_offset = _PREFIX.unpack(prefix)
+        if version > SNAPSHOT_VERSION:
+            raise RuntimeError('%r is snapshot version %s; the supported version is %s' % (
+                snapshot_filename, version, SNAPSHOT_VERSION))
+        snapshot_file.seek(header_offset)
+        header = json.loads(snapshot_file.read().decode('utf8'))
+    return header
+
+
+def _get_store_skeleton(store: Any, names: List[str]) -> Any:
+    """gets a copy of a NodeStore/ElementStore without the arrays"""
+    skeleton = store.__class__.__new__(store.__class__)
+    skeleton.__dict__.update(store.__getstate__())
+    for name in names:
+        setattr(skeleton, name, None)
+    return skeleton
+
+
+def _align(snapshot_file: Any) -> int:
+    """pads the file to the alignment and gets the offset"""
+    offset = snapshot_file.tell()
+    npad = -offset % _ALIGNMENT
+    if npad:
+        snapshot_file.write(b'\x00' * npad)
+    return offset + npad
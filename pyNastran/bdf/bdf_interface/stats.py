@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Mapping
 from typing import List, Set, Dict, Any, Union, TYPE_CHECKING
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -278,7 +279,7 @@ def get_bdf_stats(model: BDF, return_type: str='string',
 
         groups = set() # type: Set[str]
 
-        if not isinstance(card_group, dict):
+        if not isinstance(card_group, Mapping):
             msgi = '%s is a %s; not dictionary, which is required by get_bdf_stats()' % (
                 card_group_name, type(card_group))
             model.log.error(msgi)
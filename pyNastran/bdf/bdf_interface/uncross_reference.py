@@ -1,6 +1,7 @@
 """Unlinks up the various cards in the BDF."""
 from typing import List, Dict, Any
 from pyNastran.bdf.bdf_interface.safe_cross_reference import SafeXrefMesh
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore
 
 class UnXrefMesh(SafeXrefMesh):
     """
@@ -28,13 +29,16 @@ class UnXrefMesh(SafeXrefMesh):
         self._uncross_reference_optimization()
         self._uncross_reference_contact()
         self._uncross_reference_superelements()
+        self._is_xref = False
+        self._xref_dirty.clear()
+        self._xref_replaced.clear()
 
         for super_id, superelement in sorted(self.superelement_models.items()):
             superelement.uncross_reference(word=' (Superelement %i)' % super_id)
 
     def _uncross_reference_nodes(self) -> None:
         """uncross references the GRID objects"""
-        for node in self.nodes.values():
+        for node in _get_xref_values(self.nodes):
             node.uncross_reference()
         for point in self.points.values():
             point.uncross_reference()
@@ -48,7 +52,7 @@ class UnXrefMesh(SafeXrefMesh):
 
     def _uncross_reference_elements(self) -> None:
         """uncross references the element objects"""
-        for element in self.elements.values():
+        for element in _get_xref_values(self.elements):
             try:
                 element.uncross_reference()
             except TypeError:
@@ -268,3 +272,10 @@ class UnXrefMesh(SafeXrefMesh):
             desvar.uncross_reference()
         for unused_key, topvar in self.topvar.items():
             topvar.uncross_reference()
+
+
+def _get_xref_values(cards: Dict[int, Any]) -> Any:
+    """the unused proxies of a NodeStore/ElementStore aren't cross-referenced"""
+    if isinstance(cards, (NodeStore, ElementStore)):
+        return cards.used_values()
+    return cards.values()
@@ -7,6 +7,7 @@ defines:
 from __future__ import annotations
 import sys
 import traceback
+from collections.abc import Mapping
 from typing import List, Dict, Tuple, Any, TYPE_CHECKING
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -332,7 +333,7 @@ def _validate_dict_list(model: BDF, objects_dict: Dict[Any, Any]) -> None:
 
 def _validate_dict(model: BDF, objects: Dict[Any, Any]) -> None:
     """helper method for validate_bdf"""
-    assert isinstance(objects, dict), type(objects)
+    assert isinstance(objects, Mapping), type(objects)
     ifailed = 0
     nmax_failed = 0
     for unused_id, obj in sorted(objects.items()):
@@ -12,6 +12,8 @@ from typing import List, Dict, Union, Optional, Tuple, Any, cast
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_cards, write_card_dict
+from pyNastran.bdf.bdf_interface.write_mesh_parallel import write_sections_parallel
 from pyNastran.bdf.cards.nodes import write_xpoints
 
 
@@ -81,7 +83,7 @@ class WriteMesh(BDFAttributes):
                   encoding: Optional[str]=None,
                   size: int=8, is_double: bool=False,
                   interspersed: bool=False, enddata: Optional[bool]=None,
-                  write_header: bool=True, close: bool=True) -> None:
+                  write_header: bool=True, close: bool=True, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -113,6 +115,10 @@ class WriteMesh(BDFAttributes):
             flag for writing the pyNastran header
         close : bool; default=True
             should the output file be closed
+        nworkers : int; default=1
+            the number of worker processes that write the sections of
+            the bulk data (e.g., the nodes, the elements, the loads);
+            the file is the same as for nworkers=1
 
         """
         is_long_ids = False
@@ -154,33 +160,77 @@ class WriteMesh(BDFAttributes):
                 superelement.write_bdf(out_filename=bdf_file, encoding=encoding,
                                        size=size, is_double=is_double,
                                        interspersed=interspersed, enddata=False,
-                                       write_header=False, close=False)
+                                       write_header=False, close=False, nworkers=nworkers)
                 bdf_file.write('$' + '*'*80+'\n')
             bdf_file.write('BEGIN BULK\n')
 
-        self._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_nodes(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        if interspersed:
-            self._write_elements_interspersed(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        sections = self._get_write_sections(interspersed)
+        if nworkers > 1:
+            write_sections_parallel(self, bdf_file, sections, size, is_double, is_long_ids,
+                                    nworkers)
         else:
-            self._write_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-            self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids)
-            #self._write_properties_by_element_type(bdf_file, size, is_double, is_long_ids)
-        self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        self._write_masses(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        # split out for write_bdf_symmetric
-        self._write_rigid_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        self._write_common(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            for method_name, kwargs in sections:
+                getattr(self, method_name)(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                                           **kwargs)
         if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
             bdf_file.write('ENDDATA\n')
         if close:
             bdf_file.close()
 
+    def _get_write_sections(self, interspersed: bool=False) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Gets the sections of the bulk data in the order they're written
+
+        Returns
+        -------
+        sections : List[(method_name, kwargs)]
+            the write methods, which are called as
+            ``method(bdf_file, size, is_double, is_long_ids=is_long_ids, **kwargs)``
+
+        """
+        sections = [('_write_params', {}), ('_write_nodes', {})]
+        if interspersed:
+            sections.append(('_write_elements_interspersed', {}))
+        else:
+            sections += [('_write_elements', {}), ('_write_properties', {})]
+            #sections.append(('_write_properties_by_element_type', {}))
+        sections += [
+            ('_write_materials', {}),
+            ('_write_masses', {}),
+
+            # split out for write_bdf_symmetric
+            ('_write_rigid_elements', {}),
+            ('_write_aero', {}),
+        ]
+        sections += self._get_common_sections()
+        return sections
+
+    def _get_common_sections(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """gets the sections of ``_write_common``"""
+        write_aero_in_flutter, write_aero_in_gust = self._find_aero_location()
+        sections = [
+            ('_write_dmigs', {}),
+            ('_write_loads', {}),
+            ('_write_dynamic', {}),
+            ('_write_aero_control', {}),
+            ('_write_static_aero', {}),
+            ('_write_flutter', {'write_aero_in_flutter' : write_aero_in_flutter}),
+            ('_write_gust', {'write_aero_in_gust' : write_aero_in_gust}),
+            ('_write_thermal', {}),
+            ('_write_thermal_materials', {}),
+            ('_write_constraints', {}),
+            ('_write_optimization', {}),
+            ('_write_tables', {}),
+            ('_write_sets', {}),
+            ('_write_superelements', {}),
+            ('_write_contact', {}),
+            ('_write_parametric', {}),
+            ('_write_rejects', {}),
+            ('_write_coords', {}),
+            ('_write_acmodl', {}),
+        ]
+        return sections
+
     def _write_header(self, bdf_file: Any, encoding: str, write_header: bool=True) -> None:
         """Writes the executive and case control decks."""
         if self.punch is None:
@@ -244,13 +294,7 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(self.elements.items()):
                     bdf_file.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(self.elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except:
-                        print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
-                        raise
+                write_card_dict(bdf_file, self.elements, size, is_double)
         if self.ao_element_flags:
             for (eid, element) in sorted(self.ao_element_flags.items()):
                 bdf_file.write(element.write_card(size, is_double))
@@ -449,33 +493,16 @@ class WriteMesh(BDFAttributes):
             is this double precision
 
         """
-        self._write_dmigs(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_loads(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_dynamic(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_aero_control(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_static_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        write_aero_in_flutter, write_aero_in_gust = self._find_aero_location()
-        self._write_flutter(bdf_file, size, is_double, write_aero_in_flutter,
-                            is_long_ids=is_long_ids)
-        self._write_gust(bdf_file, size, is_double, write_aero_in_gust, is_long_ids=is_long_ids)
-
-        self._write_thermal(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_thermal_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_constraints(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_optimization(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_tables(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_sets(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_superelements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_contact(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_parametric(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_rejects(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_coords(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        for method_name, kwargs in self._get_common_sections():
+            getattr(self, method_name)(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                                       **kwargs)
 
+    def _write_acmodl(self, bdf_file: Any, size: int=8, is_double: bool=False,
+                      is_long_ids: Optional[bool]=None) -> None:
+        """Writes the ACMODL"""
         if self.acmodl:
             bdf_file.write(self.acmodl.write_card(size, is_double))
 
-
     def _write_constraints(self, bdf_file: Any, size: int=8, is_double: bool=False,
                            is_long_ids: Optional[bool]=None) -> None:
         """Writes the constraint cards sorted by ID"""
@@ -662,14 +689,9 @@ class WriteMesh(BDFAttributes):
                                   % (load.type, key))
                             raise
             else:
-                for (key, loadcase) in sorted(self.loads.items()):
-                    for load in loadcase:
-                        try:
-                            bdf_file.write(load.write_card(size, is_double))
-                        except:
-                            print('failed printing load...type=%s key=%r'
-                                  % (load.type, key))
-                            raise
+                loads = [load for (unused_key, loadcase) in sorted(self.loads.items())
+                         for load in loadcase]
+                write_cards(bdf_file, loads, size, is_double)
 
             for unused_key, tempd in sorted(self.tempds.items()):
                 bdf_file.write(tempd.write_card(size, is_double))
@@ -815,7 +837,10 @@ class WriteMesh(BDFAttributes):
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            _write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            if is_long_ids:
+                _write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            else:
+                write_card_dict(bdf_file, self.nodes, size, is_double)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -1082,13 +1107,7 @@ class WriteMesh(BDFAttributes):
                               'type=%s eid=%s' % (element.type, eid))
                         raise
             else:
-                for (eid, element) in sorted(self.rigid_elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except:
-                        print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
-                        raise
+                write_card_dict(bdf_file, self.rigid_elements, size, is_double)
         if self.plotels:
             bdf_file.write('$PLOT ELEMENTS\n')
             _write_dict(bdf_file, self.plotels, size, is_double, is_long_ids)
@@ -0,0 +1,670 @@
+"""
+Defines the bulk writer that ``write_bdf`` uses for the high-volume
+cards.  Defines:
+
+ - write_cards(bdf_file, cards, size, is_double)
+ - write_card_dict(bdf_file, cards, size, is_double)
+
+The GRID, CQUAD4, CTRIA3, CTETRA, CHEXA, CBAR, RBE2, FORCE and PLOAD4
+cards are grouped by type and their fields are gathered into NumPy
+columns.  Each float is formatted once per unique value (e.g., with
+``print_float_8``), so the output is the same as ``card.write_card``,
+and the cards are written with a template per card type.  A card that
+the templates don't cover (e.g., a card with a comment or a CQUAD4 with
+a non-default thickness in large field) is written with
+``card.write_card``.
+
+The cards are written in chunks of ``CHUNK_SIZE`` cards.  The
+NodeStore/ElementStore arrays (see ``array_store.py``) are used directly,
+so the proxy cards aren't created.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Optional, Callable, Any
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types, float_types
+from pyNastran.bdf.field_writer_8 import print_card_8, print_float_8
+from pyNastran.bdf.field_writer_16 import print_card_16, print_float_16
+from pyNastran.bdf.field_writer_double import print_scientific_double
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.rigid import RBE2
+from pyNastran.bdf.cards.loads.static_loads import FORCE, PLOAD4
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore
+
+#: the number of cards that are joined into one write
+CHUNK_SIZE = 100000
+
+BLANK8 = ' ' * 8
+
+
+def write_card_dict(bdf_file: Any, cards: Dict[int, Any], size: int=8,
+                    is_double: bool=False) -> None:
+    """
+    Writes a dictionary of cards sorted by id (e.g., ``model.nodes``)
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : Dict[id] = card
+        the cards; NodeStore/ElementStore are supported
+    size : int; default=8
+        the field size
+    is_double : bool; default=False
+        the large field double precision flag
+
+    """
+    if isinstance(cards, NodeStore):
+        _write_node_store(bdf_file, cards, size, is_double)
+    elif isinstance(cards, ElementStore):
+        _write_element_store(bdf_file, cards, size, is_double)
+    else:
+        write_cards(bdf_file, [card for unused_id, card in sorted(cards.items())],
+                    size, is_double)
+
+
+def write_cards(bdf_file: Any, cards: List[Any], size: int=8,
+                is_double: bool=False) -> None:
+    """
+    Writes a list of cards in order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : List[card]
+        the cards
+    size : int; default=8
+        the field size
+    is_double : bool; default=False
+        the large field double precision flag
+
+    """
+    for i0 in range(0, len(cards), CHUNK_SIZE):
+        bdf_file.write(''.join(get_cards_text(cards[i0:i0+CHUNK_SIZE], size, is_double)))
+
+
+def get_cards_text(cards: List[Any], size: int=8, is_double: bool=False) -> List[str]:
+    """
+    Gets the text of each card, which is the same as ``card.write_card``
+
+    Parameters
+    ----------
+    cards : List[card]
+        the cards
+    size : int; default=8
+        the field size
+    is_double : bool; default=False
+        the large field double precision flag
+
+    Returns
+    -------
+    texts : List[str]
+        the text of each card
+
+    """
+    icards_by_type = defaultdict(list)  # type: Dict[Any, List[int]]
+    for i, card in enumerate(cards):
+        icards_by_type[card.__class__].append(i)
+
+    texts = [None] * len(cards)  # type: List[Optional[str]]
+    for card_class, icards in icards_by_type.items():
+        func = OBJECT_WRITERS.get(card_class)
+        if func is None:
+            continue
+        group_texts = func([cards[i] for i in icards], size, is_double)
+        for i, text in zip(icards, group_texts):
+            texts[i] = text
+
+    for i, text in enumerate(texts):
+        if text is None:
+            texts[i] = cards[i].write_card(size, is_double)
+    return texts
+
+
+def _write_node_store(bdf_file: Any, nodes: NodeStore, size: int, is_double: bool) -> None:
+    """writes the GRID arrays and the other nodes"""
+    nodes.compress()
+    nid_cp_cd = nodes.nid_cp_cd
+    nids = nid_cp_cd[:, 0]
+    texts = get_grids_text(
+        nids, nid_cp_cd[:, 1], nid_cp_cd[:, 2],
+        [str(ps) if ps else '' for ps in nodes.ps.tolist()],
+        nodes.seid, nodes.xyz, size, is_double)
+    for nid in nodes.comments:
+        texts[nodes._index(nid)] = nodes[nid].write_card(size, is_double)
+    _write_sorted(bdf_file, [nids], [texts], nodes.objects, size, is_double)
+
+
+def _write_element_store(bdf_file: Any, elements: ElementStore, size: int,
+                         is_double: bool) -> None:
+    """writes the element tables and the other elements"""
+    elements.compress()
+    table_eids = []
+    table_texts = []
+    for table_name, table in elements.tables.items():
+        eids = table['eid']
+        if not len(eids):
+            continue
+        pids = table['pid']
+        if table_name in ('CQUAD4', 'CTRIA3'):
+            texts = get_shells_text(
+                table_name, eids, pids, table['nodes'], table['theta'], table['mcid'],
+                table['zoffset'], table['tflag'], table['thickness'], size)
+        else:
+            texts = get_solids_text(table_name, eids, pids, table['nodes'])
+
+        irows = {eid: i for i, eid in enumerate(eids.tolist())}
+        for eid in elements.comments:
+            i = irows.get(eid)
+            if i is not None:
+                texts[i] = None
+        for i, text in enumerate(texts):
+            if text is None:
+                texts[i] = elements[int(eids[i])].write_card(size, is_double)
+        table_eids.append(eids)
+        table_texts.append(texts)
+    _write_sorted(bdf_file, table_eids, table_texts, elements.objects, size, is_double)
+
+
+def _write_sorted(bdf_file: Any, ids_list: List[np.ndarray], texts_list: List[List[str]],
+                  objects: Dict[int, Any], size: int, is_double: bool) -> None:
+    """merges the array cards and the object cards by id and writes them"""
+    object_ids = sorted(objects)
+    ids_list = [np.asarray(ids, dtype='int64') for ids in ids_list]
+    ids_list.append(np.array(object_ids, dtype='int64'))
+    texts = [text for texts in texts_list for text in texts]
+    texts += get_cards_text([objects[card_id] for card_id in object_ids], size, is_double)
+
+    isort = np.argsort(np.hstack(ids_list), kind='stable')
+    if not np.array_equal(isort, np.arange(len(isort))):
+        texts = [texts[i] for i in isort.tolist()]
+    for i0 in range(0, len(texts), CHUNK_SIZE):
+        bdf_file.write(''.join(texts[i0:i0+CHUNK_SIZE]))
+
+
+def _format_floats(values: np.ndarray, func: Callable[[float], str]) -> np.ndarray:
+    """
+    Formats each unique float once (e.g., with ``print_float_8``)
+
+    The floats are compared as bits, so -0.0 and 0.0 are formatted
+    separately.
+    """
+    values = np.ascontiguousarray(values, dtype='float64')
+    if values.size == 0:
+        return np.zeros(values.shape, dtype='object')
+    ubits, inverse = np.unique(values.view('int64').ravel(), return_inverse=True)
+    ufields = np.array([func(value) for value in ubits.view('float64').tolist()],
+                       dtype='object')
+    return ufields[inverse].reshape(values.shape)
+
+
+def _blank_or_int(values: np.ndarray, default: int, width: int) -> List[str]:
+    """formats an int column; default values are blank"""
+    blank = ' ' * width
+    fmt = '%%%ii' % width
+    return [blank if value == default else fmt % value for value in values.tolist()]
+
+
+def get_grids_text(nids: np.ndarray, cps: np.ndarray, cds: np.ndarray, ps: List[str],
+                   seids: np.ndarray, xyz: np.ndarray,
+                   size: int, is_double: bool) -> List[str]:
+    """Gets the text of the GRIDs (see ``GRID.write_card``)"""
+    nids = np.asarray(nids).tolist()
+    width = 8 if size == 8 else 16
+    scps = _blank_or_int(np.asarray(cps), 0, width)
+    scds = _blank_or_int(np.asarray(cds), 0, width)
+    sseids = _blank_or_int(np.asarray(seids), 0, width)
+    if size == 8:
+        sxyz = _format_floats(xyz, print_float_8).tolist()
+        is_default = ((np.asarray(cds) == 0) & (np.asarray(seids) == 0)).tolist()
+        texts = [
+            'GRID    %8i%8s%s%s%s\n' % (nid, scp, x, y, z)
+            if is_defaulti and psi == '' else
+            'GRID    %8i%8s%s%s%s%s%8s%s\n' % (nid, scp, x, y, z, scd, psi, sseid)
+            for nid, scp, (x, y, z), scd, psi, sseid, is_defaulti in zip(
+                nids, scps, sxyz, scds, ps, sseids, is_default)]
+    else:
+        func = print_scientific_double if is_double else print_float_16
+        sxyz = _format_floats(xyz, func).tolist()
+        texts = [
+            'GRID*   %16i%16s%16s%16s\n'
+            '*       %16s%16s%16s%16s\n' % (nid, scp, x, y, z, scd, psi, sseid)
+            for nid, scp, (x, y, z), scd, psi, sseid in zip(
+                nids, scps, sxyz, scds, ps, sseids)]
+    return texts
+
+
+def get_shells_text(card_type: str, eids: np.ndarray, pids: np.ndarray,
+                    nodes: np.ndarray, theta: np.ndarray, mcid: np.ndarray,
+                    zoffset: np.ndarray, tflag: np.ndarray, thickness: np.ndarray,
+                    size: int) -> List[str]:
+    """
+    Gets the text of the CQUAD4s/CTRIA3s (see ``CQUAD4.write_card``)
+
+    Parameters
+    ----------
+    theta / mcid : (n, ) float/int ndarray
+        the theta_mcid; mcid=-1 is a theta
+    thickness : (n, nnodes) float ndarray
+        T1, T2, ...; nan is a blank thickness
+
+    """
+    data = np.column_stack([eids, pids, nodes]).tolist()
+    theta_is_zero = theta == 0.
+    is_theta = mcid == -1
+    is_blank_zoffset = (zoffset == 0.) | np.isnan(zoffset)
+    is_blank_thickness = (thickness == 1.) | np.isnan(thickness)
+    is_default = (
+        theta_is_zero & ((mcid == -1) | (mcid == 0)) & (zoffset == 0.) & (tflag == 0) &
+        (thickness == 1.).all(axis=1))
+    is_blank = (
+        is_theta & theta_is_zero & is_blank_zoffset & (tflag == 0) &
+        is_blank_thickness.all(axis=1))
+
+    # the rows without a 2nd line
+    if card_type == 'CTRIA3':
+        assert nodes.shape[1] == 3, nodes.shape
+        short_fmt = 'CTRIA3  %8i%8i%8i%8i%8i\n'
+        is_short = is_blank
+    else:
+        short_fmt = 'CQUAD4  %8i%8i%8i%8i%8i%8i\n'
+        is_short = is_default | is_blank if size == 8 else is_default
+    texts = [short_fmt % tuple(row) if is_shorti else None
+             for row, is_shorti in zip(data, is_short.tolist())]
+    if is_short.all():
+        return texts
+
+    irows = np.where(~is_short)[0]
+    theta = theta[irows]
+    mcid = mcid[irows]
+    zoffset = zoffset[irows]
+    tflag = tflag[irows]
+    thickness = thickness[irows]
+    is_blank_thickness = is_blank_thickness[irows]
+
+    # the CTRIA3 is always small field
+    width = 16 if card_type == 'CQUAD4' and size != 8 else 8
+    func = print_float_8 if width == 8 else print_float_16
+    blank = ' ' * width
+
+    # theta_mcid: a float theta of 0.0 is blank; an int mcid is always written
+    stheta = _format_floats(theta, func)
+    smcid = np.array(['%*i' % (width, value) for value in mcid.tolist()], dtype='object')
+    stheta_mcid = np.where(is_theta[irows], stheta, smcid)
+    stheta_mcid[is_theta[irows] & theta_is_zero[irows]] = blank
+
+    szoffset = _format_floats(zoffset, func)
+    szoffset[is_blank_zoffset[irows]] = blank
+    stflag = _blank_or_int(tflag, 0, width)
+    sthickness = _format_floats(thickness, func)
+    sthickness[is_blank_thickness] = blank
+    row2 = [(stheta_mcidi, szoffseti, stflagi) + tuple(sthicknessi)
+            for stheta_mcidi, szoffseti, stflagi, sthicknessi in zip(
+                stheta_mcid.tolist(), szoffset.tolist(), stflag, sthickness.tolist())]
+
+    irows = irows.tolist()
+    if card_type == 'CTRIA3':
+        for irow, row2i in zip(irows, row2):
+            texts[irow] = (
+                'CTRIA3  %8i%8i%8i%8i%8i%8s%8s\n'
+                '                %8s%8s%8s%8s' % (tuple(data[irow]) + row2i)).rstrip() + '\n'
+    elif size == 8:
+        for irow, row2i in zip(irows, row2):
+            texts[irow] = (
+                'CQUAD4  %8i%8i%8i%8i%8i%8i%8s%8s\n'
+                '                %8s%8s%8s%8s%8s' % (tuple(data[irow]) + row2i)
+            ).rstrip('\n ') + '\n'
+    else:
+        # the 3rd/4th lines are written if the tflag/thickness aren't blank
+        is_two_lines = ((tflag == 0) & is_blank_thickness.all(axis=1)).tolist()
+        for irow, row2i, is_two_linesi in zip(irows, row2, is_two_lines):
+            if is_two_linesi:
+                texts[irow] = (
+                    'CQUAD4* %16i%16i%16i%16i\n'
+                    '*       %16i%16i%16s%16s\n' % (tuple(data[irow]) + row2i[:2]))
+            else:
+                texts[irow] = (
+                    'CQUAD4* %16i%16i%16i%16i\n'
+                    '*       %16i%16i%16s%16s\n'
+                    '*                     %16s%16s%16s\n'
+                    '*       %16s%16s\n' % (tuple(data[irow]) + row2i)).rstrip('*\n ') + '\n'
+    return texts
+
+
+def get_solids_text(card_class_name: str, eids: np.ndarray, pids: np.ndarray,
+                    nodes: np.ndarray) -> List[str]:
+    """
+    Gets the text of the CTETRA4/CTETRA10/CHEXA8/CHEXA20s
+    (see ``CTETRA10.write_card``), which don't depend on the field size
+
+    Parameters
+    ----------
+    card_class_name : str
+        CTETRA4, CTETRA10, CHEXA8, CHEXA20
+    nodes : (n, nnodes) int ndarray
+        the node ids; 0 is a blank midside node
+
+    """
+    data = np.column_stack([eids, pids, nodes]).tolist()
+    if card_class_name == 'CTETRA4':
+        return ['CTETRA  %8i%8i%8i%8i%8i%8i\n' % tuple(row) for row in data]
+    if card_class_name == 'CHEXA8':
+        return ['CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
+                '        %8i%8i\n' % tuple(row) for row in data]
+
+    if card_class_name == 'CTETRA10':
+        ncorner = 4
+        fmt = ('CTETRA  %8i%8i%8i%8i%8i%8i%8s%8s\n'
+               '        %8s%8s%8s%8s')
+    else:
+        assert card_class_name == 'CHEXA20', card_class_name
+        ncorner = 8
+        fmt = ('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
+               '        %8i%8i%8s%8s%8s%8s%8s%8s\n'
+               '        %8s%8s%8s%8s%8s%8s')
+    i0 = 2 + ncorner
+    return [(fmt % tuple(row[:i0] + ['%8i' % nid if nid else '' for nid in row[i0:]])
+             ).rstrip() + '\n' for row in data]
+
+
+def _is_ids(nids: List[Any]) -> bool:
+    return all(isinstance(nid, integer_types) for nid in nids)
+
+
+def _split_simple(cards: List[Any], is_simple: Callable[[Any], bool]):
+    """splits the cards without a comment that the templates support"""
+    icards = [i for i, card in enumerate(cards) if not card.comment and is_simple(card)]
+    return icards, [cards[i] for i in icards]
+
+
+def _fill(ncards: int, icards: List[int], texts: List[Optional[str]]) -> List[Optional[str]]:
+    """None is a card that isn't supported by the templates"""
+    all_texts = [None] * ncards  # type: List[Optional[str]]
+    for i, text in zip(icards, texts):
+        all_texts[i] = text
+    return all_texts
+
+
+def _grid_objects_text(nodes: List[GRID], size: int, is_double: bool) -> List[Optional[str]]:
+    """GRID"""
+    ncards = len(nodes)
+    icards = []
+    columns = [[] for unused_i in range(6)]  # type: List[List[Any]]
+    nids, cps, cds, ps, seids, xyz = columns
+    for i, node in enumerate(nodes):
+        if node.comment:
+            continue
+        cp = node.Cp()
+        cd = node.Cd()
+        if not (isinstance(cp, integer_types) and isinstance(cd, integer_types) and
+                isinstance(node.seid, integer_types) and isinstance(node.ps, str)):
+            continue
+        icards.append(i)
+        nids.append(node.nid)
+        cps.append(cp)
+        cds.append(cd)
+        ps.append(node.ps)
+        seids.append(node.seid)
+        xyz.append(node.xyz)
+    if not icards:
+        return _fill(ncards, [], [])
+    texts = get_grids_text(
+        nids, np.array(cps, dtype='int64'), np.array(cds, dtype='int64'), ps,
+        np.array(seids, dtype='int64'), np.array(xyz, dtype='float64').reshape(len(xyz), 3),
+        size, is_double)
+    return _fill(ncards, icards, texts)
+
+
+def _get_node_ids(elem: Any) -> List[Optional[int]]:
+    """``elem.node_ids``, which is slow for an element that isn't cross-referenced"""
+    if elem.nodes_ref is None:
+        return elem.nodes
+    return elem.node_ids
+
+
+def _shell_objects_text(elements: List[Any], size: int,
+                        unused_is_double: bool) -> List[Optional[str]]:
+    """CQUAD4, CTRIA3"""
+    ncards = len(elements)
+    card_type = elements[0].type
+    icards = []
+    columns = [[] for unused_i in range(8)]  # type: List[List[Any]]
+    eids, pids, nodes, theta, mcid, zoffset, tflag, thickness = columns
+    for i, elem in enumerate(elements):
+        if elem.comment:
+            continue
+        if card_type == 'CQUAD4':
+            thicknesses = [elem.T1, elem.T2, elem.T3, elem.T4]
+        else:
+            thicknesses = [elem.T1, elem.T2, elem.T3]
+        theta_mcid = elem.Theta_mcid()
+        if isinstance(theta_mcid, float_types):
+            thetai, mcidi = theta_mcid, -1
+        elif isinstance(theta_mcid, integer_types) and theta_mcid >= 0:
+            thetai, mcidi = 0., theta_mcid
+        else:
+            continue
+
+        # the ids are written with %8i, so they just can't be blank
+        pid = elem.Pid()
+        nids = _get_node_ids(elem)
+        zoffseti = elem.zoffset
+        if (pid is None or None in nids or
+                not (isinstance(zoffseti, float_types) or zoffseti == 0) or
+                not isinstance(elem.tflag, integer_types) or
+                not all(thicknessi is None or isinstance(thicknessi, float_types)
+                        for thicknessi in thicknesses)):
+            continue
+        icards.append(i)
+        eids.append(elem.eid)
+        pids.append(pid)
+        nodes.append(nids)
+        theta.append(thetai)
+        mcid.append(mcidi)
+        zoffset.append(zoffseti)
+        tflag.append(elem.tflag)
+        thickness.append([np.nan if thicknessi is None else thicknessi
+                          for thicknessi in thicknesses])
+    if not icards:
+        return _fill(ncards, [], [])
+    texts = get_shells_text(
+        card_type,
+        np.array(eids, dtype='int64'), np.array(pids, dtype='int64'),
+        np.array(nodes, dtype='int64'),
+        np.array(theta, dtype='float64'), np.array(mcid, dtype='int64'),
+        np.array(zoffset, dtype='float64'), np.array(tflag, dtype='int64'),
+        np.array(thickness, dtype='float64'), size)
+    return _fill(ncards, icards, texts)
+
+
+def _is_simple_solid(elem: Any) -> bool:
+    ncorner = SOLID_NCORNER_NODES[elem.__class__.__name__]
+    nodes = _get_node_ids(elem)
+    return (
+        elem.Pid() is not None and None not in nodes[:ncorner] and
+        all(nid is None or isinstance(nid, integer_types) and nid != 0
+            for nid in nodes[ncorner:]))
+
+
+def _solid_objects_text(elements: List[Any], unused_size: int,
+                        unused_is_double: bool) -> List[Optional[str]]:
+    """CTETRA4, CTETRA10, CHEXA8, CHEXA20"""
+    ncards = len(elements)
+    card_class_name = elements[0].__class__.__name__
+    icards, elements = _split_simple(elements, _is_simple_solid)
+    if not elements:
+        return _fill(ncards, [], [])
+    nodes = np.array([[0 if nid is None else nid for nid in _get_node_ids(elem)]
+                      for elem in elements], dtype='int64')
+    texts = get_solids_text(
+        card_class_name,
+        np.array([elem.eid for elem in elements], dtype='int64'),
+        np.array([elem.Pid() for elem in elements], dtype='int64'),
+        nodes)
+    return _fill(ncards, icards, texts)
+
+
+def _get_float_fields(values: np.ndarray, size: int) -> List[Any]:
+    """formats the floats for print_card_8/print_card_16"""
+    func = print_float_8 if size == 8 else print_float_16
+    return _format_floats(values, func).tolist()
+
+
+def _is_simple_cbar(elem: CBAR) -> bool:
+    if elem.g0 is None:
+        if elem.x is None or len(elem.x) != 3 or np.isnan(elem.x).any():
+            return False
+    elif not isinstance(elem.G0(), integer_types):
+        return False
+    return (
+        isinstance(elem.eid, integer_types) and isinstance(elem.Pid(), integer_types) and
+        _is_ids(elem.node_ids) and isinstance(elem.offt, str) and
+        isinstance(elem.pa, integer_types) and isinstance(elem.pb, integer_types))
+
+
+def _cbar_objects_text(elements: List[CBAR], size: int,
+                       unused_is_double: bool) -> List[Optional[str]]:
+    """CBAR (see ``CBAR.repr_fields``)"""
+    ncards = len(elements)
+    icards, elements = _split_simple(elements, _is_simple_cbar)
+    if not elements:
+        return _fill(ncards, [], [])
+    print_card = print_card_8 if size == 8 else print_card_16
+
+    x = np.array([[0., 0., 0.] if elem.g0 is not None else elem.x for elem in elements],
+                 dtype='float64')
+    wab = np.array([np.hstack([elem.wa, elem.wb]) for elem in elements], dtype='float64')
+    sx = _get_float_fields(x, size)
+    swab = np.array(_get_float_fields(wab, size), dtype='object')
+    swab[(wab == 0.) | np.isnan(wab)] = None
+    swab = swab.tolist()
+
+    texts = []
+    for elem, sxi, swabi in zip(elements, sx, swab):
+        x1_x3 = [elem.G0(), None, None] if elem.g0 is not None else sxi
+        offt = None if elem.offt == 'GGG' else elem.offt
+        pa = None if elem.pa == 0 else elem.pa
+        pb = None if elem.pb == 0 else elem.pb
+        fields = (['CBAR', elem.eid, elem.Pid(), elem.Ga(), elem.Gb()] + x1_x3 +
+                  [offt, pa, pb] + swabi)
+        texts.append(print_card(fields))
+    return _fill(ncards, icards, texts)
+
+
+def _is_simple_rbe2(elem: RBE2) -> bool:
+    return (
+        isinstance(elem.eid, integer_types) and isinstance(elem.Gn(), integer_types) and
+        isinstance(elem.cm, str) and elem.cm != '' and _is_ids(elem.Gmi_node_ids) and
+        isinstance(elem.alpha, float_types))
+
+
+def _rbe2_objects_text(elements: List[RBE2], unused_size: int,
+                       unused_is_double: bool) -> List[Optional[str]]:
+    """RBE2 (see ``RBE2.repr_fields``), which is always small field"""
+    ncards = len(elements)
+    icards, elements = _split_simple(elements, _is_simple_rbe2)
+    if not elements:
+        return _fill(ncards, [], [])
+    alpha = np.array([elem.alpha for elem in elements], dtype='float64')
+    salpha = np.array(_get_float_fields(alpha, 8), dtype='object')
+    salpha[alpha == 0.] = None
+    texts = [print_card_8(['RBE2', elem.eid, elem.Gn(), elem.cm] + elem.Gmi_node_ids +
+                          [salphai])
+             for elem, salphai in zip(elements, salpha.tolist())]
+    return _fill(ncards, icards, texts)
+
+
+def _is_simple_force(load: FORCE) -> bool:
+    return (
+        isinstance(load.sid, integer_types) and isinstance(load.node_id, integer_types) and
+        isinstance(load.Cid(), integer_types) and isinstance(load.mag, float_types) and
+        len(load.xyz) == 3)
+
+
+def _force_objects_text(loads: List[FORCE], size: int,
+                        is_double: bool) -> List[Optional[str]]:
+    """FORCE (see ``FORCE.write_card``)"""
+    ncards = len(loads)
+    icards, loads = _split_simple(loads, _is_simple_force)
+    if not loads:
+        return _fill(ncards, [], [])
+    values = np.array([[load.mag] + list(load.xyz) for load in loads], dtype='float64')
+    cids = np.array([load.Cid() for load in loads], dtype='int64')
+    sids_nodes = [(load.sid, load.node_id) for load in loads]
+    if size == 8:
+        svalues = _format_floats(values, print_float_8).tolist()
+        scids = _blank_or_int(cids, 0, 8)
+        texts = ['FORCE   %8i%8i%8s%8s%8s%8s%8s\n' % (sid_node + (scid, ) + tuple(svaluesi))
+                 for sid_node, scid, svaluesi in zip(sids_nodes, scids, svalues)]
+    else:
+        func = print_scientific_double if is_double else print_float_16
+        svalues = _format_floats(values, func).tolist()
+        scids = _blank_or_int(cids, 0, 16)
+        texts = [('FORCE*  %16i%16i%16s%s\n'
+                  '*       %16s%16s%16s\n') % (sid_node + (scid, ) + tuple(svaluesi))
+                 for sid_node, scid, svaluesi in zip(sids_nodes, scids, svalues)]
+    return _fill(ncards, icards, texts)
+
+
+def _is_simple_pload4(load: PLOAD4) -> bool:
+    eids = load.element_ids
+    return (
+        isinstance(load.sid, integer_types) and len(eids) > 0 and _is_ids(eids) and
+        load.g1 is None and load.Cid() is None and
+        load.surf_or_line == 'SURF' and load.line_load_dir == 'NORM' and
+        len(load.pressures) == 4 and
+        all(isinstance(pressure, float_types) and not np.isnan(pressure)
+            for pressure in load.pressures) and
+        np.abs(load.nvector).max() == 0.)
+
+
+def _pload4_objects_text(loads: List[PLOAD4], size: int,
+                         unused_is_double: bool) -> List[Optional[str]]:
+    """PLOAD4 on shells without a direction vector (see ``PLOAD4.repr_fields``)"""
+    ncards = len(loads)
+    icards, loads = _split_simple(loads, _is_simple_pload4)
+    if not loads:
+        return _fill(ncards, [], [])
+    print_card = print_card_8 if size == 8 else print_card_16
+    pressures = np.array([load.pressures for load in loads], dtype='float64')
+    spressures = np.array(_get_float_fields(pressures, size), dtype='object')
+    spressures[:, 1:][pressures[:, 1:] == pressures[:, :1]] = None
+
+    texts = []
+    for load, spressuresi in zip(loads, spressures.tolist()):
+        eids = load.element_ids
+        thru = ['THRU', eids[-1]] if len(eids) > 1 else [None, None]
+        fields = ['PLOAD4', load.sid, eids[0]] + spressuresi + thru + [None] * 5
+        texts.append(print_card(fields))
+    return _fill(ncards, icards, texts)
+
+
+#: the number of corner nodes of a solid
+SOLID_NCORNER_NODES = {
+    'CTETRA4' : 4,
+    'CTETRA10' : 4,
+    'CHEXA8' : 8,
+    'CHEXA20' : 8,
+}
+
+#: card class -> func(cards, size, is_double) = texts
+OBJECT_WRITERS = {
+    GRID : _grid_objects_text,
+    CQUAD4 : _shell_objects_text,
+    CTRIA3 : _shell_objects_text,
+    CTETRA4 : _solid_objects_text,
+    CTETRA10 : _solid_objects_text,
+    CHEXA8 : _solid_objects_text,
+    CHEXA20 : _solid_objects_text,
+    CBAR : _cbar_objects_text,
+    RBE2 : _rbe2_objects_text,
+    FORCE : _force_objects_text,
+    PLOAD4 : _pload4_objects_text,
+}
@@ -6,7 +6,7 @@ This file defines:
 """
 from __future__ import annotations
 import os
-from typing import Any, Union, Optional, Any
+from typing import Dict, Any, Union, Optional, Any
 from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:  # pragma: no cover
@@ -16,6 +16,8 @@ import numpy as np
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_cards
+from pyNastran.bdf.bdf_interface.write_mesh_parallel import write_files_parallel
 from pyNastran.bdf.write_path import write_include
 
 
@@ -37,7 +39,7 @@ class WriteMeshs(WriteMesh):
                    relative_dirname: Optional[str]=None, encoding: Optional[str]=None,
                    size: int=8, is_double: bool=False,
                    enddata: Optional[bool]=None, close: bool=True,
-                   is_windows: Optional[bool]=None) -> None:
+                   is_windows: Optional[bool]=None, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -71,6 +73,9 @@ class WriteMeshs(WriteMesh):
                 files, so the format for a BDF that will run on Linux and
                 Windows is different.
             None : Check the platform
+        nworkers : int; default=1
+            the number of worker processes; each file is written by a
+            worker (the output files must be filenames)
         """
         is_long_ids = False
 
@@ -104,15 +109,33 @@ class WriteMeshs(WriteMesh):
         self.log.debug('---starting BDF.write_bdf of %s---' % out_filename)
         encoding = self.get_encoding(encoding)
 
-        #class DevNull:
-            #def write(self, *_):
-                #pass
-
-        #devnull = DevNull()
+        kwargs = {
+            'out_filenames' : out_filenames, 'encoding' : encoding,
+            'size' : size, 'is_double' : is_double, 'is_long_ids' : is_long_ids,
+            'enddata' : enddata, 'relative_dirname' : relative_dirname,
+            'is_windows' : is_windows,
+        }
+        is_filenames = all(isinstance(out_filename, str)
+                           for out_filename in ifile_out_filenames.values())
+        if nworkers > 1 and is_filenames and len(ifile_out_filenames) > 1:
+            write_files_parallel(self, ifile_out_filenames, kwargs, nworkers)
+            return
 
         bdf_files, bdf_file0 = _open_bdf_files(ifile_out_filenames, self.active_filenames, encoding)
+        self._write_bdfs_files(bdf_files, bdf_file0, **kwargs)
+        if close:
+            for bdf_file in bdf_files.values():
+                if bdf_file is not None:
+                    bdf_file.close()
+        del bdf_files
 
-        if bdf_file0 is not None:
+    def _write_bdfs_files(self, bdf_files: Dict[int, Any], bdf_file0: Any,
+                          out_filenames: Dict[str, str], encoding: str,
+                          size: int, is_double: bool, is_long_ids: bool,
+                          enddata: Optional[bool], relative_dirname: Optional[str],
+                          is_windows: Optional[bool], write_header: bool=True) -> None:
+        """writes the header, INCLUDEs, cards and ENDDATA of the files"""
+        if bdf_file0 is not None and write_header:
             self._write_header(bdf_file0, encoding)
 
         self._write_bdf_includes(out_filenames, bdf_files, relative_dirname=relative_dirname,
@@ -133,11 +156,6 @@ class WriteMeshs(WriteMesh):
         if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
             if bdf_file0:
                 bdf_file0.write('ENDDATA\n')
-        if close:
-            for bdf_file in bdf_files.values():
-                if bdf_file is not None:
-                    bdf_file.close()
-        del bdf_files
 
     def _write_bdf_includes(self, out_filenames, bdf_files, relative_dirname=None, is_windows=True):
         """
@@ -717,7 +735,7 @@ def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
     """writes a dictionary by ifile"""
     assert isinstance(cards, dict), cards
     assert isinstance(cards, (list, tuple, np.ndarray)), ids
-    if bdf_file is None:
+    if not bdf_file:
         return
     if is_long_ids:
         for idi in ids:
@@ -736,14 +754,14 @@ def write_bdfs_dict(bdf_files, cards, size, is_double, is_long_ids):
 
 def _write_bdf_dict_cards(bdf_file, cards, size, is_double, is_long_ids):
     """writes a dictionary"""
-    if bdf_file is None:
+    if not bdf_file:
+        # None or a NullFile
         return
     if is_long_ids:
         for card in cards:
             bdf_file.write(card.write_card_16(is_double))
     else:
-        for card in cards:
-            bdf_file.write(card.write_card(size, is_double))
+        write_cards(bdf_file, cards, size, is_double)
 
 def _get_ifiles_dict_list(cards):
     """gets the ids for a dictionary of lists by file number"""
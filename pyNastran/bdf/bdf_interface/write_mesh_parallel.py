@@ -0,0 +1,241 @@
+"""
+Defines the multi-process writers that are used by
+``write_bdf(nworkers=N)`` and ``write_bdfs(nworkers=N)``.  Defines:
+
+ - write_sections_parallel(model, bdf_file, sections, size, is_double,
+                           is_long_ids, nworkers)
+ - write_files_parallel(model, ifile_out_filenames, kwargs, nworkers)
+
+``write_bdf`` splits the bulk data into sections (e.g., the nodes, the
+elements, the properties, the loads; see ``WriteMesh._get_write_sections``).
+Each worker writes a section into a temporary file, and the temporary
+files are copied into the file in the order of the sections as they're
+finished, so the file is the same as a serial write.
+
+``write_bdfs`` writes each INCLUDE file with a worker.  The cards are
+split by file once, so a worker only has the cards of its file; the
+other files are skipped (see ``NullFile``).
+
+The model is passed to the workers when they're started, which is free
+on platforms that fork (e.g., Linux).  On other platforms, the model is
+pickled, so this helps less.
+
+"""
+from __future__ import annotations
+import os
+import copy
+import shutil
+import tempfile
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Set, Optional, Any, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the model of a worker process
+_MODEL = None  # type: Optional[BDF]
+
+#: the cards of each file of the model of a worker process and the
+#: attributes that are split (see ``_split_cards_by_file``)
+_FILE_CARDS = None  # type: Optional[Tuple[Dict[int, Dict[str, Any]], Set[str]]]
+
+
+class NullFile:
+    """
+    Takes the cards of the INCLUDE files that another worker writes.
+
+    It's False, so the card writers skip it (see ``write_bdfs_dict``).
+    """
+    def write(self, unused_text: str) -> None:
+        """skips the text"""
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+
+def _get_executor(model: BDF, nworkers: int,
+                  file_cards: Optional[Tuple[Dict[int, Dict[str, Any]], Set[str]]]=None,
+                  ) -> ProcessPoolExecutor:
+    """gets a process pool, where each worker has a copy of the model"""
+    mp_context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    return ProcessPoolExecutor(max_workers=nworkers, mp_context=mp_context,
+                               initializer=_set_model, initargs=(model, file_cards))
+
+
+def _set_model(model: BDF,
+               file_cards: Optional[Tuple[Dict[int, Dict[str, Any]], Set[str]]]) -> None:
+    """sets the model of a worker process"""
+    global _MODEL, _FILE_CARDS
+    _MODEL = model
+    _FILE_CARDS = file_cards
+
+
+def write_sections_parallel(model: BDF, bdf_file: Any,
+                            sections: List[Tuple[str, Dict[str, Any]]],
+                            size: int, is_double: bool, is_long_ids: bool,
+                            nworkers: int) -> None:
+    """
+    Writes the sections of the bulk data with a pool of workers
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    bdf_file : file
+        the file object
+    sections : List[(method_name, kwargs)]
+        the write methods (e.g., ``_write_nodes``) in the order of the file
+    size : int; {8, 16}
+        the field size
+    is_double : bool
+        the large field double precision flag
+    is_long_ids : bool
+        write the cards with ``write_card_16``
+    nworkers : int
+        the number of worker processes
+
+    """
+    model.log.debug('writing %i sections with %i workers' % (len(sections), nworkers))
+    dirname = tempfile.mkdtemp(prefix='pyNastran_write_')
+    try:
+        with _get_executor(model, nworkers) as executor:
+            futures = [executor.submit(_write_section, method_name, size, is_double,
+                                       is_long_ids, kwargs,
+                                       os.path.join(dirname, 'section_%i.bdf' % isection))
+                       for isection, (method_name, kwargs) in enumerate(sections)]
+            # the sections are copied as they're finished, so only a
+            # section is held at a time
+            for isection, future in enumerate(futures):
+                section_filename = future.result()
+                futures[isection] = None
+                with open(section_filename, 'r', encoding='utf8') as section_file:
+                    shutil.copyfileobj(section_file, bdf_file)
+                os.remove(section_filename)
+    finally:
+        shutil.rmtree(dirname, ignore_errors=True)
+
+
+def _write_section(method_name: str, size: int, is_double: bool, is_long_ids: bool,
+                   kwargs: Dict[str, Any], section_filename: str) -> str:
+    """writes a section of the model of the worker to a temporary file"""
+    with open(section_filename, 'w', encoding='utf8') as bdf_file:
+        getattr(_MODEL, method_name)(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                                     **kwargs)
+    return section_filename
+
+
+def write_files_parallel(model: BDF, ifile_out_filenames: Dict[int, str],
+                         kwargs: Dict[str, Any], nworkers: int) -> None:
+    """
+    Writes each INCLUDE file with a worker
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    ifile_out_filenames : Dict[ifile] = out_filename
+        the files to write
+    kwargs : Dict[str, Any]
+        the arguments of ``WriteMeshs._write_bdfs_files``, which writes
+        the header/INCLUDEs/cards/ENDDATA of each file (see ``write_bdfs``)
+    nworkers : int
+        the number of worker processes
+
+    """
+    nworkers = min(nworkers, len(ifile_out_filenames))
+    model.log.debug('writing %i files with %i workers' % (len(ifile_out_filenames), nworkers))
+    file_cards = _split_cards_by_file(model)
+    with _get_executor(model, nworkers, file_cards) as executor:
+        futures = [executor.submit(_write_file, ifile, out_filename, kwargs)
+                   for ifile, out_filename in sorted(ifile_out_filenames.items())]
+        for future in futures:
+            future.result()
+
+
+def _write_file(ifile: int, out_filename: str, kwargs: Dict[str, Any]) -> None:
+    """writes an INCLUDE file with the cards of the file"""
+    file_cards, names = _FILE_CARDS
+    cards = file_cards.get(ifile, {})
+    model = copy.copy(_MODEL)
+    for name in names:
+        setattr(model, name, cards.get(name, _empty_like(getattr(_MODEL, name))))
+
+    bdf_files = {i : NullFile() for i in range(len(model.active_filenames))}
+    with open(out_filename, 'w', encoding=kwargs['encoding']) as bdf_file:
+        bdf_files[ifile] = bdf_file
+        if ifile == 0:
+            # the header has the number of nodes/elements of the model
+            _MODEL._write_header(bdf_file, kwargs['encoding'])
+        model._write_bdfs_files(bdf_files, bdf_files[0], write_header=False, **kwargs)
+
+
+def _split_cards_by_file(model: BDF) -> Tuple[Dict[int, Dict[str, Any]], Set[str]]:
+    """
+    Splits the cards of the model by the file they were read from
+
+    Returns
+    -------
+    file_cards : Dict[ifile] = Dict[name] = cards
+        the cards of each file (e.g., file_cards[1]['elements'])
+    names : Set[str]
+        the model attributes that are split; the files without the
+        cards of an attribute get an empty dict/list/None
+
+    A dictionary/list with a card that doesn't have a file (e.g., a
+    dictionary of dictionaries) isn't split.
+
+    """
+    file_cards = defaultdict(dict)  # type: Dict[int, Dict[str, Any]]
+    names = set()
+    for name in model._slot_to_type_map:
+        cards = getattr(model, name, None)
+        if not cards:
+            continue
+        if isinstance(cards, dict):
+            split_cards = _split_dict_by_file(cards)
+            if split_cards is None:
+                continue
+            names.add(name)
+            for ifile, cardsi in split_cards.items():
+                file_cards[ifile][name] = cardsi
+        elif isinstance(cards, list):
+            if all(hasattr(card, 'ifile') for card in cards):
+                names.add(name)
+                for card in cards:
+                    file_cards[card.ifile].setdefault(name, []).append(card)
+        elif hasattr(cards, 'ifile') and hasattr(cards, 'write_card'):
+            names.add(name)
+            file_cards[cards.ifile][name] = cards
+    return dict(file_cards), names
+
+
+def _split_dict_by_file(cards: Dict[Any, Any]) -> Optional[Dict[int, Dict[Any, Any]]]:
+    """
+    Splits a dictionary of cards/lists of cards by file; None if a value
+    isn't a card (e.g., a dictionary)
+    """
+    split_cards = defaultdict(dict)  # type: Dict[int, Dict[Any, Any]]
+    for key, value in cards.items():
+        if isinstance(value, list):
+            if not all(hasattr(card, 'ifile') for card in value):
+                return None
+            for card in value:
+                split_cards[card.ifile].setdefault(key, []).append(card)
+        elif hasattr(value, 'ifile'):
+            split_cards[value.ifile][key] = value
+        else:
+            return None
+    return split_cards
+
+
+def _empty_like(cards: Any) -> Any:
+    """gets an empty dict/list for the attribute of a file without those cards"""
+    if isinstance(cards, dict):
+        return {}
+    elif isinstance(cards, list):
+        return []
+    return None
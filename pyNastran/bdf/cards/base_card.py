@@ -568,7 +568,7 @@ def _node_ids(card, nodes=None, allow_empty_nodes: bool=False, msg: str='') -> A
     try:
         if not nodes:
             nodes = card.nodes
-            assert nodes is not None, card.__dict__
+            assert nodes is not None, card.get_stats()
 
         if allow_empty_nodes:
             nodes2 = []
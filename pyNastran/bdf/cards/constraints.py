@@ -1636,7 +1636,7 @@ class SPCADD(ConstraintAdd):
     def uncross_reference(self) -> None:
         """Removes cross-reference links"""
         self.sets = self.spc_ids
-        self.sets_ref = []
+        self.sets_ref = None
 
     def raw_fields(self):
         fields = ['SPCADD', self.conid] + self.spc_ids
@@ -1758,7 +1758,7 @@ class MPCADD(ConstraintAdd):
     def uncross_reference(self) -> None:
         """Removes cross-reference links"""
         self.sets = self.mpc_ids
-        self.sets_ref = []
+        self.sets_ref = None
 
     @property
     def ids(self):
@@ -377,6 +377,13 @@ class CBAR(LineElement):
 
     """
     type = 'CBAR'
+    __slots__ = ('ga_ref', 'gb_ref', 'g0_ref', 'pid_ref', 'g0_vector', 'ifile')
+
+    #: the defaults; only the elements with other values store them
+    offt = 'GGG'
+    pa = 0
+    pb = 0
+
     _field_map = {
         1: 'eid', 2:'pid', 3:'ga', 4:'gb',
         8:'offt', 9:'pa', 10:'pb',
@@ -542,9 +549,12 @@ class CBAR(LineElement):
         self.g0 = g0
         self.ga = nids[0]
         self.gb = nids[1]
-        self.offt = offt
-        self.pa = pa
-        self.pb = pb
+        if offt != 'GGG':
+            self.offt = offt
+        if pa != 0 or type(pa) is not int:
+            self.pa = pa
+        if pb != 0 or type(pb) is not int:
+            self.pb = pb
         self.wa = wa
         self.wb = wb
         self.pid_ref = None
@@ -132,6 +132,25 @@ class ShellElement(Element):
     def __init__(self):
         Element.__init__(self)
 
+    def _set_shell_fields(self, zoffset, theta_mcid, tflag, T1, T2, T3):
+        """
+        Sets the CTRIA3/CQUAD4 fields that aren't the class-level defaults,
+        so most elements don't store them (the type is kept, so an integer
+        mcid=0 is stored and a float theta=0.0 isn't)
+        """
+        if zoffset != 0.0 or type(zoffset) is not float:
+            self.zoffset = zoffset
+        if theta_mcid != 0.0 or type(theta_mcid) is not float:
+            self.theta_mcid = theta_mcid
+        if tflag != 0 or type(tflag) is not int:
+            self.tflag = tflag
+        if T1 is not None:
+            self.T1 = T1
+        if T2 is not None:
+            self.T2 = T2
+        if T3 is not None:
+            self.T3 = T3
+
     def Theta_mcid(self):
         # () -> int
         if self.theta_mcid_ref is None:
@@ -445,6 +464,16 @@ class CTRIA3(TriShell):
 
     """
     type = 'CTRIA3'
+    __slots__ = ('nodes_ref', 'pid_ref', 'theta_mcid_ref', 'ifile')
+
+    #: the defaults; only the elements with other values store them
+    theta_mcid = 0.0
+    zoffset = 0.0
+    tflag = 0
+    T1 = None
+    T2 = None
+    T3 = None
+
     _field_map = {
         1: 'eid', 2:'pid', 6:'theta_mcid', 7:'zoffset', 10:'tflag',
         11:'T1', 12:'T2', 13:'T3'}
@@ -540,12 +569,7 @@ class CTRIA3(TriShell):
         self.pid = pid
         assert len(nids) == 3, nids
         self.nodes = self.prepare_node_ids(nids)
-        self.zoffset = zoffset
-        self.theta_mcid = theta_mcid
-        self.tflag = tflag
-        self.T1 = T1
-        self.T2 = T2
-        self.T3 = T3
+        self._set_shell_fields(zoffset, theta_mcid, tflag, T1, T2, T3)
         assert len(self.nodes) == 3
         self.theta_mcid_ref = None  # type: Optional[Any]
 
@@ -2147,6 +2171,17 @@ class CQUAD4(QuadShell):
 
     """
     type = 'CQUAD4'
+    __slots__ = ('nodes_ref', 'pid_ref', 'theta_mcid_ref', 'ifile')
+
+    #: the defaults; only the elements with other values store them
+    theta_mcid = 0.0
+    zoffset = 0.0
+    tflag = 0
+    T1 = None
+    T2 = None
+    T3 = None
+    T4 = None
+
     cp_name_map = {
         'T1' : 'T1',
         'T2' : 'T2',
@@ -2244,13 +2279,9 @@ class CQUAD4(QuadShell):
         self.pid = pid
         assert len(nids) == 4, nids
         self.nodes = self.prepare_node_ids(nids)
-        self.zoffset = zoffset
-        self.theta_mcid = theta_mcid
-        self.tflag = tflag
-        self.T1 = T1
-        self.T2 = T2
-        self.T3 = T3
-        self.T4 = T4
+        self._set_shell_fields(zoffset, theta_mcid, tflag, T1, T2, T3)
+        if T4 is not None:
+            self.T4 = T4
         self.theta_mcid_ref = None  # type: Optional[Any]
 
     def validate(self):
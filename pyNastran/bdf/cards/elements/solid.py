@@ -222,6 +222,7 @@ class CHEXA8(SolidElement):
     +-------+-----+-----+----+----+----+----+----+----+
     """
     type = 'CHEXA'
+    __slots__ = ('nodes_ref', 'pid_ref', 'ifile')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         data = [self.eid, self.Pid()] + self.node_ids
         msg = ('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
@@ -535,6 +536,7 @@ class CHEXA20(SolidElement):
     +-------+-----+-----+-----+-----+-----+-----+-----+-----+
     """
     type = 'CHEXA'
+    __slots__ = ('nodes_ref', 'pid_ref', 'ifile')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[8:]]
@@ -1919,6 +1921,7 @@ class CTETRA4(SolidElement):
     +--------+-----+-----+----+----+----+----+
     """
     type = 'CTETRA'
+    __slots__ = ('nodes_ref', 'pid_ref', 'ifile')
     @property
     def faces(self):
         """
@@ -2214,6 +2217,7 @@ class CTETRA10(SolidElement):
     +--------+-----+-----+-----+-----+-----+----+-----+-----+
     """
     type = 'CTETRA'
+    __slots__ = ('nodes_ref', 'pid_ref', 'ifile')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[4:]]
@@ -1008,6 +1008,13 @@ class GRID(BaseCard):
 
     """
     type = 'GRID'
+    __slots__ = ('cp_ref', 'cd_ref', 'elements_ref', 'ifile')
+
+    #: the defaults; only the nodes with other values store them
+    cp = 0
+    cd = 0
+    ps = ''
+    seid = 0
 
     #: allows the get_field method and update_field methods to be used
     _field_map = {1: 'nid', 2:'cp', 6:'cd', 7:'ps', 8:'seid'}
@@ -1114,14 +1121,18 @@ class GRID(BaseCard):
         if comment:
             self.comment = comment
         self.nid = nid
-        self.cp = cp
+        if cp != 0 or type(cp) is not int:
+            self.cp = cp
         if xyz is None:
             xyz = [0., 0., 0.]
         self.xyz = np.asarray(xyz, dtype='float64')
         assert self.xyz.size == 3, self.xyz.shape
-        self.cd = cd
-        self.ps = ps
-        self.seid = seid
+        if cd != 0 or type(cd) is not int:
+            self.cd = cd
+        if ps != '':
+            self.ps = ps
+        if seid != 0 or type(seid) is not int:
+            self.seid = seid
         self.cp_ref = None # type: Coord
         self.cd_ref = None # type: Coord
         self.elements_ref = None # type: List[Element]
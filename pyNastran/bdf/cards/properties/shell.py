@@ -2004,6 +2004,7 @@ class PSHELL(Property):
     +--------+-------+------+--------+------+----------+------+------+---------+
     """
     type = 'PSHELL'
+    __slots__ = ('mid1_ref', 'mid2_ref', 'mid3_ref', 'mid4_ref', 'ifile')
     _field_map = {
         1: 'pid', 2:'mid1', 3:'t', 4:'mid2', 5:'twelveIt3', 6:'mid3',
         7: 'tst', 8:'nsm',
@@ -359,6 +359,7 @@ class PSOLID(Property):
     +--------+-----+-----+-------+-----+--------+---------+------+
     """
     type = 'PSOLID'
+    __slots__ = ('mid_ref', 'ifile')
     _field_map = {
         1: 'pid', 2:'mid', 3:'cordm', 4:'integ', 5:'stress',
         6:'isop', 7:'fctn',
@@ -1369,7 +1369,7 @@ class SENQSET(BaseCard):
 def _node_ids(card, nodes, nodes_ref, allow_empty_nodes=False, msg=''):
     if nodes_ref is None:
         #nodes = card.nodes
-        assert nodes is not None, card.__dict__
+        assert nodes is not None, card.get_stats()
         return nodes
 
     try:
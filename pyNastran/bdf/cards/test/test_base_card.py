@@ -1,4 +1,9 @@
+import copy
+import pickle
 import unittest
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf_interface.subcase_utils import expand_thru_case_control
 from pyNastran.bdf.cards.expand_card import expand_thru, expand_thru_by
@@ -150,6 +155,65 @@ class TestBaseCard(unittest.TestCase):
         expected = [1, 'THRU', 8]
         self.assertEqual(collapse_thru_by(data), expected, collapse_thru_by(data))
 
+    def test_card_copy(self):
+        """tests that the high-volume cards pickle/copy/write"""
+        model = BDF(debug=False)
+        for nid in range(1, 21):
+            model.add_grid(nid, [float(nid), 0., 0.], comment='grid')
+        model.add_cquad4(1, 1, [1, 2, 3, 4], theta_mcid=2, T1=0.1)
+        model.add_ctria3(2, 1, [1, 2, 3], zoffset=0.2)
+        model.add_ctetra(3, 2, [1, 2, 3, 4])
+        model.add_ctetra(4, 2, list(range(1, 11)))
+        model.add_chexa(5, 2, list(range(1, 9)))
+        model.add_chexa(6, 2, list(range(1, 21)))
+        model.add_cbar(7, 3, [1, 2], [0., 0., 1.], None, comment='cbar')
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, 1)
+
+        cards = list(model.nodes.values()) + list(model.elements.values()) + [
+            model.properties[1], model.properties[2]]
+        for card in cards:
+            card.ifile = 0
+            card.user_attribute = 1
+            card2 = pickle.loads(pickle.dumps(card))
+            assert card2.ifile == 0, card.type
+            assert card2.user_attribute == 1, card.type
+            self.assertEqual(card2.write_card(), card.write_card())
+            self.assertEqual(copy.deepcopy(card).repr_fields(), card.repr_fields())
+        assert model.nodes[1].comment == '$grid\n'
+
+    def test_card_defaults(self):
+        """tests the high-volume cards only store the non-default fields"""
+        model = BDF(debug=False)
+        grid = model.add_grid(1, [0., 0., 0.])
+        grid_cp = model.add_grid(2, [1., 0., 0.], cp=0, cd=1, seid=2)
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        cquad4 = model.add_cquad4(1, 1, [1, 2, 3, 4])
+        cquad4_mcid = model.add_cquad4(2, 1, [1, 2, 3, 4], theta_mcid=0, T4=0.2)
+        ctria3 = model.add_ctria3(3, 1, [1, 2, 3], zoffset=0.1)
+        cbar = model.add_cbar(4, 2, [1, 2], [0., 0., 1.], None, pa=1)
+
+        assert grid.__dict__.keys() == {'nid', 'xyz'}, grid.__dict__.keys()
+        assert grid_cp.__dict__.keys() == {'nid', 'xyz', 'cd', 'seid'}, grid_cp.__dict__.keys()
+        assert (grid.cp, grid.cd, grid.ps, grid.seid) == (0, 0, '', 0)
+        assert (grid_cp.cp, grid_cp.cd, grid_cp.seid) == (0, 1, 2)
+        assert cquad4.__dict__.keys() == {'eid', 'pid', 'nodes'}, cquad4.__dict__.keys()
+        assert (cquad4.theta_mcid, cquad4.zoffset, cquad4.tflag, cquad4.T4) == (0., 0., 0, None)
+
+        # an integer mcid=0 isn't the default theta=0.0
+        assert cquad4_mcid.theta_mcid == 0 and isinstance(cquad4_mcid.theta_mcid, int)
+        assert cquad4_mcid.T4 == 0.2
+        assert ctria3.zoffset == 0.1
+        assert cbar.__dict__.keys() == {'eid', 'pid', 'x', 'g0', 'ga', 'gb', 'pa', 'wa', 'wb'}, cbar.__dict__.keys()
+        assert (cbar.offt, cbar.pa, cbar.pb) == ('GGG', 1, 0)
+
+        # the defaults may be changed on a card without changing the other cards
+        grid.cp = 1
+        cquad4.T1 = 0.3
+        assert model.nodes[3].cp == 0 and model.elements[2].T1 is None
+        assert GRID.cp == 0 and CQUAD4.T1 is None
+
 
 if __name__ == '__main__':   # pragma: no cover
     unittest.main()
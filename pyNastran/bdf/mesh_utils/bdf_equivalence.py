@@ -6,22 +6,30 @@ defines:
                                   size=8, is_double=False,
                                   remove_collapsed_elements=False,
                                   avoid_collapsed_elements=False,
-                                  crash_on_collapse=False, log=None, debug=True)
+                                  crash_on_collapse=False, log=None, debug=True,
+                                  method='new', nworkers=1, chunk_size=None)
 
 """
-from itertools import combinations
+import os
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Union, Optional, Any
 import numpy as np
 from numpy import (array, unique, arange, searchsorted,
                    setdiff1d, intersect1d, asarray)
 from numpy.linalg import norm  # type: ignore
 import scipy
+import scipy.sparse
 import scipy.spatial
+from scipy.sparse.csgraph import connected_components
 
 from pyNastran.nptyping import NDArrayNint, NDArrayN3float
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
+from pyNastran.bdf.mesh_utils.renumber_arrays import (
+    CARD_GROUPS, _iter_cards, _remap, _remap_card_fields)
 
 
 def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
@@ -31,7 +39,8 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           remove_collapsed_elements: bool=False,
                           avoid_collapsed_elements: bool=False,
                           crash_on_collapse: bool=False,
-                          log=None, debug: bool=True, method: str='new'):
+                          log=None, debug: bool=True, method: str='new',
+                          nworkers: int=1, chunk_size: Optional[int]=None):
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -79,6 +88,13 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
         'old': use neq_max; used in v1.2
     log : logger(); default=None
         bdf logging
+    nworkers : int; default=1
+        the number of threads for the neighbor search; -1 uses all the
+        processors (method='new')
+    chunk_size : int; default=None
+        the number of nodes per neighbor search, which bounds the memory
+        of the search; None searches all the nodes at once
+        (method='new')
 
     Returns
     -------
@@ -88,11 +104,14 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     .. warning:: I doubt SPOINTs/EPOINTs work correctly
     .. warning:: xref not fully implemented (assumes cid=0)
 
-    .. todo:: node_set stil does work on the all the nodes in the big
-               kdtree loop, which is very inefficient
     .. todo:: remove_collapsed_elements is not supported
     .. todo:: avoid_collapsed_elements is not supported
 
+    With method='new', the nodes within tol of each other are found with
+    a kdtree and are grouped with their neighbors (so a chain of close
+    nodes is one group, regardless of the order of the nodes).  The
+    lowest node id of each group is kept.
+
     """
     if not isinstance(tol, float):
         tol = float(tol)
@@ -100,10 +119,17 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
         bdf_filename, tol, renumber_nodes=renumber_nodes,
         xref=xref, node_set=node_set, log=log, debug=debug)
 
-    nid_pairs = _nodes_xyz_nids_to_nid_pairs(
-        nodes_xyz, nids, tol, log, inew,
-        node_set=node_set, neq_max=neq_max, method=method, debug=debug)
-    _eq_nodes_final(nid_pairs, model, tol, node_set=node_set, debug=debug)
+    if method == 'new':
+        nids_merged, nids_kept = _eq_nodes_find_clusters(
+            nodes_xyz, nids, tol, nworkers=nworkers, chunk_size=chunk_size)
+        _eq_nodes_remap(model, nids_merged, nids_kept)
+    else:
+        nid_pairs = _nodes_xyz_nids_to_nid_pairs(
+            nodes_xyz, nids, tol, log, inew,
+            node_set=node_set, neq_max=neq_max, method=method, debug=debug)
+        _eq_nodes_final(nid_pairs, model, tol, node_set=node_set, debug=debug)
+    # the node ids of the elements changed
+    model._adjacency = None
 
     if bdf_filename_out is not None:
         model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
@@ -155,16 +181,10 @@ def _eq_nodes_setup(bdf_filename, unused_tol,
 
 def _get_xyz_cid0(model, nids):
     """gets xyz_cid0"""
-    coord_ids = model.coord_ids
-    needs_get_position = (coord_ids == [0])
-
-    if needs_get_position:
-        nodes_xyz = array([model.nodes[nid].get_position()
-                           for nid in nids], dtype='float32')
-    else:
-        nodes_xyz = array([model.nodes[nid].xyz
-                           for nid in nids], dtype='float32')
-    return nodes_xyz
+    nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+        cid=0, fdtype='float64', idtype='int64')[:2]
+    inids = searchsorted(nid_cp_cd[:, 0], nids)
+    return xyz_cid0[inids, :]
 
 def _eq_nodes_setup_node_set(model: BDF, node_set, renumber_nodes: bool=False,
                              ) -> Tuple[NDArrayNint, NDArrayNint, Dict[int, int]]:
@@ -331,6 +351,170 @@ def _eq_nodes_final(nid_pairs, model: BDF, tol: float,
         #skip_nodes.append(nid2)
     return
 
+def _eq_nodes_find_clusters(nodes_xyz: NDArrayN3float,
+                            nids: NDArrayNint,
+                            tol: float,
+                            nworkers: int=1,
+                            chunk_size: Optional[int]=None) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Groups the nodes that are within tol of each other
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs to equivalence
+    nids : (nnodes,) int ndarray
+        the sorted node ids
+    tol : float
+        the spherical equivalence tolerance
+    nworkers : int; default=1
+        the number of threads for the neighbor search
+    chunk_size : int; default=None
+        the number of nodes per neighbor search
+
+    Returns
+    -------
+    nids_merged : (nmerged, ) int ndarray
+        the sorted node ids that are removed
+    nids_kept : (nmerged, ) int ndarray
+        the node id that replaces each merged node, which is the lowest
+        node id of the group
+
+    """
+    nnodes = len(nids)
+    inids1, inids2 = _get_close_pairs(None, nodes_xyz, tol,
+                                      nworkers=nworkers, chunk_size=chunk_size)
+
+    # union-find; the groups are the connected components of the pairs,
+    # so A-B-C is a group even if A and C aren't close
+    graph = scipy.sparse.coo_matrix(
+        (np.ones(len(inids1), dtype='int8'), (inids1, inids2)),
+        shape=(nnodes, nnodes))
+    unused_ngroups, igroups = connected_components(graph, directed=False)
+
+    # the nids are sorted, so the first node of a group is the lowest
+    unused_ugroups, ifirst = unique(igroups, return_index=True)
+    ikept = ifirst[igroups]
+    imerged = np.where(ikept != arange(nnodes))[0]
+    return nids[imerged], nids[ikept[imerged]]
+
+def _get_close_pairs(kdt, nodes_xyz: NDArrayN3float, tol: float,
+                     nworkers: int=1,
+                     chunk_size: Optional[int]=None) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Finds the pairs of nodes that are within tol of each other
+
+    Parameters
+    ----------
+    kdt : cKDTree() / None
+        the kdtree of nodes_xyz; None -> build it
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs
+    tol : float
+        the spherical tolerance
+    nworkers : int; default=1
+        the number of threads that search the chunks; -1 uses all the
+        processors
+    chunk_size : int; default=None
+        the number of nodes per chunk; None uses one chunk
+
+    Returns
+    -------
+    inids1, inids2 : (npairs, ) int ndarray
+        the indices of the close nodes; inids1 < inids2
+
+    The chunks are chunk_size nodes (sorted by x, so a chunk is compact)
+    that are searched against the kdtree of all the nodes, so the memory
+    of a search is bounded by the pairs of chunk_size nodes.  The kdtree
+    is searched without the GIL, so the chunks are searched in parallel.
+
+    """
+    nnodes = nodes_xyz.shape[0]
+    if kdt is None:
+        kdt = _get_tree(nodes_xyz)
+    if chunk_size is None and nworkers == 1:
+        pairs = kdt.query_pairs(tol, output_type='ndarray')
+        pairs.sort(axis=1)
+        return pairs[:, 0], pairs[:, 1]
+
+    if nworkers == -1:
+        nworkers = os.cpu_count()
+    if chunk_size is None:
+        chunk_size = -(-nnodes // nworkers)
+
+    isort = np.argsort(nodes_xyz[:, 0], kind='stable')
+    def _get_chunk_pairs(i0: int) -> NDArrayNint:
+        """gets the pairs of the nodes in the chunk and a higher index node"""
+        ichunk = isort[i0:i0 + chunk_size]
+        chunk_kdt = scipy.spatial.cKDTree(nodes_xyz[ichunk, :])
+        distances = chunk_kdt.sparse_distance_matrix(kdt, tol, output_type='ndarray')
+        inids1 = ichunk[distances['i']]
+        inids2 = distances['j']
+        is_pair = inids1 < inids2
+        return np.column_stack([inids1[is_pair], inids2[is_pair]])
+
+    with ThreadPoolExecutor(max_workers=nworkers) as executor:
+        pairs_list = list(executor.map(_get_chunk_pairs, range(0, nnodes, chunk_size)))
+    pairs = np.vstack(pairs_list).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+def _eq_nodes_remap(model: BDF, nids_merged: NDArrayNint, nids_kept: NDArrayNint) -> None:
+    """
+    Replaces the merged nodes with the kept nodes and removes the merged nodes
+
+    The node ids of the ``ElementStore`` tables and the other cards
+    (e.g., CBAR, RBE2, FORCE) are remapped with searchsorted (see
+    ``renumber_arrays``).  A cross-referenced model is uncross-referenced
+    and cross-referenced again.
+
+    """
+    if len(nids_merged) == 0:
+        return
+    nodes = model.nodes
+    for nid_merged, nid_kept in zip(nids_merged.tolist(), nids_kept.tolist()):
+        node_kept = nodes[nid_kept]
+        node = nodes[nid_merged]
+        assert node.cd == node_kept.cd, 'nid=%s cd=%s; nid=%s cd=%s' % (
+            nid_merged, node.cd, nid_kept, node_kept.cd)
+        assert node.ps == node_kept.ps
+        assert node.seid == node_kept.seid
+
+    is_xref = model._is_xref
+    if is_xref:
+        model.uncross_reference()
+    id_map = (nids_merged, nids_kept)
+    elements = model.elements
+    if isinstance(elements, ElementStore):
+        elements.compress()
+        for table in elements.tables.values():
+            table['nodes'][:] = _remap(table['nodes'], id_map, 'nid', strict=False)
+
+    # the GRIDs aren't remapped; the merged GRIDs are removed
+    cards = chain.from_iterable(
+        _iter_cards(getattr(model, name)) for name, unused_key in CARD_GROUPS
+        if name != 'nodes')
+    node_set_ids = {spline.setg for spline in model.splines.values()
+                    if hasattr(spline, 'setg')}
+    unsupported_types = _remap_card_fields(cards, {'nid' : id_map}, node_set_ids, strict=False)
+    if unsupported_types:
+        model.log.warning('bdf_equivalence_nodes: the node ids of %s are not updated' % (
+            unsupported_types))
+
+    if isinstance(nodes, NodeStore):
+        irows = searchsorted(nodes.nids, nids_merged)
+        irows = irows[irows < len(nodes.nids)]
+        irows = irows[np.isin(nodes.nids[irows], nids_merged)]
+        nodes._delete_rows(irows.tolist())
+        nodes = nodes.objects
+    for nid in nids_merged.tolist():
+        nodes.pop(nid, None)
+    type_to_id_map = model._type_to_id_map
+    if 'GRID' in type_to_id_map:
+        grid_ids = np.array(type_to_id_map['GRID'], dtype='int64')
+        type_to_id_map['GRID'] = grid_ids[~np.isin(grid_ids, nids_merged)].tolist()
+    if is_xref:
+        model.cross_reference()
+
 def _nodes_xyz_nids_to_nid_pairs(nodes_xyz: NDArrayN3float,
                                  nids: NDArrayNint,
                                  tol: float,
@@ -345,27 +529,12 @@ def _nodes_xyz_nids_to_nid_pairs(nodes_xyz: NDArrayN3float,
         neq_max=neq_max, method=method, debug=debug)
     return nid_pairs
 
-def _nodes_xyz_nids_to_nid_pairs_new(kdt, nids, node_set, tol: float):
+def _nodes_xyz_nids_to_nid_pairs_new(kdt, nodes_xyz, nids, tol: float):
     """
     helper function for `bdf_equivalence_nodes`
     """
-    ieq3 = kdt.query_ball_tree(kdt, tol)
-    nid_pairs = []
-    for pair in ieq3:
-        if len(pair) == 1:
-            continue
-        # the combinations should be paired with 2 nodes in each group
-        for inid1, inid2 in combinations(pair, 2):
-            nid1 = nids[inid1]
-            nid2 = nids[inid2]
-            #if nid1 == nid2:
-                #continue
-            if node_set is not None:
-                if nid1 not in node_set and nid2 not in node_set:
-                    continue
-            if (nid1, nid2) in nid_pairs:
-                continue
-            nid_pairs.append((nid1, nid2))
+    inids1, inids2 = _get_close_pairs(kdt, nodes_xyz, tol)
+    nid_pairs = list(zip(nids[inids1].tolist(), nids[inids2].tolist()))
     return nid_pairs
 
 def _eq_nodes_build_tree(nodes_xyz, nids, tol, log,
@@ -408,19 +577,11 @@ def _eq_nodes_build_tree(nodes_xyz, nids, tol, log,
     assert isinstance(tol, float), 'tol=%r' % tol
     kdt = _get_tree(nodes_xyz, msg=msg)
 
-    is_not_node_set = inew is None or inew == slice(None)
-
-    # check the closest 10 nodes for equality
-    if method == 'new' and is_not_node_set:
-        kdt, nid_pairs = _eq_nodes_build_tree_new(
-            kdt, nodes_xyz,
-            nids, nnodes, is_not_node_set,
-            tol, log,
-            inew=inew, node_set=node_set, neq_max=neq_max, msg=msg,
-            debug=debug)
+    if method == 'new':
+        # nodes_xyz only has the nodes in node_set
+        nid_pairs = _nodes_xyz_nids_to_nid_pairs_new(kdt, nodes_xyz, nids, tol)
     else:
-        if method == 'new':
-            log.warning(f'setting method to "old" because node_set is specified')
+        # check the closest 10 nodes for equality
         deq, ieq = kdt.query(nodes_xyz[inew, :], k=neq_max, distance_upper_bound=tol)
         if node_set is not None:
             assert len(deq) == len(nids)
@@ -431,33 +592,6 @@ def _eq_nodes_build_tree(nodes_xyz, nids, tol, log,
     assert isinstance(nid_pairs, list), nid_pairs
     return kdt, nid_pairs
 
-def _eq_nodes_build_tree_new(kdt,
-                             nodes_xyz: NDArrayN3float,
-                             nids, nnodes, is_not_node_set: bool,
-                             tol: float,
-                             log,
-                             inew=None, node_set=None, neq_max: int=4, msg: str='',
-                             debug: float=False) -> Tuple[Any, List[Tuple[int, int]]]:
-    deq, ieq = kdt.query(nodes_xyz[inew, :], k=neq_max, distance_upper_bound=tol)
-    slots = np.where(ieq[:, :] < nnodes)
-    nid_pairs_expected = _eq_nodes_find_pairs(nids, slots, ieq, node_set=node_set)
-    if is_not_node_set:
-        nid_pairs = _nodes_xyz_nids_to_nid_pairs_new(kdt, nids, node_set, tol)
-    else:
-        raise NotImplementedError(f'node_set = {node_set}')
-
-    snid_pairs = set(nid_pairs)
-    snid_pairs_expected = set(nid_pairs_expected)
-    diff_bad = snid_pairs - snid_pairs_expected
-    diff_missed = snid_pairs - snid_pairs_expected
-    if debug and len(diff_bad) or len(diff_missed):  # pragma: no cover
-        #log.warning(f'nid_pairs          = {nid_pairs}')
-        #log.warning(f'nid_pairs_expected = {nid_pairs_expected}')
-        log.warning(f'diff_bad = {diff_bad}')
-        log.warning(f'diff_missed = {diff_missed}')
-
-    return kdt, nid_pairs
-
 def _get_tree(nodes_xyz, msg=''):
     """gets the kdtree"""
     assert isinstance(nodes_xyz, np.ndarray), type(nodes_xyz)
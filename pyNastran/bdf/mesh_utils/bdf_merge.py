@@ -2,12 +2,42 @@
 defines:
  - bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
              is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False)
+ - bdf_merge_streaming(bdf_filenames, bdf_filename_out, renumber=True, encoding=None,
+                       size=8, is_double=False, cards_to_skip=None, log=None,
+                       skip_case_control_deck=False)
 
 """
+import gc
 from io import StringIO
+from collections import defaultdict
+import numpy as np
 from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.cards.expand_card import expand_thru
 from pyNastran.bdf.case_control_deck import CaseControlDeck
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber, get_renumber_starting_ids_from_model
+from pyNastran.bdf.mesh_utils.renumber_arrays import GROUP_KEYS, MATERIAL_GROUPS
+
+#: the cards of the secondary decks that are merged
+DATA_MEMBERS = [
+    'coords', 'nodes', 'elements', 'masses', 'properties', 'properties_mass',
+    'materials', 'sets', 'rigid_elements', 'mpcs', 'caeros', 'splines',
+]
+
+#: the model attributes that set the starting ids of the next deck and
+#: their key (see ``renumber_arrays``); the SPOINT/EPOINTs are 'points'
+SCAN_GROUPS = dict(
+    [('coords', 'cid'), ('nodes', 'nid'), ('spoints', 'points'), ('epoints', 'points'),
+     ('mpcs', 'mpc_id'), ('mpcadds', 'mpc_id')] +
+    [(name, key) for key in ['eid', 'pid'] for name, unused_keyi in GROUP_KEYS[key]] +
+    [(name, 'mid') for name in MATERIAL_GROUPS])
+
+#: the fields of the cards that define more than one id
+SCAN_ID_FIELDS = {
+    'CORD1R' : [1, 5], 'CORD1C' : [1, 5], 'CORD1S' : [1, 5],
+    'PELAS' : [1, 5], 'PVISC' : [1, 5], 'PMASS' : [1, 3, 5, 7], 'PDAMP' : [1, 3, 5, 7],
+}
 
 def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
               is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False):
@@ -66,16 +96,7 @@ def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None
     .. warning:: still very preliminary
 
     """
-    if not isinstance(bdf_filenames, (list, tuple)):
-        raise TypeError('bdf_filenames is not a list/tuple...%s' % str(bdf_filenames))
-
-    if not len(bdf_filenames) > 1:
-        raise RuntimeError("You can't merge one BDF...bdf_filenames=%s" % str(bdf_filenames))
-    for bdf_filename in bdf_filenames:
-        if not isinstance(bdf_filename, (str, BDF, StringIO)):
-            raise TypeError('bdf_filenames is not a string/BDF...%s' % bdf_filename)
-
-        #bdf_filenames = [bdf_filenames]
+    _check_bdf_filenames(bdf_filenames)
 
     #starting_id_dict_default = {
         #'cid' : max(model.coords.keys()),
@@ -104,10 +125,7 @@ def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None
 
     _mapper_0 = _get_mapper_0(model) # mapper for first model
 
-    data_members = [
-        'coords', 'nodes', 'elements', 'masses', 'properties', 'properties_mass',
-        'materials', 'sets', 'rigid_elements', 'mpcs', 'caeros', 'splines',
-    ]
+    data_members = DATA_MEMBERS
     mappers = []
     for bdf_filename in bdf_filenames[1:]:
         starting_id_dict = get_renumber_starting_ids_from_model(model)
@@ -187,6 +205,282 @@ def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None
                                      mapper_renumber=mapper_renumber)
     return model, mappers_final
 
+def bdf_merge_streaming(bdf_filenames, bdf_filename_out, renumber=True, encoding=None,
+                        size=8, is_double=False, cards_to_skip=None, log=None,
+                        skip_case_control_deck=False):
+    """
+    Merges multiple BDFs into one file without holding the merged model
+
+    The starting ids of each deck are one more than the max ids (by card
+    class) of the decks before it, which are found by scanning the card
+    text of the decks (see ``_scan_max_ids``).  Then, each deck is read,
+    renumbered and written before the next deck is read, so the memory is
+    set by the largest deck instead of the sum of the decks.  Like
+    ``bdf_merge``, all of the first deck is written and the
+    ``DATA_MEMBERS`` of the other decks are appended (only those cards
+    of the other decks are read).
+
+    Parameters
+    ----------
+    bdf_filenames : List[str]
+        list of bdf filenames
+    bdf_filename_out : str / file
+        the output bdf filename
+    renumber : bool
+        should the bdf be renumbered (default=True)
+    encoding : str
+        the unicode encoding (default=None; system default)
+    size : int; {8, 16}; default=8
+        the bdf write precision
+    is_double : bool; default=False
+        the field precision to write
+    cards_to_skip : List[str]; (default=None -> don't skip any cards)
+        the cards to skip when the decks are read
+    log : logger; default=None
+        a logger object
+    skip_case_control_deck : bool, optional, default : False
+        If true, don't consider the case control deck while merging.
+
+    Returns
+    -------
+    mappers_all : List[mapper]
+        mapper : Dict[bdf_attribute] : old_id_to_new_id_dict
+            the mapper of each bdf_filename (see ``bdf_merge``)
+
+    .. note:: the decks are renumbered with ``bdf_renumber(method='array')``,
+              so the set, CAERO and SPLINE ids are kept and must be unique
+    .. note:: the cards of each deck are written together, so the cards
+              are in a different order than ``bdf_merge``; for
+              renumber=True, the element ids of each deck are consecutive
+              (elements, then masses, then rigid elements) instead of the
+              elements of all the decks coming first
+    .. note:: the starting ids skip all the element (e.g., PLOTEL) and
+              material (e.g., MAT4) ids of the decks before it, while
+              ``bdf_merge`` only considers the elements/masses/rigid
+              elements and the MAT1-type materials
+
+    """
+    _check_bdf_filenames(bdf_filenames)
+    # the starting ids of each deck are set by the ids of the decks before
+    # it, which are scanned from the card text before any deck is read
+    merged_groups = [name for name in SCAN_GROUPS if name in DATA_MEMBERS]
+    max_ids = [_scan_max_ids(bdf_filenames[0], list(SCAN_GROUPS), renumber=renumber,
+                             encoding=encoding, log=log)]
+    starting_id_dicts = [None]
+    for bdf_filename in bdf_filenames[1:]:
+        starting_id_dict = {key: max_id + 1 for key, max_id in max_ids[-1].items()}
+        if len(starting_id_dicts) > 1:
+            for key, value in starting_id_dicts[-1].items():
+                starting_id_dict[key] = max(value, starting_id_dict[key])
+        starting_id_dicts.append(starting_id_dict)
+        max_ids.append(_scan_max_ids(bdf_filename, merged_groups, starting_id_dict=starting_id_dict,
+                                     encoding=encoding, log=log))
+
+    close = False
+    if isinstance(bdf_filename_out, str):
+        bdf_file = open(bdf_filename_out, 'w', encoding=encoding)
+        close = True
+    else:
+        bdf_file = bdf_filename_out
+
+    # only the merged cards of the secondary decks are read
+    type_to_slot_map = BDF(debug=False, log=log)._type_to_slot_map
+    merged_slots = set(DATA_MEMBERS + ['aero', 'aeros', 'mkaeros', 'params'])
+    secondary_cards_to_skip = [card_type for card_type, slot in type_to_slot_map.items()
+                               if slot not in merged_slots]
+    if cards_to_skip:
+        secondary_cards_to_skip += cards_to_skip
+
+    merged_ids = {'sets' : set(), 'caeros' : set(), 'splines' : set()}
+    merged_scalars = {'aero' : False, 'aeros' : False, 'params' : set()}
+    mappers_all = []
+    for ifile, bdf_filename in enumerate(bdf_filenames):
+        if isinstance(bdf_filename, BDF):
+            model = bdf_filename
+        else:
+            model = BDF(debug=False, log=log)
+            model.disable_cards(cards_to_skip if ifile == 0 else secondary_cards_to_skip)
+            model.read_bdf(bdf_filename, encoding=encoding, validate=False, xref=False)
+
+        if ifile == 0:
+            model.log.info('primary=%s' % bdf_filename)
+            if skip_case_control_deck:
+                model.case_control_deck = CaseControlDeck([], log=None)
+            is_enddata = 'ENDDATA' in model.card_count
+            model_merge = model
+            if renumber:
+                _, mapper = bdf_renumber(model_merge, None, size=size, is_double=is_double,
+                                         cards_to_skip=cards_to_skip, method='array')
+            else:
+                mapper = _get_mapper_0(model_merge)
+        else:
+            model.log.info('secondary=%s' % bdf_filename)
+            model_merge = _get_merge_model(model, merged_ids, merged_scalars)
+            _, mapper = bdf_renumber(model_merge, None,
+                                     starting_id_dict=dict(starting_id_dicts[ifile]),
+                                     size=size, is_double=is_double,
+                                     cards_to_skip=cards_to_skip, method='array')
+            for data_member in merged_ids:
+                mapper[data_member] = _dict_key_to_key(getattr(model_merge, data_member))
+        del model
+
+        groups = list(SCAN_GROUPS) if ifile == 0 else merged_groups
+        _check_max_ids(model_merge, groups, max_ids[ifile], bdf_filename)
+        for data_member, ids in merged_ids.items():
+            ids.update(getattr(model_merge, data_member))
+        merged_scalars['aero'] |= model_merge.aero is not None
+        merged_scalars['aeros'] |= model_merge.aeros is not None
+        merged_scalars['params'].update(model_merge.params)
+
+        model_merge.write_bdf(bdf_file, size=size, is_double=is_double,
+                              enddata=False, write_header=(ifile == 0), close=False)
+        mappers_all.append(mapper)
+        # a model has reference cycles, so it's collected before the next
+        # deck is read
+        del model_merge
+        gc.collect()
+
+    if is_enddata:
+        bdf_file.write('ENDDATA\n')
+    if close:
+        bdf_file.close()
+    return mappers_all
+
+def _scan_max_ids(bdf_filename, groups, renumber=True, starting_id_dict=None,
+                  encoding=None, log=None):
+    """
+    Gets the max ids of a deck after it's renumbered from the card text,
+    without building the cards
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO / BDF
+        the deck
+    groups : List[str]
+        the model attributes that are merged (see ``SCAN_GROUPS``)
+    renumber : bool; default=True
+        is the deck renumbered
+    starting_id_dict : Dict[key] = int; default=None -> 1
+        the starting ids of the renumbered deck
+
+    Returns
+    -------
+    max_ids : Dict[key] = int
+        the max id of each key (e.g., nid, eid); 0 for no ids
+
+    """
+    # the element/property groups are renumbered one after the other, so
+    # the ids are counted by group
+    ids = defaultdict(list)
+    subkeys = {name: (name if SCAN_GROUPS[name] in GROUP_KEYS else SCAN_GROUPS[name])
+               for name in groups}
+    if isinstance(bdf_filename, BDF):
+        for name in groups:
+            ids[subkeys[name]].extend(getattr(bdf_filename, name))
+    else:
+        model = BDF(debug=False, log=log)
+        type_to_slot_map = dict(model._type_to_slot_map)
+        type_to_slot_map.update({'SPOINT' : 'spoints', 'EPOINT' : 'epoints'})
+        obj = BDFInputPy(model.read_includes, model.dumplines, encoding, log=model.log)
+        out = obj.get_lines(bdf_filename, punch=False, make_ilines=True)
+        if isinstance(bdf_filename, StringIO):
+            bdf_filename.seek(0)
+        cards_list = model.get_bdf_cards(out[3], out[4])[0]
+        del out
+
+        group_to_ids = {name: ids[subkey] for name, subkey in subkeys.items()}
+        for card_name, unused_comment, card_lines, unused_iline in cards_list:
+            idsi = group_to_ids.get(type_to_slot_map.get(card_name))
+            if idsi is None:
+                continue
+            fields = to_fields(card_lines, card_name)
+            if card_name in ('SPOINT', 'EPOINT'):
+                idsi.extend(expand_thru([field.strip() for field in fields[1:]
+                                         if field.strip()], set_fields=False))
+                continue
+            for ifield in SCAN_ID_FIELDS.get(card_name, [1]):
+                if ifield < len(fields) and fields[ifield].strip():
+                    idsi.append(int(fields[ifield]))
+
+    points = np.unique(np.array(ids.pop('points', []), dtype='int64'))
+    max_ids = {key: 0 for key in set(SCAN_GROUPS.values()) if key != 'points'}
+    nids = defaultdict(int)
+    for subkey, idsi in ids.items():
+        key = SCAN_GROUPS.get(subkey, subkey)
+        idsi = np.unique(np.array(idsi, dtype='int64'))
+        if key == 'cid':
+            idsi = idsi[idsi != 0]
+        if len(idsi):
+            max_ids[key] = max(max_ids[key], int(idsi.max()))
+            nids[key] += len(idsi)
+
+    if renumber:
+        # the ids are renumbered in order from the starting id; the new
+        # GRID ids skip the SPOINT/EPOINT ids
+        for key, nidsi in nids.items():
+            start = 1 if starting_id_dict is None else starting_id_dict.get(key, 1)
+            new_ids = np.arange(start, start + nidsi + len(points), dtype='int64')
+            if key == 'nid':
+                new_ids = new_ids[~np.isin(new_ids, points)]
+            max_ids[key] = int(new_ids[nidsi - 1])
+    if len(points):
+        max_ids['nid'] = max(max_ids['nid'], int(points.max()))
+    return max_ids
+
+def _check_max_ids(model, groups, max_ids, bdf_filename):
+    """checks that the ids of a merged deck aren't more than the scanned max ids"""
+    for name in groups:
+        key = SCAN_GROUPS[name]
+        key = 'nid' if key == 'points' else key
+        ids = getattr(model, name)
+        if ids and max(ids) > max_ids[key]:
+            raise RuntimeError('%s: the max %s=%s is more than the scanned max %s=%s' % (
+                bdf_filename, name, max(ids), key, max_ids[key]))
+
+def _check_bdf_filenames(bdf_filenames):
+    """checks the decks to merge"""
+    if not isinstance(bdf_filenames, (list, tuple)):
+        raise TypeError('bdf_filenames is not a list/tuple...%s' % str(bdf_filenames))
+
+    if not len(bdf_filenames) > 1:
+        raise RuntimeError("You can't merge one BDF...bdf_filenames=%s" % str(bdf_filenames))
+    for bdf_filename in bdf_filenames:
+        if not isinstance(bdf_filename, (str, BDF, StringIO)):
+            raise TypeError('bdf_filenames is not a string/BDF...%s' % bdf_filename)
+
+def _get_merge_model(model, merged_ids, merged_scalars):
+    """
+    Gets a model with the cards of a secondary deck that are merged
+
+    Parameters
+    ----------
+    model : BDF
+        the secondary deck
+    merged_ids : Dict[data_member] = ids
+        the set/CAERO/SPLINE ids that were written, which aren't renumbered
+    merged_scalars : Dict[name] = written
+        the AERO/AEROS/PARAM cards that were written (see ``_apply_scalar_cards``)
+
+    """
+    model_merge = BDF(debug=False, log=model.log)
+    # only the bulk data is written
+    model_merge.punch = True
+    for data_member in DATA_MEMBERS:
+        setattr(model_merge, data_member, getattr(model, data_member))
+    for data_member, ids in merged_ids.items():
+        duplicate_ids = ids.intersection(getattr(model_merge, data_member))
+        if duplicate_ids:
+            raise RuntimeError('%s=%s are already merged' % (data_member, sorted(duplicate_ids)))
+
+    if not merged_scalars['aero']:
+        model_merge.aero = model.aero
+    if not merged_scalars['aeros']:
+        model_merge.aeros = model.aeros
+    model_merge.mkaeros = model.mkaeros
+    model_merge.params = {key : param for key, param in model.params.items()
+                          if key not in merged_scalars['params']}
+    return model_merge
+
 def _apply_scalar_cards(model, model2_renumber):
     """apply cards from model2 to model if they don't exist in model"""
     if model.aero is None and model2_renumber.aero:
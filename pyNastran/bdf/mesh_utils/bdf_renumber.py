@@ -2,10 +2,10 @@
 defines:
     bdf_renumber(bdf_filename, bdf_filename_out, size=8, is_double=False,
                  starting_id_dict=None, round_ids=False, cards_to_skip=None,
-                 log=None, debug=False)
+                 log=None, debug=False, method='xref', node_ordering='sorted')
     superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double=False,
                           starting_id_dict=None, cards_to_skip=None,
-                          log=None, debug=False)
+                          log=None, debug=False, method='xref', node_ordering='sorted')
 
 """
 from itertools import chain
@@ -17,6 +17,8 @@ import numpy as np
 from pyNastran.bdf.bdf import BDF
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.utils.mathematics import roundup
+from pyNastran.bdf.mesh_utils.renumber_arrays import (
+    renumber_arrays, _get_grid_id_map, MATERIAL_GROUPS)
 
 
 def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
@@ -24,7 +26,8 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
                  size=8, is_double=False,
                  starting_id_dict=None, round_ids: bool=False,
                  cards_to_skip: Optional[List[str]]=None,
-                 log=None, debug=False) -> BDF:
+                 log=None, debug=False, method: str='xref',
+                 node_ordering: str='sorted') -> BDF:
     """
     Renumbers a BDF
 
@@ -58,6 +61,17 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
         There are edge cases (e.g. FLUTTER analysis) where things can
         break due to uncross-referenced cards.  You need to disable
         entire classes of cards in that case (e.g. all aero cards).
+    method : str; default='xref'
+        xref : the cross-referenced cards are renumbered, so the model
+               must be fully valid
+        array : the id fields are renumbered with arrays, so the model
+                doesn't need to be cross-referenced; only the nid, eid,
+                pid, mid, cid, spc_id, mpc_id and load_id keys are
+                renumbered (see ``renumber_arrays``)
+    node_ordering : str; default='sorted'
+        sorted : the GRIDs are renumbered in the order of the ids
+        rcm : the GRIDs are renumbered in reverse Cuthill-McKee order,
+              which reduces the bandwidth (see ``get_node_ordering``)
 
     Returns
     -------
@@ -228,6 +242,18 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
             if key not in starting_id_dict:
                 starting_id_dict[key] = value
 
+    if method == 'array':
+        for key in starting_id_dict:
+            assert key in starting_id_dict_default, 'key=%r is invalid' % (key)
+        model = _get_bdf_model(bdf_filename, cards_to_skip=cards_to_skip, log=log, debug=debug)
+        id_maps = renumber_arrays(model, starting_id_dict, node_ordering=node_ordering)
+        mapper = _get_array_mapper(model, id_maps)
+        _update_case_control(model, mapper)
+        _write_bdf(model, bdf_filename_out, size=size, is_double=is_double)
+        return model, mapper
+    elif method != 'xref':
+        raise ValueError("method=%r and must be 'xref' or 'array'" % method)
+
     nid = None
     cid = None
     eid = None
@@ -361,7 +387,8 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
 
     model = _get_bdf_model(bdf_filename, cards_to_skip=cards_to_skip, log=log, debug=debug)
 
-    nid_map, unused_reverse_nid_map = _create_nid_maps(model, starting_id_dict, nid)
+    nid_map, unused_reverse_nid_map = _create_nid_maps(
+        model, starting_id_dict, nid, node_ordering=node_ordering)
     mid_map, all_materials = _create_mid_map(model, mid)
 
     _update_nodes(
@@ -631,12 +658,65 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
     #print('****suport1_map', suport1_map)
     #print('****dessub_map', dessub_map)
     #print('****dresp_map', dresp_map)
+    model._adjacency = None
     _update_case_control(model, mapper)
 
     _write_bdf(model, bdf_filename_out, size=size, is_double=is_double)
     return model, mapper
 
 
+class _IdentityMap(dict):
+    """the map of the ids that aren't renumbered; a missing id maps to itself"""
+    def __missing__(self, key):
+        return key
+
+
+def _get_array_mapper(model: BDF, id_maps) -> Dict[str, Dict[int, int]]:
+    """gets the mapper of ``bdf_renumber`` from the id maps of ``renumber_arrays``"""
+    def get_map(key, ids=()):
+        """gets the old_id -> new_id map of a key; the ids are kept if it's not renumbered"""
+        if key not in id_maps:
+            return _IdentityMap((idi, idi) for idi in ids)
+        old_ids, new_ids = id_maps[key]
+        return dict(zip(old_ids.tolist(), new_ids.tolist()))
+
+    materials = set()
+    for name in MATERIAL_GROUPS:
+        materials.update(getattr(model, name))
+    cid_map = get_map('cid', model.coords)
+    if 0 in model.coords:
+        cid_map[0] = 0
+
+    # an id may be an element and a mass/rigid element; the element wins
+    element_map = {}
+    for key, name in [('plotel_eid', 'plotels'), ('rigid_eid', 'rigid_elements'),
+                      ('mass_eid', 'masses'), ('eid', 'elements')]:
+        element_map.update(get_map(key, getattr(model, name)))
+    load_map = get_map('load_id')
+    mapper = {
+        'elements' : element_map,
+        'masses' : get_map('mass_eid', model.masses),
+        'rigid_elements' : get_map('rigid_eid', model.rigid_elements),
+        'nodes' : get_map('nid', chain(model.nodes, model.spoints, model.epoints)),
+        'coords' : cid_map,
+        'materials' : get_map('mid', materials),
+        'properties' : get_map('pid', model.properties),
+        'properties_mass' : get_map('mass_pid', model.properties_mass),
+        'spcs' : get_map('spc_id'),
+        'mpcs' : get_map('mpc_id'),
+        'LOAD' : load_map,
+        'LOADSET' : load_map,
+        'CLOAD' : load_map,
+        'TEMPERATURE(LOAD)' : load_map,
+        'TEMPERATURE(INITIAL)' : load_map,
+    }
+    for key in ['METHOD', 'CMETHOD', 'FLFACT', 'FMETHOD', 'FREQUENCY', 'sets', 'splines',
+                'caeros', 'DLOAD', 'RANDOM', 'TSTEP', 'TSTEPNL', 'SUPORT1', 'NLPARM',
+                'SDAMPING', 'DESSUB', 'DESOBJ', 'GUST', 'TRIM', 'IC', 'CSSCHD', 'TFL']:
+        mapper[key] = _IdentityMap()
+    return mapper
+
+
 def _write_bdf(model, bdf_filename_out, size=8, is_double=False):
     """helper method"""
     if bdf_filename_out is not None:
@@ -747,7 +827,7 @@ def get_starting_ids_dict_from_mapper(model, mapper):
 
 def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double=False,
                           starting_id_dict=None, cards_to_skip=None,
-                          log=None, debug=False):
+                          log=None, debug=False, method='xref', node_ordering='sorted'):
     """
     Renumbers a superelement
 
@@ -776,6 +856,10 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
         There are edge cases (e.g. FLUTTER analysis) where things can
         break due to uncross-referenced cards.  You need to disable
         entire classes of cards in that case (e.g. all aero cards).
+    method : str; default='xref'
+        the renumbering engine (see ``bdf_renumber``)
+    node_ordering : str; default='sorted'
+        the order of the new GRID ids (see ``bdf_renumber``)
 
     Returns
     -------
@@ -797,7 +881,8 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
     _model, mapper = bdf_renumber(
         model, _bdf_filename_out,
         size=8, is_double=False, starting_id_dict=starting_id_dict, round_ids=False,
-        cards_to_skip=None, log=None, debug=False)
+        cards_to_skip=None, log=None, debug=False,
+        method=method, node_ordering=node_ordering)
 
     starting_id_dict_new = get_starting_ids_dict_from_mapper(model, mapper)
     #mapper_short = {key : value for key, value in mapper.items() if len(value)}
@@ -807,7 +892,8 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
         _smodel, superelement_mapper = bdf_renumber(
             superelement, _bdf_filename_out,
             size=8, is_double=False, starting_id_dict=starting_id_dict_new, round_ids=False,
-            cards_to_skip=None, log=None, debug=False)
+            cards_to_skip=None, log=None, debug=False,
+            method=method, node_ordering=node_ordering)
 
         #mapper2 = {key : value for key, value in superelement_mapper.items() if len(value)}
         starting_id_dict_new = get_starting_ids_dict_from_mapper(
@@ -820,8 +906,8 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
     return model #, mapper
 
 
-def _create_nid_maps(model, starting_id_dict, nid):
-    """builds the nid_maps"""
+def _create_nid_maps(model, starting_id_dict, nid, node_ordering='sorted'):
+    """builds the nid_maps; the new ids skip the SPOINT/EPOINT ids"""
     nid_map = {}
     reverse_nid_map = {}
 
@@ -830,38 +916,10 @@ def _create_nid_maps(model, starting_id_dict, nid):
     nids = model.nodes.keys()
 
     nids_spoints_epoints = sorted(chain(nids, spoints, epoints))
-
-    #spoints_nids.sort()
-    i = 1
-    #nnodes = len(spoints_nids)
-
-    i = 1
-    #j = 1
-    #print(spoints_nids)
-    #k = 0
-    #model.log.debug(starting_id_dict)
     if 'nid' in starting_id_dict and nid is not None:
-        i = nid
-        #banned_nodes = spoints
-        for nidi in nids_spoints_epoints:
-            if nidi in spoints or nidi in epoints:
-                pass
-                #print('sid=%s -> %s' % (nid, i))
-                #i += 1
-            else:
-                while i in spoints or i in epoints:
-                    #print('*bump')
-                    i += 1
-                #print('nid=%s -> %s' % (nid, i))
-                nid_map[nidi] = i
-                reverse_nid_map[i] = nidi
-                i += 1
-        #for nid in sorted(nids):
-            #nid_map[nid] = i
-            #reverse_nid_map[i] = nid
-            #i += 1
-        #print(nid_map)
-        #print(reverse_nid_map)
+        nids_old, nids_new = _get_grid_id_map(model, nid, node_ordering)
+        nid_map = dict(zip(nids_old.tolist(), nids_new.tolist()))
+        reverse_nid_map = dict(zip(nids_new.tolist(), nids_old.tolist()))
     else:
         for nid in nids_spoints_epoints:
             nid_map[nid] = nid
@@ -5,10 +5,14 @@ defines:
                               max_taper_ratio=4.0)
  - eids_to_delete = get_bad_shells(model, xyz_cid0, nid_map, max_theta=175., max_skew=70.,
                                    max_aspect_ratio=100., max_taper_ratio=4.0)
+ - quality = element_quality(model, nids=None, xyz_cid0=None, nid_map=None)
+ - quality = element_quality_arrays(etype, inodes, xyz_cid0, chunk_size=100000)
 
 """
 import numpy as np
 
+from pyNastran.bdf.mesh_utils.model_arrays import get_element_columns
+
 SIDE_MAP = {}
 SIDE_MAP['CHEXA'] = {
     1 : [4, 3, 2, 1],
@@ -21,6 +25,81 @@ SIDE_MAP['CHEXA'] = {
 PIOVER2 = np.pi / 2.
 PIOVER3 = np.pi / 3.
 
+# these normals point inwards
+#      4
+#    / | \
+#   /  |  \
+#  3-------2
+#   \  |   /
+#    \ | /
+#      1
+CTETRA_FACES = (
+    (0, 1, 2), # (1, 2, 3),
+    (0, 3, 1), # (1, 4, 2),
+    (0, 3, 2), # (1, 3, 4),
+    (1, 3, 2), # (2, 4, 3),
+)
+
+# these normals point inwards
+#
+#        /4-----3
+#       /       /
+#      /  5    /
+#    /    \   /
+#   /      \ /
+# 1---------2
+CPYRAM_FACES = (
+    (0, 1, 2, 3), # (1, 2, 3, 4),
+    (1, 4, 2), # (2, 5, 3),
+    (2, 4, 3), # (3, 5, 4),
+    (0, 3, 4), # (1, 4, 5),
+    (0, 4, 1), # (1, 5, 2),
+)
+
+# these normals point inwards
+#       /6
+#     /  | \
+#   /    |   \
+# 3\     |     \
+# |  \   /4-----5
+# |    \/       /
+# |   /  \     /
+# |  /    \   /
+# | /      \ /
+# 1---------2
+CPENTA_FACES = (
+    (0, 2, 1), # (1, 3, 2),
+    (3, 4, 5), # (4, 5, 6),
+
+    (0, 1, 4, 3), # (1, 2, 5, 4), # bottom
+    (1, 2, 5, 4), # (2, 3, 6, 5), # right
+    (0, 3, 5, 2), # (1, 4, 6, 3), # left
+)
+
+# these normals point inwards
+#      8----7
+#     /|   /|
+#    / |  / |
+#   /  5-/--6
+# 4-----3   /
+# |  /  |  /
+# | /   | /
+# 1-----2
+CHEXA_FACES = (
+    (4, 5, 6, 7), # (5, 6, 7, 8),
+    (0, 3, 2, 1), # (1, 4, 3, 2),
+    (1, 2, 6, 5), # (2, 3, 7, 6),
+    (2, 3, 7, 6), # (3, 4, 8, 7),
+    (0, 4, 7, 3), # (1, 5, 8, 4),
+    (0, 1, 5, 4), # (1, 2, 6, 5),
+)
+SOLID_FACES = {
+    'CTETRA' : CTETRA_FACES,
+    'CPYRAM' : CPYRAM_FACES,
+    'CPENTA' : CPENTA_FACES,
+    'CHEXA' : CHEXA_FACES,
+}
+
 
 def delete_bad_shells(model,
                       min_theta=0.1, max_theta=175.,
@@ -342,7 +421,7 @@ def element_quality(model, nids=None, xyz_cid0=None, nid_map=None):
     xyz_cid0 : (nnodes, 3) float ndarray; default=None
         the associated global xyz locations
     nid_map : Dict[nid]->index; default=None
-        a mapper dictionary
+        a mapper dictionary (unused)
 
     Returns
     -------
@@ -358,6 +437,9 @@ def element_quality(model, nids=None, xyz_cid0=None, nid_map=None):
     Notes
     -----
      - pulled from nastran_io.py
+     - the supported elements are first (sorted by element id); the
+       unsupported elements (e.g., CELAS1) are 0.0
+     - see ``element_quality_arrays``
 
     """
     if nids is None or xyz_cid0 is None:
@@ -368,325 +450,311 @@ def element_quality(model, nids=None, xyz_cid0=None, nid_map=None):
         xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
             xyz_cp, nids, icp_transform, cid=0,
             in_place=False)
+    nids = np.asarray(nids)
 
-    if nid_map is None:
-        nid_map = {}
-        for i, nid in enumerate(nids):
-            nid_map[nid] = i
-
-    all_nids = nids
-    del nids
-
-    # these normals point inwards
-    #      4
-    #    / | \
-    #   /  |  \
-    #  3-------2
-    #   \  |   /
-    #    \ | /
-    #      1
-    _ctetra_faces = (
-        (0, 1, 2), # (1, 2, 3),
-        (0, 3, 1), # (1, 4, 2),
-        (0, 3, 2), # (1, 3, 4),
-        (1, 3, 2), # (2, 4, 3),
-    )
-
-    # these normals point inwards
-    #
-    #
-    #
-    #
-    #        /4-----3
-    #       /       /
-    #      /  5    /
-    #    /    \   /
-    #   /      \ /
-    # 1---------2
-    _cpyram_faces = (
-        (0, 1, 2, 3), # (1, 2, 3, 4),
-        (1, 4, 2), # (2, 5, 3),
-        (2, 4, 3), # (3, 5, 4),
-        (0, 3, 4), # (1, 4, 5),
-        (0, 4, 1), # (1, 5, 2),
-    )
-
-    # these normals point inwards
-    #       /6
-    #     /  | \
-    #   /    |   \
-    # 3\     |     \
-    # |  \   /4-----5
-    # |    \/       /
-    # |   /  \     /
-    # |  /    \   /
-    # | /      \ /
-    # 1---------2
-    _cpenta_faces = (
-        (0, 2, 1), # (1, 3, 2),
-        (3, 4, 5), # (4, 5, 6),
-
-        (0, 1, 4, 3), # (1, 2, 5, 4), # bottom
-        (1, 2, 5, 4), # (2, 3, 6, 5), # right
-        (0, 3, 5, 2), # (1, 4, 6, 3), # left
-    )
-
-    # these normals point inwards
-    #      8----7
-    #     /|   /|
-    #    / |  / |
-    #   /  5-/--6
-    # 4-----3   /
-    # |  /  |  /
-    # | /   | /
-    # 1-----2
-    _chexa_faces = (
-        (4, 5, 6, 7), # (5, 6, 7, 8),
-        (0, 3, 2, 1), # (1, 4, 3, 2),
-        (1, 2, 6, 5), # (2, 3, 7, 6),
-        (2, 3, 7, 6), # (3, 4, 8, 7),
-        (0, 4, 7, 3), # (1, 5, 8, 4),
-        (0, 6, 5, 4), # (1, 7, 6, 5),
-    )
-
-    # quality
-    nelements = len(model.elements)
-    min_interior_angle = np.zeros(nelements, 'float32')
-    max_interior_angle = np.zeros(nelements, 'float32')
-    dideal_theta = np.zeros(nelements, 'float32')
-    max_skew_angle = np.zeros(nelements, 'float32')
-    max_warp_angle = np.zeros(nelements, 'float32')
-    max_aspect_ratio = np.zeros(nelements, 'float32')
-    #area = np.zeros(nelements, 'float32')
-    area_ratio = np.zeros(nelements, 'float32')
-    taper_ratio = np.zeros(nelements, 'float32')
-    min_edge_length = np.zeros(nelements, 'float32')
-    #normals = np.full((nelements, 3), np.nan, 'float32')
-
-
-    #nids_list = []
-    ieid = 0
-    for unused_eid, elem in sorted(model.elements.items()):
-        if ieid % 5000 == 0 and ieid > 0:
-            print('  map_elements = %i' % ieid)
-        etype = elem.type
-        nids = None
-        inids = None
-
-        dideal_thetai = np.nan
-        min_thetai = np.nan
-        max_thetai = np.nan
-        #max_thetai = np.nan
-        max_skew = np.nan
-        max_warp = np.nan
-        aspect_ratio = np.nan
-        #areai = np.nan
-        area_ratioi = np.nan
-        taper_ratioi = np.nan
-        min_edge_lengthi = np.nan
-        #normali = np.nan
-        if etype in ['CTRIA3', 'CTRIAR', 'CTRAX3', 'CPLSTN3']:
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2, p3 = xyz_cid0[inids, :]
-            out = tri_quality(p1, p2, p3)
-            (areai, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-            #normali = np.cross(p1 - p2, p1 - p3)
-
-        elif etype in ['CQUAD4', 'CQUADR', 'CPLSTN4', 'CQUADX4']:
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2, p3, p4 = xyz_cid0[inids, :]
-            out = quad_quality(elem, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
-
-        elif etype == 'CTRIA6':
-            nids = elem.nodes
-            if None in nids:
-                inids = np.searchsorted(all_nids, nids[:3])
-                nids = nids[:3]
-                p1, p2, p3 = xyz_cid0[inids, :]
-            else:
-                inids = np.searchsorted(all_nids, nids)
-                p1, p2, p3, p4, unused_p5, unused_p6 = xyz_cid0[inids, :]
-            out = tri_quality(p1, p2, p3)
-            (areai, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-
-        elif etype == 'CQUAD8':
-            nids = elem.nodes
-            if None in nids:
-                inids = np.searchsorted(all_nids, nids[:4])
-                nids = nids[:4]
-                p1, p2, p3, p4 = xyz_cid0[inids, :]
-            else:
-                inids = np.searchsorted(all_nids, nids)
-                p1, p2, p3, p4 = xyz_cid0[inids[:4], :]
-            out = quad_quality(elem, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
-            #normali = np.cross(p1 - p3, p2 - p4)
-
-        elif etype == 'CSHEAR':
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2, p3, p4 = xyz_cid0[inids, :]
-            out = quad_quality(elem, p1, p2, p3, p4)
-            (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
-
-        elif etype == 'CTETRA':
-            nids = elem.nodes
-            if None in nids:
-                nids = nids[:4]
-            inids = np.searchsorted(all_nids, nids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _ctetra_faces, nids, nid_map, xyz_cid0)
-
-        elif etype == 'CHEXA':
-            nids = elem.nodes
-            if None in nids:
-                nids = nids[:8]
-            inids = np.searchsorted(all_nids, nids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _chexa_faces, nids, nid_map, xyz_cid0)
-
-        elif etype == 'CPENTA':
-            nids = elem.nodes
-            if None in nids:
-                nids = nids[:6]
-            inids = np.searchsorted(all_nids, nids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpenta_faces, nids, nid_map, xyz_cid0)
-
-        elif etype == 'CPYRAM':
-            # TODO: assuming 5
-            nids = elem.nodes
-            if None in nids:
-                nids = nids[:5]
-            inids = np.searchsorted(all_nids, nids)
-            min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                _cpyram_faces, nids, nid_map, xyz_cid0)
-        elif etype in ['CELAS2', 'CELAS4', 'CDAMP4']:
-            # these can have empty nodes and have no property
-            # CELAS1: 1/2 GRID/SPOINT and pid
-            # CELAS2: 1/2 GRID/SPOINT, k, ge, and s
-            # CELAS3: 1/2 SPOINT and pid
-            # CELAS4: 1/2 SPOINT and k
+    all_eids = np.array(list(model.elements.keys()), dtype='int64')
+    eids_list = []
+    qualities = []
+    for etype, (nnodes, unused_quality_func) in QUALITY_TYPES.items():
+        if etype not in model._type_to_id_map:
             continue
-            #nids = elem.nodes
-            #assert nids[0] != nids[1]
-            #if None in nids:
-                #assert nids[0] is not None, nids
-                #assert nids[1] is None, nids
-                #nids = [nids[0]]
-            #else:
-                #nids = elem.nodes
-                #assert nids[0] != nids[1]
-            #inids = np.searchsorted(all_nids, nids)
-        elif etype in ['CBUSH', 'CBUSH1D', 'CBUSH2D',
-                       'CELAS1', 'CELAS3',
-                       'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP5',
-                       'CFAST', 'CGAP', 'CVISC']:
-            #nids = elem.nodes
-            #assert nids[0] != nids[1]
-            #assert None not in nids, 'nids=%s\n%s' % (nids, elem)
-            #inids = np.searchsorted(all_nids, nids)
-            continue
-        elif etype in ['CBAR', 'CBEAM']:
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2 = xyz_cid0[inids, :]
-            min_edge_lengthi = np.linalg.norm(p2 - p1)
-        elif etype in ['CROD', 'CTUBE']:
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2 = xyz_cid0[inids, :]
-            min_edge_lengthi = np.linalg.norm(p2 - p1)
-            #nnodes = 2
-            #dim = 1
-        elif etype == 'CONROD':
-            nids = elem.nodes
-            inids = np.searchsorted(all_nids, nids)
-            p1, p2 = xyz_cid0[inids, :]
-            min_edge_lengthi = np.linalg.norm(p2 - p1)
-        #------------------------------
-        # rare
-        #elif etype == 'CIHEX1':
-            #nids = elem.nodes
-            #pid = elem.pid
-            #cell_type = cell_type_hexa8
-            #inids = np.searchsorted(all_nids, nids)
-            #min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                #_chexa_faces, nids, nid_map, xyz_cid0)
-            #nnodes = 8
-            #dim = 3
-        elif etype == 'CHBDYE':
-            continue
-            #self.eid_map[eid] = ieid
-            #eid_solid = elem.eid2
-            #side = elem.side
-            #element_solid = model.elements[eid_solid]
-
-            #mapped_inids = SIDE_MAP[element_solid.type][side]
-            #side_inids = [nid - 1 for nid in mapped_inids]
-            #nodes = element_solid.node_ids
-
-            ##nnodes = len(side_inids)
-            #nids = [nodes[inid] for inid in side_inids]
-            #inids = np.searchsorted(all_nids, nids)
-
-            #if len(side_inids) == 4:
-                #pass
-            #else:
-                #msg = 'element_solid:\n%s' % (str(element_solid))
-                #msg += 'mapped_inids = %s\n' % mapped_inids
-                #msg += 'side_inids = %s\n' % side_inids
-                #msg += 'nodes = %s\n' % nodes
-                ##msg += 'side_nodes = %s\n' % side_nodes
-                #raise NotImplementedError(msg)
-        else:
-            #raise NotImplementedError(elem)
-            nelements -= 1
+        eids = np.intersect1d(np.array(model._type_to_id_map[etype], dtype='int64'), all_eids)
+        if len(eids) == 0:
             continue
-        #nids_list.append(nnodes)
-        #nids_list.extend(inids)
-        #normals[ieid] = normali
-        #eids_array[ieid] = eid
-        #pids_array[ieid] = pid
-        #dim_array[ieid] = dim
-        #cell_types_array[ieid] = cell_type
-        #cell_offsets_array[ieid] = cell_offset  # I assume the problem is here
-        #cell_offset += nnodes + 1
-        #eid_map[eid] = ieid
-
-        min_interior_angle[ieid] = min_thetai
-        max_interior_angle[ieid] = max_thetai
-        dideal_theta[ieid] = dideal_thetai
-        max_skew_angle[ieid] = max_skew
-        max_warp_angle[ieid] = max_warp
-        max_aspect_ratio[ieid] = aspect_ratio
-        #area[ieid] = areai
-        area_ratio[ieid] = area_ratioi
-        taper_ratio[ieid] = taper_ratioi
-        min_edge_length[ieid] = min_edge_lengthi
-        ieid += 1
+        unused_pids, node_ids = get_element_columns(model, etype, eids, nnodes)[:2]
+        inids = np.searchsorted(nids, node_ids)
+        inids[inids == len(nids)] = 0
+        if not np.array_equal(nids[inids], node_ids):
+            missing = np.setdiff1d(node_ids, nids)
+            raise RuntimeError('nids=%s are missing' % missing.tolist())
+        eids_list.append(eids)
+        qualities.append(element_quality_arrays(etype, inids, xyz_cid0))
+
+    names = [
+        'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+        'max_skew_angle', 'max_warp_angle', 'max_aspect_ratio',
+        'area_ratio', 'taper_ratio', 'min_edge_length',
+    ]
+    nelements = len(model.elements)
+    quality = {name : np.zeros(nelements, 'float32') for name in names}
+    if eids_list:
+        isort = np.argsort(np.hstack(eids_list), kind='stable')
+        nquality = len(isort)
+        for name in names:
+            values = np.hstack([qualityi[name] for qualityi in qualities])
+            quality[name][:nquality] = values[isort]
+    return quality
+
+def element_quality_arrays(etype, inodes, xyz_cid0, chunk_size=100000):
+    """
+    Gets the quality metrics for a group of elements of the same type
+
+    Parameters
+    ----------
+    etype : str
+        the element type (e.g., CTRIA3, CQUAD8, CTETRA, CHEXA, CBAR);
+        see ``QUALITY_TYPES``
+    inodes : (nelements, nnodes) int ndarray
+        the indices of the nodes into xyz_cid0; only the corner nodes
+        are used, so the midside nodes may be left off
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the global xyz locations
+    chunk_size : int; default=100000
+        the number of elements that are evaluated at once, which bounds
+        the size of the temporary arrays
+
+    Returns
+    -------
+    quality : Dict[name] : (nelements, ) float ndarray
+        Various quality metrics
+        names : area, min_interior_angle, max_interior_angle, dideal_theta,
+                max_skew_angle, max_warp_angle, max_aspect_ratio,
+                area_ratio, taper_ratio, min_edge_length
+        values : The result is ``np.nan`` if element type does not define
+                 the parameter.
+
+    """
+    nnodes, quality_func = QUALITY_TYPES[etype]
+    inodes = np.asarray(inodes)
+    nelements = inodes.shape[0]
+    names = [
+        'area', 'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+        'max_skew_angle', 'max_warp_angle', 'max_aspect_ratio',
+        'area_ratio', 'taper_ratio', 'min_edge_length',
+    ]
+    quality = {name : np.full(nelements, np.nan, dtype='float64') for name in names}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i0 in range(0, nelements, chunk_size):
+            i1 = i0 + chunk_size
+            xyz = xyz_cid0[inodes[i0:i1, :nnodes], :]
+            for name, values in quality_func(etype, xyz).items():
+                quality[name][i0:i1] = values
+    return quality
+
+def _dot(v1, v2):
+    """dots the rows of two (n, 3) arrays"""
+    return np.einsum('ij,ij->i', v1, v2)
+
+def _norm(v):
+    """gets the norms of the rows of an (n, 3) array"""
+    return np.linalg.norm(v, axis=1)
+
+def _tri_quality_array(unused_etype, xyz):
+    """vectorized version of ``tri_quality``"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    e1 = (p1 + p2) / 2.
+    e2 = (p2 + p3) / 2.
+    e3 = (p3 + p1) / 2.
+    e21 = e2 - e1
+    e31 = e3 - e1
+    e32 = e3 - e2
+    e3_p2 = e3 - p2
+    e2_p1 = e2 - p1
+    e1_p3 = e1 - p3
+
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v13 = p1 - p3
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length13 = _norm(v13)
+    lengths = np.column_stack([length21, length32, length13])
+    min_edge_length = lengths.min(axis=1)
+    area = 0.5 * _norm(np.cross(v21, v13))
+
+    cos_skew1 = _dot(e2_p1, e31) / (_norm(e2_p1) * _norm(e31))
+    cos_skew3 = _dot(e3_p2, e21) / (_norm(e3_p2) * _norm(e21))
+    cos_skew5 = _dot(e1_p3, e32) / (_norm(e1_p3) * _norm(e32))
+    cos_skew = np.column_stack([cos_skew1, -cos_skew1, cos_skew3,
+                                -cos_skew3, cos_skew5, -cos_skew5])
+    max_skew = PIOVER2 - np.abs(np.arccos(np.clip(cos_skew, -1., 1.))).min(axis=1)
+
+    # a collapsed edge doesn't have an aspect ratio or angles
+    is_collapsed = min_edge_length == 0.0
+    aspect_ratio = np.where(is_collapsed, np.nan, lengths.max(axis=1) / min_edge_length)
+    cos_theta1 = -_dot(v21, v13) / (length21 * length13)
+    cos_theta2 = -_dot(v32, v21) / (length32 * length21)
+    cos_theta3 = -_dot(v13, v32) / (length13 * length32)
+    thetas = np.arccos(np.clip(np.column_stack([cos_theta1, cos_theta2, cos_theta3]), -1., 1.))
+    min_theta = np.where(is_collapsed, np.nan, thetas.min(axis=1))
+    max_theta = np.where(is_collapsed, np.nan, thetas.max(axis=1))
+    dideal_theta = np.maximum(max_theta - PIOVER3, PIOVER3 - min_theta)
     quality = {
-        'min_interior_angle' : min_interior_angle,
-        'max_interior_angle' : max_interior_angle,
+        'area' : area,
+        'min_interior_angle' : min_theta,
+        'max_interior_angle' : max_theta,
         'dideal_theta' : dideal_theta,
-        'max_skew_angle' : max_skew_angle,
-        'max_warp_angle' : max_warp_angle,
-        'max_aspect_ratio' : max_aspect_ratio,
-        #'area' : area,
+        'max_skew_angle' : max_skew,
+        'max_aspect_ratio' : aspect_ratio,
+        'min_edge_length' : min_edge_length,
+    }
+    return quality
+
+def _quad_quality_array(unused_etype, xyz):
+    """vectorized version of ``quad_quality``"""
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    p3 = xyz[:, 2, :]
+    p4 = xyz[:, 3, :]
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v43 = p4 - p3
+    v14 = p1 - p4
+    v31 = p3 - p1
+    v42 = p4 - p2
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length43 = _norm(v43)
+    length14 = _norm(v14)
+    lengths = np.column_stack([length21, length32, length43, length14])
+    min_edge_length = lengths.min(axis=1)
+    aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+    normal = np.cross(v31, v42)
+    area = 0.5 * _norm(normal)
+
+    # the ratio of the ideal area to the actual area
+    # this is an hourglass check
+    areas = np.column_stack([
+        _norm(np.cross(-v14, v21)), # v41 x v21
+        _norm(np.cross(v32, -v21)), # v32 x v12
+        _norm(np.cross(v43, -v32)), # v43 x v23
+        _norm(np.cross(v14, v43)),  # v14 x v43
+    ])
+    min_area = areas.min(axis=1)
+    area_ratio = np.where(
+        min_area == 0.,
+        np.nan,
+        np.maximum(area / min_area, areas.max(axis=1) / area))
+
+    # the corner areas are half the parallelograms
+    corner_areas = 0.5 * areas
+    aavg = corner_areas.mean(axis=1)
+    taper_ratio = np.abs(corner_areas - aavg[:, np.newaxis]).sum(axis=1) / aavg
+
+    #    e3
+    # 4-------3
+    # |       |
+    # |e4     |  e2
+    # 1-------2
+    #     e1
+    e13 = (p3 + p4) / 2. - (p1 + p2) / 2.
+    e42 = (p2 + p3) / 2. - (p4 + p1) / 2.
+    cos_skew1 = _dot(e13, e42) / (_norm(e13) * _norm(e42))
+    max_skew = PIOVER2 - np.abs(np.arccos(
+        np.clip(np.column_stack([cos_skew1, -cos_skew1]), -1., 1.))).min(axis=1)
+
+    cos_thetas = np.column_stack([
+        -_dot(v21, v14) / (length21 * length14),
+        -_dot(v32, v21) / (length32 * length21),
+        -_dot(v43, v32) / (length43 * length32),
+        -_dot(v14, v43) / (length14 * length43),
+    ])
+
+    # a corner that points against the normal is reflex
+    signs = np.sign(np.column_stack([
+        _dot(np.cross(v14, v21), normal),
+        _dot(np.cross(v21, v32), normal),
+        _dot(np.cross(v32, v43), normal),
+        _dot(np.cross(v43, v14), normal),
+    ]))
+    theta_additional = np.where(signs < 0, 2*np.pi, 0.)
+    thetas = signs * np.arccos(np.clip(cos_thetas, -1., 1.)) + theta_additional
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    dideal_theta = np.maximum(max_theta - PIOVER2, PIOVER2 - min_theta)
+
+    # warp angle; the max angle between the triangles of the two splits
+    v41 = -v14
+    n123 = np.cross(v21, v31)
+    n134 = np.cross(v31, v41)
+    cos_warp1 = _dot(n123, n134) / (_norm(n123) * _norm(n134))
+    n124 = np.cross(v21, v41)
+    n234 = np.cross(v32, v42)
+    cos_warp2 = _dot(n124, n234) / (_norm(n124) * _norm(n234))
+    max_warp = np.abs(np.arccos(
+        np.clip(np.column_stack([cos_warp1, cos_warp2]), -1., 1.))).max(axis=1)
+
+    quality = {
+        'area' : area,
+        'min_interior_angle' : min_theta,
+        'max_interior_angle' : max_theta,
+        'dideal_theta' : dideal_theta,
+        'max_skew_angle' : max_skew,
+        'max_warp_angle' : max_warp,
+        'max_aspect_ratio' : aspect_ratio,
         'area_ratio' : area_ratio,
         'taper_ratio' : taper_ratio,
         'min_edge_length' : min_edge_length,
     }
     return quality
 
+def _solid_quality_array(etype, xyz):
+    """vectorized version of ``get_min_max_theta``"""
+    faces = SOLID_FACES[etype]
+    cos_thetas = []
+    ideal_theta = []
+    lengths = []
+    for face in faces:
+        xyz_face = xyz[:, face, :]
+        # v21, v32, v13 or v21, v32, v43, v14
+        edges = np.roll(xyz_face, -1, axis=1) - xyz_face
+        edge_lengths = np.linalg.norm(edges, axis=2)
+        previous_edges = np.roll(edges, 1, axis=1)
+        previous_lengths = np.roll(edge_lengths, 1, axis=1)
+        cos_thetas.append(-np.einsum('ijk,ijk->ij', edges, previous_edges) / (
+            edge_lengths * previous_lengths))
+        lengths.append(edge_lengths)
+        ideal_theta.extend([PIOVER3 if len(face) == 3 else PIOVER2] * len(face))
+
+    thetas = np.arccos(np.hstack(cos_thetas))
+    ideal_theta = np.array(ideal_theta)
+    dideal_theta = np.maximum((thetas - ideal_theta).max(axis=1),
+                              (ideal_theta - thetas).min(axis=1))
+    quality = {
+        'min_interior_angle' : thetas.min(axis=1),
+        'max_interior_angle' : thetas.max(axis=1),
+        'dideal_theta' : dideal_theta,
+        'min_edge_length' : np.hstack(lengths).min(axis=1),
+    }
+    return quality
+
+def _line_quality_array(unused_etype, xyz):
+    """gets the length of a line element"""
+    quality = {
+        'min_edge_length' : _norm(xyz[:, 1, :] - xyz[:, 0, :]),
+    }
+    return quality
+
+#: etype : (the number of corner nodes, the vectorized quality function)
+QUALITY_TYPES = {
+    'CTRIA3' : (3, _tri_quality_array),
+    'CTRIAR' : (3, _tri_quality_array),
+    'CTRAX3' : (3, _tri_quality_array),
+    'CPLSTN3' : (3, _tri_quality_array),
+    'CTRIA6' : (3, _tri_quality_array),
+
+    'CQUAD4' : (4, _quad_quality_array),
+    'CQUADR' : (4, _quad_quality_array),
+    'CPLSTN4' : (4, _quad_quality_array),
+    'CQUADX4' : (4, _quad_quality_array),
+    'CQUAD8' : (4, _quad_quality_array),
+    'CSHEAR' : (4, _quad_quality_array),
+
+    'CTETRA' : (4, _solid_quality_array),
+    'CPYRAM' : (5, _solid_quality_array),
+    'CPENTA' : (6, _solid_quality_array),
+    'CHEXA' : (8, _solid_quality_array),
+
+    'CBAR' : (2, _line_quality_array),
+    'CBEAM' : (2, _line_quality_array),
+    'CROD' : (2, _line_quality_array),
+    'CTUBE' : (2, _line_quality_array),
+    'CONROD' : (2, _line_quality_array),
+}
+
 def tri_quality(p1, p2, p3):
     """gets the quality metrics for a tri"""
     e1 = (p1 + p2) / 2.
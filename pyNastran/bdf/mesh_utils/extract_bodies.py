@@ -3,9 +3,10 @@ defines:
   - extract_bodies(bdf_filename)
 
 """
-from collections import defaultdict
 import numpy as np
-from pyNastran.bdf.bdf import BDF, read_bdf, print_card_16
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
+from pyNastran.bdf.bdf import BDF, read_bdf
 
 def extract_bodies(bdf_filename, mpc_id=0):
     """
@@ -21,6 +22,14 @@ def extract_bodies(bdf_filename, mpc_id=0):
         >0 : use this MPC set
         not supported
 
+    Returns
+    -------
+    body_eids : Dict[ibody] = [eids, rigid_eids]
+        eids : (n, ) int ndarray
+            the element ids of the body
+        rigid_eids : (n, ) int ndarray
+            the rigid element ids of the body
+
     Considers:
      - elements
      - rigid_elements
@@ -31,10 +40,9 @@ def extract_bodies(bdf_filename, mpc_id=0):
       - MPCADD
       - DMIx
 
-    Doesn't support:
-      - xref
-      - duplicate element ids
-      - large values
+    The bodies are the connected components of the element/node graph,
+    which uses the node -> element map of ``model.get_adjacency()``.
+    The bodies are in the order of the smallest element id.
 
     """
     if isinstance(bdf_filename, BDF):
@@ -42,158 +50,55 @@ def extract_bodies(bdf_filename, mpc_id=0):
     else:
         model = read_bdf(bdf_filename, xref=False)
 
-    debug = False
-    nnodes = len(model.nodes)
-    nspoints = 0
-    nepoints = 0
-    if model.spoints:
-        nspoints = len(model.spoints)
-    if model.epoints:
-        nepoints = len(model.epoints)
-    npoints = nnodes + nspoints + nepoints
-    nelements = len(model.elements) + len(model.rigid_elements) + len(model.masses)
+    npoints = len(model.nodes) + len(model.spoints) + len(model.epoints)
+    nelements = len(model.elements) + len(model.rigid_elements)
     if npoints == 0 or nelements == 0:
         return {}
 
-    nid_to_eid_map = defaultdict(list)
-    eid_to_nid_map = defaultdict(list)
-    for eid, elem in model.elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        node_ids = elem.node_ids
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                continue
-            nid_to_eid_map[nid].append(eid)
-
-    rigid_offset = 0
-    if len(model.elements):
-        rigid_offset = max(model.elements)
-    for eid, elem in model.rigid_elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        eid += rigid_offset
-        assert eid not in model.elements, 'eid=%s cannot be used twice' % eid
-        #node_ids = elem.node_ids
+    # the rigid elements are after the elements
+    adjacency = model.get_adjacency(rebuild=True)
+    rigid_eids = []
+    rigid_nids = []
+    nrigid_nodes = []
+    for eid, elem in sorted(model.rigid_elements.items()):
         node_ids = elem.independent_nodes + elem.dependent_nodes
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                raise RuntimeError(elem)
-            nid_to_eid_map[nid].append(eid)
-    #mpc_offset = rigid_offset + max(model.rigid_elements)
-
-    if len(nid_to_eid_map) == 0:
+        if None in node_ids:
+            raise RuntimeError(elem)
+        rigid_eids.append(eid)
+        rigid_nids.extend(node_ids)
+        nrigid_nodes.append(len(node_ids))
+
+    eids = np.hstack([adjacency.eids, np.array(rigid_eids, dtype='int64')])
+    is_rigid = np.arange(len(eids)) >= len(adjacency.eids)
+    nnodes = np.hstack([np.diff(adjacency.element_node_offsets),
+                        np.array(nrigid_nodes, dtype='int64')])
+    element_nids = np.hstack([adjacency.element_nodes, np.array(rigid_nids, dtype='int64')])
+    if len(element_nids) == 0:
         raise RuntimeError(model.get_bdf_stats())
-        #return {}
-
-    nids_used = set()
-    eids_used = set()
-    ibody = 0
-    keys = list(nid_to_eid_map.keys())
-    all_nids_to_check = set(keys)
-    key0 = keys[0]
-    nids_to_check = set([key0])
-    if debug:  # pragma: no cover
-        print('all_nids_to_check= ', all_nids_to_check)
-    body_eids = {ibody : set()}
-    nbodies_max = 3
-    while all_nids_to_check:
-        if debug:  # pragma: no cover
-            print(all_nids_to_check)
-        while nids_to_check:
-            #if len(nids_to_check) < 10:
-                #print('nids_to_check =', nids_to_check)
-            nid = nids_to_check.pop()
-            if debug:  # pragma: no cover
-                print('nid = ', nid)
-                print('all_nids_to_check =', all_nids_to_check)
-            if nid not in all_nids_to_check:
-                msg = 'nids_to_check = %s' % nids_to_check
-                raise RuntimeError(msg)
-            if debug:  # pragma: no cover
-                print('nids_used         =', nids_used)
-                print('all_nids_to_check =', all_nids_to_check)
-
-            nids_used.add(nid)
-            if debug:  # pragma: no cover
-                print('  adding nid=%s' % nid)
-            all_nids_to_check.remove(nid)
-            if debug:  # pragma: no cover
-                print('  nids_used         =', nids_used)
-                print('  all_nids_to_check =', all_nids_to_check)
-
-            eids = nid_to_eid_map[nid]
-            if debug:  # pragma: no cover
-                print('  eids = %s' % eids)
-            for eidi in eids:
-                if eidi in eids_used:
-                    continue
-                eids_used.add(eidi)
-                try:
-                    elem = model.elements[eidi]
-                except KeyError:
-                    elem = model.rigid_elements[eidi - rigid_offset]
-                if debug:  # pragma: no cover
-                    print(print_card_16(elem.repr_fields()))
-                    print('adding eidi=%s' % eidi)
-                body_eids[ibody].add(eidi)
-                nidsi = eid_to_nid_map[eidi]
-                for nidi in nidsi:
-                    if nidi not in nids_used:
-                        nids_to_check.add(nidi)
-                        if debug:  # pragma: no cover
-                            print('  adding nid=%s' % nidi)
-                del nidsi # , elem
-            if debug:  # pragma: no cover
-                print('next eid\n')
-                print('---------------------------')
-            del nid, eids
-
-        if len(body_eids[ibody]) == 0:
-            return body_eids
-            # unused node
-            #try:
-                #nid = nids_to_check.pop()
-            #except KeyError:
-                #break
-            #continue
-            #msg = 'cannot find a new body...nbodies=%s\nelements:' % ibody
-            #for nid, eids in sorted(nid_to_eid_map.items()):
-                #msg += '  nid=%r eids=%s\n' % (nid, eids)
-                #for eid in eids:
-                    #try:
-                        #elem = model.elements[eid]
-                    #except KeyError:
-                        #elem = model.rigid_elements[eid - rigid_offset]
-                    #msg += print_card_16(elem.repr_fields())
-
-                    #msg += 'eid=%s used=%s\n\n' % (eid, eid in eids_used)
-                #msg += '----------------\n'
-            #msg += ''
-            #raise RuntimeError(msg + model.get_bdf_stats())
-        ibody += 1
-        if ibody > nbodies_max:
-            raise RuntimeError('Too many bodies...\n' + model.get_bdf_stats())
-        body_eids[ibody] = set()
-        #print('--------------------------------------')
-    if len(body_eids[ibody]) == 0:
-        del body_eids[ibody]
 
-    body_eids2 = {}
-    for ibody, body in sorted(body_eids.items()):
-        abody = np.unique(np.array(list(body), dtype='int64'))
-        ielem = np.where(abody <= rigid_offset)
-        irigid = np.where(abody > rigid_offset)
-        #ielem = np.asarray(ielem, dtype='int32')
-        #ielem = np.asarray(ielem, dtype='int32')
-        body_eids2[ibody] = [
-            np.asarray(abody[ielem], dtype='int32'),
-            np.asarray(abody[irigid], dtype='int32')
+    # the graph of the elements and the nodes; the nodes are after the elements
+    neids = len(eids)
+    unused_nids, inodes = np.unique(element_nids, return_inverse=True)
+    ielements = np.repeat(np.arange(neids), nnodes)
+    ngraph = neids + inodes.max() + 1
+    graph = scipy.sparse.coo_matrix(
+        (np.ones(len(ielements), dtype='int8'), (ielements, neids + inodes.ravel())),
+        shape=(ngraph, ngraph))
+    unused_ncomponents, icomponents = connected_components(graph, directed=False)
+
+    # the elements without nodes aren't part of a body
+    iused = np.where(nnodes > 0)[0]
+    icomponents = icomponents[iused]
+    ucomponents, ifirst = np.unique(icomponents, return_index=True)
+    body_eids = {}
+    for ibody, icomponent in enumerate(ucomponents[np.argsort(ifirst)]):
+        ibody_eids = iused[icomponents == icomponent]
+        is_rigidi = is_rigid[ibody_eids]
+        body_eids[ibody] = [
+            np.asarray(eids[ibody_eids[~is_rigidi]], dtype='int32'),
+            np.asarray(eids[ibody_eids[is_rigidi]], dtype='int32'),
         ]
-    #print('body_eids = %s' % body_eids2)
-    nbodies = len(body_eids2)
+    nbodies = len(body_eids)
     if nbodies > 1:
         print('nbodies = %i' % nbodies)
-    return body_eids2
+    return body_eids
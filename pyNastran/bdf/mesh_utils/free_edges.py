@@ -5,11 +5,15 @@ defines:
 
 """
 from __future__ import annotations
-from collections import defaultdict
 from typing import Tuple, List, Optional, TYPE_CHECKING
+import numpy as np
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
+SHELL_ELEMENTS = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
+                  'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
+                  'CSHEAR']
+
 def free_edges(model: BDF, eids: Optional[List[int]]=None, maps=None) -> List[Tuple[int, int]]:
     """
     Gets the free edges for shell elements.
@@ -32,11 +36,11 @@ def free_edges(model: BDF, eids: Optional[List[int]]=None, maps=None) -> List[Tu
         list of node ids of each edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        edges, counts = _get_shell_edge_counts(model, eids=eids)
+        return [tuple(edge) for edge in edges[counts == 1].tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) == 1:
@@ -65,39 +69,35 @@ def non_paired_edges(model: BDF, eids: List[int]=None, maps=None) -> List[Tuple[
         the non-paired edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        edges, counts = _get_shell_edge_counts(model, eids=eids)
+        return [tuple(edge) for edge in edges[counts != 2].tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) != 2:
             edges.append(edge)
     return edges
 
-def _get_edge_to_eids_map(model, eids=None):
-    """helper method"""
-    edge_to_eids = defaultdict(set)
-    shell_elements = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
-                      'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
-                      'CSHEAR']
-    if eids is None:
-        for eid, elem in model.elements.items():
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-    else:
-        if isinstance(eids, int):
-            eids = [eids]
-        for eid in eids:
-            elem = model.elements[eid]
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-
-    return edge_to_eids
+def _get_shell_edge_counts(model: BDF, eids: Optional[List[int]]=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the shell edges and the number of shell elements of each edge
+    from the adjacency index (see ``model.get_adjacency()``)
+
+    Returns
+    -------
+    edges : (nedges, 2) int ndarray
+        the edges in the order that they're first used
+    counts : (nedges, ) int ndarray
+        the number of elements of each edge
+
+    """
+    adjacency = model.get_adjacency(rebuild=True)
+    ielements = adjacency.get_element_indices(eids, etypes=SHELL_ELEMENTS)
+    unused_ielement, iedges = adjacency.get_element_edges(ielements)
+    counts = np.bincount(iedges, minlength=len(adjacency.edges))
+
+    unused_iedges, ifirst = np.unique(iedges, return_index=True)
+    iedges = iedges[np.sort(ifirst)]
+    return adjacency.edges[iedges], counts[iedges]
@@ -44,13 +44,8 @@ def get_oml_eids(bdf_filename, eid_start, theta_tol=30.,
     theta_tol = np.radians(theta_tol)
 
     model = read_bdf(bdf_filename, xref=True)
-    maps = model._get_maps(
-        eids=None, map_names=None,
-        consider_0d=False, consider_0d_rigid=False,
-        consider_1d=False, consider_2d=True, consider_3d=False)
-    edge_to_eid_map = maps['edge_to_eid_map']
-    eid_to_edge_map = maps['eid_to_edge_map']
-    nid_to_edge_map = maps['nid_to_edge_map']
+    adjacency = model.get_adjacency(rebuild=True)
+    offsets, neighbors = adjacency.get_neighbors(by='edge')
 
     #free_edges = get_free_edges(model, maps=maps)
     #---------------------------------
@@ -75,23 +70,10 @@ def get_oml_eids(bdf_filename, eid_start, theta_tol=30.,
             eid_start = eid_starts.pop()
             normal_start = normals[eid_start]
 
-            # get the next set of edges
-            edges = eid_to_edge_map[eid_start]
-
-
-            #flattened = []
-            #for row in matrix:
-                #for n in row:
-                    #flattened.append(n)
-            # flattened = [n for row in matrix for n in row]
-            #eids_to_consider = [edge_to_eid_map[edge] for edge in edges]
-            list_eids_to_consider = []
-            for edge in edges:
-                eids_with_edge = edge_to_eid_map[edge]
-                list_eids_to_consider += eids_with_edge
-            #list_eids_to_consider = set([eid for eid in edge_to_eid_map[edge] for edge in edges])
-            #print('list_eids_to_consider =', list_eids_to_consider)
-            eids_to_consider = set(list_eids_to_consider)
+            # get the elements that share an edge
+            ielement = adjacency.get_element_indices([eid_start])[0]
+            ineighbors = neighbors[offsets[ielement]:offsets[ielement+1]]
+            eids_to_consider = set(adjacency.eids[ineighbors].tolist()).intersection(normals)
 
             # don't do the same element twice; creates an infinite loop if you do
             #eids_to_check = np.setdiff1d(eids_to_consider, eids_oml)
@@ -2,19 +2,24 @@
 Defines:
   - sum_forces_moments
       find the net force/moment on the model
+  - sum_forces_moments_loadcases
+      find the net force/moment on the model for multiple load cases
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
 
 """
 from __future__ import annotations
-from typing import Tuple, Dict, Optional, TYPE_CHECKING
+from typing import List, Tuple, Dict, Optional, Any, TYPE_CHECKING
 from math import radians, sin, cos
+from collections import defaultdict
 import numpy as np
 from numpy import array, cross, allclose, mean
 from numpy.linalg import norm  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.utils import get_xyz_cid0_dict, transform_load
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector
+from pyNastran.bdf.mesh_utils.model_arrays import (
+    get_xyz_cid0_array, get_element_columns, get_node_xyz)
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping import NDArray3float
     from pyNastran.bdf.bdf import BDF, Subcase
@@ -61,24 +66,147 @@ def sum_forces_moments(model: BDF, p0: np.ndarray, loadcase_id: int,
         the moments
 
     .. warning:: not full validated
-    .. todo:: It's super slow for cid != 0.   We can speed this up a lot
-             if we calculate the normal, area, centroid based on
-             precomputed node locations.
 
     Pressure acts in the normal direction per model/real/loads.bdf and loads.f06
 
     """
     if not isinstance(loadcase_id, integer_types):
         raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+    forces, moments = sum_forces_moments_loadcases(
+        model, p0, [loadcase_id], cid=cid, include_grav=include_grav, xyz_cid0=xyz_cid0)
+    return forces[0, :], moments[0, :]
+
+def sum_forces_moments_loadcases(model: BDF, p0: np.ndarray, loadcase_ids: List[int],
+                                 cid: int=0,
+                                 include_grav: bool=False,
+                                 xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                                 ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for
+    multiple load cases.
+
+    The resultant of each load set (e.g., the FORCEs of a SID) is
+    calculated once and the LOAD scale factors of the load cases are
+    applied with a (nloadcases, nsids) matrix.  The
+    FORCE/MOMENT/PLOAD/PLOAD2/PLOAD4 loads are summed with arrays, so
+    the node positions and the element areas, normals and centroids are
+    calculated once.  The other loads (e.g., PLOAD1, GRAV) are summed
+    one at a time.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : List[int]
+        the LOAD=IDs to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation (not supported)
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces
+    moments : (nloadcases, 3) float ndarray
+        the moments
+
+    """
+    for loadcase_id in loadcase_ids:
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
 
     p = _get_load_summation_point(model, p0, cid=0)
-    loads, scale_factors, unused_is_grav = model.get_reduced_loads(
-        loadcase_id, skip_scale_factor0=True)
 
-    F = array([0., 0., 0.])
-    M = array([0., 0., 0.])
-    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+    # the loads of each load set are summed once and then combined with
+    # the scale factors of the load cases
+    sids, loads_list, scale_matrix = _get_load_scale_matrix(model, loadcase_ids)
+    scale_factors_list = [[1.] * len(loads) for loads in loads_list]
+    sid_forces, sid_moments, other_loads = _sum_forces_moments_arrays(
+        model, p, loads_list, scale_factors_list, xyz_cid0=xyz_cid0)
+
+    xyz = None
+    for i, sid in enumerate(sids):
+        loads, scale_factors = other_loads[i]
+        if not loads:
+            continue
+        if xyz is None:
+            xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+        _sum_forces_moments_objects(model, p, sid, loads, scale_factors, xyz,
+                                    sid_forces[i, :], sid_moments[i, :],
+                                    include_grav=include_grav)
+    forces = scale_matrix @ sid_forces
+    moments = scale_matrix @ sid_moments
 
+    if cid == 0:
+        return forces, moments
+    cid0 = 0
+    for i, (force, moment) in enumerate(zip(forces, moments)):
+        forces[i, :], moments[i, :] = transform_load(force, moment, cid0, cid, model)
+    return forces, moments
+
+def _get_load_scale_matrix(model: BDF, loadcase_ids: List[int]) -> Tuple[List[int], List[List[Any]], np.ndarray]:
+    """
+    Gets the scale factor of each load set (e.g., the FORCEs of a SID)
+    of each load case, so the LOADs that are shared by load cases are
+    only reduced once (see ``model.get_reduced_loads``)
+
+    Returns
+    -------
+    sids : List[int]
+        the ids of the load sets
+    loads_list : List[List[load]]
+        the loads of each load set
+    scale_matrix : (nloadcases, nsids) float ndarray
+        the scale factors
+
+    """
+    set_loads = {}  # type: Dict[int, List[Any]]
+    reduced_loads = {}  # type: Dict[int, Dict[int, float]]
+    def _reduce(load_id, trace):
+        """gets the {sid : scale} of a load id"""
+        if load_id in reduced_loads:
+            return reduced_loads[load_id]
+        sid_scales = defaultdict(float)
+        loads = []
+        for load in model.Load(load_id, consider_load_combinations=True):
+            if load.type != 'LOAD':
+                loads.append(load)
+                continue
+            # get_load_ids loops over the loads of each set
+            for load_idi, scale in zip(load.load_ids, load.scale_factors):
+                # prevents recursion
+                if load_idi in trace:
+                    msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
+                        trace, load_idi)
+                    raise RuntimeError(msg)
+                for sid, scalei in _reduce(load_idi, trace + [load_idi]).items():
+                    sid_scales[sid] += load.scale * scale * scalei
+        if loads:
+            set_loads[load_id] = loads
+            sid_scales[load_id] += 1.
+        reduced_loads[load_id] = sid_scales
+        return sid_scales
+
+    sid_scales_list = [_reduce(loadcase_id, [loadcase_id]) for loadcase_id in loadcase_ids]
+    sids = sorted(set_loads)
+    isids = {sid: i for i, sid in enumerate(sids)}
+    scale_matrix = np.zeros((len(loadcase_ids), len(sids)), dtype='float64')
+    for icase, sid_scales in enumerate(sid_scales_list):
+        for sid, scale in sid_scales.items():
+            scale_matrix[icase, isids[sid]] += scale
+    loads_list = [set_loads[sid] for sid in sids]
+    return sids, loads_list, scale_matrix
+
+def _sum_forces_moments_objects(model: BDF, p: np.ndarray, loadcase_id: int,
+                                loads, scale_factors, xyz: Dict[int, NDArray3float],
+                                F: np.ndarray, M: np.ndarray,
+                                include_grav: bool=False) -> None:
+    """sums the loads one at a time for ``sum_forces_moments_loadcases``"""
     unsupported_types = set()
     for load, scale in zip(loads, scale_factors):
         #if load.type not in ['FORCE1']:
@@ -189,14 +317,6 @@ def sum_forces_moments(model: BDF, p0: np.ndarray, loadcase_id: int,
     for load_type in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
 
-    #forces, moments = sum_forces_moments(self, p0, loadcase_id,
-    #include_grav=include_grav, xyz_cid0=xyz_cid0)
-    if cid == 0:
-        return F, M
-    cid0 = 0
-    F2, M2 = transform_load(F, M, cid0, cid, model)
-    return F2, M2
-
 def _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p):
     """helper method for ``sum_forces_moments``"""
     elem = load.eid_ref
@@ -224,9 +344,9 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    # don't change the positions in xyz
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -420,10 +540,17 @@ def sum_forces_moments_elements(model: BDF, p0: int, loadcase_id: int,
     loads, scale_factors, unused_is_grav = model.get_reduced_loads(
         loadcase_id, skip_scale_factor0=True)
 
-    F = array([0., 0., 0.])
-    M = array([0., 0., 0.])
+    forces, moments, other_loads = _sum_forces_moments_arrays(
+        model, p, [loads], [scale_factors], xyz_cid0=xyz_cid0, eids=eids, nids=nids)
+    F = forces[0, :]
+    M = moments[0, :]
 
-    xyz = get_xyz_cid0_dict(model, xyz_cid0)
+    # the other loads are summed one at a time
+    loads, scale_factors = other_loads[0]
+    if loads:
+        xyz = get_xyz_cid0_dict(model, xyz_cid0)
+        eids = set(eids)
+        nids = set(nids)
 
     unsupported_types = set()
     shell_elements = {
@@ -635,7 +762,7 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
         F += p1 * force_dir
-        M += cross(r - p, F)
+        M += cross(r - p, p1 * force_dir)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -669,7 +796,7 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        M += cross(r - p, p1 * force_dir)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -992,6 +1119,259 @@ def _pload4_helper_line(load, load_dir, elem, scale, pressures, nodes, xyz, p):
     return fi, mi
 
 
+NODE_LOAD_TYPES = {'FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2'}
+PLOAD2_FACE_TYPES = {'CTRIA3', 'CTRIAR', 'CQUAD4', 'CQUADR', 'CSHEAR'}
+PLOAD4_FACE_TYPES = {
+    'CTRIA3', 'CTRIA6', 'CTRIAR',
+    'CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'}
+TRI_FACE_TYPES = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+
+def _sum_forces_moments_arrays(model: BDF, p: np.ndarray, loads_list, scale_factors_list,
+                               xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                               eids: Optional[List[int]]=None,
+                               nids: Optional[List[int]]=None):
+    """
+    Sums the FORCE/MOMENT/PLOAD/PLOAD2/PLOAD4 loads of multiple load
+    cases with arrays
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p : (3, ) float ndarray
+        the summation point in the global frame
+    loads_list : List[List[load]]
+        the reduced loads of each load case
+    scale_factors_list : List[List[float]]
+        the scale factors of each load case
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+    eids / nids : List[int]; default=None -> all
+        the elements/nodes to include (see ``sum_forces_moments_elements``)
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces in the global frame
+    moments : (nloadcases, 3) float ndarray
+        the moments in the global frame
+    other_loads : List[(loads, scale_factors)]
+        the loads of each load case that must be summed one at a time
+        (e.g., PLOAD1, a PLOAD4 on a CHEXA)
+
+    """
+    nloadcases = len(loads_list)
+    forces = np.zeros((nloadcases, 3), dtype='float64')
+    moments = np.zeros((nloadcases, 3), dtype='float64')
+    other_loads = [([], []) for unused_i in range(nloadcases)]
+    nids_set = None if nids is None else set(nids)
+
+    # forces/moments at the nodes
+    node_icase = []
+    node_nids = []
+    node_vectors = []
+    moment_icase = []
+    moment_vectors = []
+
+    # PLOAD
+    pload_icase = []
+    pload_nodes = []
+    pload_pressures = []
+
+    # PLOAD2/PLOAD4; a row for each element of each load
+    face_loads = []
+    face_neids = []
+    face_eids = []
+    for icase, (loads, scale_factors) in enumerate(zip(loads_list, scale_factors_list)):
+        for load, scale in zip(loads, scale_factors):
+            loadtype = load.type
+            if loadtype in NODE_LOAD_TYPES:
+                if nids_set is not None:
+                    load_nids = [load.node_id] if loadtype == 'FORCE' else load.node_ids
+                    if not all(nid in nids_set for nid in load_nids):
+                        continue
+                vector = load.xyz
+                if loadtype in ('FORCE', 'MOMENT') and load.Cid() != 0:
+                    vector = load.cid_ref.transform_vector_to_global(vector)
+                if loadtype.startswith('FORCE'):
+                    node_icase.append(icase)
+                    node_nids.append(load.node_id)
+                    node_vectors.append(load.mag * scale * vector)
+                else:
+                    moment_icase.append(icase)
+                    moment_vectors.append(load.mag * scale * vector)
+
+            elif loadtype == 'PLOAD' and len(load.node_ids) in (3, 4):
+                nodes = load.node_ids
+                pload_icase.append(icase)
+                pload_nodes.append(nodes + [0] * (4 - len(nodes)))
+                pload_pressures.append(load.pressure * scale)
+
+            elif loadtype == 'PLOAD2' or (
+                    loadtype == 'PLOAD4' and load.surf_or_line == 'SURF' and
+                    load.line_load_dir == 'NORM' and
+                    (load.Cid() in [0, None] or not load.nvector.any())):
+                face_neids.append(len(load.eids))
+                face_eids.extend(load.eids)
+                face_loads.append((icase, load, scale))
+            else:
+                other_loads[icase][0].append(load)
+                other_loads[icase][1].append(scale)
+
+    if node_icase or pload_icase or face_loads:
+        all_nids, xyz = get_xyz_cid0_array(model, xyz_cid0)
+
+    if node_icase:
+        force = np.array(node_vectors, dtype='float64')
+        xyz_nodes = get_node_xyz(all_nids, xyz, np.array(node_nids, dtype='int64'))
+        _add_forces_moments(forces, moments, node_icase, xyz_nodes - p, force)
+    if moment_icase:
+        moment = np.array(moment_vectors, dtype='float64')
+        for i in range(3):
+            moments[:, i] += np.bincount(moment_icase, weights=moment[:, i],
+                                         minlength=nloadcases)
+
+    if pload_icase:
+        nodes = np.array(pload_nodes, dtype='int64')
+        is_tri = nodes[:, 3] == 0
+        nodes[is_tri, 3] = nodes[is_tri, 2]
+        xyz_nodes = get_node_xyz(all_nids, xyz, nodes)
+        area, centroid, normal = _get_face_area_centroid_normal(xyz_nodes, is_tri)
+        force = (np.array(pload_pressures) * area)[:, np.newaxis] * normal
+        if nids is not None:
+            # the fraction of the nodes that are included
+            nnodes = np.where(is_tri, 3., 4.)
+            is_node = np.isin(nodes, np.asarray(list(nids_set), dtype='int64'))
+            is_node[is_tri, 3] = False
+            force *= (is_node.sum(axis=1) / nnodes)[:, np.newaxis]
+        _add_forces_moments(forces, moments, pload_icase, centroid - p, force)
+
+    if face_loads:
+        _sum_face_loads(model, p, face_loads, face_neids, face_eids, eids,
+                        all_nids, xyz, forces, moments, other_loads)
+    return forces, moments, other_loads
+
+def _sum_face_loads(model: BDF, p: np.ndarray, face_loads, face_neids, face_eids, eids,
+                    all_nids: np.ndarray, xyz: np.ndarray,
+                    forces: np.ndarray, moments: np.ndarray, other_loads) -> None:
+    """sums the PLOAD2/PLOAD4 loads for ``_sum_forces_moments_arrays``"""
+    nloads = len(face_loads)
+    row_iload = np.repeat(np.arange(nloads), face_neids)
+    row_eids = np.array(face_eids, dtype='int64')
+    is_pload2 = np.array([load.type == 'PLOAD2' for unused_icase, load, unused_scale
+                          in face_loads], dtype='bool')
+
+    # the element type of each row
+    row_etypes = np.full(len(row_eids), '', dtype='<U6')
+    for etype in PLOAD4_FACE_TYPES:
+        type_eids = model._type_to_id_map.get(etype, [])
+        if len(type_eids):
+            row_etypes[np.isin(row_eids, np.asarray(type_eids, dtype='int64'))] = etype
+    is_valid = np.isin(row_etypes, list(PLOAD4_FACE_TYPES))
+    is_valid[is_pload2[row_iload]] &= np.isin(row_etypes[is_pload2[row_iload]],
+                                              list(PLOAD2_FACE_TYPES))
+
+    # a load with an unsupported element (e.g., a PLOAD4 on a CHEXA) is
+    # summed one at a time
+    ilocal = np.unique(row_iload[~is_valid])
+    for iload in ilocal:
+        icase, load, scale = face_loads[iload]
+        other_loads[icase][0].append(load)
+        other_loads[icase][1].append(scale)
+    irow = ~np.isin(row_iload, ilocal)
+    if eids is not None:
+        irow &= np.isin(row_eids, np.asarray(list(eids), dtype='int64'))
+    row_iload = row_iload[irow]
+    row_eids = row_eids[irow]
+    row_etypes = row_etypes[irow]
+    if len(row_eids) == 0:
+        return
+
+    # the geometry of each element is calculated once
+    ueids, ielement = np.unique(row_eids, return_inverse=True)
+    uetypes = row_etypes[np.unique(row_eids, return_index=True)[1]]
+    nodes = np.zeros((len(ueids), 4), dtype='int64')
+    for etype in np.unique(uetypes):
+        ietype = np.where(uetypes == etype)[0]
+        nnodes = 3 if etype in TRI_FACE_TYPES else 4
+        nodes[ietype, :nnodes] = get_element_columns(model, etype, ueids[ietype], nnodes)[1]
+    is_tri = np.isin(uetypes, list(TRI_FACE_TYPES))
+    nodes[is_tri, 3] = nodes[is_tri, 2]
+    area, centroid, normal = _get_face_area_centroid_normal(
+        get_node_xyz(all_nids, xyz, nodes), is_tri)
+
+    # the pressure and direction of each load
+    load_icase = np.array([icase for icase, unused_load, unused_scale in face_loads])
+    load_scales = np.array([scale for unused_icase, unused_load, scale in face_loads])
+    load_pressures = np.array([
+        [load.pressure] * 4 if load.type == 'PLOAD2' else load.pressures
+        for unused_icase, load, unused_scale in face_loads], dtype='float64')
+    load_pressures *= load_scales[:, np.newaxis]
+    load_dirs = np.array([
+        [0., 0., 0.] if load.type == 'PLOAD2' else load.nvector
+        for unused_icase, load, unused_scale in face_loads], dtype='float64')
+    load_norms = norm(load_dirs, axis=1)
+    is_nvector = load_norms > 0.
+    load_dirs[is_nvector, :] /= load_norms[is_nvector, np.newaxis]
+
+    # the mean pressure of the nodes of the face
+    pressures = load_pressures[row_iload, :]
+    row_is_tri = is_tri[ielement]
+    pressures[row_is_tri, 3] = pressures[row_is_tri, 0]
+    pressure = np.where(pressures.min(axis=1) == pressures.max(axis=1),
+                        pressures[:, 0], np.where(row_is_tri, pressures[:, :3].mean(axis=1),
+                                                  pressures.mean(axis=1)))
+
+    load_dir = load_dirs[row_iload, :]
+    is_normal = np.abs(load_dir).max(axis=1) == 0.
+    load_dir[is_normal, :] = normal[ielement[is_normal], :]
+
+    force = (pressure * area[ielement])[:, np.newaxis] * load_dir
+    _add_forces_moments(forces, moments, load_icase[row_iload],
+                        centroid[ielement, :] - p, force)
+
+def _get_face_area_centroid_normal(xyz_nodes: np.ndarray,
+                                   is_tri: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the area, centroid and normal of tri/quad faces
+
+    Parameters
+    ----------
+    xyz_nodes : (n, 4, 3) float ndarray
+        the corner nodes; the 4th node of a tri is the 3rd node
+    is_tri : (n, ) bool ndarray
+        is the face a tri
+
+    """
+    n1 = xyz_nodes[:, 0, :]
+    n2 = xyz_nodes[:, 1, :]
+    n3 = xyz_nodes[:, 2, :]
+    n4 = xyz_nodes[:, 3, :]
+    axb = np.where(is_tri[:, np.newaxis],
+                   cross(n1 - n2, n1 - n3),
+                   cross(n1 - n3, n2 - n4))
+    centroid = np.where(is_tri[:, np.newaxis],
+                        (n1 + n2 + n3) / 3.,
+                        (n1 + n2 + n3 + n4) / 4.)
+    nunit = norm(axb, axis=1)
+    area = 0.5 * nunit
+
+    # a face with no area has no load
+    normal = np.zeros(axb.shape, dtype='float64')
+    iarea = nunit > 0.
+    normal[iarea, :] = axb[iarea, :] / nunit[iarea, np.newaxis]
+    return area, centroid, normal
+
+def _add_forces_moments(forces: np.ndarray, moments: np.ndarray, icase,
+                        r: np.ndarray, force: np.ndarray) -> None:
+    """adds the forces at r to the forces/moments of each load case"""
+    nloadcases = forces.shape[0]
+    moment = cross(r, force)
+    for i in range(3):
+        forces[:, i] += np.bincount(icase, weights=force[:, i], minlength=nloadcases)
+        moments[:, i] += np.bincount(icase, weights=moment[:, i], minlength=nloadcases)
+
+
 def get_static_force_vector_from_subcase_id(model: BDF, subcase_id: int):
     """
     solves for F in:
@@ -4,6 +4,9 @@
 Defines:
   - mass_poperties
       get the mass & moment of inertia of the model
+  - mass_properties_arrays
+      get the mass & moment of inertia of the model and the mass/centroid
+      of each element/mass
 
 """
 from itertools import count
@@ -14,6 +17,8 @@ import numpy as np
 #from pyNastran.bdf.cards.materials import get_mat_props_S
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.utils.mathematics import integrate_positive_unit_line
+from pyNastran.bdf.mesh_utils.model_arrays import (
+    get_xyz_cid0_array, get_element_columns, get_node_xyz, is_missing_nodes)
 
 NO_MASS = {
     # has mass
@@ -67,6 +72,14 @@ NO_MASS = {
     'CHACAB', 'CAABSF',
 }
 
+#: the element/mass types that are calculated with arrays instead of one at a time
+MASS_ARRAY_TYPES = {
+    'CTRIA3', 'CQUAD4',
+    'CTETRA', 'CPENTA', 'CHEXA',
+    'CBAR', 'CBEAM',
+    'CONM2',
+}
+
 def transform_inertia(mass, xyz_cg, xyz_ref, xyz_ref2, I_ref):
     """
     Transforms mass moment of inertia using parallel-axis theorem.
@@ -189,16 +202,162 @@ def mass_properties(model, element_ids=None, mass_ids=None,
 
     .. seealso:: model.mass_properties
 
+    """
+    mass, cg, inertia = mass_properties_arrays(
+        model, element_ids=element_ids, mass_ids=mass_ids,
+        reference_point=reference_point,
+        sym_axis=sym_axis, scale=scale, inertia_reference=inertia_reference)[:3]
+    return mass, cg, inertia
+
+def mass_properties_arrays(model, element_ids=None, mass_ids=None,
+                           reference_point=None,
+                           sym_axis=None, scale=None, inertia_reference='cg'):
+    """
+    Calculates mass properties in the global system about the
+    reference point and gets the mass of each element/mass.
+
+    The CTRIA3s, CQUAD4s, CTETRAs, CPENTAs, CHEXAs, CBARs, CBEAMs and
+    CONM2s are calculated with arrays (one card type at a time).  The
+    other cards are calculated one at a time.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    element_ids : List[int]; ndarray
+        the element ids to consider
+    mass_ids : List[int]; ndarray
+        the mass ids to consider
+    reference_point : (3, ) ndarray; default = <0,0,0>.
+        an array that defines the origin of the frame.
+    sym_axis : str, optional
+        the symmetry axes (see ``mass_properties_nsm``)
+    scale : float, optional
+        the WTMASS scaling value; default=None -> PARAM, WTMASS is used
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg
+        'ref' : inertia is about the reference point
+
+    Returns
+    -------
+    mass : float
+        the mass of the model
+    cg : (3, ) float NDARRAY
+        the cg of the model as an array.
+    I : (6, ) float NDARRAY
+        moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+    eids : (n, ) int ndarray
+        the sorted element ids followed by the sorted mass ids
+    element_mass : (n, ) float ndarray
+        the mass of each element/mass; sym_axis and scale aren't applied
+    element_cg : (n, 3) float ndarray
+        the cg of each element/mass
+
+    .. seealso:: mass_properties
+
     """
     reference_point, is_cg = _update_reference_point(
         model, reference_point, inertia_reference)
-    element_ids, elements, mass_ids, masses = _mass_properties_elements_init(
-        model, element_ids, mass_ids)
-    mass, cg, I = _mass_properties(
-        model, elements, masses,
-        reference_point, is_cg)
-    mass, cg, I = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, I)
-    return mass, cg, I
+    element_ids, mass_ids = _get_mass_properties_ids(model, element_ids, mass_ids)
+
+    etype_eids = {}
+    for etype in MASS_ARRAY_TYPES:
+        if etype not in model._type_to_id_map:
+            continue
+        ids = mass_ids if etype == 'CONM2' else element_ids
+        eids = np.intersect1d(np.array(model._type_to_id_map[etype], dtype='int64'), ids)
+        if len(eids):
+            etype_eids[etype] = eids
+    mass_arrays, leftover_eids = _get_mass_arrays_by_type(model, etype_eids)
+
+    # the cards that aren't calculated with arrays are calculated one at a time
+    array_eids = []
+    array_mass_ids = []
+    for etype, eids in etype_eids.items():
+        if etype in leftover_eids:
+            eids = np.setdiff1d(eids, leftover_eids[etype])
+        if etype == 'CONM2':
+            array_mass_ids.append(eids)
+        else:
+            array_eids.append(eids)
+
+    data = []
+    for ids, array_ids, cards in [(element_ids, array_eids, model.elements),
+                                  (mass_ids, array_mass_ids, model.masses)]:
+        if array_ids:
+            ids = np.setdiff1d(ids, np.hstack(array_ids))
+        eids, mass, centroid = _get_point_masses(
+            model, [cards[eid] for eid in ids], reference_point)
+        data.append([(eids, mass, centroid, np.zeros(len(eids)), centroid)])
+
+    for etype, (eids, unused_pids, unused_size, mass, centroid,
+                nsm, nsm_centroid) in mass_arrays.items():
+        idata = 1 if etype == 'CONM2' else 0
+        data[idata].append((eids, mass, centroid, nsm, nsm_centroid))
+
+    # sort the elements and then the masses
+    arrays = []
+    for datai in data:
+        arraysi = [np.hstack(values) if values[0].ndim == 1 else np.vstack(values)
+                   for values in zip(*datai)]
+        isort = np.argsort(arraysi[0], kind='stable')
+        arrays.append([values[isort] for values in arraysi])
+    eids, masses, centroids, nsms, nsm_centroids = [
+        np.hstack(values) if values[0].ndim == 1 else np.vstack(values)
+        for values in zip(*arrays)]
+
+    inertia = (
+        _get_inertia_array(masses, centroids, reference_point).sum(axis=0) +
+        _get_inertia_array(nsms, nsm_centroids, reference_point).sum(axis=0))
+    element_mass = masses + nsms
+    mass_cg = masses[:, np.newaxis] * centroids + nsms[:, np.newaxis] * nsm_centroids
+    mass = element_mass.sum()
+    cg = mass_cg.sum(axis=0)
+    if mass:
+        cg /= mass
+
+    element_cg = centroids.copy()
+    imass = np.where(element_mass != 0.)[0]
+    element_cg[imass, :] = mass_cg[imass, :] / element_mass[imass, np.newaxis]
+
+    # only transform if we're calculating the inertia about the cg
+    if is_cg:
+        xyz_ref = reference_point
+        xyz_ref2 = cg
+        inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
+    mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
+    return mass, cg, inertia, eids, element_mass, element_cg
+
+def _get_mass_properties_ids(model, element_ids, mass_ids):
+    """
+    Gets the sorted element/mass ids of the model to consider
+    (see ``_mass_properties_elements_init``)
+
+    """
+    if isinstance(element_ids, integer_types):
+        element_ids = [element_ids]
+    if isinstance(mass_ids, integer_types):
+        mass_ids = [mass_ids]
+
+    all_eids = np.unique(np.array(list(model.elements.keys()), dtype='int64'))
+    all_mass_ids = np.unique(np.array(list(model.masses.keys()), dtype='int64'))
+    if element_ids is None and mass_ids is None:
+        return all_eids, all_mass_ids
+
+    # if either element_id or mass_ids are specified and the other is not, use only the
+    # specified ids
+    if element_ids is None:
+        element_ids = np.zeros(0, dtype='int64')
+    else:
+        assert len(model.elements) > 0
+        element_ids = np.intersect1d(all_eids, np.array(list(element_ids), dtype='int64'))
+
+    if mass_ids is None:
+        mass_ids = np.zeros(0, dtype='int64')
+    else:
+        assert len(model.masses) > 0
+        mass_ids = np.intersect1d(all_mass_ids, np.array(list(mass_ids), dtype='int64'))
+    return element_ids, mass_ids
 
 def _update_reference_point(model, reference_point, inertia_reference='cg'):
     """helper method for handling reference point"""
@@ -244,63 +403,55 @@ def mass_properties_no_xref(model, element_ids=None, mass_ids=None,
     mass, cg, I = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, I)
     return mass, cg, I
 
-def _mass_properties(model, elements, masses, reference_point, is_cg):
-    """helper method for ``mass_properties``"""
-    mass = 0.
-    cg = array([0., 0., 0.])
-    inertia = array([0., 0., 0., 0., 0., 0., ])
-    no_mass = NO_MASS
-    for pack in [elements, masses]:
-        for element in pack:
-            if element.type == 'CBEAM':
-                mass = _get_cbeam_mass_no_nsm(model, element, mass, cg, inertia, reference_point)
-                continue
+def _get_point_masses(model, elements, reference_point):
+    """
+    Gets the mass and center of mass of the elements/masses one at a time
+    for ``mass_properties_arrays``
 
-            try:
-                p = element.center_of_mass()  # was Centroid()
-            except AttributeError:
-                if element.type in no_mass:
-                    continue
-                model.log.error(element.rstrip())
-                raise
+    Returns
+    -------
+    eids : (n, ) int ndarray
+        the element/mass ids that have a mass
+    mass : (n, ) float ndarray
+        the mass
+    centroid : (n, 3) float ndarray
+        the center of mass
 
-            try:
-                m = element.Mass()
-                #print('eid=%s type=%s mass=%s'  %(element.eid, element.type, m))
-            except:
-                #raise
-                if element.type in no_mass:
-                    continue
-                # PLPLANE
-                if element.pid_ref.type == 'PSHELL':
-                    model.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (
-                        p, reference_point, type(reference_point)))
-                    raise
-                model.log.warning("could not get the inertia for element/property\n%s%s" % (
-                    element, element.pid_ref))
+    """
+    eids = []
+    masses = []
+    centroids = []
+    no_mass = NO_MASS
+    for element in elements:
+        try:
+            p = element.center_of_mass()  # was Centroid()
+        except AttributeError:
+            if element.type in no_mass:
                 continue
-            mass += m
-            cg += m * p
-            (x, y, z) = p - reference_point
-            x2 = x * x
-            y2 = y * y
-            z2 = z * z
-            inertia[0] += m * (y2 + z2)  # Ixx
-            inertia[1] += m * (x2 + z2)  # Iyy
-            inertia[2] += m * (x2 + y2)  # Izz
-            inertia[3] += m * x * y      # Ixy
-            inertia[4] += m * x * z      # Ixz
-            inertia[5] += m * y * z      # Iyz
-
-    if mass:
-        cg /= mass
+            model.log.error(element.rstrip())
+            raise
 
-    # only transform if we're calculating the inertia about the cg
-    if is_cg:
-        xyz_ref = reference_point
-        xyz_ref2 = cg
-        inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
-    return mass, cg, inertia
+        try:
+            m = element.Mass()
+            #print('eid=%s type=%s mass=%s'  %(element.eid, element.type, m))
+        except:
+            #raise
+            if element.type in no_mass:
+                continue
+            # PLPLANE
+            if element.pid_ref.type == 'PSHELL':
+                model.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (
+                    p, reference_point, type(reference_point)))
+                raise
+            model.log.warning("could not get the inertia for element/property\n%s%s" % (
+                element, element.pid_ref))
+            continue
+        eids.append(element.eid)
+        masses.append(m)
+        centroids.append(p)
+    neids = len(eids)
+    return (np.array(eids, dtype='int64'), np.array(masses, dtype='float64'),
+            np.array(centroids, dtype='float64').reshape(neids, 3))
 
 def _mass_properties_no_xref(model, elements, masses, reference_point, is_cg):  # pragma: no cover
     """
@@ -396,6 +547,383 @@ def _increment_inertia(centroid, reference_point, m, mass, cg, I):
     cg += m * centroid
     return mass
 
+def _increment_inertia_array(centroids, reference_point, masses, mass, cg, I):
+    """vectorized version of ``_increment_inertia``"""
+    if len(masses) == 0:
+        return mass
+    I += _get_inertia_array(masses, centroids, reference_point).sum(axis=0)
+    mass += masses.sum()
+    cg += (masses[:, np.newaxis] * centroids).sum(axis=0)
+    return mass
+
+def _get_inertia_array(masses, centroids, reference_point):
+    """gets the [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] of point masses about the reference point"""
+    dxyz = centroids - reference_point
+    x = dxyz[:, 0]
+    y = dxyz[:, 1]
+    z = dxyz[:, 2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia = np.zeros((len(masses), 6), dtype='float64')
+    inertia[:, 0] = masses * (y2 + z2)  # Ixx
+    inertia[:, 1] = masses * (x2 + z2)  # Iyy
+    inertia[:, 2] = masses * (x2 + y2)  # Izz
+    inertia[:, 3] = masses * x * y      # Ixy
+    inertia[:, 4] = masses * x * z      # Ixz
+    inertia[:, 5] = masses * y * z      # Iyz
+    return inertia
+
+def _get_mass_arrays_by_type(model, etype_eids, xyz_cid0_dict=None):
+    """
+    Gets the mass of the elements/masses that are calculated with arrays
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    etype_eids : Dict[etype] = eids
+        etype : str
+            the card type (see ``MASS_ARRAY_TYPES``)
+        eids : (n, ) int ndarray
+            the sorted element/mass ids
+    xyz_cid0_dict : dict[nid] : xyz; default=None -> auto-calculate
+        mapping of the node id to the global position
+
+    Returns
+    -------
+    mass_arrays : Dict[etype] = (eids, pids, size, mass, centroid, nsm, nsm_centroid)
+        eids : (n, ) int ndarray
+            the element/mass ids
+        pids : (n, ) int ndarray
+            the property ids; 0 for the masses
+        size : (n, ) float ndarray
+            the area/volume/length; nan for the masses
+        mass : (n, ) float ndarray
+            the mass at the centroid
+        centroid : (n, 3) float ndarray
+            the centroid
+        nsm : (n, ) float ndarray
+            the PBEAM/PBCOMP non-structural mass, which is at nsm_centroid;
+            the NSM of the other properties is part of mass
+        nsm_centroid : (n, 3) float ndarray
+            the position of the non-structural mass
+    leftover_eids : Dict[etype] = eids
+        the elements/masses that must be calculated one at a time
+        (e.g., a CQUAD4 with a PLPLANE)
+
+    """
+    mass_arrays = {}
+    leftover_eids = {}
+    if not etype_eids:
+        return mass_arrays, leftover_eids
+
+    nids, xyz_cid0 = get_xyz_cid0_array(model, xyz_cid0_dict)
+    for etype, eids in etype_eids.items():
+        if etype in ('CTRIA3', 'CQUAD4'):
+            out = _get_shell_mass_arrays(model, etype, eids, nids, xyz_cid0)
+        elif etype in ('CTETRA', 'CPENTA', 'CHEXA'):
+            out = _get_solid_mass_arrays(model, etype, eids, nids, xyz_cid0)
+        elif etype == 'CBAR':
+            out = _get_cbar_mass_arrays(model, eids, nids, xyz_cid0)
+        elif etype == 'CBEAM':
+            out = _get_cbeam_mass_arrays(model, eids, nids, xyz_cid0)
+        elif etype == 'CONM2':
+            out = _get_conm2_mass_arrays(model, eids, nids, xyz_cid0)
+        else:  # pragma: no cover
+            raise NotImplementedError(etype)
+        arrays, is_leftover = out
+        if is_leftover.any():
+            leftover_eids[etype] = eids[is_leftover]
+        if len(arrays[0]):
+            mass_arrays[etype] = arrays
+    return mass_arrays, leftover_eids
+
+def _get_property_array(model, pids, func, nvalues):
+    """
+    Calls func(prop) once for each property, so the properties of the
+    elements can be calculated without looping over the elements
+
+    Returns
+    -------
+    values : (neids, nvalues) float ndarray
+        the values of the properties of the elements
+    is_leftover : (neids, ) bool ndarray
+        func failed or returned None (e.g., an unsupported property type),
+        so the element must be calculated one at a time
+
+    """
+    upids, ipids = np.unique(pids, return_inverse=True)
+    uvalues = np.full((len(upids), nvalues), np.nan, dtype='float64')
+    for i, pid in enumerate(upids):
+        try:
+            value = func(model.properties[pid])
+        except Exception:
+            continue
+        if value is not None:
+            uvalues[i, :] = value
+    values = uvalues[ipids, :]
+    is_leftover = np.isnan(values).any(axis=1)
+    return values, is_leftover
+
+def _shell_mass_per_area(prop):
+    """gets the (nsm, rho, t) of a shell property, where m/A = nsm + rho * t"""
+    if prop.type == 'PSHELL':
+        if prop.t is None:
+            return None
+        return prop.nsm, prop.mid_ref.Rho(), prop.t
+    elif prop.type in ['PCOMP', 'PCOMPG']:
+        return prop.get_mass_per_area(), 0., 0.
+    return None
+
+def _get_shell_mass_arrays(model, etype, eids, nids, xyz_cid0):
+    """gets the mass of the CTRIA3s/CQUAD4s with a PSHELL/PCOMP/PCOMPG"""
+    nnodes = 3 if etype == 'CTRIA3' else 4
+    pids, nodes, tflag, thickness = get_element_columns(
+        model, etype, eids, nnodes, is_shell=True)
+    values, is_leftover = _get_property_array(model, pids, _shell_mass_per_area, 3)
+    is_leftover |= (tflag != 0) & (tflag != 1)
+    is_leftover |= is_missing_nodes(nids, nodes)
+
+    iarray = ~is_leftover
+    eids = eids[iarray]
+    pids = pids[iarray]
+    tflag = tflag[iarray]
+    thickness = thickness[iarray, :]
+    nsm, rho, t0 = values[iarray, :].T
+    xyz = get_node_xyz(nids, xyz_cid0, nodes[iarray, :])
+    if etype == 'CTRIA3':
+        p1, p2, p3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+        centroid = (p1 + p2 + p3) / 3.
+        area = 0.5 * norm(cross(p1 - p2, p1 - p3), axis=1)
+    else:
+        p1, p2, p3, p4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        centroid = (p1 + p2 + p3 + p4) / 4.
+        area = 0.5 * norm(cross(p3 - p1, p4 - p2), axis=1)
+
+    # T1-T4 are absolute (tflag=0) or relative (tflag=1) thicknesses
+    # and a blank thickness is the thickness of the PSHELL
+    t0_nodes = t0[:, np.newaxis]
+    is_blank = np.isnan(thickness)
+    thickness = np.where(tflag[:, np.newaxis] == 0, thickness, thickness * t0_nodes)
+    thickness[is_blank] = np.broadcast_to(t0_nodes, thickness.shape)[is_blank]
+    mass_per_area = nsm + rho * thickness.mean(axis=1)
+    mass = mass_per_area * area
+
+    zero = np.zeros(len(eids), dtype='float64')
+    arrays = (eids, pids, area, mass, centroid, zero, centroid)
+    return arrays, is_leftover
+
+def _get_solid_mass_arrays(model, etype, eids, nids, xyz_cid0):
+    """gets the mass of the CTETRAs/CPENTAs/CHEXAs"""
+    nnodes = {'CTETRA' : 4, 'CPENTA' : 6, 'CHEXA' : 8}[etype]
+    pids, nodes = get_element_columns(model, etype, eids, nnodes)[:2]
+    values, is_leftover = _get_property_array(model, pids, lambda prop: prop.Rho(), 1)
+    is_leftover |= is_missing_nodes(nids, nodes)
+
+    iarray = ~is_leftover
+    eids = eids[iarray]
+    pids = pids[iarray]
+    rho = values[iarray, 0]
+    xyz = get_node_xyz(nids, xyz_cid0, nodes[iarray, :])
+    if etype == 'CTETRA':
+        p1, p2, p3, p4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        centroid = (p1 + p2 + p3 + p4) / 4.
+        volume = -(
+            (p1 - p4) * cross(p2 - p4, p3 - p4)).sum(axis=1) / 6.
+    elif etype == 'CPENTA':
+        p1, p2, p3, p4, p5, p6 = [xyz[:, i, :] for i in range(6)]
+        area1 = 0.5 * norm(cross(p3 - p1, p2 - p1), axis=1)
+        area2 = 0.5 * norm(cross(p6 - p4, p5 - p4), axis=1)
+        centroid1 = (p1 + p2 + p3) / 3.
+        centroid2 = (p4 + p5 + p6) / 3.
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    else:
+        p1, p2, p3, p4, p5, p6, p7, p8 = [xyz[:, i, :] for i in range(8)]
+        area1 = 0.5 * norm(cross(p3 - p1, p4 - p2), axis=1)
+        area2 = 0.5 * norm(cross(p7 - p5, p8 - p6), axis=1)
+        centroid1 = (p1 + p2 + p3 + p4) / 4.
+        centroid2 = (p5 + p6 + p7 + p8) / 4.
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    mass = rho * volume
+
+    zero = np.zeros(len(eids), dtype='float64')
+    arrays = (eids, pids, volume, mass, centroid, zero, centroid)
+    return arrays, is_leftover
+
+def _get_line_objects(model, eids):
+    """gets the property ids and the end nodes of CBARs/CBEAMs"""
+    neids = len(eids)
+    pids = np.zeros(neids, dtype='int64')
+    nodes = np.zeros((neids, 2), dtype='int64')
+    for ieid, eid in enumerate(eids):
+        elem = model.elements[eid]
+        pids[ieid] = elem.pid
+        nodes[ieid, :] = elem.nodes
+    return pids, nodes
+
+def _get_cbar_mass_arrays(model, eids, nids, xyz_cid0):
+    """gets the mass of the CBARs"""
+    pids, nodes = _get_line_objects(model, eids)
+    values, is_leftover = _get_property_array(
+        model, pids, lambda prop: prop.MassPerLength(), 1)
+    is_leftover |= is_missing_nodes(nids, nodes)
+
+    iarray = ~is_leftover
+    eids = eids[iarray]
+    pids = pids[iarray]
+    xyz = get_node_xyz(nids, xyz_cid0, nodes[iarray, :])
+    xyz1 = xyz[:, 0, :]
+    xyz2 = xyz[:, 1, :]
+    centroid = (xyz1 + xyz2) / 2.
+    length = norm(xyz2 - xyz1, axis=1)
+    mass = values[iarray, 0] * length
+
+    zero = np.zeros(len(eids), dtype='float64')
+    arrays = (eids, pids, length, mass, centroid, zero, centroid)
+    return arrays, is_leftover
+
+def _get_cbeam_mass_arrays(model, eids, nids, xyz_cid0):
+    """
+    Gets the mass of the CBEAMs
+
+    The non-structural mass of a PBEAM/PBCOMP is offset from the beam
+    axis, so the axes are only calculated for the CBEAMs with an offset.
+
+    """
+    neids = len(eids)
+    pids = np.zeros(neids, dtype='int64')
+    nodes = np.zeros((neids, 2), dtype='int64')
+    is_offset = np.zeros(neids, dtype='bool')
+    for ieid, eid in enumerate(eids):
+        elem = model.elements[eid]
+        pids[ieid] = elem.pid
+        nodes[ieid, :] = elem.nodes
+        is_offset[ieid] = elem.bit is not None or elem.wa.any() or elem.wb.any()
+
+    upids, ipids = np.unique(pids, return_inverse=True)
+    uvalues = np.full((len(upids), 6), np.nan, dtype='float64')
+    for i, pid in enumerate(upids):
+        out = _get_cbeam_mass_per_length(model.properties[pid])
+        if out is not None:
+            uvalues[i, :] = out
+
+    # the PBMSECTs are skipped
+    values = uvalues[ipids, :]
+    is_leftover = is_missing_nodes(nids, nodes)
+    iarray = ~np.isnan(values[:, 0]) & ~is_leftover
+    eids = eids[iarray]
+    pids = pids[iarray]
+    values = values[iarray, :]
+    mass_per_length = values[:, 0]
+    nsm_per_length = values[:, 1]
+    nsm_offsets = values[:, 2:]
+
+    xyz = get_node_xyz(nids, xyz_cid0, nodes[iarray, :])
+    xyz1 = xyz[:, 0, :]
+    xyz2 = xyz[:, 1, :]
+    centroid = (xyz1 + xyz2) / 2.
+    length = norm(xyz2 - xyz1, axis=1)
+    mass = mass_per_length * length
+    nsm = nsm_per_length * length
+
+    nsm_centroid = centroid.copy()
+    is_offset = is_offset[iarray] | nsm_offsets.any(axis=1)
+    for ieid in np.where(is_offset)[0]:
+        elem = model.elements[eids[ieid]]
+        is_failed, out = elem.get_axes(model)
+        if is_failed:
+            model.log.error(str(out))
+            raise RuntimeError(out)
+        wa, wb, unused_ihat, jhat, khat = out
+        m1a, m2a, m1b, m2b = nsm_offsets[ieid, :]
+        nsm_n1 = xyz1[ieid, :] + wa + jhat * m1a + khat * m2a
+        nsm_n2 = xyz2[ieid, :] + wb + jhat * m1b + khat * m2b
+        nsm_centroid[ieid, :] = (nsm_n1 + nsm_n2) / 2.
+
+    arrays = (eids, pids, length, mass, centroid, nsm, nsm_centroid)
+    return arrays, is_leftover
+
+def _get_cbeam_mass_per_length(prop):
+    """
+    Gets the mass/length of a PBEAM/PBEAML/PBCOMP
+
+    We don't call the MassPerLength method, so we can put the
+    NSM of a PBEAM/PBCOMP on a different axis (the PBEAM is weird).
+
+    Returns
+    -------
+    mass_per_length : float
+        the mass/length without the PBEAM/PBCOMP NSM
+    nsm_per_length : float
+        the PBEAM/PBCOMP NSM
+    m1a, m2a, m1b, m2b : float
+        the offset of the NSM at end A/B
+    None : a PBMSECT, which is skipped
+
+    """
+    if prop.type == 'PBEAM':
+        rho = prop.Rho()
+        mass_per_lengths = []
+        nsm_per_lengths = []
+        for (area, nsm) in zip(prop.A, prop.nsm):
+            mass_per_lengths.append(area * rho)
+            nsm_per_lengths.append(nsm)
+        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
+        nsm_per_length = integrate_positive_unit_line(prop.xxb, nsm_per_lengths)
+        nsm_offsets = [prop.m1a, prop.m2a, prop.m1b, prop.m2b]
+    elif prop.type == 'PBEAML':
+        # mass_per_length already includes nsm
+        mass_per_lengths = prop.get_mass_per_lengths()
+        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
+        nsm_per_length = 0.
+        nsm_offsets = [0., 0., 0., 0.]
+    elif prop.type == 'PBCOMP':
+        mass_per_length = prop.MassPerLength()
+        nsm_per_length = prop.nsm
+        nsm_offsets = [prop.m1, prop.m2, prop.m1, prop.m2]
+    elif prop.type == 'PBMSECT':
+        return None
+    else:  # pragma: no cover
+        raise NotImplementedError(prop.type)
+    return [mass_per_length, nsm_per_length] + nsm_offsets
+
+def _get_conm2_mass_arrays(model, eids, nids, xyz_cid0):
+    """gets the mass of the CONM2s"""
+    neids = len(eids)
+    mass = np.zeros(neids, dtype='float64')
+    centroid = np.zeros((neids, 3), dtype='float64')
+    offset_nids = np.zeros(neids, dtype='int64')
+    is_offset = np.zeros(neids, dtype='bool')
+    for ieid, eid in enumerate(eids):
+        elem = model.masses[eid]
+        mass[ieid] = elem.mass
+        cid = elem.Cid()
+        if cid == 0:
+            # X is an offset from the node
+            offset_nids[ieid] = elem.Nid()
+            centroid[ieid, :] = elem.X
+            is_offset[ieid] = True
+        elif cid == -1:
+            centroid[ieid, :] = elem.X
+        else:
+            centroid[ieid, :] = elem.Centroid()
+    is_leftover = np.zeros(neids, dtype='bool')
+    is_leftover[is_offset] = is_missing_nodes(nids, offset_nids[is_offset])
+    is_offset &= ~is_leftover
+    if is_offset.any():
+        centroid[is_offset, :] += get_node_xyz(nids, xyz_cid0, offset_nids[is_offset])
+
+    iarray = ~is_leftover
+    neids = iarray.sum()
+    size = np.full(neids, np.nan, dtype='float64')
+    zero = np.zeros(neids, dtype='float64')
+    pids = np.zeros(neids, dtype='int64')
+    arrays = (eids[iarray], pids, size, mass[iarray], centroid[iarray, :], zero, centroid[iarray, :])
+    return arrays, is_leftover
+
 def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
                         reference_point=None,
                         sym_axis=None, scale=None, inertia_reference='cg',
@@ -488,16 +1016,7 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
     # TODO: check CG for F:\work\pyNastran\examples\Dropbox\move_tpl\ac11102g.bdf
     reference_point, is_cg = _update_reference_point(
         model, reference_point, inertia_reference)
-
-    if xyz_cid0_dict is None:
-        xyz = {}
-        for nid, node in model.nodes.items():
-            xyz[nid] = node.get_position()
-    else:
-        xyz = xyz_cid0_dict
-
-    element_ids, unused_elements, mass_ids, unused_masses = _mass_properties_elements_init(
-        model, element_ids, mass_ids)
+    element_ids, mass_ids = _get_mass_properties_ids(model, element_ids, mass_ids)
 
     mass = 0.
     cg = array([0., 0., 0.])
@@ -529,10 +1048,30 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
     lengths = defaultdict(list)
 
     no_mass = NO_MASS
+    etype_eids = {}
+    etype_eids_scalar = {}
     for etype, eids in model._type_to_id_map.items():
         #assert isinstance(eids, list), f'etype={etype} eids={eids} type={type(eids)}'
         if etype in no_mass or len(eids) == 0:
             continue
+        if etype in MASS_ARRAY_TYPES:
+            all_ids = all_mass_ids if etype == 'CONM2' else all_eids
+            etype_eids[etype] = np.intersect1d(np.array(eids, dtype=idtype), all_ids)
+        else:
+            etype_eids_scalar[etype] = eids
+
+    # the leftover elements (e.g., a CQUAD4 with a PLPLANE) are calculated one at a time
+    mass_arrays, leftover_eids = _get_mass_arrays_by_type(model, etype_eids, xyz_cid0_dict)
+    etype_eids_scalar.update(leftover_eids)
+    if etype_eids_scalar:
+        if xyz_cid0_dict is None:
+            xyz = {}
+            for nid, node in model.nodes.items():
+                xyz[nid] = node.get_position()
+        else:
+            xyz = xyz_cid0_dict
+
+    for etype, eids in etype_eids_scalar.items():
         #assert isinstance(eids, list), 'etype=%r eids=%s'%  (etype, eids)
         mass, cg, inertia = _get_mass_nsm(
             model, element_ids, mass_ids,
@@ -542,6 +1081,12 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
             area_eids_pids, nsm_centroids_area, areas,
             mass, cg, inertia, reference_point)
 
+    mass = _get_mass_arrays_nsm(
+        mass_arrays, element_ids, mass_ids,
+        length_eids_pids, nsm_centroids_length, lengths,
+        area_eids_pids, nsm_centroids_area, areas,
+        mass, cg, inertia, reference_point)
+
     model_eids = np.array(list(model.elements.keys()), dtype=idtype)
     model_pids = np.array(list(model.properties.keys()), dtype=idtype)
     if debug:  # pragma: no cover
@@ -567,6 +1112,46 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
     return mass, cg, inertia
 
 
+def _get_mass_arrays_nsm(mass_arrays, element_ids, mass_ids,
+                         length_eids_pids, nsm_centroids_length, lengths,
+                         area_eids_pids, nsm_centroids_area, areas,
+                         mass, cg, inertia, reference_point):
+    """
+    Adds the elements/masses of ``_get_mass_arrays_by_type`` to the
+    mass/cg/inertia and to the area/length lists of the NSM cards
+    for ``mass_properties_nsm``
+
+    """
+    area_keys = {'CTRIA3' : 'PSHELL', 'CQUAD4' : 'PSHELL'}
+    length_keys = {'CBAR' : 'PBAR', 'CBEAM' : 'PBEAM'}
+    for etype, (eids, pids, size, massi, centroid,
+                nsm, nsm_centroid) in mass_arrays.items():
+        if etype in area_keys:
+            _add_nsm_arrays(area_eids_pids, areas, nsm_centroids_area, area_keys[etype],
+                            eids, pids, size, nsm_centroid)
+        elif etype in length_keys:
+            _add_nsm_arrays(length_eids_pids, lengths, nsm_centroids_length, length_keys[etype],
+                            eids, pids, size, nsm_centroid)
+
+        ids = mass_ids if etype == 'CONM2' else element_ids
+        ieids = np.where(np.in1d(eids, ids))[0]
+        mass = _increment_inertia_array(
+            centroid[ieids, :], reference_point, massi[ieids], mass, cg, inertia)
+        mass = _increment_inertia_array(
+            nsm_centroid[ieids, :], reference_point, nsm[ieids], mass, cg, inertia)
+    return mass
+
+def _add_nsm_arrays(eids_pids, area_length, nsm_centroids, ptype,
+                    eids, pids, area_lengthi, nsm_centroidsi):
+    """appends the (eid, pid), area/length and centroid arrays to the NSM lists"""
+    eids_pids[ptype] = np.vstack([
+        np.array(eids_pids[ptype], dtype='int64').reshape(-1, 2),
+        np.column_stack([eids, pids])])
+    area_length[ptype] = np.hstack([
+        np.array(area_length[ptype], dtype='float64'), area_lengthi])
+    nsm_centroids[ptype] = np.vstack([
+        np.array(nsm_centroids[ptype], dtype='float64').reshape(-1, 3), nsm_centroidsi])
+
 def get_sub_eids(all_eids, eids, etype):
     """supports limiting the element/mass ids"""
     eids = np.array(eids)
@@ -1007,97 +1592,6 @@ def _get_cbeam_mass(model, xyz, element_ids, all_eids,
             raise RuntimeError(msg)
     return mass
 
-def _get_cbeam_mass_no_nsm(model, elem, mass, cg, inertia, reference_point):
-    """helper method for mass_properties"""
-    prop = elem.pid_ref
-    xyz1, xyz2 = elem.get_node_positions()
-    centroid = (xyz1 + xyz2) / 2.
-    length = norm(xyz2 - xyz1)
-
-    is_failed, out = elem.get_axes(model)
-    if is_failed:
-        model.log.error(str(out))
-        raise RuntimeError(out)
-
-    wa, wb, _ihat, jhat, khat = out
-    p1 = xyz1 + wa
-    p2 = xyz2 + wb
-    if prop.type == 'PBEAM':
-        rho = prop.Rho()
-        # we don't call the MassPerLength method so we can put the NSM centroid
-        # on a different axis (the PBEAM is weird)
-        mass_per_lengths = []
-        nsm_per_lengths = []
-        for (area, nsm) in zip(prop.A, prop.nsm):
-            mass_per_lengths.append(area * rho)
-            nsm_per_lengths.append(nsm)
-        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
-        nsm_per_length = integrate_positive_unit_line(prop.xxb, nsm_per_lengths)
-        #print('nsm/Ls=%s nsm/L=%s' % (nsm_per_lengths, nsm_per_length))
-        #print('mass/Ls=%s mass/L=%s' % (mass_per_lengths, mass_per_length))
-        nsm_n1 = (p1 + jhat * prop.m1a + khat * prop.m2a)
-        nsm_n2 = (p2 + jhat * prop.m1b + khat * prop.m2b)
-        nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-
-    elif prop.type == 'PBEAML':
-        mass_per_lengths = prop.get_mass_per_lengths()
-        #mass_per_length = prop.MassPerLength() # includes simplified nsm
-
-        # m1a, m1b, m2a, m2b=0.
-        nsm_centroid = (p1 + p2) / 2.
-
-        # mass_per_length already includes nsm
-        mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
-        nsm_per_length = 0.
-
-        #nsm_centroid = np.zeros(3) # TODO: what is this...
-        #nsm = prop.nsm[0] * length # TODO: simplified
-    elif prop.type == 'PBCOMP':
-        mass_per_length = prop.MassPerLength()
-        nsm_per_length = prop.nsm
-        nsm_n1 = (p1 + jhat * prop.m1 + khat * prop.m2)
-        nsm_n2 = (p2 + jhat * prop.m1 + khat * prop.m2)
-        nsm_centroid = (nsm_n1 + nsm_n2) / 2.
-    elif prop.type == 'PBMSECT':
-        return mass
-        #mass_per_length = prop.MassPerLength()
-        #m = mass_per_length * length
-        #nsm = prop.nsm
-    else:  # pragma: no cover
-        raise NotImplementedError(prop.type)
-
-    m = mass_per_length * length
-    nsm = nsm_per_length * length
-    if (m + nsm) != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-        msg = 'CBEAM; eid=%s; %s pid=%s; m/L=%s nsm/L=%s; length=%s\n' % (
-            elem.eid, elem.pid, prop.type, mass_per_length, nsm_per_length, length)
-        msg += 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-        msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-            str(centroid), str(elem.Centroid()), str(elem))
-        raise RuntimeError(msg)
-
-    #nsm = (nsm_per_length + nsmi) * length
-    (x, y, z) = centroid - reference_point
-    (xm, ym, zm) = nsm_centroid - reference_point
-    x2 = x * x
-    y2 = y * y
-    z2 = z * z
-    xm2 = xm * xm
-    ym2 = ym * ym
-    zm2 = zm * zm
-
-    # Ixx, Iyy, Izz, Ixy, Ixz, Iyz
-    inertia[0] += m * (y2 + z2) + nsm * (ym2 + zm2)
-    inertia[1] += m * (x2 + z2) + nsm * (xm2 + zm2)
-    inertia[2] += m * (x2 + y2) + nsm * (xm2 + ym2)
-    inertia[3] += m * x * y + nsm * xm * ym
-    inertia[4] += m * x * z + nsm * xm * zm
-    inertia[5] += m * y * z + nsm * ym * zm
-    massi = m + nsm
-    mass += massi
-    cg += m * centroid + nsm * nsm_centroid
-    return mass
-
 def _get_tri_mass(model, xyz, element_ids, all_eids,
                   area_eids_pids, areas, nsm_centroids_area,
                   eids, mass, cg, inertia, reference_point):
@@ -1287,42 +1781,44 @@ def _setup_apply_nsm(area_eids_pids, areas, nsm_centroids_area,
     #print(areas)
     for ptype, eids_pids in area_eids_pids.items():
         areasi = np.array(areas[ptype], dtype='float64')
-        area_eids_pids[ptype] = np.array(eids_pids, dtype='int32')
+        eids_pids = np.array(eids_pids, dtype='int32').reshape(-1, 2)
+        area_eids_pids[ptype] = eids_pids
         areas[ptype] = areasi
         assert len(areasi) > 0, areas
-        all_eids_pids += eids_pids
-        nsm_centroidsi = np.array(nsm_centroids_area[ptype])
+        all_eids_pids.append(eids_pids)
+        nsm_centroidsi = np.array(nsm_centroids_area[ptype], dtype='float64').reshape(-1, 3)
         nsm_centroids.append(nsm_centroidsi)
         assert len(eids_pids) == len(nsm_centroids_area[ptype]), ptype
         area_length.append(areasi)
-        is_area += [True] * len(areasi)
+        is_area.append(np.ones(len(areasi), dtype='bool'))
         #is_data = True
         nsm_centroids_area[ptype] = nsm_centroidsi
 
     for ptype, eids_pids in length_eids_pids.items():
         lengthsi = np.array(lengths[ptype], dtype='float64')
-        length_eids_pids[ptype] = np.array(eids_pids, dtype='int32')
+        eids_pids = np.array(eids_pids, dtype='int32').reshape(-1, 2)
+        length_eids_pids[ptype] = eids_pids
         lengths[ptype] = lengthsi
         assert len(lengthsi) > 0, lengthsi
-        all_eids_pids += eids_pids
-        nsm_centroidsi = np.array(nsm_centroids_length[ptype])
+        all_eids_pids.append(eids_pids)
+        nsm_centroidsi = np.array(nsm_centroids_length[ptype], dtype='float64').reshape(-1, 3)
         nsm_centroids.append(nsm_centroidsi)
         assert len(eids_pids) == len(nsm_centroids_length[ptype]), ptype
         area_length.append(lengthsi)
-        is_area += [False] * len(lengthsi)
+        is_area.append(np.zeros(len(lengthsi), dtype='bool'))
         #is_data = True
         nsm_centroids_length[ptype] = nsm_centroidsi
 
-    all_eids_pids = np.array(all_eids_pids, dtype='int32')
-    nelements = len(is_area)
-    if nelements == 0:
+    if len(is_area) == 0:
+        all_eids_pids = np.array(all_eids_pids, dtype='int32')
         return all_eids_pids, area_length, is_area, nsm_centroids
 
+    all_eids_pids = np.vstack(all_eids_pids)
     isort = np.argsort(all_eids_pids[:, 0])
     all_eids_pids = all_eids_pids[isort, :]
     area_length = np.hstack(area_length)[isort]
 
-    is_area_array = np.array(is_area, dtype='bool')[isort]
+    is_area_array = np.hstack(is_area)[isort]
     nsm_centroids = np.vstack(nsm_centroids)[isort]
     return all_eids_pids, area_length, is_area_array, nsm_centroids
 
@@ -1371,15 +1867,12 @@ def _combine_prop_weighted_area_length_simple(model, eids, area, centroids,
         if debug:
             model.log.debug('dividing by %s=%s' % (word, area_sum))
 
-    for eid, areai, centroid in zip(eids, area, centroids):
-        #area_sum += areai
-        m = nsm_value * areai
-        if debug:  # pragma: no cover
+    masses = nsm_value * area
+    if debug:  # pragma: no cover
+        for eid, areai, m in zip(eids, area, masses):
             model.log.debug('  eid=%s %si=%s nsm_value=%s mass=%s %s=%s' % (
                 eid, word, areai, nsm_value, m, word, areai))
-        #elem = model.elements[eid]
-        #assert np.allclose(m, elem.Mass()), elem.get_stats()
-        mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     if debug:  # pragma: no cover
         model.log.debug('mass = %s' % mass)
     return mass
@@ -1408,15 +1901,12 @@ def _combine_prop_weighted_area_length(
             model.log.debug("  nsm_centroidsi = %s" % nsm_centroidsi)
         centroids = nsm_centroidsi[ipid, :]
 
-        area2 = area / area_sum
-        for areai, centroid in zip(area2, centroids):
-            #print('  areai=%s area_sum=%s nsm_value=%s' % (areai*area_sum, area_sum, nsm_value))
-            m = nsm_value * areai
-            if debug:  # pragma: no cover
+        masses = nsm_value * area / area_sum
+        if debug:  # pragma: no cover
+            for areai, m in zip(area, masses):
                 model.log.debug('  %si=%s %s_sum=%s nsm_value=%s mass=%s' % (
-                    word, areai*area_sum, word, area_sum, nsm_value, m))
-            #assert np.allclose(m, elem.Mass()), elem.get_stats()
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+                    word, areai, word, area_sum, nsm_value, m))
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     return mass
 
 def _apply_nsm(model, nsm_id,
@@ -1871,12 +2361,11 @@ def _nsm1_element(model, nsm, nsm_ids, all_eids_pids, area_length, nsm_centroids
         #area_sum_str = ''
         area_length_actual2 = area_length_actual
 
-    for eid, area_lengthi, centroid in zip(eids_actual, area_length_actual2, nsm_centroid):
-        massi = nsm_value * area_lengthi
-        #if debug:  # pragma: no cover
-            #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
-                #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
-        mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    masses = nsm_value * area_length_actual2
+    #if debug:  # pragma: no cover
+        #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
+            #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
+    mass = _increment_inertia_array(nsm_centroid, reference_point, masses, mass, cg, I)
     return mass
 
 def _get_sym_axis(model, sym_axis):
@@ -0,0 +1,130 @@
+"""
+Defines the array helpers that are shared by the vectorized mesh
+utilities (e.g., ``mass_properties_arrays``, ``sum_forces_moments``):
+
+ - nids, xyz_cid0 = get_xyz_cid0_array(model, xyz_cid0_dict=None)
+ - pids, nodes, tflag, thickness = get_element_columns(
+       model, etype, eids, nnodes, is_shell=False)
+ - xyz = get_node_xyz(nids, xyz_cid0, node_ids)
+ - is_missing = is_missing_nodes(nids, node_ids)
+
+"""
+import numpy as np
+from pyNastran.bdf.bdf_interface.array_store import ElementStore, SOLID_TABLE_NAMES
+
+
+def get_xyz_cid0_array(model, xyz_cid0_dict=None):
+    """
+    Gets the sorted node ids and the global positions of the nodes
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    xyz_cid0_dict : Dict[nid] = (3, ) float ndarray; default=None
+        the global positions; None -> calculate them
+
+    Returns
+    -------
+    nids : (nnodes, ) int ndarray
+        the sorted node ids
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the global positions
+
+    """
+    if xyz_cid0_dict is None:
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+            cid=0, fdtype='float64', idtype='int64')[:2]
+        nids = nid_cp_cd[:, 0]
+        if model.gridb:
+            # the GRIDBs aren't GRIDs; the elements on GRIDBs are left
+            # to the element methods (see ``is_missing_nodes``)
+            is_grid = ~np.isin(nids, list(model.gridb))
+            nids = nids[is_grid]
+            xyz_cid0 = xyz_cid0[is_grid, :]
+    else:
+        nids = np.array(sorted(xyz_cid0_dict), dtype='int64')
+        xyz_cid0 = np.array([xyz_cid0_dict[nid] for nid in nids], dtype='float64').reshape(
+            len(nids), 3)
+    return nids, xyz_cid0
+
+def get_element_columns(model, etype, eids, nnodes, is_shell=False):
+    """
+    Gets the property ids, the nodes and the shell thicknesses of
+    the elements from the ``ElementStore`` tables or the element objects
+
+    Returns
+    -------
+    pids : (n, ) int ndarray
+        the property ids
+    nodes : (n, nnodes) int ndarray
+        the first nnodes node ids
+    tflag : (n, ) int ndarray
+        the thickness flag; None if is_shell=False
+    thickness : (n, nnodes) float ndarray
+        T1, T2, ...; nan is blank; None if is_shell=False
+
+    """
+    elements = model.elements
+    neids = len(eids)
+    pids = np.zeros(neids, dtype='int64')
+    nodes = np.zeros((neids, nnodes), dtype='int64')
+    tflag = None
+    thickness = None
+    if is_shell:
+        tflag = np.zeros(neids, dtype='int64')
+        thickness = np.full((neids, nnodes), np.nan, dtype='float64')
+
+    is_object = np.ones(neids, dtype='bool')
+    if isinstance(elements, ElementStore) and neids:
+        elements.compress()
+        for table_name in SOLID_TABLE_NAMES.get(etype, [etype]):
+            table = elements.tables.get(table_name)
+            if table is None or len(table['eid']) == 0:
+                continue
+            table_eids = table['eid']
+            irow = np.searchsorted(table_eids, eids)
+            irow[irow == len(table_eids)] = 0
+            ieids = np.where(table_eids[irow] == eids)[0]
+            irow = irow[ieids]
+            pids[ieids] = table['pid'][irow]
+            nodes[ieids, :] = table['nodes'][irow, :nnodes]
+            if is_shell:
+                tflag[ieids] = table['tflag'][irow]
+                thickness[ieids, :] = table['thickness'][irow, :]
+            is_object[ieids] = False
+
+    for ieid in np.where(is_object)[0]:
+        elem = elements[eids[ieid]]
+        pids[ieid] = elem.pid
+        nodes[ieid, :] = elem.nodes[:nnodes]
+        if is_shell:
+            tflag[ieid] = elem.tflag
+            thickness[ieid, :] = [np.nan if ti is None else ti
+                                  for ti in elem.get_thickness_scale()]
+    return pids, nodes, tflag, thickness
+
+def is_missing_nodes(nids, node_ids):
+    """
+    Flags the rows of an (n, nnodes) array of node ids with a node that
+    isn't in nids (e.g., a GRIDB), which are calculated one at a time
+    """
+    if len(nids) == 0:
+        return np.ones(len(node_ids), dtype='bool')
+    inids = np.searchsorted(nids, node_ids)
+    inids[inids == len(nids)] = 0
+    is_missing = nids[inids] != node_ids
+    if is_missing.ndim == 2:
+        is_missing = is_missing.any(axis=1)
+    return is_missing
+
+def get_node_xyz(nids, xyz_cid0, node_ids):
+    """gets the global position of an (n, nnodes) array of node ids"""
+    if node_ids.size == 0:
+        return np.zeros(node_ids.shape + (3, ), dtype='float64')
+    inids = np.searchsorted(nids, node_ids)
+    inids[inids == len(nids)] = 0
+    if len(nids) == 0 or not np.array_equal(nids[inids], node_ids):
+        missing = np.setdiff1d(node_ids, nids)
+        raise RuntimeError('nids=%s are missing' % missing.tolist())
+    return xyz_cid0[inids, :]
@@ -1,24 +1,208 @@
 """
 defines some methods for cleaning up a model
  - model = remove_unused(bdf_filename, remove_nids=True, remove_cids=True,
-                         remove_pids=True, remove_mids=True)
+                         remove_pids=True, remove_mids=True,
+                         remove_spcs=True, remove_mpcs=True, remove_loads=True)
+ - graph = CardGraph(model, root_keys=None)
+
+The cards are a dependency graph (see ``CardGraph``).  The vertices are
+the ids of each key (e.g., nid=10, pid=2, spc_id=1) and an edge is an id
+field of a card (e.g., the pid of a CQUAD4 or the mid1 of a PSHELL; see
+``CARD_ID_FIELDS`` in ``renumber_arrays.py``).  The roots are:
+
+ - the elements, masses, rigid elements and plotels
+ - the cards that don't have an id key (e.g., SUPORT1, DLOAD, SET1)
+ - the SPC/MPC/LOAD/TEMPERATURE sets of the subcases
+ - the ids of the keys that aren't removed (e.g., the SPCs of a model
+   without case control)
+
+A card that isn't reachable from a root isn't used.  The graph is a set
+of edge arrays, so the reachability is vectorized (a breadth first
+search over the edge arrays) and each vertex stores the vertex it was
+reached from, which is why the card is kept (see ``get_reason``).
 
 """
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Tuple, Set, Optional, Iterator, Any
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.bdf import BDF, read_bdf
-#from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore, PROXY_CLASSES
+from pyNastran.bdf.mesh_utils.renumber_arrays import (
+    CARD_GROUPS, CARD_ID_FIELDS, GROUP_KEYS, MATERIAL_GROUPS,
+    _get_card_id_fields, _get_field, _get_ids, _get_id_column)
+
+#: the model attributes that are vertices of the graph and the key of the
+#: dictionary; the cards of the other attributes (e.g., SUPORT1, DLOAD)
+#: are roots
+GRAPH_GROUPS = [(name, key) for name, key in CARD_GROUPS if key is not None] + [
+    ('pbusht', 'pid'), ('pelast', 'pid'), ('pdampt', 'pid'),
+    ('convection_properties', 'pconv_id'), ('tables', 'table_id'),
+]
+
+#: the keys of the elements, which are always used
+ELEMENT_KEYS = [key for unused_name, key in GROUP_KEYS['eid']]
+
+#: the case control parameters that select a set; TEMPERATURE(LOAD),
+#: TEMPERATURE(INITIAL), ... are load ids as well
+CASE_CONTROL_KEYS = {
+    'SPC' : 'spc_id', 'MPC' : 'mpc_id',
+    'LOAD' : 'load_id', 'LOADSET' : 'load_id', 'CLOAD' : 'load_id', 'DEFORM' : 'load_id',
+}
+
+#: the model attributes of the ids that are removed
+REMOVE_GROUPS = {
+    'nid' : ['nodes'],
+    'cid' : ['coords'],
+    'pid' : ['properties', 'pbusht', 'pelast', 'pdampt'],
+    'mass_pid' : ['properties_mass'],
+    'mid' : MATERIAL_GROUPS,
+    'spc_id' : ['spcadds', 'spcs'],
+    'mpc_id' : ['mpcadds', 'mpcs'],
+    'load_id' : ['load_combinations', 'loads', 'tempds', 'dareas'],
+    'pconv_id' : ['convection_properties'],
+    'table_id' : ['tables'],
+}
+
+#: the card types that are removed if a key has other cards (e.g., the
+#: TABLES1 of a MATS1 aren't in the graph)
+REMOVE_TYPES = {'table_id' : {'TABLEHT', 'TABLEH1'}}
+
+_ELEMENT = (('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'))
+_PROPERTY = (('pid', 'pid'), )
+_PROPERTY_MID = (('pid', 'pid'), ('mid', 'mid'))
+_LOAD = (('sid', 'load_id'), )
+_MONITOR = (('cp', 'cid'), ('cd', 'cid'))
+_NODE_SET = (('ids', 'nid'), )
+_NODES = (('nodes', 'nid'), )
+
+#: card type -> the (attribute, key) of the id fields of the cards that
+#: aren't renumbered (see ``CARD_ID_FIELDS``); () : the card doesn't
+#: reference an id of the graph
+REFERENCE_FIELDS = {
+    # elements
+    'CPLSTN3' : _ELEMENT, 'CPLSTN4' : _ELEMENT, 'CPLSTN6' : _ELEMENT, 'CPLSTN8' : _ELEMENT,
+    'CPLSTS3' : _ELEMENT, 'CPLSTS4' : _ELEMENT, 'CPLSTS6' : _ELEMENT, 'CPLSTS8' : _ELEMENT,
+    'CTRAX3' : _ELEMENT, 'CTRAX6' : _ELEMENT, 'CQUADX4' : _ELEMENT,
+    'CRAC2D' : _ELEMENT, 'CRAC3D' : _ELEMENT, 'CAABSF' : _ELEMENT,
+    'CCONEAX' : (('eid', 'eid'), ('pid', 'pid')),
+    'CFAST' : (('eid', 'eid'), ('pid', 'pid'), ('gs', 'nid'), ('ga', 'nid'), ('gb', 'nid')),
+    'GENEL' : (('eid', 'eid'), ('node_ids', 'nid')),
+    'CGEN' : (('eid', 'eid'), ('pid', 'pid')),
+    'SNORM' : (('nid', 'nid'), ('cid', 'cid')),
+    'CBARAO' : (),
+
+    # properties
+    'PFAST' : (('pid', 'pid'), ('mcid', 'cid')),
+    'PIHEX' : _PROPERTY_MID + (('cordm', 'cid'), ),
+    'PRAC3D' : _PROPERTY_MID, 'PBRSECT' : _PROPERTY_MID, 'PBMSECT' : _PROPERTY_MID,
+    'PAABSF' : _PROPERTY, 'PACBAR' : _PROPERTY,
+    'PBUSHT' : _PROPERTY, 'PELAST' : _PROPERTY, 'PDAMPT' : _PROPERTY,
+    'MAT3D' : (('mid', 'mid'), ), 'MATG' : (('mid', 'mid'), ('idmem', 'mid')),
+
+    # thermal
+    'PCONV' : (('pconid', 'pconv_id'), ('mid', 'mid'), ('tid', 'table_id'),
+               ('gidin', 'nid'), ('ce', 'cid')),
+    'PCONVM' : (('pconid', 'pconv_id'), ('mid', 'mid')),
+    'CONV' : (('eid', 'eid'), ('pconid', 'pconv_id'), ('film_node', 'nid'),
+              ('cntrlnd', 'nid'), ('ta', 'nid')),
+    'CONVM' : (('eid', 'eid'), ('pconvm', 'pconv_id'), ('film_node', 'nid'),
+               ('cntmdot', 'nid'), ('ta1', 'nid'), ('ta2', 'nid')),
+    'RADBC' : (('nodamb', 'nid'), ('cntrlnd', 'nid'), ('eids', 'eid')),
+    'TEMPBC' : _NODES,
+    'RADM' : (), 'RADSET' : (), 'RADCAV' : (), 'RADLST' : (), 'RADMTX' : (),
+    'VIEW' : (), 'VIEW3D' : (),
+    'TABLEHT' : (('tid', 'table_id'), ('y', 'table_id')),
+    'TABLEH1' : (('tid', 'table_id'), ), 'TABLES1' : (('tid', 'table_id'), ),
+    'TABLEST' : (('tid', 'table_id'), ),
+
+    # constraints
+    'SPCAX' : (('conid', 'spc_id'), ), 'SESUP' : (('nodes', 'nid'), ),
+    'SEQGP' : (('nids', 'nid'), ), 'CYJOIN' : (('nids', 'nid'), ), 'CYAX' : (('nids', 'nid'), ),
+
+    # superelements; the GRIDs of the other superelements (e.g., the
+    # nodes_seid of a SELOC) aren't in the model
+    'SEBSET' : _NODE_SET, 'SEBSET1' : _NODE_SET, 'SECSET' : _NODE_SET, 'SECSET1' : _NODE_SET,
+    'SEQSET' : _NODE_SET, 'SEQSET1' : _NODE_SET, 'SEUSET' : _NODE_SET, 'SEUSET1' : _NODE_SET,
+    'RELEASE' : (('nids', 'nid'), ), 'SEELT' : (('eids', 'eid'), ),
+    'SELOAD' : (('lid_s0', 'load_id'), ), 'SELOC' : (('nodes_0', 'nid'), ),
+    'SEEXCLD' : _NODES, 'SEMPLN' : _NODES, 'CSUPER' : _NODES, 'CSUPEXT' : _NODES,
+    'SECONCT' : (('nodes_a', 'nid'), ('nodes_b', 'nid')),
+    'SEBULK' : (), 'SELABEL' : (), 'SETREE' : (), 'SENQSET' : (),
+
+    # loads
+    'LOADCYN' : (('sid', 'load_id'), ('load_ids', 'load_id')),
+    'GMLOAD' : (('sid', 'load_id'), ('cid', 'cid')),
+    'TEMPB3' : (('sid', 'load_id'), ('eid', 'eid'), ('eids', 'eid')),
+    'FORCEAX' : _LOAD, 'PRESAX' : _LOAD, 'TEMPAX' : _LOAD,
+    'NSMADD' : (),
+
+    # contact
+    'BSURF' : (('eids', 'eid'), ),
+    'BSURFS' : (('eids', 'eid'), ('g1s', 'nid'), ('g2s', 'nid'), ('g3s', 'nid')),
+    'BCONP' : (('cid', 'cid'), ), 'BLSEG' : _NODES,
+    'BCTSET' : (), 'BCTADD' : (), 'BCTPARA' : (), 'BCRPARA' : (), 'BFRIC' : (),
+
+    # aero
+    'MONPNT1' : _MONITOR, 'MONPNT3' : _MONITOR, 'MONDSP1' : _MONITOR, 'MONPNT2' : (),
+    'AECOMP' : (), 'AECOMPL' : (), 'AEFACT' : (), 'AELINK' : (), 'AELIST' : (),
+    'AEPARM' : (), 'AESTAT' : (), 'AESURFS' : (), 'CSSCHD' : (), 'DIVERG' : (),
+    'FLFACT' : (), 'FLUTTER' : (), 'GUST' : (), 'MKAERO1' : (), 'MKAERO2' : (),
+    'PAERO1' : (), 'PAERO2' : (), 'PAERO3' : (), 'PAERO4' : (), 'PAERO5' : (),
+    'TRIM' : (), 'TRIM2' : (),
+
+    # the cards that are referenced by case control or other cards
+    'PARAM' : (), 'POINT' : (('cp', 'cid'), ), 'RINGAX' : (), 'POINTAX' : (), 'AXIC' : (),
+    'AXIF' : (), 'RINGFL' : (), 'GRIDB' : (), 'ACMODL' : (), 'GMCORD' : (('cid', 'cid'), ),
+    'EIGB' : (), 'EIGC' : (), 'EIGP' : (), 'EIGR' : (), 'EIGRL' : (),
+    'FREQ' : (), 'FREQ1' : (), 'FREQ2' : (), 'FREQ3' : (), 'FREQ4' : (), 'FREQ5' : (),
+    'TSTEP' : (), 'TSTEP1' : (), 'TSTEPNL' : (), 'NLPARM' : (), 'NLPCI' : (),
+    'ROTORG' : (), 'ROTORD' : (), 'NXSTRAT' : (), 'TF' : (('nid0', 'nid'), ('nids', 'nid')),
+    'TABLED1' : (), 'TABLED2' : (), 'TABLED3' : (), 'TABLED4' : (), 'TABLED5' : (),
+    'TABLEM1' : (), 'TABLEM2' : (), 'TABLEM3' : (), 'TABLEM4' : (),
+    'TABDMP1' : (), 'TABRND1' : (), 'TABRNDG' : (),
+    'DMI' : (), 'DMIG' : (), 'DMIJ' : (), 'DMIJI' : (), 'DMIK' : (), 'DMIAX' : (), 'DTI' : (),
+    'DEQATN' : (), 'DTABLE' : (), 'DRESP3' : (), 'DDVAL' : (), 'DOPTPRM' : (), 'DSCREEN' : (),
+    'TOPVAR' : (),
+    'FEEDGE' : (), 'FEFACE' : (), 'GMCURV' : (), 'GMSURF' : (), 'PSET' : (), 'PVAL' : (),
+}
+
+#: the NSM types that are element ids; the others are property ids
+NSM_ELEMENT_TYPES = {'ELEMENT', 'CONROD'}
+
 
 def remove_unused(bdf_filename, remove_nids=True, remove_cids=True,
-                  remove_pids=True, remove_mids=True, remove_spcs=True, remove_mpcs=True):
+                  remove_pids=True, remove_mids=True, remove_spcs=True, remove_mpcs=True,
+                  remove_loads=True):
     """
-    Takes an uncross-referenced bdf and removes unused data
+    Takes a bdf and removes the cards that aren't used (see ``CardGraph``)
 
     removes unused:
      - nodes
+     - coords
      - properties
      - materials
-     - coords
-     - spcs
-     - mpcs
+     - spcs, mpcs, loads (if there's case control)
+     - PCONV, TABLEHT, TABLEH1
+
+    Parameters
+    ----------
+    bdf_filename : str / BDF
+        str : a bdf_filename (string; supports PathLib)
+        BDF : a BDF model that has been cross referenced or not
+    remove_nids / remove_cids / remove_pids / remove_mids : bool; default=True
+        remove the unused GRIDs / coords / properties / materials
+    remove_spcs / remove_mpcs / remove_loads : bool; default=True
+        remove the SPC / MPC / load sets that the subcases don't use; a
+        model without case control doesn't change
+
+    Returns
+    -------
+    model : BDF
+        the model
 
     """
     if isinstance(bdf_filename, BDF):
@@ -26,894 +210,493 @@ def remove_unused(bdf_filename, remove_nids=True, remove_cids=True,
     else:
         model = read_bdf(bdf_filename, xref=False)
 
-    #nids = model.nodes.keys()
-    #cids =
-    #nids = set(list(model.nodes.keys()))
-    #cids = set(list(model.coords.keys()))
-    #pids = set(list(model.properties.keys()))
-
-    nids_used = set()
-    cids_used = set()
-    eids_used = set()
-    pids_used = set()
-    pids_mass_used = set()
-    mids_used = set()
-    mids_thermal_used = set()
-    sets_used = set()
-    desvars_used = set()
-    mpcs_used = set()
-    spcs_used = set()
-    #nsms_used = set()
-
-    #card_types = list(model.card_count.keys())
-    #card_map = model.get_card_ids_by_card_types(
-        #card_types=card_types,
-        #reset_type_to_slot_map=False,
-        #stop_on_missing_card=True)
-
-    #for nid, node in model.nodes.items():
-        #cids_used.update([node.Cp(), node.Cd()])
-
-    # ureferenced types aren't referenced by anything
-    unreferenced_types = {
-        'ENDDATA', 'PARAM', 'EIGR', 'EIGRL', 'EIGB', 'EIGP', 'EIGC',
-        'SPOINT', 'EPOINT', 'DESVAR',
-        'SET1', 'FREQ', 'FREQ1', 'FREQ2',
-        'TSTEP', 'TSTEPNL', 'NLPCI',
-        'NLPARM', 'ROTORG', 'ROTORD',
-        'DAREA', 'DEQATN',
-        'DMIG', 'DMI', 'DMIJ', 'DMIK', 'DMIJI', 'DMIAX',
-        'POINT', 'EPOINT',
-        'DELAY', 'DPHASE',
-        'CBARAO', 'AEPARM',
-
-        # properties
-        'PELAS', 'PDAMP', 'PBUSH',
-        'PELAST', 'PDAMPT', 'PBUSHT',
-        'PGAP', 'PBUSH1D', 'PFAST', 'PVISC', 'PMASS',
-
-        'FLFACT', 'FLUTTER', 'DLINK', 'DDVAL', 'DIVERG', 'GUST',
-        'AELINK', 'AELIST', 'TRIM', 'TRIM2', 'PAERO1', 'AEFACT', 'AESTAT',
-
-        # contact
-        'BCTPARA', 'BCRPARA', 'BSURF', 'BSURFS', 'BCTADD',
-        'BCTSET', 'BFRIC',
-
-        'TABRNDG', 'DTI', 'TABLEH1',
-
+    is_case_control = model.case_control_deck is not None
+    is_removed = {
+        'nid' : remove_nids, 'cid' : remove_cids,
+        'pid' : remove_pids, 'mass_pid' : remove_pids, 'mid' : remove_mids,
+        'spc_id' : remove_spcs and is_case_control,
+        'mpc_id' : remove_mpcs and is_case_control,
+        'load_id' : remove_loads and is_case_control,
+        'pconv_id' : True, 'table_id' : True,
     }
+    # the cards of a key that isn't removed are used
+    root_keys = ELEMENT_KEYS + [key for key, is_removedi in is_removed.items()
+                                if not is_removedi]
+    graph = CardGraph(model, root_keys=root_keys)
+
+    for key, names in REMOVE_GROUPS.items():
+        if not is_removed[key]:
+            continue
+        ids_to_remove = graph.get_unused_ids(key)
+        if key == 'cid':
+            ids_to_remove = ids_to_remove[ids_to_remove != 0]
+        if len(ids_to_remove):
+            _remove_ids(model, names, ids_to_remove, REMOVE_TYPES.get(key))
+    return model
+
+
+class CardGraph:
+    """
+    The dependency graph of the cards of a model
+
+    The vertices are the ids of each key (e.g., nid=10, pid=2; see
+    ``GRAPH_GROUPS``), which are numbered in the order of the keys, and
+    then the roots that aren't ids (e.g., a SUPORT1, the SPC of a
+    subcase).  An edge is an id field of a card (e.g., the pid of a
+    CQUAD4 or the mid1 of a PSHELL); an id that isn't defined (e.g., a
+    SPOINT) isn't a vertex.
+
+    Attributes
+    ----------
+    ids : Dict[key] = (n, ) int ndarray
+        the sorted ids of each key
+    offsets : Dict[key] = int
+        the vertex of the first id of each key
+    nid_vertices : int
+        the number of vertices that are ids; the roots that aren't ids
+        are the vertices after them
+    src, dst : (nedges, ) int ndarray
+        the vertex that references a vertex
+    is_root : (nvertices, ) bool ndarray
+        the vertices that are used
+    is_used : (nvertices, ) bool ndarray
+        the vertices that are reachable from the roots
+    parent : (nvertices, ) int ndarray
+        the vertex that a vertex was reached from; -1 for the roots and
+        the vertices that aren't used
 
-    # this are things that haven't been referenced yet
-    not_implemented_types = {
-        # not checked------------------------------------------
-        'PHBDY', 'CHBDYG', 'CHBDYP', 'CHBDYE', 'RADBC', # 'CONV',
-        'QVOL', 'PCONVM', # 'PCONV',
-        #'PBCOMP', 'PDAMP5', 'CFAST',
-        'AECOMP', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5',
-        'PAERO2', 'PAERO3', 'PAERO4', 'PAERO5',
-        'DCONADD',
-        'GMCORD',
-        'MONPNT1', 'MONPNT2', 'MONPNT3',
-        'DSCREEN', 'DTI', 'NSMADD',
-        'AESURFS', 'CSSCHD',
-        'CGEN', 'NXSTRAT',
-
-        # axisymmetric
-        'FORCEAX',
-
-        # acoustic
-        'PACABS',
-
-        # superelements
-        'SELOC',
-
-        # parametric
-        'FEEDGE', 'FEFACE'
-    }
-    set_types_simple = [
-        'SET1', 'SET3',
-    ]
-    set_types = {
-        'ASET', 'ASET1', 'BSET', 'BSET1', 'CSET', 'CSET1',
-        'QSET', 'QSET1', 'USET', 'USET1', 'OMIT', 'OMIT1',
-    }
-    #seset_types = {
-        #'SESET',
-    #}
-    load_types = {
-        'GRAV', 'RANDPS', 'FORCE', 'FORCE1', 'FORCE2',
-        'MOMENT', 'MOMENT1', 'MOMENT2',
-        'PLOAD', 'PLOAD1', 'PLOAD2', 'PLOAD4', 'SPCD',
-        'GMLOAD', 'RFORCE', 'RFORCE1',
-        'TEMP', 'QBDY1', 'QBDY2', 'QBDY3', 'QHBDY',
-        'ACCEL', 'PLOADX1', 'SLOAD', 'ACCEL1', 'LOADCYN', 'LOAD', 'CLOAD',
-        'LSEQ', 'DLOAD', 'QVECT', 'RADM', 'TEMPAX', 'DEFORM',
-    }
-    masses = {'CONM1', 'CONM2', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4'}
-    elements = {
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-        'CGAP', 'CBUSH', 'CBUSH1D', 'CBUSH2D', 'CFAST',
-        'CVISC',
-        'CSHEAR', 'CTUBE',
-        'GENEL',
-        'CTRIA3', 'CQUAD4', 'CTRIA6', 'CTRIAR', 'CQUAD8', 'CQUADR',
-        'CTRIAX', 'CQUADX', 'CQUAD',
-
-        'CPLSTN3', 'CPLSTN4', 'CPLSTN6', 'CPLSTN8',
-        'CPLSTS3', 'CPLSTS4', 'CPLSTS6', 'CPLSTS8',
-        'CQUADX4', 'CQUADX8', 'CTRIAX6',
-        'CTRAX3', 'CTRAX6', 'CTRIAX6',
-        'CTETRA', 'CHEXA', 'CPENTA', 'CPYRAM',
-        'CROD', 'CRAC2D', 'CRAC3D',
-        'CONROD', 'CCONEAX',
-        'CBAR', 'CBEAM', 'CBEND', 'CBEAM3',
-
-        # acoustic
-        'CHACAB',
-    }
-    tableht_used = set([])
-    tableh1_used = set([])
-    pconv_used = set([])
-
-    friction_ids_used = set([])
-
-    # could remove some if we look at the rid_trace
-    #for cid, coord in model.coords.items():
-        #if coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
-            #nids_used.update(node_ids)
-        #elif coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
-            #cids_used.update(coord.Rid())
-        #else:
-            #raise NotImplementedError(coord)
-
-    for card_type, ids in model._type_to_id_map.items():
-    #for card_type, ids in card_map.items():
-        if card_type in ['CORD1R', 'CORD1C', 'CORD1S']:
-            for cid in ids:
-                coord = model.coords[cid]
-                nids_used.update(coord.node_ids)
-        elif card_type in ['CORD2R', 'CORD2C', 'CORD2S']:
-            for cid in ids:
-                coord = model.coords[cid]
-                cids_used.add(coord.Rid())
-
-        elif card_type in ['MAT1', 'MAT2', 'MAT3', 'MAT4', 'MAT5',
-                           'MAT8', 'MAT9', 'MAT10', 'MAT11']:
-            # todo: MATS1, MATT1, etc.
-            pass
-        elif card_type in ['MATS1', 'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5',
-                           'MATT8', 'MATT9', 'MATHE', 'MATHP', 'CREEP']:
-            mids_used.update(ids)
-
-        elif card_type in masses:
-            _store_masses(card_type, model, ids, nids_used, pids_mass_used, cids_used)
-        elif card_type in elements:
-            _store_elements(card_type, model, ids, nids_used, pids_used, mids_used, cids_used)
-
-        elif card_type == 'PLPLANE':
-            for pid in ids:
-                prop = model.properties[pid]
-                cids_used.add(prop.cid)
-                mids_used.add(prop.Mid())
-        elif card_type == 'PPLANE':
-            for pid in ids:
-                prop = model.properties[pid]
-                mids_used.add(prop.Mid())
-
-        elif card_type == 'PLOTEL':
-            for eid in ids:
-                elem = model.plotels[eid]
-                nids_used.update(elem.node_ids)
-        elif card_type in ['PSOLID', 'PLSOLID', 'PIHEX']:
-            for pid in ids:
-                prop = model.properties[pid]
-                mids_used.add(prop.Mid())
-        elif card_type == 'PDAMP5':
-            for pid in ids:
-                prop = model.properties[pid]
-                mids_thermal_used.add(prop.Mid())
-        elif card_type in ['PBAR', 'PBARL', 'PROD', 'PTUBE', 'PBEAM', 'PBEAML', 'PBEAM3',
-                           'PSHEAR', 'PRAC2D', 'PRAC3D', 'PBEND']:
-            for pid in ids:
-                prop = model.properties[pid]
-                mids_used.add(prop.Mid())
-        elif card_type == 'PSHELL':
-            for pid in ids:
-                prop = model.properties[pid]
-                mids = [mid for mid in prop.material_ids if mid is not None]
-                mids_used.update(mids)
-        elif card_type in ['PCOMP', 'PCOMPG']:
-            for pid in ids:
-                prop = model.properties[pid]
-                mids = prop.material_ids
-                mids_used.update(mids)
-        elif card_type in ['PBCOMP']:
-            for pid in ids:
-                prop = model.properties[pid]
-                mids = prop.Mids()
-                mids_used.add(prop.Mid())
-                mids_used.update(mids)
-        elif card_type == 'PCOMPS':
-            for pid in ids:
-                prop = model.properties[pid]
-                mids = prop.Mids()
-                mids_used.update(mids)
-                cids_used.add(prop.cordm)
-
-        elif card_type == 'PCONEAX':
-            for pid in ids:
-                # MID1 T1 MID2 I MID3 T2 NSM
-                prop = model.properties[pid]
-                #print(prop.object_methods())
-                mids = [mid for mid in prop.Mids() if mid not in (0, None)]
-                prop = model.properties[pid]
-                mids_used.update(mids)
-
-        elif card_type in ['RBAR', 'RBAR1', 'RBE1', 'RBE2', 'RBE3', 'RROD', 'RSPLINE', 'RSSCON']:
-            for eid in ids:
-                elem = model.rigid_elements[eid]
-                #print(elem.object_attributes())
-                #print(elem.object_methods())
-                nids_used.update(elem.independent_nodes)
-                nids_used.update(elem.dependent_nodes)
-
-        elif card_type in ['TLOAD1', 'TLOAD2', 'RLOAD1', 'RLOAD2', 'ACSRCE']:
-            pass
-        elif card_type in load_types:
-            _store_loads(model, card_type, ids, nids_used, eids_used, cids_used)
-
-        elif card_type == 'TEMPD':
-            pass
-            #for temp_id in ids:
-                #tempd = self.tempds[temp_id]
-
-        elif card_type == 'MPCADD':
-            for mpcadds in model.mpcadds.values():
-                for mpcadd in mpcadds:
-                    mpcs_used.update(mpcadd.mpc_ids)
-        elif card_type == 'MPC':
-            for mpcs in model.mpcs.values():
-                for mpc in mpcs:
-                    nids_used.update(mpc.node_ids)
-
-        elif card_type == 'SPCADD':
-            for spcadds in model.spcadds.values():
-                for spcadd in spcadds:
-                    spcs_used.update(spcadd.spc_ids)
-        elif card_type in ['SPC1', 'SPC', 'GMSPC', 'SPCAX']:
-            for spcs in model.spcs.values():
-                for spc in spcs:
-                    if spc.type in ['GMSPC', 'SPCAX']:
-                        pass
-                    elif spc.type in ['SPC1', 'SPC']:
-                        nids_used.update(spc.node_ids)
-                    else:
-                        raise NotImplementedError(spc)
-
-        elif card_type in ['TABLED1', 'TABLED2', 'TABLED3', 'TABLED4',
-                           'TABLEM1', 'TABLEM2', 'TABLEM3', 'TABLEM4',
-                           'TABDMP1', 'TABRND1', 'TABLES1',]:
-            pass
-        elif card_type == 'SUPORT':
-            for suport in model.suport:
-                nids_used.update(suport.node_ids)
-        elif card_type == 'SUPORT1':
-            for suport1 in model.suport1.values():
-                nids_used.update(suport1.node_ids)
-        elif card_type == 'TIC':
-            for tic in model.tics.values():
-                nids_used.update(tic.node_ids)
-        elif card_type == 'GRID':
-            for unused_nid, node in model.nodes.items():
-                cids_used.update([node.Cp(), node.Cd()])
-
-        elif card_type in ['PBUSH']:
-            pass
-            #for pid in ids:
-                #prop = model.properties[pid]
-                #raise RuntimeError(prop)
-        elif card_type == 'PBUSHT':
-            # tables
-            pass
-        elif card_type == 'AESURF':
-            #CID1  | ALID1 | CID2   | ALID2
-            for aesurf in model.aesurf.values():
-                cids_used.add(aesurf.Cid1())
-                cid2 = aesurf.Cid2()
-                if cid2 is not None:
-                    cids_used.add(cid2)
-
-        elif card_type in ['SPLINE1', 'SPLINE2', 'SPLINE3', 'SPLINE4', 'SPLINE5']:
-            pass
-            #for spline_id in ids:
-                #spline = model.splines[spline_id]
-                #if card_type in ['SPLINE1', 'SPLINE2', 'SPLINE4', 'SPLINE5']:
-                    #sets_used.add(spline.Set())
-
-        elif card_type == 'CAERO1':
-            for eid in ids:
-                caero = model.caeros[eid]
-                # PID, LSPAN, LCHORD
-                cids_used.add(caero.Cp())
-
-        elif card_type in unreferenced_types:
-            pass
-        elif card_type in set_types_simple:
-            # handled based on context in other blocks
-            pass
-        elif card_type in ['USET', 'USET1']:
-            for set_cards in model.usets.values():
-                for set_card in set_cards:
-                    nids_used.update(set_card.ids)
-
-        elif card_type in set_types:
-            obj = card_type[:4].lower() + 's'
-            sets = getattr(model, obj) # list of SETs
-            for set_card in sets:
-                nids_used.update(set_card.ids)
-
-        elif card_type == 'SESET':
-            sets = model.se_sets # list of SETs
-            for unused_id, set_card in sorted(sets.items()):
-                nids_used.update(set_card.ids)
-
-        elif card_type in ['DCONSTR']:
-            pass
-        elif card_type == 'DRESP1':
-            _store_dresp1(model, ids, nids_used, pids_used)
-        elif card_type == 'DRESP2':
-            pass
-            #for dresp_id in ids:
-                #dresp = model.dresps[dresp_id]
-                #dresp.deqatn
-                #if dresp.property_type in ['PSHELL', 'PCOMP', 'PBAR', 'PBARL', 'PBEAM', 'PROD']:
-                    #pids_used.update(dresp.atti_values())
-                #elif dresp.property_type is None:
-                    #if dresp.response_type in ['WEIGHT', 'EIGN', 'VOLUME']:
-                        #pass
-                    #elif dresp.response_type in ['DISP']:
-                        #nids_used.update(dresp.atti)
-                    #else:
-                        #msg = str(dresp) + 'response_type=%r' % dresp.response_type
-                        #raise NotImplementedError(msg)
-                #else:
-                #raise NotImplementedError(dresp)
-                #msg = str(dresp) + 'response_type=%r' % dresp.response_type
-                #raise NotImplementedError(msg)
-        elif card_type == 'DRESP3':
-            pass
-
-        elif card_type in ['DVPREL1', 'DVPREL2']:
-            for dvprel_id in ids:
-                dvprel = model.dvprels[dvprel_id]
-                desvars_used.update(dvprel.desvar_ids)
-                if dvprel.prop_type in ['PSHELL', 'PCOMP', 'PBAR', 'PBARL', 'PBEAM',
-                                        'PROD', 'PELAS', 'PBUSH', 'PDAMP', 'PTUBE',
-                                        'PSHEAR', 'PDAMP', 'PMASS', 'PBEAML', 'PCOMPG',
-                                        'PVISC', 'PBUSHT', 'PELAST', 'PBUSH1D', 'PGAP']:
-                    pids_used.add(dvprel.Pid())
-                elif dvprel.prop_type in ['DISP']:
-                    msg = str(dvprel) + 'dvprel.prop_type=%r' % dvprel.prop_type
-                    raise NotImplementedError(msg)
-                else:
-                    raise NotImplementedError(dvprel)
-
-        elif card_type in ['DVCREL1', 'DVCREL2']:
-            for dvcrel_id in ids:
-                dvcrel = model.dvcrels[dvcrel_id]
-                desvars_used.update(dvcrel.desvar_ids)
-                if dvcrel.element_type in ['CMASS2', 'CMASS4', 'CONM1', 'CONM2',
-                                           'CELAS2', 'CELAS4', 'CBUSH',
-                                           'CDAMP2', 'CQUAD4', 'CGAP', 'CBAR']:
-                    #eids_used.add(dvcrel.Eid())  # we don't remove elements...for now
-                    pass
-                else:
-                    msg = str(dvcrel) + 'element_type=%r' % dvcrel.element_type
-                    raise NotImplementedError(msg)
-
-        elif card_type in ['DVMREL1', 'DVMREL2']:
-            for dvmrel_id in ids:
-                dvmrel = model.dvmrels[dvmrel_id]
-                desvars_used.update(dvmrel.desvar_ids)
-                if dvmrel.mat_type in ['MAT1', 'MAT2', 'MAT8', 'MAT9', 'MAT10', 'MAT11']:
-                    mids_used.add(dvmrel.Mid())
-                else:
-                    msg = str(dvmrel) + 'mat_type=%r' % dvmrel.mat_type
-                    raise NotImplementedError(msg)
-        elif card_type == 'DVGRID':
-            for dvgrid_id in ids:
-                dvgrids = model.dvgrids[dvgrid_id]
-                for dvgrid in dvgrids:
-                    desvars_used.add(dvgrid.desvar_id)
-                    nids_used.add(dvgrid.nid)
-                    cids_used.add(dvgrid.cid)
-        elif card_type == 'TF':
-            for tf_id in ids:
-                tfs = model.transfer_functions[tf_id]
-                for transfer_function in tfs:
-                    nids_used.update(transfer_function.nids)
-        elif card_type in ['NSM', 'NSM1', 'NSML', 'NSML1']:
-            _store_nsm(model, ids, pids_used)
-
-        elif card_type in ['POINTAX', 'AXIC', 'RINGAX']:
-            pass
-            #for eid in ids:
-                #elem = model.plotels[eid]
-                #nids_used.update(elem.node_ids)
-        elif card_type in ['PBRSECT', 'PBMSECT']:
-            for pid in ids:
-                prop = model.properties[pid]
-                if prop.outp:
-                    sets_used.add(prop.outp)
-                if prop.brps:
-                    for unused_key, value in prop.brps.items():
-                        sets_used.add(value)
-                #if prop.cores:
-                    #for key, value in prop.cores.items():
-                        #pids_used.add(value)
-        elif card_type == 'CYJOIN':
-            for idi in ids:
-                cyjoin = model.cyjoin[idi]
-                nids_used.update(cyjoin.nids)
-        elif card_type == 'TABLEHT':
-            for idi in ids:
-                table = model.tables[idi]
-                tableh1_ids = table.y.tolist()
-                tableh1_used.update(tableh1_ids)
-                del tableh1_ids
-        elif card_type == 'PCONV':
-            for idi in ids:
-                pconv = model.convection_properties[idi]
-                if pconv.tid is not None:
-                    tableht_used.add(pconv.tid)
-        elif card_type == 'CONV':
-            for idi in ids:
-                bcs = model.bcs[idi]
-                for conv in bcs:
-                    if conv.type != 'CONV':
+    """
+    def __init__(self, model: BDF, root_keys: Optional[List[str]]=None) -> None:
+        """
+        Parameters
+        ----------
+        model : BDF
+            the model
+        root_keys : List[str]; default=None -> ELEMENT_KEYS
+            the keys of the ids that are used (e.g., eid, spc_id)
+
+        """
+        if root_keys is None:
+            root_keys = ELEMENT_KEYS
+        groups = [(name, key, getattr(model, name)) for name, key in GRAPH_GROUPS]
+        self._set_ids(groups)
+
+        #: the card type of each vertex of an id
+        self._itypes = np.full(self.nid_vertices, -1, dtype='int32')
+        self._types = []  # type: List[str]
+        self._type_to_itype = {}  # type: Dict[str, int]
+
+        #: the label of each root that isn't an id (e.g., SUBCASE 1 SPC)
+        self._root_labels = []  # type: List[str]
+        self._root_src = []  # type: List[int]
+        self._root_dst = []  # type: List[Tuple[str, int]]
+
+        # the edges of the id columns and of the other fields/roots
+        src = {key: [] for key in self.ids}  # type: Dict[str, List[np.ndarray]]
+        dst = {key: [] for key in self.ids}  # type: Dict[str, List[np.ndarray]]
+        src_ids = {key: [] for key in self.ids}  # type: Dict[str, List[int]]
+        dst_ids = {key: [] for key in self.ids}  # type: Dict[str, List[int]]
+
+        # the (vertices, cards) of the card types with fixed id fields
+        type_to_cards = defaultdict(lambda: ([], []))  # type: Dict[str, Tuple[List[int], List[Any]]]
+        node_set_ids = _get_node_set_ids(model)
+        unsupported_types = set()
+        for name, key, group in groups:
+            keyed_cards = list(_iter_keyed_cards(group))
+            if keyed_cards:
+                idis = np.array([idi for idi, unused_card in keyed_cards], dtype='int64')
+                ivertices = self.offsets[key] + np.searchsorted(self.ids[key], idis)
+                card_types = [card.type for unused_idi, card in keyed_cards]
+                self._set_types(ivertices, card_types)
+                for ivertex, card_type, (unused_idi, card) in zip(
+                        ivertices.tolist(), card_types, keyed_cards):
+                    if _get_type_fields(card_type) is not None:
+                        ivertices_list, cards = type_to_cards[card_type]
+                        ivertices_list.append(ivertex)
+                        cards.append(card)
+                        continue
+                    try:
+                        card_fields = _get_reference_fields(card, node_set_ids)
+                    except KeyError:
+                        unsupported_types.add(card_type)
                         continue
-                    pconv_used.add(conv.pconid)
-        elif card_type == 'BLSEG':
-            for idi in ids:
-                blseg = model.blseg[idi]
-                # line_id
-                nids_used.update(blseg.nodes)
-                #print(blseg.get_stats())
-        elif card_type == 'BCONP':
-            for idi in ids:
-                bconp = model.bconp[idi]
-                # master
-                # slave
-                # ???
-                #print(bconp.get_stats())
-                cids_used.add(bconp.cid)
-                friction_ids_used.add(bconp.friction_id)
-        #elif card_type == 'FORCEAX':
-            #pass
-            #ring_id
-            #sid
-        elif card_type in not_implemented_types:
-            model.log.warning(f'skipping {card_type}')
+                    self._add_fields(ivertex, card_fields, src_ids, dst_ids)
+
+            if isinstance(group, NodeStore):
+                self._add_node_store(group, src, dst)
+            elif isinstance(group, ElementStore):
+                self._add_element_store(group, src, dst)
+
+        graph_names = {name for name, unused_key in GRAPH_GROUPS}
+        for name in model._slot_to_type_map:
+            if name in graph_names or name == 'params':
+                continue
+            for card in _iter_root_cards(getattr(model, name, None)):
+                card_type = card.type
+                type_fields = _get_type_fields(card_type)
+                if type_fields is not None:
+                    if type_fields:
+                        ivertices_list, cards = type_to_cards[card_type]
+                        ivertices_list.append(self.nid_vertices + len(self._root_labels))
+                        cards.append(card)
+                        self._root_labels.append(card_type)
+                    continue
+                try:
+                    card_fields = _get_reference_fields(card, node_set_ids)
+                except KeyError:
+                    unsupported_types.add(card_type)
+                    continue
+                if card_fields:
+                    ivertex = self.nid_vertices + len(self._root_labels)
+                    self._root_labels.append(card_type)
+                    self._add_fields(ivertex, card_fields, src_ids, dst_ids)
+        if unsupported_types:
+            raise NotImplementedError('removing the unused cards of %s is not supported' % (
+                sorted(unsupported_types)))
+
+        for card_type, (ivertices_list, cards) in type_to_cards.items():
+            self._add_columns(np.array(ivertices_list, dtype='int64'), cards,
+                              _get_type_fields(card_type), src, dst, src_ids, dst_ids)
+
+        if model.case_control_deck is not None:
+            self._add_case_control(model.case_control_deck, src_ids, dst_ids)
+        for key in self.ids:
+            src[key].append(np.array(src_ids[key], dtype='int64'))
+            dst[key].append(np.array(dst_ids[key], dtype='int64'))
+
+        nvertices = self.nid_vertices + len(self._root_labels)
+        self._set_edges(src, dst, nvertices)
+
+        is_root = np.zeros(nvertices, dtype='bool')
+        is_root[self.nid_vertices:] = True
+        for key in root_keys:
+            offset = self.offsets[key]
+            is_root[offset:offset + len(self.ids[key])] = True
+        self.is_root = is_root
+        self.is_used, self.parent = _get_reachable(self.src, self.dst, is_root)
+
+    def _set_ids(self, groups: List[Tuple[str, str, Any]]) -> None:
+        """sets the sorted ids and the first vertex of each key"""
+        ids = {}  # type: Dict[str, List[Any]]
+        for unused_name, key, group in groups:
+            ids.setdefault(key, []).append(np.array(list(group), dtype='int64'))
+        self.ids = {key: np.unique(np.hstack(idsi)) for key, idsi in ids.items()}
+        self.offsets = {}  # type: Dict[str, int]
+        offset = 0
+        for key, idsi in self.ids.items():
+            self.offsets[key] = offset
+            offset += len(idsi)
+        self.nid_vertices = offset
+
+    def _set_type(self, ivertex: int, card_type: str) -> None:
+        """sets the card type of a vertex (the first card of an id)"""
+        if self._itypes[ivertex] >= 0:
+            return
+        self._itypes[ivertex] = self._get_itype(card_type)
+
+    def _get_itype(self, card_type: str) -> int:
+        """gets the index of a card type"""
+        itype = self._type_to_itype.get(card_type)
+        if itype is None:
+            itype = len(self._types)
+            self._types.append(card_type)
+            self._type_to_itype[card_type] = itype
+        return itype
+
+    def _set_types(self, ivertices: np.ndarray, card_types: List[str]) -> None:
+        """sets the card types of the vertices (the first card of an id)"""
+        itypes = np.array([self._get_itype(card_type) for card_type in card_types], dtype='int32')
+        is_unset = self._itypes[ivertices] < 0
+        unused_ivertices, i = np.unique(ivertices[is_unset], return_index=True)
+        self._itypes[ivertices[is_unset][i]] = itypes[is_unset][i]
+
+    def _add_fields(self, ivertex: int, card_fields: List[Tuple[Any, Any, str]],
+                    src_ids: Dict[str, List[int]], dst_ids: Dict[str, List[int]]) -> None:
+        """adds the edges of the id fields of a card"""
+        for obj, name, key in card_fields:
+            if key not in dst_ids:
+                continue
+            value = _get_field(obj, name)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            ids = _get_ids(value)
+            src_ids[key].extend([ivertex] * len(ids))
+            dst_ids[key].extend(ids)
+
+    def _add_columns(self, ivertices: np.ndarray, cards: List[Any],
+                     card_fields: Tuple[Tuple[str, str], ...],
+                     src: Dict[str, List[np.ndarray]], dst: Dict[str, List[np.ndarray]],
+                     src_ids: Dict[str, List[int]], dst_ids: Dict[str, List[int]]) -> None:
+        """
+        adds the edges of the id fields of the cards of a type, a field
+        at a time (e.g., the nodes of the CQUAD4s); a field that isn't
+        an id column (e.g., an optional id) is added card by card
+        """
+        for name, key in card_fields:
+            if key not in dst:
+                continue
+            values = [getattr(card, name) for card in cards]
+            column = _get_id_column(values)
+            if column is not None:
+                src[key].append(np.repeat(ivertices, column.size // len(cards)))
+                dst[key].append(column.ravel().astype('int64'))
+                continue
+            for ivertex, value in zip(ivertices.tolist(), values):
+                if value is None or type(value) is float:
+                    continue
+                elif isinstance(value, np.ndarray):
+                    value = value.tolist()
+                ids = _get_ids(value)
+                src_ids[key].extend([ivertex] * len(ids))
+                dst_ids[key].extend(ids)
+
+    def _add_node_store(self, nodes: NodeStore,
+                        src: Dict[str, List[np.ndarray]], dst: Dict[str, List[np.ndarray]]) -> None:
+        """adds the cp/cd of the GRID arrays"""
+        nid_cp_cd = nodes.nid_cp_cd.astype('int64')
+        if len(nid_cp_cd) == 0:
+            return
+        ivertex = self.offsets['nid'] + np.searchsorted(self.ids['nid'], nodes.nids)
+        self._set_type(int(ivertex[0]), 'GRID')
+        self._itypes[ivertex] = self._type_to_itype['GRID']
+        src['cid'].append(np.repeat(ivertex, 2))
+        dst['cid'].append(nid_cp_cd[:, 1:].ravel())
+
+    def _add_element_store(self, elements: ElementStore,
+                           src: Dict[str, List[np.ndarray]], dst: Dict[str, List[np.ndarray]]) -> None:
+        """adds the pid/nodes/mcid of the element tables"""
+        columns = [('pid', 'pid'), ('nodes', 'nid'), ('mcid', 'cid')]
+        for table_name, table in elements.tables.items():
+            eids = elements._get_keys(table_name).astype('int64')
+            if len(eids) == 0:
+                continue
+            ivertex = self.offsets['eid'] + np.searchsorted(self.ids['eid'], eids)
+            card_type = PROXY_CLASSES[table_name].type
+            self._set_type(int(ivertex[0]), card_type)
+            self._itypes[ivertex] = self._type_to_itype[card_type]
+            for name, key in columns:
+                if name not in table:
+                    continue
+                values = table[name].astype('int64').reshape(len(eids), -1)
+                src[key].append(np.repeat(ivertex, values.shape[1]))
+                dst[key].append(values.ravel())
+
+    def _add_case_control(self, case_control_deck: Any,
+                          src_ids: Dict[str, List[int]], dst_ids: Dict[str, List[int]]) -> None:
+        """adds a root for each SPC/MPC/LOAD/TEMPERATURE set of each subcase"""
+        for isubcase, subcase in sorted(case_control_deck.subcases.items()):
+            for name, param in subcase.params.items():
+                key = CASE_CONTROL_KEYS.get(name)
+                if key is None and name.startswith('TEMP'):
+                    key = 'load_id'
+                value = param[0]
+                if key is None or not isinstance(value, integer_types):
+                    continue
+                ivertex = self.nid_vertices + len(self._root_labels)
+                self._root_labels.append('SUBCASE %i %s' % (isubcase, name))
+                src_ids[key].append(ivertex)
+                dst_ids[key].append(value)
+
+    def _set_edges(self, src: Dict[str, List[np.ndarray]], dst: Dict[str, List[np.ndarray]],
+                   nvertices: int) -> None:
+        """maps the ids of the edges to vertices; the ids that aren't defined are skipped"""
+        srcs = [np.zeros(0, dtype='int64')]
+        dsts = [np.zeros(0, dtype='int64')]
+        for key, ids in self.ids.items():
+            if not dst[key]:
+                continue
+            dsti = np.hstack(dst[key])
+            srci = np.hstack(src[key])
+            i = np.searchsorted(ids, dsti)
+            is_found = i < len(ids)
+            is_found[is_found] = ids[i[is_found]] == dsti[is_found]
+            srcs.append(srci[is_found])
+            dsts.append(self.offsets[key] + i[is_found])
+        self.src = np.hstack(srcs)
+        self.dst = np.hstack(dsts)
+        assert len(self.src) == 0 or self.src.max() < nvertices
+
+    def _get_vertex(self, key: str, idi: int) -> int:
+        """gets the vertex of an id"""
+        ids = self.ids[key]
+        i = int(np.searchsorted(ids, idi))
+        if i == len(ids) or ids[i] != idi:
+            raise KeyError('%s=%s is not defined' % (key, idi))
+        return self.offsets[key] + i
+
+    def _get_label(self, ivertex: int) -> str:
+        """gets the card type and id of a vertex (e.g., CQUAD4 eid=10)"""
+        if ivertex >= self.nid_vertices:
+            return self._root_labels[ivertex - self.nid_vertices]
+        for key, offset in self.offsets.items():
+            i = ivertex - offset
+            if i < len(self.ids[key]):
+                return '%s %s=%s' % (self._types[self._itypes[ivertex]], key, self.ids[key][i])
+        raise RuntimeError(ivertex)  # pragma: no cover
+
+    def get_used_ids(self, key: str) -> np.ndarray:
+        """gets the sorted ids of a key that are used (e.g., nid)"""
+        offset = self.offsets[key]
+        ids = self.ids[key]
+        return ids[self.is_used[offset:offset + len(ids)]]
+
+    def get_unused_ids(self, key: str) -> np.ndarray:
+        """gets the sorted ids of a key that aren't used (e.g., nid)"""
+        offset = self.offsets[key]
+        ids = self.ids[key]
+        return ids[~self.is_used[offset:offset + len(ids)]]
+
+    def get_reason(self, key: str, idi: int) -> str:
+        """
+        Gets why an id is used
+
+        Parameters
+        ----------
+        key : str
+            the key of the id (e.g., mid)
+        idi : int
+            the id
+
+        Returns
+        -------
+        reason : str
+            the cards that the id was reached from, back to a root
+            (e.g., 'MAT1 mid=3 <- PSHELL pid=2 <- CQUAD4 eid=10');
+            '' if the id isn't used
+
+        """
+        ivertex = self._get_vertex(key, idi)
+        if not self.is_used[ivertex]:
+            return ''
+        labels = []
+        while ivertex >= 0:
+            labels.append(self._get_label(ivertex))
+            ivertex = self.parent[ivertex]
+        return ' <- '.join(labels)
+
+
+def _get_reachable(src: np.ndarray, dst: np.ndarray,
+                   is_root: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the vertices that are reachable from the roots with a breadth
+    first search; each level is a pass over the edges
+    """
+    is_used = is_root.copy()
+    parent = np.full(len(is_root), -1, dtype='int64')
+    is_front = is_root.copy()
+    while True:
+        is_edge = is_front[src] & ~is_used[dst]
+        if not is_edge.any():
+            break
+        # the first edge of a vertex is the parent
+        dsti, iedge = np.unique(dst[is_edge], return_index=True)
+        parent[dsti] = src[is_edge][iedge]
+        is_used[dsti] = True
+        is_front = np.zeros(len(is_root), dtype='bool')
+        is_front[dsti] = True
+    return is_used, parent
+
+
+def _get_reference_fields(card: Any, node_set_ids: Set[int]) -> List[Tuple[Any, Any, str]]:
+    """gets the (object, attribute/index, key) of the id fields of a card"""
+    card_type = card.type
+    if card_type in ('NSM', 'NSM1', 'NSML', 'NSML1'):
+        key = 'eid' if card.nsm_type in NSM_ELEMENT_TYPES else 'pid'
+        return [(card, 'ids', key)]
+    elif card_type in REFERENCE_FIELDS:
+        return [(card, name, key) for name, key in REFERENCE_FIELDS[card_type]]
+    return _get_card_id_fields(card, node_set_ids)
+
+
+def _get_type_fields(card_type: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """
+    gets the (attribute, key) of the id fields of a card type, if every
+    card of the type has the same id fields; otherwise, None (e.g., a
+    SET1, an NSM)
+    """
+    if card_type in REFERENCE_FIELDS:
+        return REFERENCE_FIELDS[card_type]
+    elif card_type in ('NSM', 'NSM1', 'NSML', 'NSML1'):
+        return None
+    return CARD_ID_FIELDS.get(card_type)
+
+
+def _get_node_set_ids(model: BDF) -> Set[int]:
+    """gets the ids of the SET1s that are GRIDs (the SET1s of the splines, AESURFS, ...)"""
+    node_set_ids = {spline.setg for spline in model.splines.values()
+                    if hasattr(spline, 'setg')}
+    for aesurfs in model.aesurfs.values():
+        node_set_ids.update([aesurfs.list1, aesurfs.list2])
+    for monitor_point in model.monitor_points:
+        if monitor_point.type == 'MONPNT3':
+            node_set_ids.add(monitor_point.grid_set)
+    for aecomp in model.aecomps.values():
+        if getattr(aecomp, 'list_type', None) == 'SET1':
+            node_set_ids.update(aecomp.lists)
+    return node_set_ids
+
+
+def _iter_keyed_cards(group: Any) -> Iterator[Tuple[int, Any]]:
+    """iterates over the (id, card) of a dictionary; the GRID/element arrays are skipped"""
+    if isinstance(group, (NodeStore, ElementStore)):
+        group = group.objects
+    for idi, value in group.items():
+        if isinstance(value, list):
+            for card in value:
+                yield idi, card
         else:
-            raise NotImplementedError(card_type)
-
-
-    #for pid, prop in model.properties.items():
-        #prop = model.properties[pid]
-        #if prop.type in no_materials:
-            #continue
-        #elif prop.type == 'PSHELL':
-            #mids_used.extend([mid for mid in prop.material_ids if mid is not None])
-        #elif prop.type == 'PCONEAX':
-            #mids_used.extend([mid for mid in model.Mids() if mid is not None])
-
-        #elif prop.type in prop_mid:
-            #mids_used.append(prop.Mid())
-        #elif prop.type in ['PCOMP', 'PCOMPG', 'PCOMPS']:
-            #mids_used.extend(prop.Mids())
-
-        #elif prop.type == 'PBCOMP':
-            #mids_used.append(prop.Mid())
-            #mids_used.extend(prop.Mids())
-        #else:
-            #raise NotImplementedError(prop)
-    remove_desvars = False
-    _remove(
-        model,
-        nids_used, cids_used,
-        pids_used, pids_mass_used,
-        mids_used,
-        spcs_used, mpcs_used,
-        pconv_used, tableht_used, tableh1_used,
-        desvars_used,
-        remove_nids=remove_nids,
-        remove_cids=remove_cids,
-        remove_pids=remove_pids,
-        remove_mids=remove_mids,
-        remove_spcs=remove_spcs, remove_mpcs=remove_mpcs,
-        unused_remove_desvars=remove_desvars,
-    )
-
-
-def _store_elements(card_type, model, ids, nids_used, pids_used, mids_used, cids_used):
-    if card_type in ['CTETRA', 'CPENTA', 'CPYRAM', 'CHEXA', 'CHACAB']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CELAS1', 'CDAMP1', 'CVISC', 'CDAMP5']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CELAS2', 'CDAMP2']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-    elif card_type in ['CELAS3', 'CDAMP3']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CELAS4', 'CDAMP4', 'GENEL']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-
-    elif card_type in ['CTRIA3', 'CQUAD4', 'CTRIA6', 'CTRIAR', 'CQUAD8', 'CQUADR',
-                       'CTRIAX', 'CQUADX', 'CQUAD']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-            if isinstance(elem.theta_mcid, int):
-                cids_used.add(elem.theta_mcid)
-    elif card_type in ['CTRIAX6', ]:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            mids_used.add(elem.Mid())
-    elif card_type in ['CSHEAR', 'CTUBE']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CPLSTN3', 'CPLSTN4', 'CPLSTN6', 'CPLSTN8',
-                       'CPLSTS3', 'CPLSTS4', 'CPLSTS6', 'CPLSTS8',
-                       'CQUADX4', 'CQUADX8', 'CTRIAX6',
-                       'CTRAX3', 'CTRAX6']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CROD', 'CRAC2D', 'CRAC3D']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type in ['CONROD']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Mid())
-    elif card_type == 'CCONEAX':
-        for eid in ids:
-            elem = model.elements[eid]
-            pids_used.add(elem.Pid())
-    elif card_type in ['CBAR', 'CBEAM', 'CBEND']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-            if elem.g0 is not None:
-                assert isinstance(elem.g0, int), elem.g0
-                nids_used.add(elem.g0)
-    elif card_type == 'CBEAM3':
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.add(elem.Ga())
-            nids_used.add(elem.Gb())
-            if elem.gc is not None:
-                nids_used.add(elem.gc)
-            pids_used.add(elem.Pid())
-            if elem.g0 is not None:
-                assert isinstance(elem.g0, int), elem.g0
-
-    elif card_type == 'CFAST':
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-    elif card_type == 'CGAP':
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-            if elem.g0 is not None:
-                assert isinstance(elem.g0, int), elem.g0
-                nids_used.add(elem.G0())
-    elif card_type == 'CBUSH':
-        for eid in ids:
-            elem = model.elements[eid]
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            if elem.g0 is not None:
-                assert isinstance(elem.g0, int), elem.g0
-                nids_used.add(elem.G0())
-            pids_used.add(elem.Pid())
-            if elem.cid is not None:
-                cids_used.add(elem.Cid())
-    elif card_type in ['CBUSH1D', 'CBUSH2D']:
-        for eid in ids:
-            elem = model.elements[eid]
-            nids_used.update(elem.node_ids)
-            pids_used.add(elem.Pid())
-            cids_used.add(elem.Cid())
-    else:
-        raise NotImplementedError(card_type)
-
-def _store_nsm(model, ids, pids_used):
-    """helper for ``remove_unused``"""
-    for nsm_id in ids:
-        nsms = model.nsms[nsm_id]
-        for nsm in nsms:
-            idsi = nsm.ids
-
-            if nsm.nsm_type in ['PROD', 'PBARL', 'PBEAML',
-                                'PSHELL', 'PCOMP', ]:
-                if len(idsi) == 1 and idsi[0] == 'ALL':
-                    idsi = list(model.properties.keys())
-                    #raise NotImplementedError('found ALL...\n%s' % str(nsm))
-                pids_used.update(idsi)
-            elif nsm.nsm_type in ['CONROD', 'ELEMENT']:
-                # we skip this because we assume all elements are used
-                #if len(idsi) == 1 and idsi[0] == 'ALL':
-                    #raise NotImplementedError('found ALL...\n%s' % str(nsm))
-                #eids_used.update(idsi)
-                pass
-            else:
-                msg = 'found nsm_type=%r...\n%s' % (nsm.nsm_type, str(nsm))
-                raise NotImplementedError(msg)
-
-def _store_loads(model, unused_card_type, unused_ids, nids_used, eids_used, cids_used):
-    """helper for ``remove_unused``"""
-    for loads in model.loads.values():
-        for load in loads:
-            if load.type in ['FORCE', 'MOMENT']:
-                nids_used.add(load.node_id)
-                cids_used.add(load.Cid())
-            elif load.type in ['FORCE1', 'FORCE2', 'MOMENT1', 'MOMENT2']:
-                nids_used.update(load.node_ids)
-            elif load.type == 'GRAV':
-                cids_used.add(load.Cid())
-            elif load.type == 'RANDPS':
-                pass
-            elif load.type == 'PLOAD':
-                nids_used.update(load.node_ids)
-            elif load.type == 'PLOAD1':
-                #eid = integer(card, 2, 'eid')
-                pass
-            elif load.type == 'PLOAD2':
-                #eids_used.update(load.element_ids)
-                pass
-            elif load.type == 'PLOAD4':
-                # eids, g1, g34
-                cids_used.add(load.Cid())
-            elif load.type == 'DEFORM':
-                eids_used.add(load.Eid())
-            elif load.type == 'SPCD':
-                nids_used.update(load.node_ids)
-            elif load.type == 'GMLOAD':
-                cids_used.add(load.Cid())
-            elif load.type in ['RFORCE', 'RFORCE1']:
-                nids_used.add(load.node_id)
-                cids_used.add(load.Cid())
-            elif load.type == 'TEMP':
-                nids_used.update(list(load.temperatures.keys()))
-            elif load.type == 'ACCEL':
-                # nids?
-                cids_used.add(load.Cid())
-            elif load.type == 'ACCEL1':
-                # nids?
-                cids_used.add(load.Cid())
-            elif load.type in ['QBDY1', 'QBDY2', 'QBDY3', 'QHBDY']:
-                pass
-            #'QBDY1', 'QBDY2', 'QBDY3', 'QHBDY', 'PLOADX1
-            elif load.type in ['PLOADX1']:
-                nids_used.update(load.node_ids)
-            elif load.type in ['SLOAD']:
-                nids_used.update(load.node_ids)
-            elif load.type in ['LOAD', 'LSEQ', 'LOADCYN']:
-                pass
-            elif load.type in ['QVOL', 'TEMPRB']:
-                # eids
-                pass
-            elif load.type in ['TEMPAX']:
-                pass # not done...
-            else:
-                raise NotImplementedError(load)
-
-def _store_dresp1(model, ids, nids_used, pids_used):
-    """helper for ``remove_unused``"""
-    for dresp_id in ids:
-        dresp = model.dresps[dresp_id]
-        if dresp.property_type in ['PSHELL', 'PCOMP', 'PCOMPG', 'PBAR', 'PBARL', 'PBEAM',
-                                   'PROD', 'PDAMP', 'PVISC', 'PTUBE', 'PSHEAR', 'PELAS',
-                                   'PSOLID', 'PBEAML']:
-            pids_used.update(dresp.atti_values())
-        elif dresp.property_type == 'ELEM':
-            if dresp.response_type in ['STRESS', 'FRSTRE',
-                                       'CFAILURE',
-                                       'TFORC', 'FRFORC']:
-                #eids_used.update(dresp.atti_values())
-                pass
-            else:
-                msg = (
-                    str(dresp) + 'region=%r property_type=%r response_type=%r, '
-                    'atta=%r attb=%s atti=%s' % (
-                        dresp.region, dresp.property_type, dresp.response_type,
-                        dresp.atta, dresp.attb, dresp.atti))
-                raise NotImplementedError(msg)
-
-        #elif dresp.property_type == 'STRESS':
-
-        elif dresp.property_type is None:
-            if dresp.response_type in ['WEIGHT', 'EIGN', 'VOLUME', 'LAMA', 'CEIG',
-                                       'FREQ', 'STABDER']:
-                pass
-            elif dresp.response_type in ['DISP', 'FRDISP', 'TDISP', 'RMSDISP', 'PSDDISP',
-                                         'TVELO', 'FRVELO', 'RMSVELO',
-                                         'TACCL', 'FRACCL', 'RMSACCL',
-                                         'SPCFORCE', 'TSPCF', 'FRSPCF',
-                                         'FORCE', 'TFORC', 'FRFORC']:
-                nids_used.update(dresp.atti)
-            elif dresp.response_type in ['FLUTTER', 'TRIM', 'DIVERG']:
-                # flutter_id / trim_id
-                pass
-            else:
-                msg = (
-                    str(dresp) + 'region=%r property_type=%r response_type=%r '
-                    'atta=%r attb=%s atti=%s' % (
-                        dresp.region, dresp.property_type, dresp.response_type,
-                        dresp.atta, dresp.attb, dresp.atti))
-                raise NotImplementedError(msg)
+            yield idi, value
+
+
+def _iter_root_cards(group: Any) -> Iterator[Any]:
+    """iterates over the cards of a model attribute that isn't a dictionary of ids"""
+    if group is None:
+        return
+    elif not isinstance(group, (dict, list)):
+        # a single card (e.g., GRDSET)
+        yield group
+        return
+    values = group.values() if isinstance(group, dict) else group
+    for value in values:
+        if isinstance(value, list):
+            yield from value
+        elif isinstance(value, dict):
+            yield from _iter_root_cards(value)
         else:
-            msg = (
-                str(dresp) + 'region=%r property_type=%r response_type=%r '
-                'atta=%r attb=%s atti=%s' % (
-                    dresp.region, dresp.property_type, dresp.response_type,
-                    dresp.atta, dresp.attb, dresp.atti))
-            raise NotImplementedError(msg)
-
-def _store_masses(card_type, model, ids, nids_used, pids_mass_used, cids_used) -> None:
-    """handles masses"""
-    if card_type in ['CONM1', 'CONM2']:
-        for eid in ids:
-            elem = model.masses[eid]
-            nids_used.add(elem.Nid())
-            cids_used.add(elem.Cid())
-    elif card_type in ['CMASS1', 'CMASS3']:
-        for eid in ids:
-            elem = model.masses[eid]
-            pids_mass_used.add(elem.Pid())
-            nids_used.update(elem.node_ids)
-    elif card_type in ['CMASS2', 'CMASS4']:
-        for eid in ids:
-            elem = model.masses[eid]
-            nids_used.update(elem.node_ids)
-    else:
-        raise NotImplementedError(card_type)
-
-def _remove(model: BDF,
-            nids_used, cids_used,
-            pids_used, pids_mass_used, mids_used, spcs_used, mpcs_used,
-            pconv_used, tableht_used, tableh1_used,
-            unused_desvars_used,
-            remove_nids=True, remove_cids=True,
-            remove_pids=True, remove_mids=True,
-            remove_spcs=True, remove_mpcs=True,
-            unused_remove_desvars=True):
-    """actually removes the cards"""
-    nids = set(model.nodes.keys())
-    pids = set(model.properties.keys())
-    pids_mass = set(model.properties_mass.keys())
-    cids = set(model.coords.keys())
-    mids = set(model.materials.keys())
-    spcs = set(model.spcs.keys())  # spcadds?
-    mpcs = set(model.mpcs.keys()) # mpcadds?
-
-    nids_to_remove = list(nids - nids_used)
-    pids_to_remove = list(pids - pids_used)
-    pids_mass_to_remove = list(pids_mass - pids_mass_used)
-    mids_to_remove = list(mids - mids_used)
-    cids_to_remove = list(cids - cids_used)
-
-    #for subcase in model.subcases:
-    #    if 'SPC' in subcase:
-    #        value = subcase['SPC']
-    #        spcs_used.add(value)
-    #    if 'MPC' in subcase:
-    #        value = subcase['MPC']
-    #        mpcs_used.add(value)
-    #    #if 'LOAD' in subcase:
-    #        #value = subcase['LOAD']
-    #        #loads_used.add(value)
-
-    spcs_to_remove = list(spcs - spcs_used)
-    mpcs_to_remove = list(mpcs - mpcs_used)
-
-    if 0 in cids_to_remove:
-        cids_to_remove.remove(0)
-
-    if remove_nids and nids_to_remove:
-        for nid in nids_to_remove:
-            del model.nodes[nid]
-        nids_to_remove.sort()
-        model.log.debug('removed nodes %s' % nids_to_remove)
-
-    if remove_cids and cids_to_remove:
-        for cid in cids_to_remove:
-            del model.coords[cid]
-        cids_to_remove.sort()
-        model.log.debug('removing coords %s' % cids_to_remove)
-
-    if remove_pids and pids_to_remove:
-        for pid in pids_mass_to_remove:
-            del model.properties_mass[pid]
-        pids_mass_to_remove.sort()
-        model.log.debug('removing properties_mass %s' % pids_mass_to_remove)
-
-        for pid in pids_to_remove:
-            del model.properties[pid]
-        pids_to_remove.sort()
-        model.log.debug('removing properties %s' % pids_to_remove)
-
-    if remove_mids and mids_to_remove:
-        for mid in mids_to_remove:
-            del model.materials[mid]
-        mids_to_remove.sort()
-        model.log.debug('removing materials %s' % mids_to_remove)
-
-    #if remove_spcs and spcs_to_remove:
-    #    for spc_id in spcs_to_remove:
-    #        del model.spcs[spc_id]
-    #    spcs_to_remove.sort()
-    #    model.log.debug('removed spcs %s' % spcs_to_remove)
-    #if remove_mpcs and mpcs_to_remove:
-    #    for mpc_id in mpcs_to_remove:
-    #        del model.mpcs[mpc_id]
-    #    mpcs_to_remove.sort()
-    #    model.log.debug('removed mpcs %s' % mpcs_to_remove)
-    _remove_thermal(model, pconv_used, tableht_used, tableh1_used)
-
-def _remove_thermal(model: BDF, pconv_used, tableht_used, tableh1_used) -> None:
-    """removes some thermal cards"""
-    pconv = {pid for pid, prop in model.convection_properties.items() if prop.type == 'PCONV'}
-    tableht = {tid for tid, table in model.tables.items() if table.type == 'TABLEHT'}
-    tableh1 = {tid for tid, table in model.tables.items() if table.type == 'TABLEH1'}
-
-    pconv_to_remove = list(pconv - pconv_used)
-    tableht_to_remove = list(tableht - tableht_used)
-    tableh1_to_remove = list(tableh1 - tableh1_used)
-
-    remove_pconv = True
-    if remove_pconv and pconv_to_remove:
-        for pid in pconv_to_remove:
-            del model.convection_properties[pid]
-        pconv_to_remove.sort()
-        model.log.debug('removing convection_properties %s' % pconv_to_remove)
-
-    remove_tableh1 = True
-    remove_tableht = True
-    if remove_tableh1 and tableh1_to_remove:
-        for pid in tableh1_to_remove:
-            del model.tables[pid]
-        tableh1_to_remove.sort()
-        model.log.debug('removing TABLEH1 %s' % tableh1_to_remove)
-    if remove_tableht and tableht_to_remove:
-        for pid in tableht_to_remove:
-            del model.tables[pid]
-        tableht_to_remove.sort()
-        model.log.debug('removing TABLEH1 %s' % tableht_to_remove)
-    return
+            yield value
+
+
+def _remove_ids(model: BDF, names: List[str], ids_to_remove: np.ndarray,
+                card_types: Optional[Set[str]]) -> None:
+    """removes the cards of some ids from the model attributes (e.g., nodes)"""
+    log = model.log
+    type_to_id_map = model._type_to_id_map
+    for name in names:
+        group = getattr(model, name)
+        removed_ids = {}  # type: Dict[str, Set[int]]
+        if isinstance(group, NodeStore):
+            irows = np.where(np.isin(group.nids, ids_to_remove))[0]
+            if len(irows):
+                removed_ids['GRID'] = set(group.nids[irows].tolist())
+                group._delete_rows(irows.tolist())
+
+        objects = group.objects if isinstance(group, NodeStore) else group
+        for idi in ids_to_remove.tolist():
+            value = objects.get(idi)
+            if value is None:
+                continue
+            cards = value if isinstance(value, list) else [value]
+            if card_types is not None and any(card.type not in card_types for card in cards):
+                continue
+            for card in cards:
+                removed_ids.setdefault(card.type, set()).add(idi)
+            del objects[idi]
+
+        if not removed_ids:
+            continue
+        for card_type, idsi in removed_ids.items():
+            if card_type in type_to_id_map:
+                type_to_id_map[card_type] = [idi for idi in type_to_id_map[card_type]
+                                             if idi not in idsi]
+        removed = sorted(set().union(*removed_ids.values()))
+        log.debug('removing %s %s' % (name, removed))
@@ -0,0 +1,780 @@
+"""
+Defines the id-array renumbering engine that's used by
+``bdf_renumber(method='array')``.  Defines:
+
+ - renumber_arrays(model, starting_id_dict=None, node_ordering='sorted')
+ - get_node_ordering(model, node_ordering='rcm')
+ - get_node_bandwidth(model)
+
+The ids of each key (e.g., the node ids) are gathered into an array, so
+each key is renumbered with a single ``searchsorted``:
+
+ - the old ids are sorted and the new ids are in the same order
+ - the id fields of the cards (e.g., CBAR ga/gb/g0; see
+   ``CARD_ID_FIELDS``) are gathered, remapped and scattered back
+ - the GRID/element arrays of the array store (see ``array_store.py``)
+   are remapped without creating the card objects
+
+The id fields are used instead of the cross-referenced objects, so the
+model doesn't need to be cross-referenced (a cross-referenced model is
+uncross-referenced first, so the id fields are current).
+
+The GRIDs may be renumbered in a bandwidth reducing order (reverse
+Cuthill-McKee on the node graph of the elements and rigid elements).
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from itertools import chain
+from typing import List, Dict, Tuple, Set, Optional, Iterator, Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.cards.optimization import DRESP_PROPERTIES
+from pyNastran.bdf.bdf_interface.array_store import (
+    NodeStore, ElementStore, PROXY_CLASSES, _get_int_dtype)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the keys of starting_id_dict that are renumbered
+ID_KEYS = ['nid', 'eid', 'pid', 'mid', 'cid', 'spc_id', 'mpc_id', 'load_id']
+
+#: the keys of the element/property groups, which are renumbered in order
+#: from the eid/pid starting id; the groups have a key each, since the
+#: ids of a group may be used by another group (e.g., a CONM2 with the
+#: id of a CQUAD4)
+GROUP_KEYS = {
+    'eid' : [('elements', 'eid'), ('masses', 'mass_eid'),
+             ('rigid_elements', 'rigid_eid'), ('plotels', 'plotel_eid')],
+    'pid' : [('properties', 'pid'), ('properties_mass', 'mass_pid'),
+             ('phbdys', 'phbdy_pid')],
+}
+
+MATERIAL_GROUPS = [
+    'materials', 'creep_materials', 'thermal_materials', 'hyperelastic_materials',
+    'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9',
+    'MATS1', 'MATS3', 'MATS8',
+]
+
+#: the model attributes with id fields and the key of the dictionary
+#: (None : the dictionary/list isn't renumbered), in the renumbering order
+CARD_GROUPS = [
+    ('nodes', 'nid'), ('coords', 'cid'), ('grdset', None),
+] + GROUP_KEYS['eid'] + GROUP_KEYS['pid'] + [(name, 'mid') for name in MATERIAL_GROUPS] + [
+    ('spcadds', 'spc_id'), ('spcs', 'spc_id'),
+    ('mpcadds', 'mpc_id'), ('mpcs', 'mpc_id'),
+    ('load_combinations', 'load_id'), ('loads', 'load_id'), ('tempds', 'load_id'),
+    ('dareas', 'load_id'), ('dloads', None), ('dload_entries', None),
+    ('dphases', None), ('delays', None), ('tics', None),
+    ('spcoffs', None), ('suport', None), ('suport1', None),
+    ('sets', None), ('asets', None), ('bsets', None), ('csets', None), ('qsets', None),
+    ('omits', None), ('usets', None), ('se_sets', None),
+    ('dvprels', None), ('dvmrels', None), ('dvcrels', None), ('dresps', None),
+    ('dvgrids', None),
+    ('aero', None), ('aeros', None), ('caeros', None), ('aesurf', None), ('splines', None),
+]
+
+#: the id fields that may refer to a card that isn't renumbered (e.g., the
+#: excite_id of a TLOAD1 may be a TEMPBC), so an id that isn't renumbered
+#: is kept
+UNCHECKED_FIELDS = {'excite_id'}
+
+#: the cards that may refer to renumbered ids, but aren't updated
+UNSUPPORTED_GROUPS = [
+    'nsms', 'nsmadds', 'dmig', 'bcs', 'monitor_points',
+    'bsurf', 'bsurfs', 'bctsets', 'transfer_functions',
+]
+
+_ELEMENT = (('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'))
+_SHELL = _ELEMENT + (('theta_mcid', 'cid'), )
+_SCALAR = (('eid', 'eid'), ('nodes', 'nid'))
+_MASS = (('eid', 'mass_eid'), ('pid', 'mass_pid'), ('nodes', 'nid'))
+_SCALAR_MASS = (('eid', 'mass_eid'), ('nodes', 'nid'))
+_RIGID = (('eid', 'rigid_eid'), ('ga', 'nid'), ('gb', 'nid'))
+_LINE = (('eid', 'eid'), ('pid', 'pid'), ('ga', 'nid'), ('gb', 'nid'))
+_BAR = _LINE + (('g0', 'nid'), )
+_PROPERTY = (('pid', 'pid'), )
+_PROPERTY_MID = (('pid', 'pid'), ('mid', 'mid'))
+_MATERIAL = (('mid', 'mid'), )
+_CONSTRAINT = (('conid', 'spc_id'), ('nodes', 'nid'))
+_NODE_SET = (('ids', 'nid'), )
+_NODES = (('nodes', 'nid'), )
+_NODE_LOAD = (('sid', 'load_id'), ('node', 'nid'), ('cid', 'cid'))
+
+#: card type -> the (attribute, key) of the id fields; an attribute is an id,
+#: a list of ids (e.g., nodes) or a dict with id keys (e.g., TEMP); the ids
+#: less than 1 (e.g., cd=-1, a blank) aren't changed
+CARD_ID_FIELDS = {
+    # nodes
+    'GRID' : (('nid', 'nid'), ('cp', 'cid'), ('cd', 'cid')),
+    'GRDSET' : (('cp', 'cid'), ('cd', 'cid')),
+    'CORD1R' : (('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')),
+    'CORD1C' : (('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')),
+    'CORD1S' : (('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')),
+    'CORD2R' : (('cid', 'cid'), ('rid', 'cid')),
+    'CORD2C' : (('cid', 'cid'), ('rid', 'cid')),
+    'CORD2S' : (('cid', 'cid'), ('rid', 'cid')),
+
+    # elements
+    'CQUAD4' : _SHELL, 'CTRIA3' : _SHELL, 'CQUAD8' : _SHELL, 'CTRIA6' : _SHELL,
+    'CQUADR' : _SHELL, 'CTRIAR' : _SHELL, 'CQUAD' : _SHELL, 'CTRIAX' : _SHELL,
+    'CQUADX' : _SHELL, 'CQUADX8' : _ELEMENT,
+    'CTRIAX6' : (('eid', 'eid'), ('mid', 'mid'), ('nodes', 'nid')),
+    'CSHEAR' : _ELEMENT, 'CTETRA' : _ELEMENT, 'CPENTA' : _ELEMENT, 'CPYRAM' : _ELEMENT,
+    'CHEXA' : _ELEMENT, 'CROD' : _ELEMENT, 'CTUBE' : _ELEMENT, 'CVISC' : _ELEMENT,
+    'CHACAB' : _ELEMENT, 'CHACBR' : _ELEMENT,
+    'CONROD' : (('eid', 'eid'), ('mid', 'mid'), ('nodes', 'nid')),
+    'CELAS1' : _ELEMENT, 'CELAS2' : _SCALAR, 'CELAS3' : _ELEMENT, 'CELAS4' : _SCALAR,
+    'CDAMP1' : _ELEMENT, 'CDAMP2' : _SCALAR, 'CDAMP3' : _ELEMENT, 'CDAMP4' : _SCALAR,
+    'CDAMP5' : _ELEMENT,
+    'CBAR' : _BAR, 'CBEND' : _BAR, 'CBEAM3' : _BAR + (('gc', 'nid'), ),
+    'CBEAM' : _BAR + (('sa', 'nid'), ('sb', 'nid')),
+    'CBUSH' : _ELEMENT + (('g0', 'nid'), ('cid', 'cid'), ('ocid', 'cid')),
+    'CBUSH1D' : _LINE + (('cid', 'cid'), ),
+    'CBUSH2D' : _LINE + (('cid', 'cid'), ),
+    'CGAP' : _BAR + (('cid', 'cid'), ),
+    'CHBDYG' : (('eid', 'eid'), ('nodes', 'nid')),
+    'CHBDYE' : (('eid', 'eid'), ('eid2', 'eid')),
+    'CHBDYP' : (('eid', 'eid'), ('pid', 'phbdy_pid'), ('g1', 'nid'), ('g2', 'nid'),
+                ('g0', 'nid'), ('gmid', 'nid'), ('ce', 'cid')),
+    'PLOTEL' : (('eid', 'plotel_eid'), ('nodes', 'nid')),
+
+    # masses
+    'CONM1' : (('eid', 'mass_eid'), ('nid', 'nid'), ('cid', 'cid')),
+    'CONM2' : (('eid', 'mass_eid'), ('nid', 'nid'), ('cid', 'cid')),
+    'CMASS1' : _MASS, 'CMASS2' : _SCALAR_MASS, 'CMASS3' : _MASS, 'CMASS4' : _SCALAR_MASS,
+
+    # rigid elements
+    'RBAR' : _RIGID, 'RBAR1' : _RIGID,
+    'RBE1' : (('eid', 'rigid_eid'), ('Gni', 'nid'), ('Gmi', 'nid')),
+    'RBE2' : (('eid', 'rigid_eid'), ('gn', 'nid'), ('Gmi', 'nid')),
+    'RBE3' : (('eid', 'rigid_eid'), ('refgrid', 'nid'), ('Gijs', 'nid'), ('Gmi', 'nid')),
+    'RROD' : (('eid', 'rigid_eid'), ('nodes', 'nid')),
+    'RSPLINE' : (('eid', 'rigid_eid'), ('independent_nid', 'nid'), ('dependent_nids', 'nid')),
+
+    # properties
+    'PSHELL' : (('pid', 'pid'), ('mid1', 'mid'), ('mid2', 'mid'), ('mid3', 'mid'),
+                ('mid4', 'mid')),
+    'PCOMP' : (('pid', 'pid'), ('mids', 'mid')),
+    'PCOMPG' : (('pid', 'pid'), ('mids', 'mid')),
+    'PCOMPS' : (('pid', 'pid'), ('mids', 'mid'), ('cordm', 'cid')),
+    'PSOLID' : _PROPERTY_MID + (('cordm', 'cid'), ),
+    'PLPLANE' : _PROPERTY_MID + (('cid', 'cid'), ),
+    'PBCOMP' : _PROPERTY_MID + (('mids', 'mid'), ),
+    'PCONEAX' : (('pid', 'pid'), ('mid1', 'mid'), ('mid2', 'mid'), ('mid3', 'mid')),
+    'PLSOLID' : _PROPERTY_MID, 'PBAR' : _PROPERTY_MID, 'PBARL' : _PROPERTY_MID,
+    'PBEAM' : _PROPERTY_MID, 'PBEAML' : _PROPERTY_MID, 'PBEND' : _PROPERTY_MID,
+    'PBEAM3' : _PROPERTY_MID,
+    'PROD' : _PROPERTY_MID, 'PTUBE' : _PROPERTY_MID, 'PSHEAR' : _PROPERTY_MID,
+    'PRAC2D' : _PROPERTY_MID, 'PPLANE' : _PROPERTY_MID, 'PDAMP5' : _PROPERTY_MID,
+    'PBUSH' : _PROPERTY, 'PBUSH1D' : _PROPERTY, 'PBUSH2D' : _PROPERTY, 'PELAS' : _PROPERTY,
+    'PDAMP' : _PROPERTY, 'PVISC' : _PROPERTY, 'PGAP' : _PROPERTY, 'PACABS' : _PROPERTY,
+    'PMASS' : (('pid', 'mass_pid'), ), 'PHBDY' : (('pid', 'phbdy_pid'), ),
+
+    # materials
+    'MAT1' : _MATERIAL + (('mcsid', 'cid'), ), 'MAT2' : _MATERIAL + (('mcsid', 'cid'), ),
+    'MAT3' : _MATERIAL, 'MAT4' : _MATERIAL, 'MAT5' : _MATERIAL, 'MAT8' : _MATERIAL,
+    'MAT9' : _MATERIAL, 'MAT10' : _MATERIAL, 'MAT11' : _MATERIAL, 'MATHE' : _MATERIAL,
+    'MATHP' : _MATERIAL, 'CREEP' : _MATERIAL,
+    'MATT1' : _MATERIAL, 'MATT2' : _MATERIAL, 'MATT3' : _MATERIAL, 'MATT4' : _MATERIAL,
+    'MATT5' : _MATERIAL, 'MATT8' : _MATERIAL, 'MATT9' : _MATERIAL,
+    'MATS1' : _MATERIAL, 'MATS3' : _MATERIAL, 'MATS8' : _MATERIAL,
+
+    # constraints
+    'SPC' : _CONSTRAINT, 'SPC1' : _CONSTRAINT, 'GMSPC' : (('conid', 'spc_id'), ),
+    'SPCADD' : (('conid', 'spc_id'), ('sets', 'spc_id')),
+    'MPC' : (('conid', 'mpc_id'), ('nodes', 'nid')),
+    'MPCADD' : (('conid', 'mpc_id'), ('sets', 'mpc_id')),
+    'SPCOFF' : (('nodes', 'nid'), ), 'SPCOFF1' : (('nodes', 'nid'), ),
+    'SUPORT' : (('nodes', 'nid'), ), 'SUPORT1' : (('nodes', 'nid'), ),
+
+    # sets
+    'SESET' : _NODE_SET, 'USET' : _NODE_SET, 'USET1' : _NODE_SET,
+    'ASET' : _NODE_SET, 'ASET1' : _NODE_SET, 'BSET' : _NODE_SET, 'BSET1' : _NODE_SET,
+    'CSET' : _NODE_SET, 'CSET1' : _NODE_SET, 'QSET' : _NODE_SET, 'QSET1' : _NODE_SET,
+    'OMIT' : _NODE_SET, 'OMIT1' : _NODE_SET,
+
+    # loads
+    'LOAD' : (('sid', 'load_id'), ('load_ids', 'load_id')),
+    'CLOAD' : (('sid', 'load_id'), ('load_ids', 'load_id')),
+    'LSEQ' : (('sid', 'load_id'), ('excite_id', 'load_id'), ('lid', 'load_id')),
+    'FORCE' : _NODE_LOAD, 'MOMENT' : _NODE_LOAD,
+    'FORCE1' : (('sid', 'load_id'), ('node', 'nid'), ('g1', 'nid'), ('g2', 'nid')),
+    'MOMENT1' : (('sid', 'load_id'), ('node', 'nid'), ('g1', 'nid'), ('g2', 'nid')),
+    'FORCE2' : (('sid', 'load_id'), ('node', 'nid'), ('g1', 'nid'), ('g2', 'nid'),
+                ('g3', 'nid'), ('g4', 'nid')),
+    'MOMENT2' : (('sid', 'load_id'), ('node', 'nid'), ('g1', 'nid'), ('g2', 'nid'),
+                 ('g3', 'nid'), ('g4', 'nid')),
+    'PLOAD' : (('sid', 'load_id'), ('nodes', 'nid')),
+    'PLOAD1' : (('sid', 'load_id'), ('eid', 'eid')),
+    'PLOAD2' : (('sid', 'load_id'), ('eids', 'eid')),
+    'PLOAD4' : (('sid', 'load_id'), ('eids', 'eid'), ('g1', 'nid'), ('g34', 'nid'),
+                ('cid', 'cid')),
+    'PLOADX1' : (('sid', 'load_id'), ('eid', 'eid'), ('ga', 'nid'), ('gb', 'nid')),
+    'GRAV' : (('sid', 'load_id'), ('cid', 'cid')),
+    'ACCEL' : (('sid', 'load_id'), ('cid', 'cid')),
+    'ACCEL1' : (('sid', 'load_id'), ('cid', 'cid'), ('nodes', 'nid')),
+    'RFORCE' : (('sid', 'load_id'), ('nid', 'nid'), ('cid', 'cid')),
+    'RFORCE1' : (('sid', 'load_id'), ('nid', 'nid'), ('cid', 'cid')),
+    'SLOAD' : (('sid', 'load_id'), ('nodes', 'nid')),
+    'SPCD' : (('sid', 'load_id'), ('nodes', 'nid')),
+    'DEFORM' : (('sid', 'load_id'), ('eid', 'eid')),
+    'TEMP' : (('sid', 'load_id'), ('temperatures', 'nid')),
+    'TEMPD' : (('sid', 'load_id'), ),
+    'TEMPRB' : (('sid', 'load_id'), ('eids', 'eid')),
+    'QBDY1' : (('sid', 'load_id'), ('eids', 'eid')),
+    'QBDY2' : (('sid', 'load_id'), ('eid', 'eid')),
+    'QBDY3' : (('sid', 'load_id'), ('cntrlnd', 'nid'), ('eids', 'eid')),
+    'QHBDY' : (('sid', 'load_id'), ('grids', 'nid')),
+    'QVOL' : (('sid', 'load_id'), ('control_point', 'nid'), ('elements', 'eid')),
+
+    # dynamic loads; the DLOAD/RLOADx/TLOADx/DPHASE/DELAY/TIC ids aren't
+    # renumbered, but the excite_id is a DAREA/SPCD/static load id
+    'DAREA' : (('sid', 'load_id'), ('nodes', 'nid')),
+    'DPHASE' : _NODES, 'DELAY' : _NODES, 'TIC' : _NODES,
+    'DLOAD' : (), 'RANDPS' : (), 'RANDT1' : (),
+    'RLOAD1' : (('excite_id', 'load_id'), ), 'RLOAD2' : (('excite_id', 'load_id'), ),
+    'TLOAD1' : (('excite_id', 'load_id'), ), 'TLOAD2' : (('excite_id', 'load_id'), ),
+    'ACSRCE' : (('excite_id', 'load_id'), ),
+    'QVECT' : (('ce', 'cid'), ('control_id', 'nid'), ('eids', 'eid')),
+
+    # aero; the CAEROx/AESURF/SPLINEx ids aren't renumbered
+    'AERO' : (('acsid', 'cid'), ), 'AEROS' : (('acsid', 'cid'), ('rcsid', 'cid')),
+    'CAERO1' : (('cp', 'cid'), ), 'CAERO2' : (('cp', 'cid'), ), 'CAERO3' : (('cp', 'cid'), ),
+    'CAERO4' : (('cp', 'cid'), ), 'CAERO5' : (('cp', 'cid'), ),
+    'AESURF' : (('cid1', 'cid'), ('cid2', 'cid')),
+    'SPLINE1' : (), 'SPLINE2' : (('cid', 'cid'), ), 'SPLINE3' : _NODES, 'SPLINE4' : (),
+    'SPLINE5' : (('cid', 'cid'), ),
+
+    # optimization; the DESVAR/DRESP ids aren't renumbered
+    'DVMREL1' : (('mid', 'mid'), ), 'DVMREL2' : (('mid', 'mid'), ),
+    'DVGRID' : (('nid', 'nid'), ('cid', 'cid')),
+}
+
+
+def renumber_arrays(model: BDF, starting_id_dict: Optional[Dict[str, Optional[int]]]=None,
+                    node_ordering: str='sorted') -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Renumbers a model with the id arrays (see ``bdf_renumber(method='array')``)
+
+    Parameters
+    ----------
+    model : BDF
+        the model; a cross-referenced model is uncross-referenced
+    starting_id_dict : Dict[key] = starting_id; default=None -> 1
+        key : str
+            nid, eid, pid, mid, cid, spc_id, mpc_id, load_id; the other
+            keys of ``bdf_renumber`` (e.g., method_id) are kept
+        starting_id : int / None
+            None : don't renumber this key
+    node_ordering : str; default='sorted'
+        the order of the new GRID ids (see ``get_node_ordering``)
+
+    Returns
+    -------
+    id_maps : Dict[key] = (old_ids, new_ids)
+        the sorted old ids and the new ids of each renumbered key; the
+        eid/pid keys are split by group (see ``GROUP_KEYS``)
+
+    """
+    if starting_id_dict is None:
+        starting_id_dict = {}
+    if getattr(model, '_is_xref', False):
+        model.uncross_reference()
+    nodes = model.nodes
+    elements = model.elements
+    if isinstance(nodes, NodeStore):
+        nodes.compress()
+    if isinstance(elements, ElementStore):
+        elements.compress()
+
+    id_maps = {}  # type: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    for key in ID_KEYS:
+        start = starting_id_dict.get(key, 1)
+        if start is None:
+            continue
+        if key in GROUP_KEYS:
+            for name, keyi in GROUP_KEYS[key]:
+                id_maps[keyi] = _get_id_map(sorted(getattr(model, name)), start, keyi)
+                start += len(id_maps[keyi][0])
+        elif key == 'nid':
+            id_maps[key] = _get_nid_map(model, start, node_ordering)
+        elif key == 'mid':
+            mids = [list(getattr(model, name)) for name in MATERIAL_GROUPS]
+            mids = np.unique(np.array(list(chain(*mids)), dtype='int64'))
+            id_maps[key] = (mids, start + np.arange(len(mids), dtype='int64'))
+        else:
+            old_ids = [sorted(getattr(model, name)) for name, keyi in CARD_GROUPS
+                       if keyi == key]
+            old_ids = list(chain(*old_ids))
+            if key == 'load_id':
+                # the LSEQ excite_id is a load id of the RLOADx/TLOADx cards
+                old_ids += sorted(set(_get_lseq_excite_ids(model)))
+            if key == 'cid':
+                old_ids = [cid for cid in old_ids if cid != 0]
+            elif key in ('spc_id', 'mpc_id', 'load_id'):
+                # a set id may be used by different cards (e.g., FORCE, TEMP)
+                old_ids = list(dict.fromkeys(old_ids))
+            id_maps[key] = _get_id_map(old_ids, start, key)
+
+    if isinstance(nodes, NodeStore):
+        _remap_node_store(nodes, id_maps)
+    if isinstance(elements, ElementStore):
+        _remap_element_store(elements, id_maps)
+
+    cards = chain.from_iterable(
+        _iter_cards(getattr(model, name)) for name, unused_key in CARD_GROUPS)
+    # a SET1 is a set of GRIDs if it's the SETG of a spline; otherwise,
+    # it may be a set of modes or aero boxes, which aren't renumbered
+    node_set_ids = {spline.setg for spline in model.splines.values()
+                    if hasattr(spline, 'setg')}
+    _remap_card_fields(cards, id_maps, node_set_ids)
+
+    types_to_remap = {}  # type: Dict[str, str]
+    for name, key in CARD_GROUPS:
+        if key not in id_maps:
+            continue
+        group = getattr(model, name)
+        for card in _iter_cards(group):
+            types_to_remap[card.type] = key
+        if isinstance(group, NodeStore):
+            types_to_remap['GRID'] = key
+            group.objects = _rekey(group.objects, id_maps[key], key)
+        elif isinstance(group, ElementStore):
+            for table_name in group.tables:
+                types_to_remap[PROXY_CLASSES[table_name].type] = key
+            group.objects = _rekey(group.objects, id_maps[key], key)
+        else:
+            setattr(model, name, _rekey(group, id_maps[key], key))
+
+    type_to_id_map = model._type_to_id_map
+    for card_type, key in types_to_remap.items():
+        if card_type in type_to_id_map:
+            ids = _remap(type_to_id_map[card_type], id_maps[key], key, strict=False)
+            type_to_id_map[card_type] = ids.tolist()
+    model._adjacency = None
+
+    unsupported_groups = [name for name in UNSUPPORTED_GROUPS if getattr(model, name, None)]
+    if unsupported_groups:
+        model.log.warning('renumber_arrays: the ids of %s are not updated' % unsupported_groups)
+    return id_maps
+
+
+def get_node_ordering(model: BDF, node_ordering: str='rcm') -> np.ndarray:
+    """
+    Gets the GRID ids in the order that they're renumbered
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    node_ordering : str; default='rcm'
+        sorted : the order of the ids
+        rcm : reverse Cuthill-McKee, which reduces the bandwidth of the
+              node graph of the elements and rigid elements
+
+    Returns
+    -------
+    nids : (nnodes, ) int ndarray
+        the GRID ids
+
+    """
+    nids = _get_grid_ids(model)
+    if node_ordering == 'sorted':
+        return nids
+    elif node_ordering == 'rcm':
+        graph = _get_node_graph(model, nids)
+        if graph.nnz == 0:
+            return nids
+        return nids[reverse_cuthill_mckee(graph, symmetric_mode=True)]
+    raise ValueError("node_ordering=%r and must be 'sorted' or 'rcm'" % node_ordering)
+
+
+def get_node_bandwidth(model: BDF) -> int:
+    """
+    Gets the bandwidth of the node graph (i.e., the largest difference of
+    the indices of the sorted GRID ids of an element or rigid element)
+    """
+    nids = _get_grid_ids(model)
+    graph = _get_node_graph(model, nids).tocoo()
+    if graph.nnz == 0:
+        return 0
+    return int(np.abs(graph.row - graph.col).max())
+
+
+def _get_grid_ids(model: BDF) -> np.ndarray:
+    """gets the sorted GRID ids"""
+    nodes = model.nodes
+    if isinstance(nodes, NodeStore):
+        nodes.compress()
+        nids = np.hstack([nodes.nids.astype('int64'),
+                          np.array(list(nodes.objects), dtype='int64')])
+    else:
+        nids = np.array(list(nodes), dtype='int64')
+    return np.sort(nids)
+
+
+def _get_node_graph(model: BDF, nids: np.ndarray) -> scipy.sparse.csr_matrix:
+    """
+    Gets the (nnodes, nnodes) connectivity of the GRIDs of the elements and
+    rigid elements; the SPOINTs/EPOINTs are skipped
+    """
+    adjacency = model.get_adjacency()
+    offsets = adjacency.element_node_offsets
+    nelements = len(offsets) - 1
+    rows = [np.repeat(np.arange(nelements), np.diff(offsets)), ]
+    cols = [adjacency.element_nodes.astype('int64')]
+
+    rigid_rows = []
+    rigid_nids = []
+    for irigid, elem in enumerate(model.rigid_elements.values()):
+        rigid_nidsi = [nid for nid in elem.independent_nodes + elem.dependent_nodes
+                       if nid is not None]
+        rigid_rows.extend([nelements + irigid] * len(rigid_nidsi))
+        rigid_nids.extend(rigid_nidsi)
+    rows.append(np.array(rigid_rows, dtype='int64'))
+    cols.append(np.array(rigid_nids, dtype='int64'))
+    rows = np.hstack(rows)
+    cols = np.hstack(cols)
+    nrows = nelements + len(model.rigid_elements)
+
+    inode = np.searchsorted(nids, cols)
+    is_grid = inode < len(nids)
+    is_grid[is_grid] = nids[inode[is_grid]] == cols[is_grid]
+    element_node = scipy.sparse.coo_matrix(
+        (np.ones(is_grid.sum(), dtype='int32'), (rows[is_grid], inode[is_grid])),
+        shape=(nrows, len(nids))).tocsr()
+    return (element_node.T @ element_node).tocsr()
+
+
+def _get_nid_map(model: BDF, nid: int, node_ordering: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the node map; the new GRID ids skip the SPOINT/EPOINT ids, which
+    aren't renumbered
+    """
+    nids, new_nids = _get_grid_id_map(model, nid, node_ordering)
+    points = np.array(list(chain(model.spoints, model.epoints)), dtype='int64')
+    old_ids = np.hstack([nids, points])
+    new_ids = np.hstack([new_nids, points])
+    _check_unique(old_ids, 'nid')
+    isort = np.argsort(old_ids)
+    return old_ids[isort], new_ids[isort]
+
+
+def _get_grid_id_map(model: BDF, nid: int, node_ordering: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the old GRID ids in the renumbering order and the new ids; the new
+    ids skip the SPOINT/EPOINT ids
+    """
+    nids = get_node_ordering(model, node_ordering)
+    points = np.array(list(chain(model.spoints, model.epoints)), dtype='int64')
+    new_nids = np.arange(nid, nid + len(nids) + len(points), dtype='int64')
+    new_nids = new_nids[~np.isin(new_nids, points)][:len(nids)]
+    return nids, new_nids
+
+
+def _get_lseq_excite_ids(model: BDF) -> Iterator[int]:
+    """gets the excite ids of the LSEQ cards"""
+    for card in _iter_cards(model.load_combinations):
+        if card.type == 'LSEQ':
+            yield card.excite_id
+
+
+def _get_id_map(old_ids: List[int], start: int, key: str) -> Tuple[np.ndarray, np.ndarray]:
+    """gets the sorted old ids and the new ids, which are in the order of old_ids"""
+    old_ids = np.array(old_ids, dtype='int64')
+    _check_unique(old_ids, key)
+    new_ids = start + np.arange(len(old_ids), dtype='int64')
+    isort = np.argsort(old_ids)
+    return old_ids[isort], new_ids[isort]
+
+
+def _check_unique(ids: np.ndarray, key: str) -> None:
+    """the old ids of a key must be unique (e.g., a CONM2 can't have the id of a CQUAD4)"""
+    uids, counts = np.unique(ids, return_counts=True)
+    if len(uids) != len(ids):
+        raise RuntimeError('%s=%s are duplicated' % (key, uids[counts > 1].tolist()))
+
+
+def _remap(ids: Any, id_map: Tuple[np.ndarray, np.ndarray], key: str,
+           strict: bool=True) -> np.ndarray:
+    """
+    Maps the ids; the ids less than 1 (e.g., a blank, cd=-1) aren't changed
+
+    Parameters
+    ----------
+    ids : (n, ...) int ndarray / List[int]
+        the ids
+    id_map : (old_ids, new_ids)
+        the sorted old ids and the new ids
+    key : str
+        the key of the ids (e.g., nid) for the error message
+    strict : bool; default=True
+        True : an id that isn't in old_ids raises a KeyError
+        False : an id that isn't in old_ids isn't changed
+
+    """
+    old_ids, new_ids = id_map
+    ids = np.array(ids, dtype='int64')
+    is_id = ids > 0
+    values = ids[is_id]
+    if len(old_ids) == 0:
+        i = np.zeros(len(values), dtype='int64')
+        is_found = np.zeros(len(values), dtype='bool')
+    else:
+        i = np.searchsorted(old_ids, values)
+        is_found = i < len(old_ids)
+        is_found[is_found] = old_ids[i[is_found]] == values[is_found]
+    if strict and not is_found.all():
+        raise KeyError('%s=%s are not defined' % (key, np.unique(values[~is_found]).tolist()))
+    values[is_found] = new_ids[i[is_found]]
+    ids[is_id] = values
+    return ids
+
+
+def _remap_node_store(nodes: NodeStore, id_maps: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+    """remaps the nid/cp/cd of the GRID arrays and sorts them by the new ids"""
+    nid_cp_cd = nodes.nid_cp_cd.astype('int64')
+    if 'nid' in id_maps:
+        nid_cp_cd[:, 0] = _remap(nid_cp_cd[:, 0], id_maps['nid'], 'nid')
+        nodes.comments = _rekey(nodes.comments, id_maps['nid'], 'nid')
+    if 'cid' in id_maps:
+        nid_cp_cd[:, 1:] = _remap(nid_cp_cd[:, 1:], id_maps['cid'], 'cid')
+    isort = np.argsort(nid_cp_cd[:, 0], kind='stable')
+    nodes.nid_cp_cd = nid_cp_cd[isort].astype(_get_int_dtype(nid_cp_cd))
+    nodes.xyz = nodes.xyz[isort]
+    nodes.ps = nodes.ps[isort]
+    nodes.seid = nodes.seid[isort]
+    nodes._proxies = {}
+    nodes._transforms = None
+
+
+def _remap_element_store(elements: ElementStore,
+                         id_maps: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+    """remaps the eid/pid/nodes/mcid of the element tables and sorts them by the new ids"""
+    columns = [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('mcid', 'cid')]
+    for table in elements.tables.values():
+        for name, key in columns:
+            if name in table and key in id_maps:
+                values = _remap(table[name], id_maps[key], key)
+                table[name] = values.astype(_get_int_dtype(values))
+        isort = np.argsort(table['eid'], kind='stable')
+        for name, values in table.items():
+            table[name] = values[isort]
+    if 'eid' in id_maps:
+        elements.comments = _rekey(elements.comments, id_maps['eid'], 'eid')
+    elements._proxies = {}
+    elements._update_index()
+
+
+def _remap_card_fields(cards: Iterator[Any],
+                       id_maps: Dict[str, Tuple[np.ndarray, np.ndarray]],
+                       node_set_ids: Set[int], strict: bool=True) -> List[str]:
+    """
+    Gathers the id fields of the cards, remaps them and scatters them back
+
+    The cards of a type in ``CARD_ID_FIELDS`` have the same id fields, so
+    a field (e.g., the nodes of the CQUAD4s) is remapped as a column.
+
+    Parameters
+    ----------
+    cards : Iterator[card]
+        the cards to remap
+    id_maps : Dict[key] = (old_ids, new_ids)
+        the sorted old ids and the new ids of the keys to remap
+    node_set_ids : Set[int]
+        the ids of the SET1s that are GRIDs
+    strict : bool; default=True
+        True : an unsupported card or an id that isn't in old_ids raises
+        (except for the ``UNCHECKED_FIELDS``)
+        False : the unsupported cards and the missing ids aren't changed
+
+    Returns
+    -------
+    unsupported_types : List[str]
+        the sorted card types that aren't remapped (strict=False)
+
+    """
+    type_to_cards = defaultdict(list)  # type: Dict[str, List[Any]]
+    fields = []  # type: List[Tuple[Any, Any, str]]
+    unsupported_types = set()
+    for card in cards:
+        card_type = card.type
+        if card_type in CARD_ID_FIELDS:
+            type_to_cards[card_type].append(card)
+            continue
+        try:
+            card_fields = _get_card_id_fields(card, node_set_ids)
+        except KeyError:
+            unsupported_types.add(card_type)
+            continue
+        fields.extend(field for field in card_fields if field[2] in id_maps)
+    if unsupported_types and strict:
+        raise NotImplementedError('renumbering %s is not supported' % sorted(unsupported_types))
+
+    # the ids are remapped before any card is changed, so a KeyError
+    # doesn't leave the model half renumbered
+    columns = []  # type: List[Tuple[List[Any], str, List[Any]]]
+    for card_type, cards_list in type_to_cards.items():
+        for name, key in CARD_ID_FIELDS[card_type]:
+            if key not in id_maps:
+                continue
+            values = [getattr(card, name) for card in cards_list]
+            if all(value is None or type(value) is float for value in values):
+                # no ids (e.g., the theta of a CQUAD4)
+                continue
+            column = _get_id_column(values)
+            stricti = strict and name not in UNCHECKED_FIELDS
+            if column is None:
+                fields.extend((card, name, key) for card in cards_list)
+            else:
+                new_values = _remap(column, id_maps[key], key, strict=stricti).tolist()
+                columns.append((cards_list, name, new_values))
+
+    ids = defaultdict(list)  # type: Dict[Tuple[str, bool], List[int]]
+    for obj, name, key in fields:
+        stricti = strict and name not in UNCHECKED_FIELDS
+        ids[(key, stricti)].extend(_get_ids(_get_field(obj, name)))
+    new_ids = {(key, stricti): iter(_remap(idsi, id_maps[key], key, strict=stricti).tolist())
+               for (key, stricti), idsi in ids.items()}
+
+    for cards_list, name, new_values in columns:
+        for card, value in zip(cards_list, new_values):
+            setattr(card, name, value)
+    for obj, name, key in fields:
+        stricti = strict and name not in UNCHECKED_FIELDS
+        value = _set_ids(_get_field(obj, name), new_ids[(key, stricti)])
+        if isinstance(obj, (list, dict)):
+            obj[name] = value
+        else:
+            setattr(obj, name, value)
+    return sorted(unsupported_types)
+
+
+def _get_id_column(values: List[Any]) -> Optional[np.ndarray]:
+    """
+    Gets the ids of a field of the cards as an int array, if the field is
+    an id or a list of ids with the same length for all the cards
+    (e.g., the nodes of the CQUAD4s); otherwise, None
+    """
+    if not values:
+        return None
+    value_type = type(values[0])
+    if value_type not in (int, list) or any(type(value) is not value_type for value in values):
+        return None
+    if value_type is list and len({len(value) for value in values}) != 1:
+        return None
+    column = np.array(values)
+    if column.dtype.kind != 'i' or column.ndim != (1 if value_type is int else 2):
+        return None
+    return column
+
+
+def _get_card_id_fields(card: Any, node_set_ids: Set[int]) -> List[Tuple[Any, Any, str]]:
+    """gets the (object, attribute/index, key) of the id fields of a card"""
+    card_type = card.type
+    if card_type in ('SPOINT', 'EPOINT', 'DESVAR', 'DCONSTR', 'DCONADD', 'DLINK'):
+        return []
+    elif card_type == 'SET1':
+        return [(card, 'ids', 'nid')] if card.sid in node_set_ids else []
+    elif card_type == 'SET3':
+        key = {'GRID' : 'nid', 'POINT' : 'nid', 'ELEMENT' : 'eid', 'PROP' : 'pid',
+               'RBEIN' : 'rigid_eid', 'RBEEX' : 'rigid_eid'}[card.desc]
+        return [(card, 'ids', key)]
+    elif card_type == 'RSSCON':
+        if card.rigid_type == 'ELEM':
+            return [(card, 'eid', 'eid'), (card, 'shell_eid', 'eid'), (card, 'solid_eid', 'eid')]
+        return [(card, 'eid', 'eid'), (card, 'shell_grids', 'nid'),
+                (card, 'a_solid_grids', 'nid'), (card, 'b_solid_grids', 'nid')]
+    elif card_type in ('DVPREL1', 'DVPREL2'):
+        return [(card, 'pid', 'mass_pid' if card.prop_type == 'PMASS' else 'pid')]
+    elif card_type in ('DVCREL1', 'DVCREL2'):
+        is_mass = card.element_type in ('CONM1', 'CONM2', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4')
+        return [(card, 'eid', 'mass_eid' if is_mass else 'eid')]
+    elif card_type == 'DRESP1':
+        return [(card, name, key) for name, key in _get_dresp1_fields(card)]
+    elif card_type == 'DRESP2':
+        return [(values, 0, 'nid') for (unused_iorder, name), values in card.params.items()
+                if name == 'DNODE']
+    return [(card, name, key) for name, key in CARD_ID_FIELDS[card_type]]
+
+
+def _get_dresp1_fields(dresp: Any) -> List[Tuple[str, str]]:
+    """gets the id fields of a DRESP1 (see ``DRESP1.cross_reference``)"""
+    response_type = dresp.response_type
+    if dresp.property_type == 'ELEM' or response_type == 'GPFORCE':
+        return [('atti', 'eid')]
+    elif dresp.property_type in DRESP_PROPERTIES or response_type in ('FRSTRE', 'ABSTRESS'):
+        return [('atti', 'pid')]
+    elif response_type in ('DISP', 'TDISP', 'TVELO', 'FRDISP', 'FRVELO', 'FRACCL',
+                           'PSDVELO', 'PSDACCL'):
+        return [('atti', 'nid')]
+    elif response_type == 'GPFORCP':
+        return [('atta', 'nid'), ('atti', 'nid')]
+    return []
+
+
+def _iter_cards(group: Any) -> Iterator[Any]:
+    """iterates over the cards of a model attribute (e.g., model.spcs)"""
+    if group is None:
+        return
+    elif isinstance(group, (NodeStore, ElementStore)):
+        group = group.objects
+    elif not isinstance(group, (dict, list)):
+        # a single card (e.g., GRDSET)
+        yield group
+        return
+    values = group.values() if isinstance(group, dict) else group
+    for value in values:
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def _get_field(obj: Any, name: Any) -> Any:
+    """gets an attribute of a card or an item of a list/dict"""
+    if isinstance(obj, (list, dict)):
+        return obj[name]
+    return getattr(obj, name)
+
+
+def _get_ids(value: Any) -> List[int]:
+    """gets the ids of a field (an id, a list of ids or a dict with id keys)"""
+    if isinstance(value, bool):
+        return []
+    elif isinstance(value, integer_types):
+        return [value]
+    elif isinstance(value, (list, tuple)):
+        return list(chain.from_iterable(_get_ids(valuei) for valuei in value))
+    elif isinstance(value, dict):
+        return _get_ids(list(value))
+    return []
+
+
+def _set_ids(value: Any, new_ids: Iterator[int]) -> Any:
+    """replaces the ids of a field in the order of ``_get_ids``"""
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, integer_types):
+        return next(new_ids)
+    elif isinstance(value, list):
+        return [_set_ids(valuei, new_ids) for valuei in value]
+    elif isinstance(value, tuple):
+        return tuple(_set_ids(valuei, new_ids) for valuei in value)
+    elif isinstance(value, dict):
+        return {_set_ids(keyi, new_ids): valuei for keyi, valuei in value.items()}
+    return value
+
+
+def _rekey(group: Any, id_map: Tuple[np.ndarray, np.ndarray], key: str) -> Any:
+    """maps the keys of a dictionary and sorts it by the new keys"""
+    if not isinstance(group, dict) or not group:
+        return group
+    keys = list(group)
+    new_keys = _remap(keys, id_map, key).tolist()
+    isort = np.argsort(new_keys, kind='stable')
+    return {new_keys[i]: group[keys[i]] for i in isort}
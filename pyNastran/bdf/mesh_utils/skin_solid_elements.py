@@ -4,7 +4,7 @@ defines:
 
 """
 from collections import defaultdict
-from copy import deepcopy
+import numpy as np
 
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
@@ -122,44 +122,26 @@ def get_solid_skin_faces(model):
            the face nids
 
     """
-    eid_faces = model.get_element_faces()
-    face_set = defaultdict(int)
+    adjacency = model.get_adjacency(rebuild=True)
+    ielement, ifaces, face_nodes = adjacency.get_element_faces(
+        adjacency.get_element_indices())
+    counts = np.bincount(ifaces, minlength=len(adjacency.faces))
+
+    # the sorted faces have the blanks first
+    sorted_faces = {}
     eid_set = defaultdict(list)
     face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
-        face_map[tface] = raw_face
-
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
-
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
+    eids = adjacency.eids[ielement].tolist()
+    for eid, iface, face in zip(eids, ifaces.tolist(), face_nodes.tolist()):
+        tface = sorted_faces.get(iface)
+        if tface is None:
+            tface = tuple(nid for nid in adjacency.faces[iface].tolist() if nid)
+            sorted_faces[iface] = tface
+        face_map[tface] = [nid for nid in face if nid]
+
+        # a face with 2 elements is an internal face
+        if counts[iface] != 2:
+            eid_set[tface].append(eid)
     return eid_set, face_map
 
 
@@ -4,7 +4,8 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    mass_properties, mass_properties_nsm, mass_properties_arrays)
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +164,52 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_properties_arrays(self):
+        """tests the vectorized mass properties against the element methods"""
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model.read_bdf(bdfname, xref=True)
+        model.params['WTMASS'].values[0] = 1.0
+
+        mass, cg, inertia, eids, element_mass, element_cg = mass_properties_arrays(
+            model, reference_point=None, sym_axis=None, scale=None)
+        assert np.array_equal(eids, sorted(model.elements)), eids
+        for eid, massi, cgi in zip(eids, element_mass, element_cg):
+            elem = model.elements[eid]
+            assert np.allclose(massi, elem.Mass()), 'eid=%s mass=%s expected=%s' % (
+                eid, massi, elem.Mass())
+            assert np.allclose(cgi, elem.Centroid()), 'eid=%s cg=%s expected=%s' % (
+                eid, cgi, elem.Centroid())
+        assert np.allclose(mass, element_mass.sum()), 'mass=%s' % mass
+
+        mass2, cg2, inertia2 = mass_properties(model)
+        mass3, cg3, inertia3 = mass_properties_nsm(model)
+        assert np.allclose(mass, mass2), 'mass=%s mass2=%s' % (mass, mass2)
+        assert np.allclose(mass, mass3), 'mass=%s mass3=%s' % (mass, mass3)
+        assert np.allclose(cg, cg2) and np.allclose(cg, cg3), 'cg=%s cg2=%s cg3=%s' % (cg, cg2, cg3)
+        assert np.allclose(inertia, inertia2), 'I=%s I2=%s' % (inertia, inertia2)
+        assert np.allclose(inertia, inertia3), 'I=%s I3=%s' % (inertia, inertia3)
+
+        # a subset of the elements
+        mass, cg, inertia, eids, element_mass, element_cg = mass_properties_arrays(
+            model, element_ids=[1, 3, 7])
+        assert np.array_equal(eids, [1, 3, 7]), eids
+        assert np.allclose(mass, element_mass.sum()), 'mass=%s' % mass
+        mass2 = mass_properties(model, element_ids=[1, 3, 7])[0]
+        assert np.allclose(mass, mass2), 'mass=%s mass2=%s' % (mass, mass2)
+
+    def test_mass_properties_arrays_gridb(self):
+        """the CQUAD4s on GRIDBs are calculated with the element methods"""
+        bdf_filename = os.path.join(PKG_PATH, '..', 'models', 'other', 'd07d2.bdf')
+        model = BDF(debug=None, log=None)
+        model.read_bdf(bdf_filename, xref=True)
+        mass, cg, unused_inertia, eids, element_mass = mass_properties_arrays(model)[:5]
+        assert len(eids) == 6, eids
+        for eid, massi in zip(eids, element_mass):
+            elem = model.elements[eid]
+            assert np.allclose(massi, elem.Mass()), 'eid=%s mass=%s expected=%s' % (
+                eid, massi, elem.Mass())
+        assert np.allclose(mass, element_mass.sum()), 'mass=%s' % mass
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
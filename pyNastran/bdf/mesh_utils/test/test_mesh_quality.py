@@ -9,9 +9,11 @@ from cpylog import SimpleLogger
 #test_path = os.path.join(root_path, 'bdf', 'test', 'unit')
 
 import pyNastran
-from pyNastran.bdf.bdf import read_bdf
+from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.mesh_utils.collapse_bad_quads import convert_bad_quads_to_tris
-from pyNastran.bdf.mesh_utils.delete_bad_elements import delete_bad_shells, get_bad_shells
+from pyNastran.bdf.mesh_utils.delete_bad_elements import (
+    delete_bad_shells, get_bad_shells, element_quality, element_quality_arrays,
+    tri_quality, quad_quality, get_min_max_theta, CHEXA_FACES)
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -323,6 +325,95 @@ class TestMeshQuality(unittest.TestCase):
         #assert len(model.elements) == 0, model.elements
         os.remove(bdf_filename)
 
+    def test_element_quality_arrays(self):
+        """the vectorized quality matches the element-by-element quality"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1.2, 1., 0.1])
+        model.add_grid(4, [0., 1.5, 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.2])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 1.])
+        model.add_ctria3(1, 1, [1, 2, 3])
+        model.add_ctria3(2, 1, [1, 2, 2])  # collapsed
+        model.add_cquad4(3, 1, [1, 2, 3, 4])
+        model.add_cquad4(4, 1, [1, 3, 2, 4])  # bowtie
+        model.add_chexa(5, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_conrod(6, 1, [1, 7])
+        model.add_celas2(7, 1000., [1, 2], c1=1, c2=1)
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, mid=1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+        inodes = np.array([[0, 1, 2], [0, 1, 1]])
+        quality = element_quality_arrays('CTRIA3', inodes, xyz_cid0, chunk_size=1)
+        for i, (n1, n2, n3) in enumerate(inodes):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                out = tri_quality(xyz_cid0[n1], xyz_cid0[n2], xyz_cid0[n3])
+            expected = np.array(out)[[0, 1, 2, 3, 4, 5, 6]]
+            actual = [quality[name][i] for name in [
+                'area', 'max_skew_angle', 'max_aspect_ratio', 'min_interior_angle',
+                'max_interior_angle', 'dideal_theta', 'min_edge_length']]
+            assert np.allclose(actual, expected, equal_nan=True), (actual, expected)
+
+        inodes = np.array([[0, 1, 2, 3], [0, 2, 1, 3]])
+        quality = element_quality_arrays('CQUAD4', inodes, xyz_cid0, chunk_size=1)
+        for i, inodesi in enumerate(inodes):
+            out = quad_quality(None, *xyz_cid0[inodesi])
+            actual = [quality[name][i] for name in [
+                'area', 'taper_ratio', 'area_ratio', 'max_skew_angle', 'max_aspect_ratio',
+                'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+                'min_edge_length', 'max_warp_angle']]
+            assert np.allclose(actual, out, equal_nan=True), (actual, out)
+
+        node_ids = list(range(1, 9))
+        nid_map = {nid : nid - 1 for nid in node_ids}
+        quality = element_quality_arrays('CHEXA', [range(8)], xyz_cid0)
+        min_theta, max_theta, dideal_theta, unused_min_edge_length = get_min_max_theta(
+            CHEXA_FACES, node_ids, nid_map, xyz_cid0)
+        assert np.allclose(quality['min_interior_angle'], min_theta)
+        assert np.allclose(quality['max_interior_angle'], max_theta)
+        assert np.allclose(quality['dideal_theta'], dideal_theta)
+        assert np.allclose(quality['min_edge_length'], np.sqrt(0.85))  # 3-7
+        assert np.isnan(quality['area'][0])
+
+        # the unsupported CELAS2 is last
+        quality = element_quality(model)
+        assert np.allclose(quality['min_edge_length'], [1., 0., 1., np.sqrt(1.05), np.sqrt(0.85), np.sqrt(3.), 0.])
+
+    def test_element_quality_unit_cube(self):
+        """a unit cube CHEXA has 90 degree interior angles"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 1.])
+        model.add_chexa(1, 1, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_psolid(1, mid=1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        quality = element_quality(model)
+        assert np.allclose(quality['min_interior_angle'], np.pi / 2), quality['min_interior_angle']
+        assert np.allclose(quality['max_interior_angle'], np.pi / 2), quality['max_interior_angle']
+        assert np.allclose(quality['dideal_theta'], 0.), quality['dideal_theta']
+        assert np.allclose(quality['min_edge_length'], 1.), quality['min_edge_length']
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+        node_ids = list(range(1, 9))
+        nid_map = {nid : nid - 1 for nid in node_ids}
+        min_theta, max_theta, dideal_theta, min_edge_length = get_min_max_theta(
+            CHEXA_FACES, node_ids, nid_map, xyz_cid0)
+        assert np.allclose([min_theta, max_theta], np.pi / 2), (min_theta, max_theta)
+        assert np.allclose(dideal_theta, 0.), dideal_theta
+        assert np.allclose(min_edge_length, 1.), min_edge_length
+
     def test_fix_bad_quads(self):
         """split high interior angle quads"""
         msg = [
@@ -1,6 +1,7 @@
 """various mesh_utils tests"""
 import os
 import unittest
+import tracemalloc
 from io import StringIO
 
 from docopt import DocoptExit
@@ -20,13 +21,16 @@ from pyNastran.bdf.mesh_utils.mirror_mesh import (
 from pyNastran.bdf.mesh_utils.mass_properties import (
     mass_properties, mass_properties_nsm)  #mass_properties_breakdown
 from pyNastran.bdf.mesh_utils.make_half_model import make_half_model
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_streaming
 from pyNastran.bdf.mesh_utils.utils import cmd_line
 from pyNastran.bdf.mesh_utils.find_closest_nodes import find_closest_nodes
 from pyNastran.bdf.mesh_utils.find_coplanar_elements import find_coplanar_triangles
 from pyNastran.bdf.mesh_utils.force_to_pressure import force_to_pressure
 from pyNastran.bdf.mesh_utils.free_edges import free_edges, non_paired_edges
+from pyNastran.bdf.mesh_utils.skin_solid_elements import get_solid_skin_faces
+from pyNastran.bdf.mesh_utils.extract_bodies import extract_bodies
 from pyNastran.bdf.mesh_utils.get_oml import get_oml_eids
+from pyNastran.bdf.mesh_utils.validate_xref import validate_xref
 
 from pyNastran.bdf.mesh_utils.mesh import create_structured_cquad4s, create_structured_chexas
 
@@ -111,6 +115,82 @@ class TestMeshUtils(unittest.TestCase):
         assert edges1 == [(1, 2), (2, 3),         (3, 4), (1, 4), (3, 5), (1, 5)], edges1
         assert edges2 == [(1, 2), (2, 3), (1, 3), (3, 4), (1, 4), (3, 5), (1, 5)], edges2
 
+    def test_adjacency(self):
+        """tests the cached node/element adjacency index"""
+        log = SimpleLogger(level='warning')
+        model = BDF(log=log)
+        for nid in range(1, 15):
+            model.add_grid(nid, [float(nid), 0., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_cquad4(2, 1, [2, 5, 6, 3])
+        model.add_ctria3(3, 1, [3, 6, 7])
+        model.add_chexa(11, 2, [1, 2, 3, 4, 8, 9, 10, 11])
+        model.add_ctetra(12, 2, [8, 9, 10, 12])
+
+        adjacency = model.get_adjacency()
+        assert model.get_adjacency() is adjacency
+        assert adjacency.get_element_ids(3).tolist() == [1, 2, 3, 11]
+        assert adjacency.get_neighbor_ids(1, by='edge').tolist() == [2, 11]
+        assert adjacency.get_neighbor_ids(2, by='edge').tolist() == [1, 3, 11]
+        assert adjacency.get_neighbor_ids(11, by='face').tolist() == []
+        assert adjacency.get_neighbor_ids(12, by='node').tolist() == [11]
+        nid_to_eids_map = model.get_node_id_to_element_ids_map()
+        assert nid_to_eids_map[3] == [1, 2, 3, 11], nid_to_eids_map
+        assert nid_to_eids_map[13] == [], nid_to_eids_map
+
+        # the chexa/ctetra share 3 nodes, but not a face
+        eid_set, face_map = get_solid_skin_faces(model)
+        assert len(eid_set) == 10, eid_set
+        assert face_map[(1, 2, 3, 4)] == [1, 2, 3, 4], face_map
+
+        # adding an element rebuilds the index
+        model.add_ctria3(13, 1, [13, 14, 4])
+        adjacency2 = model.get_adjacency()
+        assert adjacency2 is not adjacency
+        assert adjacency2.get_element_ids(4).tolist() == [1, 11, 13]
+        maps = model._get_maps(consider_1d=False, consider_3d=False)
+        assert maps['eid_to_edge_map'][13] == [(13, 14), (4, 14), (4, 13)], maps['eid_to_edge_map']
+        assert maps['edge_to_eid_map'][(2, 3)] == {1, 2}, maps['edge_to_eid_map']
+        assert free_edges(model, eids=[1, 2]) == [
+            (1, 2), (3, 4), (1, 4), (2, 5), (5, 6), (3, 6)]
+
+        model.add_grid(20, [0., 0., 0.])
+        model.add_grid(21, [0., 0., 0.])
+        model.add_conrod(21, 1, [20, 21])
+        model.add_rbe2(22, 21, '123456', [1])
+        body_eids = extract_bodies(model)
+        assert len(body_eids) == 1, body_eids
+        assert body_eids[0][1].tolist() == [22], body_eids
+
+        del model.rigid_elements[22]
+        body_eids = extract_bodies(model)
+        assert len(body_eids) == 2, body_eids
+        assert body_eids[1][0].tolist() == [21], body_eids
+
+    def test_adjacency_equivalence(self):
+        """the node/element maps aren't stale after the nodes are changed"""
+        log = SimpleLogger(level='warning')
+        model = BDF(log=log)
+        for nid, x, y in [(1, 0., 0.), (2, 1., 0.), (3, 1., 1.), (4, 0., 1.),
+                          (5, 1., 0.), (6, 2., 0.), (7, 2., 1.), (8, 1., 1.)]:
+            model.add_grid(nid, [x, y, 0.])
+        model.add_cquad4(2, 1, [5, 6, 7, 8])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        assert model.get_node_id_to_element_ids_map()[5] == [2]
+        assert len(free_edges(model)) == 8
+
+        bdf_equivalence_nodes(model, None, 0.01)
+        nid_to_eids_map = model.get_node_id_to_element_ids_map()
+        assert nid_to_eids_map == {1: [1], 2: [2, 1], 3: [2, 1], 4: [1],
+                                   6: [2], 7: [2]}, nid_to_eids_map
+        assert len(free_edges(model)) == 6
+
+        model.add_cquad4(3, 1, [1, 2, 3, 9])
+        with self.assertRaises(KeyError):
+            model.get_node_id_to_element_ids_map()
+
     def test_free_faces(self):
         """CTETRA10"""
         #bdf free_faces [-d | -l] [-f] [--encoding ENCODE] BDF_FILENAME SKIN_FILENAME
@@ -283,6 +363,71 @@ class TestMeshUtils(unittest.TestCase):
         os.remove(bdf_filename_out2)
         os.remove(bdf_filename_out3)
 
+    def test_merge_streaming(self):
+        """merges the bdfs one at a time and checks it against bdf_merge"""
+        log = SimpleLogger(level='error')
+        bdf_filename1 = os.path.join(MODEL_PATH, 'bwb', 'bwb_saero.bdf')
+        bdf_filename2 = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        bdf_filename3 = os.path.join(MODEL_PATH, 'iSat', 'ISat_Dploy_Sm.dat')
+        bdf_filename_out1 = os.path.join(MODEL_PATH, 'bwb', 'BWBsaero_merge.out')
+        bdf_filename_out2 = os.path.join(MODEL_PATH, 'bwb', 'BWBsaero_merge_streaming.out')
+        bdf_filenames = [bdf_filename1, bdf_filename2, bdf_filename3]
+
+        for renumber in [False, True]:
+            unused_model, mappers1 = bdf_merge(
+                bdf_filenames, bdf_filename_out=bdf_filename_out1, renumber=renumber, log=log)
+            mappers2 = bdf_merge_streaming(
+                bdf_filenames, bdf_filename_out2, renumber=renumber, log=log)
+            model1 = read_bdf(bdf_filename_out1, log=log)
+            model2 = read_bdf(bdf_filename_out2, log=log)
+            self.assertEqual(model1.card_count, model2.card_count)
+            for nid, node in model1.nodes.items():
+                assert np.allclose(node.get_position(), model2.nodes[nid].get_position()), nid
+
+            mass1, cg1, inertia1 = mass_properties(model1)
+            mass2, cg2, inertia2 = mass_properties(model2)
+            self.assertAlmostEqual(mass1, mass2)
+            assert np.allclose(cg1, cg2)
+            assert np.allclose(inertia1, inertia2)
+
+            self.assertEqual(len(mappers1), len(mappers2))
+            for mapper1, mapper2 in zip(mappers1, mappers2):
+                self.assertEqual(mapper1['nodes'], mapper2['nodes'])
+                if not renumber:
+                    self.assertEqual(mapper1['elements'], mapper2['elements'])
+        os.remove(bdf_filename_out1)
+        os.remove(bdf_filename_out2)
+
+    def test_merge_streaming_ids(self):
+        """the starting ids of the decks skip the thermal materials"""
+        log = SimpleLogger(level='error')
+        bdf_filename1 = os.path.join(MODEL_PATH, 'elements', 'time_thermal_elements.bdf')
+        bdf_filename2 = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        for renumber in [False, True]:
+            bdf_file = StringIO()
+            mappers = bdf_merge_streaming([bdf_filename1, bdf_filename2], bdf_file,
+                                          renumber=renumber, log=log)
+            bdf_file.seek(0)
+            model = read_bdf(bdf_file, log=log)
+            mids = sorted(mappers[1]['materials'].values())
+            assert min(mids) > max(model.thermal_materials), mids
+            self.assertEqual(len(model.elements), len(mappers[0]['elements']) +
+                             len(mappers[1]['elements']))
+
+    def test_merge_streaming_memory(self):
+        """the memory of the streaming merge doesn't grow with the number of decks"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        peaks = []
+        for func, ndecks in [(bdf_merge_streaming, 2), (bdf_merge_streaming, 6), (bdf_merge, 6)]:
+            tracemalloc.start()
+            func([bdf_filename] * ndecks, StringIO(), log=log)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        peak_streaming2, peak_streaming6, peak_merge6 = peaks
+        assert peak_streaming6 < 2 * peak_streaming2, peaks
+        assert peak_streaming6 < 0.5 * peak_merge6, peaks
+
     def test_exit(self):
         """tests totally failing to run"""
         with self.assertRaises(SystemExit):
@@ -786,6 +931,58 @@ class TestMeshUtils(unittest.TestCase):
         ]
         pierce_shell_model(model, xyz_points)
 
+    def test_validate_xref(self):
+        """tests validate_xref"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.], cp=5)
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_cquad4(11, 2, [1, 2, 3, 40])
+        model.add_ctria3(12, 3, [1, 2, 30])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_pshell(2, mid1=20, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_rbe2(20, 1, '123456', [2, 50])
+        model.add_force(100, 60, 1., [1., 0., 0.])
+        model.add_load(101, 1., [1.], [100])
+        model.add_load(102, 1., [1.], [70])
+        model.add_spc1(200, '123', [1, 80])
+        model.add_spcadd(201, [200, 90])
+
+        missing = validate_xref(model)
+        assert sorted(missing) == ['coords', 'loads', 'materials', 'nodes',
+                                   'properties', 'spcs'], sorted(missing)
+        nodes = missing['nodes']
+        assert sorted(nodes) == ['CQUAD4', 'CTRIA3', 'FORCE', 'RBE2', 'SPC1'], sorted(nodes)
+        assert np.array_equal(nodes['CQUAD4'][0], [11]), nodes['CQUAD4']
+        assert np.array_equal(nodes['CQUAD4'][1], [40]), nodes['CQUAD4']
+        assert np.array_equal(nodes['CTRIA3'][1], [30]), nodes['CTRIA3']
+        assert np.array_equal(nodes['RBE2'][1], [50]), nodes['RBE2']
+        assert np.array_equal(nodes['FORCE'][1], [60]), nodes['FORCE']
+        assert np.array_equal(nodes['SPC1'][1], [80]), nodes['SPC1']
+        assert np.array_equal(missing['coords']['GRID'][0], [2])
+        assert np.array_equal(missing['coords']['GRID'][1], [5])
+        assert np.array_equal(missing['properties']['CTRIA3'][1], [3])
+        assert np.array_equal(missing['materials']['PSHELL'][0], [2])
+        assert np.array_equal(missing['materials']['PSHELL'][1], [20])
+        assert np.array_equal(missing['loads']['LOAD'][0], [102])
+        assert np.array_equal(missing['loads']['LOAD'][1], [70])
+        assert np.array_equal(missing['spcs']['SPCADD'][1], [90])
+
+        model.build_array_store()
+        missing2 = validate_xref(model)
+        assert sorted(missing2['nodes']) == sorted(nodes)
+        assert np.array_equal(missing2['nodes']['CQUAD4'][1], [40])
+
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        assert validate_xref(model) == {}
+        model = read_bdf(bdf_filename, array_store=True, log=log)
+        assert validate_xref(model) == {}
+
     #def test_intersect(self):
         #p0 = np.array([0,0,0], 'd')
         #p1 = np.array([1,0,0], 'd')
@@ -1201,6 +1398,64 @@ class TestEquiv(unittest.TestCase):
         node_ids = list(sorted(model.nodes))
         assert node_ids == [1], node_ids
 
+    def test_eq6(self):
+        """a chain of close nodes is merged into the lowest node id"""
+        log = SimpleLogger(level='error')
+        bdf_filename_out = os.path.join(DIRNAME, 'eq6.bdf')
+        for chunk_size, nworkers in [(None, 1), (2, 1), (2, 2)]:
+            model = BDF(log=log, debug=False)
+            # 1-3 and 3-2 are close; 1-2 aren't
+            model.add_grid(3, [0.15, 0., 0.])
+            model.add_grid(2, [0.3, 0., 0.])
+            model.add_grid(1, [0., 0., 0.])
+            model.add_grid(4, [1., 0., 0.])
+            model.add_grid(5, [1., 1., 0.])
+            model.add_grid(6, [0., 1., 0.])
+            model.add_grid(7, [0., 1.1, 0.])
+            model.add_cquad4(10, 1, [2, 4, 5, 7])
+            model.add_ctria3(11, 1, [3, 4, 6])
+            model.add_conrod(12, 1, [1, 7], A=1.0)
+            model.add_pshell(1, mid1=1, t=0.1)
+            model.add_mat1(1, 3.0e7, None, 0.3)
+            model.build_array_store()
+            model.nodes = model.nodes.to_dict()
+            model.cross_reference()
+
+            bdf_equivalence_nodes(model, bdf_filename_out, 0.2,
+                                  log=log, debug=False, method='new',
+                                  nworkers=nworkers, chunk_size=chunk_size)
+            assert model.elements.tables['CQUAD4']['nodes'].tolist() == [[1, 4, 5, 6]]
+            assert model.elements.tables['CTRIA3']['nodes'].tolist() == [[1, 4, 6]]
+            model2 = save_check_nodes(bdf_filename_out, log, nnodes=4)
+            assert model2.elements[12].node_ids == [1, 6], model2.elements[12]
+
+    def test_eq7(self):
+        """the GRIDs of a NodeStore and the nodes of the other cards are remapped"""
+        log = SimpleLogger(level='error')
+        for xref in [False, True]:
+            model = BDF(log=log, debug=False)
+            for nid, x in [(1, 0.), (2, 1.), (3, 1.), (4, 2.), (5, 1.), (6, 3.)]:
+                model.add_grid(nid, [x, 0., 0.])
+            model.add_conrod(10, 1, [1, 3], A=1.0)
+            model.add_conrod(11, 1, [5, 4], A=1.0)
+            model.add_conrod(12, 1, [4, 6], A=1.0)
+            model.add_force(100, 5, 1.0, [1., 0., 0.])
+            model.add_spc1(200, '123', [3, 6])
+            model.add_mat1(1, 3.0e7, None, 0.3)
+            model.build_array_store()
+            if xref:
+                model.cross_reference()
+
+            bdf_equivalence_nodes(model, None, 0.01, log=log, debug=False,
+                                  chunk_size=2, nworkers=2)
+            assert sorted(model.nodes) == [1, 2, 4, 6], model.nodes
+            assert model.nodes.nids.tolist() == [1, 2, 4, 6]
+            assert model.elements[10].node_ids == [1, 2]
+            assert model.elements[11].node_ids == [2, 4]
+            assert model.loads[100][0].node_id == 2
+            assert model.spcs[200][0].node_ids == [2, 6]
+            assert model._type_to_id_map['GRID'] == [1, 2, 4, 6]
+
 
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
@@ -5,7 +5,7 @@ import unittest
 import numpy as np
 
 
-from pyNastran.bdf.mesh_utils.remove_unused import remove_unused
+from pyNastran.bdf.mesh_utils.remove_unused import remove_unused, CardGraph
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CaseControlDeck, PARAM
@@ -64,6 +64,67 @@ class TestRemoveUnused(unittest.TestCase):
         model.write_bdf(bdf_filename_out)
         os.remove(bdf_filename_out)
 
+    def test_remove_graph(self):
+        """removes the cards that aren't reachable from the elements/subcases"""
+        model = _get_plate_model()
+        model.case_control_deck = CaseControlDeck(['SUBCASE 1', '  SPC = 1', '  LOAD = 3'])
+
+        graph = CardGraph(model)
+        self.assertEqual(graph.get_reason('mid', 100),
+                         'MAT1 mid=100 <- PSHELL pid=10 <- CQUAD4 eid=1')
+        self.assertEqual(graph.get_reason('cid', 8), 'CORD2R cid=8 <- GRID nid=1 <- CQUAD4 eid=1')
+        self.assertEqual(graph.get_reason('spc_id', 1), 'SPC1 spc_id=1 <- SUBCASE 1 SPC')
+        self.assertEqual(graph.get_reason('nid', 5), '')
+        self.assertEqual(graph.get_unused_ids('pid').tolist(), [11])
+        with self.assertRaises(KeyError):
+            graph.get_reason('nid', 42)
+
+        remove_unused(model)
+        self.assertEqual(sorted(model.nodes), [1, 2, 3, 4])
+        self.assertEqual(sorted(model.coords), [0, 8])
+        self.assertEqual(sorted(model.properties), [10])
+        self.assertEqual(sorted(model.materials), [100])
+        self.assertEqual(sorted(model.spcs), [1])
+        self.assertEqual(sorted(model.loads), [3])
+        self.assertEqual(model._type_to_id_map['GRID'], [1, 2, 3, 4])
+        model.cross_reference()
+
+    def test_remove_graph_no_case_control(self):
+        """the SPCs/loads of a model without case control are used"""
+        model = _get_plate_model()
+        remove_unused(model, remove_cids=False)
+        self.assertEqual(sorted(model.nodes), [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(model.coords), [0, 7, 8])
+        self.assertEqual(sorted(model.properties), [10])
+        self.assertEqual(sorted(model.spcs), [1, 2])
+        self.assertEqual(sorted(model.loads), [3, 4])
+        model.cross_reference()
+
+
+def _get_plate_model():
+    """
+    a CQUAD4 with an unused PSHELL/MAT1/CORD2R; GRID 5 is only used by
+    SPC 2 and FORCE 4
+    """
+    model = BDF(log=log)
+    model.add_cord2r(7, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+    model.add_cord2r(8, [1., 0., 0.], [1., 0., 1.], [2., 0., 0.])
+    model.add_grid(1, [0., 0., 0.], cp=8)
+    model.add_grid(2, [1., 0., 0.])
+    model.add_grid(3, [1., 1., 0.])
+    model.add_grid(4, [0., 1., 0.])
+    model.add_grid(5, [2., 0., 0.])
+    model.add_cquad4(1, 10, [1, 2, 3, 4])
+    model.add_pshell(10, mid1=100, t=0.1)
+    model.add_pshell(11, mid1=101, t=0.2)
+    model.add_mat1(100, 3.0e7, None, 0.3)
+    model.add_mat1(101, 1.0e7, None, 0.3)
+    model.add_spc1(1, '123456', [1, 2])
+    model.add_spc1(2, '123456', [5])
+    model.add_force(3, 3, 1.0, [0., 0., 1.])
+    model.add_force(4, 5, 1.0, [0., 0., 1.])
+    return model
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,9 +1,13 @@
 """tests bdf_renumber"""
 import os
 import unittest
+import numpy as np
+from io import StringIO
 from cpylog import SimpleLogger
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
+from pyNastran.bdf.mesh_utils.renumber_arrays import get_node_ordering, get_node_bandwidth
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 #from pyNastran.utils.dev import get_files_of_type
 
 import pyNastran
@@ -124,6 +128,127 @@ class TestRenumber(unittest.TestCase):
         read_bdf(bdf_filename_out2, log=log)
         read_bdf(bdf_filename_out3, log=log)
 
+    def test_renumber_array_01(self):
+        """renumbers a deck with the id arrays, which doesn't cross-reference"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'bwb', 'bwb_saero.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        mass1, cg1, inertia1 = mass_properties(model)
+
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        nelements = len(model.elements)
+        model, mapper = bdf_renumber(model, None, method='array',
+                                     starting_id_dict={'nid' : 101, 'eid' : 1001})
+        self.assertEqual(min(model.nodes), 101)
+        self.assertEqual(max(model.nodes), 100 + len(model.nodes))
+        self.assertEqual(sorted(model.elements), list(range(1001, 1001 + nelements)))
+        self.assertEqual(min(model.masses), 1001 + nelements)
+        self.assertEqual(mapper['nodes'][min(mapper['nodes'])], 101)
+
+        model.cross_reference()
+        mass2, cg2, inertia2 = mass_properties(model)
+        self.assertAlmostEqual(mass1, mass2)
+        assert np.allclose(cg1, cg2)
+        assert np.allclose(inertia1, inertia2)
+
+    def test_renumber_array_02(self):
+        """the array and xref methods renumber the same way"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Dploy_Sm.dat')
+        model1, mapper1 = bdf_renumber(read_bdf(bdf_filename, log=log), None)
+        model2, mapper2 = bdf_renumber(read_bdf(bdf_filename, xref=False, log=log), None,
+                                       method='array')
+        for key in ['nodes', 'coords', 'properties', 'materials']:
+            self.assertEqual(mapper1[key], mapper2[key], msg=key)
+        elements1 = {elem.eid : elem for elem in model1.elements.values()}
+        for eid, elem in model2.elements.items():
+            self.assertEqual(elem.node_ids, elements1[eid].node_ids)
+
+    def test_renumber_array_models(self):
+        """the renumbered decks can be cross-referenced"""
+        log = SimpleLogger(level='error')
+        bdf_filenames = [
+            os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf'),
+            os.path.join(MODEL_PATH, 'elements', 'time_thermal_elements.bdf'),
+            os.path.join(MODEL_PATH, 'elements', 'freq_elements.bdf'),
+            os.path.join(MODEL_PATH, 'thermal', 'thermal_elements.bdf'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf'),
+            os.path.join(MODEL_PATH, 'plate', 'plate.bdf'),
+            os.path.join(MODEL_PATH, 'aero', 'aerobeam.bdf'),
+        ]
+        for bdf_filename in bdf_filenames:
+            model = read_bdf(bdf_filename, xref=False, log=log)
+            nnodes = len(model.nodes)
+            bdf_file = StringIO()
+            bdf_renumber(model, bdf_file, method='array')
+            bdf_file.seek(0)
+            model2 = read_bdf(bdf_file, punch=model.punch, log=log)
+            self.assertEqual(sorted(model2.nodes), list(range(1, nnodes + 1)), msg=bdf_filename)
+
+        # the TLOAD1 excite_id is a TEMPBC, which isn't renumbered
+        model = read_bdf(bdf_filenames[1], xref=False, log=log)
+        bdf_renumber(model, None, method='array')
+        tload1 = [load for loads in model.dload_entries.values() for load in loads
+                  if load.type == 'TLOAD1'][0]
+        self.assertEqual(tload1.excite_id, 300)
+
+    def test_renumber_array_store(self):
+        """the GRID/element proxies of a NodeStore/ElementStore can be renumbered"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model1, mapper1 = bdf_renumber(read_bdf(bdf_filename, log=log), None,
+                                       starting_id_dict={'nid' : 101, 'eid' : 1001})
+        model2 = read_bdf(bdf_filename, array_store=True, log=log)
+        grid = model2.nodes[min(model2.nodes)]
+        grid.comment = 'the first GRID'
+        model2, mapper2 = bdf_renumber(model2, None,
+                                       starting_id_dict={'nid' : 101, 'eid' : 1001})
+        self.assertEqual(mapper1['nodes'], mapper2['nodes'])
+        self.assertEqual(mapper1['elements'], mapper2['elements'])
+        self.assertEqual(grid.nid, 101)
+
+        # the ids of the stores change when they're compressed
+        model2.nodes.compress()
+        model2.elements.compress()
+        self.assertIs(model2.nodes[101], grid)
+        self.assertEqual(model2.nodes[101].comment, '$the first GRID\n')
+        elements1 = {elem.eid : elem for elem in model1.elements.values()}
+        for elem in model2.elements.values():
+            self.assertEqual(elem.node_ids, elements1[elem.eid].node_ids)
+
+        grid.nid = 102
+        with self.assertRaises(ValueError):
+            model2.nodes.compress()
+
+    def test_renumber_rcm(self):
+        """the reverse Cuthill-McKee ordering reduces the bandwidth of a plate"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        nx, ny = 8, 6
+        inids = np.random.RandomState(42).permutation((nx + 1) * (ny + 1)) + 1
+        nids = inids.reshape(ny + 1, nx + 1)
+        for j in range(ny + 1):
+            for i in range(nx + 1):
+                model.add_grid(int(nids[j, i]), [float(i), float(j), 0.])
+        eid = 1
+        for j in range(ny):
+            for i in range(nx):
+                model.add_cquad4(eid, 1, [int(nids[j, i]), int(nids[j, i+1]),
+                                          int(nids[j+1, i+1]), int(nids[j+1, i])])
+                eid += 1
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        bandwidth = get_node_bandwidth(model)
+        self.assertEqual(len(get_node_ordering(model, 'rcm')), len(model.nodes))
+        with self.assertRaises(ValueError):
+            get_node_ordering(model, 'cat')
+
+        model, unused_mapper = bdf_renumber(model, None, method='array', node_ordering='rcm')
+        self.assertLess(get_node_bandwidth(model), bandwidth)
+        model.cross_reference()
+        for elem in model.elements.values():
+            self.assertAlmostEqual(elem.Area(), 1.0)
+
     #def test_renumber_06(self):
         #dirname = os.path.join(UNIT_PATH, 'obscure')
         #bdf_filenames = get_files_of_type(dirname, extension='.bdf')
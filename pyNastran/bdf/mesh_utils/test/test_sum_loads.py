@@ -7,7 +7,8 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_loadcases)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -484,5 +485,54 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
 
+    def test_loads_sum_loadcases(self):
+        """tests summing multiple load cases with PLOAD4, PLOAD2, FORCE, LOAD"""
+        model = BDF(log=log, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_ctria3(2, 1, [2, 5, 3])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        model.add_pload4(10, [1], [2., 2., 2., 2.])
+        model.add_pload2(11, 3., [2])
+        model.add_force(12, 5, 4., [0., 0., 1.])
+        model.add_load(20, 1., [2., 1.], [10, 12])
+        model.add_load(21, 0.5, [2., 1.], [10, 11])
+        model.cross_reference()
+
+        p0 = array([0., 0., 0.])
+        loadcase_ids = [10, 11, 12, 20, 21]
+        forces, moments = sum_forces_moments_loadcases(model, p0, loadcase_ids)
+        forces_expected = array([
+            [0., 0., 2.],
+            [0., 0., 1.5],
+            [0., 0., 4.],
+            [0., 0., 8.],
+            [0., 0., 2.75],
+        ])
+        moments_expected = array([
+            [1., -1., 0.],
+            [0.5, -2., 0.],
+            [0., -8., 0.],
+            [2., -10., 0.],
+            [1.25, -2., 0.],
+        ])
+        assert np.allclose(forces, forces_expected), forces
+        assert np.allclose(moments, moments_expected), moments
+        for i, loadcase_id in enumerate(loadcase_ids):
+            F1, M1 = sum_forces_moments(model, p0, loadcase_id)
+            assert np.allclose(F1, forces[i, :]), 'F1=%s F=%s' % (F1, forces[i, :])
+            assert np.allclose(M1, moments[i, :]), 'M1=%s M=%s' % (M1, moments[i, :])
+
+        # only the PLOAD4
+        F2, M2 = sum_forces_moments_elements(model, p0, 20, [1], [], include_grav=False)
+        assert np.allclose(F2, [0., 0., 4.]), F2
+        assert np.allclose(M2, [2., -2., 0.]), M2
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,282 @@
+"""
+Finds the cards that reference missing cards (e.g., an element that
+references a missing node) without cross-referencing the model.
+
+ - missing = validate_xref(model)
+
+The ids of each reference (e.g., the element nodes) are gathered into
+arrays and checked against the sorted ids of the cards they reference
+with ``np.searchsorted``.  The elements come from
+``get_elements_properties_nodes_by_element_type``, so they're vectorized
+when the model uses ``read_bdf(..., array_store=True)``.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+import numpy as np
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.bdf_interface.array_store import ElementStore
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+MissingRefs = Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]]
+
+#: elements that reference a material (rather than a property)
+MATERIAL_ELEMENT_TYPES = {'CONROD', 'CTRIAX6'}
+
+#: the attributes of the load cards that hold node/element/coord ids
+LOAD_REF_ATTRS = {
+    'FORCE' : {'nodes' : ['node'], 'coords' : ['cid']},
+    'MOMENT' : {'nodes' : ['node'], 'coords' : ['cid']},
+    'FORCE1' : {'nodes' : ['node', 'g1', 'g2']},
+    'MOMENT1' : {'nodes' : ['node', 'g1', 'g2']},
+    'FORCE2' : {'nodes' : ['node', 'g1', 'g2', 'g3', 'g4']},
+    'MOMENT2' : {'nodes' : ['node', 'g1', 'g2', 'g3', 'g4']},
+    'PLOAD' : {'nodes' : ['nodes']},
+    'SLOAD' : {'nodes' : ['nodes']},
+    'SPCD' : {'nodes' : ['nodes']},
+    'PLOAD1' : {'elements' : ['eid']},
+    'PLOAD2' : {'elements' : ['eids']},
+    'PLOAD4' : {'elements' : ['eids'], 'nodes' : ['g1', 'g34'], 'coords' : ['cid']},
+    'GRAV' : {'coords' : ['cid']},
+    'ACCEL' : {'coords' : ['cid']},
+    'ACCEL1' : {'nodes' : ['nodes'], 'coords' : ['cid']},
+}
+
+
+def validate_xref(model: BDF) -> MissingRefs:
+    """
+    Finds the dangling references of the elements, masses, rigid elements,
+    properties, materials, coords, loads and SPC/MPCs
+
+    Parameters
+    ----------
+    model : BDF
+        the model; cross-referencing isn't required
+
+    Returns
+    -------
+    missing : Dict[ref_type][card_type] = (card_ids, ref_ids)
+        ref_type : str
+            the type of the missing card
+            (nodes, ringaxs, coords, elements, properties, properties_mass,
+            materials, loads, spcs, mpcs)
+        card_type : str
+            the card with the dangling reference (e.g., CQUAD4, CTETRA10)
+        card_ids : (n, ) int ndarray
+            the card ids (e.g., the eids or the load ids), which are
+            repeated for each missing reference
+        ref_ids : (n, ) int ndarray
+            the missing ids
+        an empty dictionary means all the references are valid
+
+    .. code-block:: python
+
+       >>> missing = validate_xref(model)
+       >>> missing['nodes']['CQUAD4']
+       (array([10, 10, 11]), array([101, 102, 102]))
+
+    """
+    refs = defaultdict(lambda: defaultdict(list))
+    _get_node_refs(model, refs)
+    _get_element_refs(model, refs)
+    _get_mass_refs(model, refs)
+    _get_rigid_element_refs(model, refs)
+    _get_property_refs(model, refs)
+    _get_load_refs(model, refs)
+    _get_constraint_refs(model, refs)
+
+    valid_ids = {
+        'nodes' : [model.nodes, model.spoints, model.epoints, model.gridb],
+        'ringaxs' : [model.ringaxs],
+        'coords' : [model.coords],
+        'elements' : [model.elements],
+        'properties' : [model.properties],
+        'properties_mass' : [model.properties_mass],
+        'materials' : [model.materials, model.thermal_materials,
+                       model.hyperelastic_materials],
+        'loads' : [model.loads, model.load_combinations],
+        'spcs' : [model.spcs],
+        'mpcs' : [model.mpcs],
+    }
+
+    missing = {}
+    for ref_type, card_type_refs in refs.items():
+        ids = [np.fromiter(cards, dtype='int64', count=len(cards))
+               for cards in valid_ids[ref_type]]
+        valid = np.unique(np.hstack(ids))
+        missing_type = {}
+        for card_type, card_refs in sorted(card_type_refs.items()):
+            card_ids, ref_ids = _stack_refs(card_refs)
+            imissing = ~_isin_sorted(ref_ids, valid)
+            if imissing.any():
+                card_ids = card_ids[imissing]
+                ref_ids = ref_ids[imissing]
+                isort = np.argsort(card_ids, kind='stable')
+                missing_type[card_type] = (card_ids[isort], ref_ids[isort])
+        if missing_type:
+            missing[ref_type] = missing_type
+    return missing
+
+
+def _isin_sorted(ids: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """is each id in the sorted valid ids?"""
+    if len(valid) == 0:
+        return np.zeros(len(ids), dtype='bool')
+    i = np.searchsorted(valid, ids)
+    i[i == len(valid)] = 0
+    return valid[i] == ids
+
+
+def _stack_refs(card_refs: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """combines the (card_ids, ref_ids) of a card type"""
+    card_ids = np.hstack([np.asarray(ids[0], dtype='int64') for ids in card_refs])
+    ref_ids = np.hstack([np.asarray(ids[1], dtype='int64') for ids in card_refs])
+    return card_ids, ref_ids
+
+
+def _add_card_refs(refs, ref_type: str, card_type: str,
+                   card_id: int, ref_ids: List[Any]) -> None:
+    """adds the references of a single card; None/0 are skipped"""
+    ref_ids = [ref_id for ref_id in ref_ids if ref_id]
+    if ref_ids:
+        refs[ref_type][card_type].append(([card_id] * len(ref_ids), ref_ids))
+
+
+def _get_attr_ids(card: Any, attrs: List[str]) -> List[Any]:
+    """gets the ids from int/list attributes"""
+    ids = []
+    for attr in attrs:
+        value = getattr(card, attr, None)
+        if isinstance(value, (list, tuple, np.ndarray)):
+            ids.extend(value)
+        else:
+            ids.append(value)
+    return ids
+
+
+def _get_node_refs(model: BDF, refs) -> None:
+    """GRID (cp/cd) and CORDx (rid/nodes)"""
+    if model.nodes:
+        nid_cp_cd = model.get_displacement_index_xyz_cp_cd(idtype='int64')[3]
+        nid_cp_cd = nid_cp_cd[np.isin(nid_cp_cd[:, 0], list(model.nodes)), :]
+        nids = nid_cp_cd[:, 0]
+        for icoord in [1, 2]:
+            cids = nid_cp_cd[:, icoord]
+            icid = cids > 0
+            refs['coords']['GRID'].append((nids[icid], cids[icid]))
+
+    for cid, coord in model.coords.items():
+        if coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
+            _add_card_refs(refs, 'nodes', coord.type, cid, [coord.g1, coord.g2, coord.g3])
+        elif coord.type in ['CORD2R', 'CORD2C', 'CORD2S']:
+            _add_card_refs(refs, 'coords', coord.type, cid, [coord.rid])
+
+
+def _get_element_refs(model: BDF, refs) -> None:
+    """Gets the element nodes/properties/materials"""
+    if not model.elements:
+        return
+    etypes_found = set()
+    output = model.get_elements_properties_nodes_by_element_type(
+        dtype='int64', stop_if_no_eids=True)
+    for etype, (eids, pids, nids) in output.items():
+        etypes_found.add(model.elements[eids[0]].type)
+        nnodes = nids.shape[1]
+        nids = nids.ravel()
+        inode = nids != 0
+        refs['nodes'][etype].append((np.repeat(eids, nnodes)[inode], nids[inode]))
+
+        # CONROD/CTRIAX6 are checked below
+        ipid = pids > 0
+        if ipid.any() and etype not in MATERIAL_ELEMENT_TYPES:
+            refs['properties'][etype].append((eids[ipid], pids[ipid]))
+
+    for etype in MATERIAL_ELEMENT_TYPES:
+        for eid in model._type_to_id_map.get(etype, []):
+            elem = model.elements[eid]
+            _add_card_refs(refs, 'materials', etype, eid, [elem.mid])
+
+    elements = model.elements
+    if isinstance(elements, ElementStore):
+        # the tables are in output
+        elements = elements.objects
+    for eid, elem in elements.items():
+        if elem.type in etypes_found:
+            continue
+        try:
+            nids = elem.node_ids
+        except (AttributeError, TypeError, RuntimeError):
+            nids = []
+        ref_type = 'ringaxs' if elem.type == 'CCONEAX' else 'nodes'
+        _add_card_refs(refs, ref_type, elem.type, eid, nids)
+        pid = getattr(elem, 'pid', None)
+        if (elem.type not in MATERIAL_ELEMENT_TYPES and elem.type != 'CHBDYP'
+                and isinstance(pid, integer_types)):
+            _add_card_refs(refs, 'properties', elem.type, eid, [pid])
+
+
+def _get_mass_refs(model: BDF, refs) -> None:
+    """CONM1, CONM2, CMASSx"""
+    for eid, mass in model.masses.items():
+        if mass.type in ['CONM1', 'CONM2']:
+            _add_card_refs(refs, 'nodes', mass.type, eid, [mass.nid])
+            if mass.cid != -1:
+                _add_card_refs(refs, 'coords', mass.type, eid, [mass.cid])
+        else:
+            _add_card_refs(refs, 'nodes', mass.type, eid, mass.nodes)
+            if mass.type in ['CMASS1', 'CMASS3']:
+                _add_card_refs(refs, 'properties_mass', mass.type, eid, [mass.pid])
+
+
+def _get_rigid_element_refs(model: BDF, refs) -> None:
+    """RBAR, RBE1, RBE2, RBE3, RROD, ..."""
+    for eid, elem in model.rigid_elements.items():
+        nids = elem.independent_nodes + elem.dependent_nodes
+        _add_card_refs(refs, 'nodes', elem.type, eid, nids)
+
+
+def _get_property_refs(model: BDF, refs) -> None:
+    """the materials of the properties"""
+    for pid, prop in model.properties.items():
+        if hasattr(prop, 'mid'):
+            mids = [prop.mid]
+        elif hasattr(prop, 'material_ids'):
+            mids = prop.material_ids
+        else:
+            continue
+        _add_card_refs(refs, 'materials', prop.type, pid, mids)
+
+
+def _get_load_refs(model: BDF, refs) -> None:
+    """the static loads and LOAD combinations"""
+    for sid, loads in model.loads.items():
+        for load in loads:
+            ref_attrs = LOAD_REF_ATTRS.get(load.type, {})
+            for ref_type, attrs in ref_attrs.items():
+                _add_card_refs(refs, ref_type, load.type, sid, _get_attr_ids(load, attrs))
+
+    for sid, load_combinations in model.load_combinations.items():
+        for load in load_combinations:
+            if load.type == 'LOAD':
+                _add_card_refs(refs, 'loads', load.type, sid, load.load_ids)
+
+
+def _get_constraint_refs(model: BDF, refs) -> None:
+    """SPC, SPC1, SPCADD, MPC, MPCADD"""
+    for spc_id, spcs in model.spcs.items():
+        for spc in spcs:
+            if spc.type in ['SPC', 'SPC1']:
+                _add_card_refs(refs, 'nodes', spc.type, spc_id, spc.nodes)
+    for spc_id, spcadds in model.spcadds.items():
+        for spcadd in spcadds:
+            _add_card_refs(refs, 'spcs', spcadd.type, spc_id, spcadd.sets)
+
+    for mpc_id, mpcs in model.mpcs.items():
+        for mpc in mpcs:
+            if mpc.type == 'MPC':
+                _add_card_refs(refs, 'nodes', mpc.type, mpc_id, mpc.nodes)
+    for mpc_id, mpcadds in model.mpcadds.items():
+        for mpcadd in mpcadds:
+            _add_card_refs(refs, 'mpcs', mpcadd.type, mpc_id, mpcadd.sets)
@@ -0,0 +1,507 @@
+"""
+Benchmarks the columnar card parsers against ``BDF.add_card``::
+
+    python -m pyNastran.bdf.test.benchmark_bdf
+    python -m pyNastran.bdf.test.benchmark_bdf model1.bdf model2.bdf
+    python -m pyNastran.bdf.test.benchmark_bdf --memory 1000000
+    python -m pyNastran.bdf.test.benchmark_bdf --snapshot 1000000
+    python -m pyNastran.bdf.test.benchmark_bdf --write 1000000
+    python -m pyNastran.bdf.test.benchmark_bdf --equivalence 1000000 10000000
+
+If no files are given, a set of small field, large field and free field
+cards is created for each card type.  The fixed field cards are split
+into fields with NumPy, while the free field cards are split with
+``to_fields``, so they gain less.
+
+The per-card time of ``BDF.add_card`` (to_fields, BDFCard, the card
+object and the model dictionaries) is compared to
+``parse_card_columns``, which creates the NumPy columns.
+
+The memory benchmark creates a CQUAD4 plate with ~1M elements and reports
+the traced memory per GRID/CQUAD4 (before and after cross-referencing) and
+per card of the array store (see ``BDF.build_array_store``).  The GRID,
+CQUAD4, CTRIA3 and CBAR objects only store the fields that aren't the
+class-level defaults and keep the *_ref attributes in ``__slots__``, which
+took the plate from 370 to 338 bytes/GRID and 482 to 426 bytes/CQUAD4
+(Python 3.11).
+
+The snapshot benchmark saves/loads the plate with ``write_bdf``/``read_bdf``,
+``save``/``load`` (pickle), ``export_hdf5_filename``/``load_hdf5_filename``
+(if h5py is installed) and ``save_snapshot``/``load_snapshot``.
+
+The write benchmark writes the GRIDs/CQUAD4s of the plate with
+``card.write_card`` and with the bulk writer (see ``write_mesh_bulk.py``).
+
+The equivalence benchmark finds the groups of coincident nodes of a
+random point cloud (10% of the points are doubled) with the kdtree
+search/union-find of ``bdf_equivalence_nodes`` (see ``bdf_equivalence.py``).
+The neq_max=4 query of method='old' is timed for comparison.
+
+"""
+import os
+import gc
+import sys
+import math
+import time
+import tempfile
+import tracemalloc
+from io import StringIO
+from typing import List, Dict, Tuple, Optional
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.field_writer import print_card
+from pyNastran.bdf.bdf_interface.columnar_cards import (
+    CARD_PARSERS, parse_card_columns, get_cards_lines)
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import write_card_dict
+from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree, _eq_nodes_find_clusters
+
+
+def _get_card_fields(card_name: str, i: int) -> List[object]:
+    """gets the fields of the i-th benchmark card"""
+    x = 0.1 * (i % 100)
+    y = 0.1 * (i // 100)
+    nids = [i + j + 1 for j in range(20)]
+    if card_name == 'GRID':
+        fields = ['GRID', i + 1, None, x, y, 0.]
+    elif card_name == 'CQUAD4':
+        fields = ['CQUAD4', i + 1, 1] + nids[:4]
+    elif card_name == 'CTRIA3':
+        fields = ['CTRIA3', i + 1, 1] + nids[:3] + [0.1]
+    elif card_name == 'CHEXA':
+        fields = ['CHEXA', i + 1, 1] + nids[:8]
+    elif card_name == 'CTETRA':
+        fields = ['CTETRA', i + 1, 1] + nids[:10]
+    elif card_name == 'CBAR':
+        fields = ['CBAR', i + 1, 1] + nids[:2] + [0., 1., 0.]
+    elif card_name == 'RBE2':
+        fields = ['RBE2', i + 1, nids[0], '123456'] + nids[1:9]
+    elif card_name == 'FORCE':
+        fields = ['FORCE', 1, i + 1, None, 1., x, y, 1.]
+    else:
+        assert card_name == 'PLOAD4', card_name
+        fields = ['PLOAD4', 1, i + 1, 1. + x]
+    return fields
+
+
+def get_benchmark_cards(ncards: int=20000, card_format: str='small') -> Dict[str, List[List[str]]]:
+    """
+    Creates the cards for each card type
+
+    Parameters
+    ----------
+    ncards : int; default=20000
+        the number of cards per card type
+    card_format : str; default='small'
+        small, large, free
+
+    Returns
+    -------
+    cards : Dict[card_name] = List[card_lines]
+        the lines of each card
+
+    """
+    cards = {}
+    for card_name in CARD_PARSERS:
+        cards_lines = []
+        for i in range(ncards):
+            fields = _get_card_fields(card_name, i)
+            if card_format == 'free':
+                sfields = ['' if field is None else str(field) for field in fields]
+                card_lines = [','.join(sfields[:9])] + [
+                    ',' + ','.join(sfields[j:j+8]) for j in range(9, len(sfields), 8)]
+            else:
+                size = 16 if card_format == 'large' else 8
+                card_lines = print_card(fields, size=size).rstrip('\n').split('\n')
+            cards_lines.append(card_lines)
+        cards[card_name] = cards_lines
+    return cards
+
+
+def _add_cards(card_name: str, cards_lines: List[List[str]]) -> BDF:
+    """parses the cards with ``BDF.add_card``"""
+    model = BDF(log=SimpleLogger(level='error'), debug=False)
+    for card_lines in cards_lines:
+        model.add_card(card_lines, card_name, is_list=False, has_none=False)
+    return model
+
+
+def benchmark_card_parsers(cards: Dict[str, List[List[str]]],
+                           nrepeat: int=3) -> Dict[str, Tuple[int, float, float]]:
+    """
+    Times ``BDF.add_card`` and ``parse_card_columns``
+
+    Parameters
+    ----------
+    cards : Dict[card_name] = List[card_lines]
+        the lines of each card
+    nrepeat : int; default=3
+        the best time of nrepeat parses is kept
+
+    Returns
+    -------
+    times : Dict[card_name] = (ncards, dt_add_card, dt_columns)
+        the time (in seconds) to parse the cards
+
+    """
+    times = {}
+    for card_name, cards_lines in cards.items():
+        if not cards_lines:
+            continue
+        dts = []
+        for func in [_add_cards, parse_card_columns]:
+            dt = []
+            for unused_i in range(nrepeat):
+                t0 = time.perf_counter()
+                func(card_name, cards_lines)
+                dt.append(time.perf_counter() - t0)
+            dts.append(min(dt))
+        times[card_name] = (len(cards_lines), dts[0], dts[1])
+    return times
+
+
+def get_memory_model(nelements: int=1000000) -> BDF:
+    """
+    Creates a flat CQUAD4 plate
+
+    Parameters
+    ----------
+    nelements : int; default=1000000
+        the approximate number of elements; nx = ny = ceil(sqrt(nelements))
+
+    Returns
+    -------
+    model : BDF
+        the model with nx*ny CQUAD4s, (nx+1)*(ny+1) GRIDs, a PSHELL and a MAT1
+
+    """
+    nx = int(math.ceil(nelements ** 0.5))
+    model = BDF(log=SimpleLogger(level='error'), debug=False)
+    _add_plate_nodes(model, nx)
+    _add_plate_elements(model, nx)
+    model.add_pshell(1, mid1=1, t=0.1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+    return model
+
+
+def _add_plate_nodes(model: BDF, nx: int) -> None:
+    """adds the (nx+1)*(nx+1) GRIDs of the plate"""
+    nid = 1
+    for j in range(nx + 1):
+        for i in range(nx + 1):
+            model.add_grid(nid, [float(i), float(j), 0.])
+            nid += 1
+
+
+def _add_plate_elements(model: BDF, nx: int) -> None:
+    """adds the nx*nx CQUAD4s of the plate"""
+    eid = 1
+    for j in range(nx):
+        for i in range(nx):
+            n1 = j * (nx + 1) + i + 1
+            model.add_cquad4(eid, 1, [n1, n1 + 1, n1 + nx + 2, n1 + nx + 1])
+            eid += 1
+
+
+def benchmark_memory(nelements: int=1000000) -> Dict[str, Tuple[int, int]]:
+    """
+    Measures the traced memory of a CQUAD4 plate
+
+    Parameters
+    ----------
+    nelements : int; default=1000000
+        the approximate number of elements
+
+    Returns
+    -------
+    memory : Dict[name] = (ncards, nbytes)
+        name : str
+            GRID, CQUAD4, xref (the *_ref attributes),
+            array_store (the GRIDs/CQUAD4s in a NodeStore/ElementStore)
+        ncards : int
+            the number of cards
+        nbytes : int
+            the memory that was added
+
+    """
+    nx = int(math.ceil(nelements ** 0.5))
+    model = BDF(log=SimpleLogger(level='error'), debug=False)
+    model.add_pshell(1, mid1=1, t=0.1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+
+    tracemalloc.start()
+    try:
+        nbytes0 = tracemalloc.get_traced_memory()[0]
+        _add_plate_nodes(model, nx)
+        nbytes1 = tracemalloc.get_traced_memory()[0]
+        _add_plate_elements(model, nx)
+        nbytes2 = tracemalloc.get_traced_memory()[0]
+        model.cross_reference()
+        nbytes3 = tracemalloc.get_traced_memory()[0]
+        model.build_array_store()
+        gc.collect()
+        nbytes4 = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    ncards = len(model.nodes) + len(model.elements)
+    memory = {
+        'GRID' : (len(model.nodes), nbytes1 - nbytes0),
+        'CQUAD4' : (len(model.elements), nbytes2 - nbytes1),
+        'xref' : (ncards, nbytes3 - nbytes2),
+        'array_store' : (ncards, nbytes4 - nbytes0),
+    }
+    return memory
+
+
+def benchmark_snapshot(nelements: int=1000000,
+                       dirname: Optional[str]=None) -> Dict[str, Tuple[float, float, int]]:
+    """
+    Times saving/loading a CQUAD4 plate
+
+    Parameters
+    ----------
+    nelements : int; default=1000000
+        the approximate number of elements
+    dirname : str; default=None -> a temporary directory
+        the directory for the files
+
+    Returns
+    -------
+    times : Dict[name] = (dt_save, dt_load, nbytes)
+        name : str
+            bdf, pickle, hdf5, snapshot, snapshot (no mmap),
+            snapshot (store), which saves an array store model
+        dt_save / dt_load : float
+            the time (in seconds) to save/load the model
+        nbytes : int
+            the size of the file
+
+    """
+    log = SimpleLogger(level='error')
+    model = get_memory_model(nelements)
+    with tempfile.TemporaryDirectory(dir=dirname) as tmp_dirname:
+        def _save_load(name: str, filename: str, save, load) -> None:
+            filename = os.path.join(tmp_dirname, filename)
+            t0 = time.perf_counter()
+            save(filename)
+            t1 = time.perf_counter()
+            model2 = load(filename)
+            t2 = time.perf_counter()
+            assert len(model2.elements) == len(model.elements), name
+            times[name] = (t1 - t0, t2 - t1, os.path.getsize(filename))
+
+        def _load_method(method_name: str, **kwargs):
+            def load(filename: str) -> BDF:
+                model2 = BDF(log=log, debug=False)
+                getattr(model2, method_name)(filename, **kwargs)
+                return model2
+            return load
+
+        times = {}  # type: Dict[str, Tuple[float, float, int]]
+        _save_load('bdf', 'model.bdf', model.write_bdf,
+                   lambda filename: read_bdf(filename, log=log, debug=False))
+        _save_load('pickle', 'model.obj', model.save, _load_method('load'))
+        try:
+            import h5py  # pylint: disable=unused-import
+        except ImportError:
+            pass
+        else:
+            _save_load('hdf5', 'model.h5', model.export_hdf5_filename,
+                       _load_method('load_hdf5_filename'))
+        _save_load('snapshot', 'model.snap', model.save_snapshot,
+                   _load_method('load_snapshot'))
+        _save_load('snapshot (no mmap)', 'model.snap', model.save_snapshot,
+                   _load_method('load_snapshot', mmap=False))
+
+        # the arrays don't need to be created
+        model.build_array_store()
+        _save_load('snapshot (store)', 'model.snap', model.save_snapshot,
+                   _load_method('load_snapshot'))
+    return times
+
+
+def benchmark_write(nelements: int=1000000) -> Dict[str, Tuple[float, float]]:
+    """
+    Times writing the GRIDs/CQUAD4s of a CQUAD4 plate
+
+    Parameters
+    ----------
+    nelements : int; default=1000000
+        the approximate number of elements
+
+    Returns
+    -------
+    times : Dict[name] = (dt_write_card, dt_bulk)
+        name : str
+            the field size (8, 16, 16 double) and the store
+            (dict, store)
+        dt_write_card / dt_bulk : float
+            the time (in seconds) to write the cards with
+            ``card.write_card``/``write_card_dict``
+
+    """
+    model = get_memory_model(nelements)
+    times = {}  # type: Dict[str, Tuple[float, float]]
+    for store in ['dict', 'store']:
+        if store == 'store':
+            model.build_array_store()
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            dt_write_card = 0.
+            dt_bulk = 0.
+            for cards in [model.nodes, model.elements]:
+                t0 = time.perf_counter()
+                text1 = ''.join(card.write_card(size, is_double)
+                                for unused_id, card in sorted(cards.items()))
+                t1 = time.perf_counter()
+                bdf_file = StringIO()
+                write_card_dict(bdf_file, cards, size, is_double)
+                t2 = time.perf_counter()
+                assert bdf_file.getvalue() == text1
+                dt_write_card += t1 - t0
+                dt_bulk += t2 - t1
+            name = '%s %s%s' % (store, size, ' double' if is_double else '')
+            times[name] = (dt_write_card, dt_bulk)
+    return times
+
+
+def get_equivalence_nodes(nnodes: int=1000000, tol: float=0.001,
+                          seed: int=0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Creates a random point cloud, where 10% of the points have a
+    duplicate within tol/10
+
+    Returns
+    -------
+    nids : (nnodes, ) int ndarray
+        the node ids
+    xyz : (nnodes, 3) float ndarray
+        the points
+
+    """
+    rng = np.random.default_rng(seed)
+    nduplicates = nnodes // 10
+    xyz = rng.random((nnodes - nduplicates, 3)) * nnodes ** (1. / 3.)
+    duplicates = xyz[:nduplicates, :] + tol / 10.
+    xyz = np.vstack([xyz, duplicates])
+    nids = np.arange(1, nnodes + 1, dtype='int32')
+    return nids, xyz
+
+
+def benchmark_equivalence(nnodes_list: List[int],
+                          tol: float=0.001) -> Dict[str, Tuple[float, float, int]]:
+    """
+    Times finding the coincident nodes
+
+    Parameters
+    ----------
+    nnodes_list : List[int]
+        the number of nodes of each point cloud
+    tol : float; default=0.001
+        the equivalence tolerance
+
+    Returns
+    -------
+    times : Dict[name] = (dt, peak_nbytes, nmerged)
+        name : str
+            the number of nodes and the method (k=4 query, pairs,
+            chunked pairs)
+        dt : float
+            the time (in seconds)
+        peak_nbytes : int
+            the peak traced memory
+        nmerged : int
+            the number of merged nodes; -1 for the k=4 query
+
+    """
+    times = {}  # type: Dict[str, Tuple[float, float, int]]
+    for nnodes in nnodes_list:
+        nids, xyz = get_equivalence_nodes(nnodes, tol)
+
+        def _query_k4():
+            kdt = _get_tree(xyz)
+            kdt.query(xyz, k=4, distance_upper_bound=tol)
+            return None, None
+
+        for name, func in [
+                ('k=4 query', _query_k4),
+                ('pairs', lambda: _eq_nodes_find_clusters(xyz, nids, tol)),
+                ('chunked pairs', lambda: _eq_nodes_find_clusters(
+                    xyz, nids, tol, nworkers=-1, chunk_size=1000000)), ]:
+            tracemalloc.start()
+            try:
+                t0 = time.perf_counter()
+                nids_merged, unused_nids_kept = func()
+                dt = time.perf_counter() - t0
+                peak_nbytes = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            nmerged = -1 if nids_merged is None else len(nids_merged)
+            times['%i %s' % (nnodes, name)] = (dt, peak_nbytes, nmerged)
+    return times
+
+
+def main(argv=None):  # pragma: no cover
+    """runs the benchmark"""
+    if argv is None:
+        argv = sys.argv
+    bdf_filenames = argv[1:]
+    if bdf_filenames and bdf_filenames[0] == '--memory':
+        nelements = int(bdf_filenames[1]) if len(bdf_filenames) > 1 else 1000000
+        memory = benchmark_memory(nelements)
+        print('%-11s %8s %10s %10s' % ('card', 'ncards', 'MB', 'bytes/card'))
+        for name, (ncards, nbytes) in memory.items():
+            print('%-11s %8i %10.1f %10.1f' % (name, ncards, nbytes / 1024**2, nbytes / ncards))
+        return
+    if bdf_filenames and bdf_filenames[0] == '--snapshot':
+        nelements = int(bdf_filenames[1]) if len(bdf_filenames) > 1 else 1000000
+        times = benchmark_snapshot(nelements)
+        print('%-18s %10s %10s %10s' % ('format', 'save (s)', 'load (s)', 'MB'))
+        for name, (dt_save, dt_load, nbytes) in times.items():
+            print('%-18s %10.2f %10.2f %10.1f' % (name, dt_save, dt_load, nbytes / 1024**2))
+        return
+
+    if bdf_filenames and bdf_filenames[0] == '--write':
+        nelements = int(bdf_filenames[1]) if len(bdf_filenames) > 1 else 1000000
+        times = benchmark_write(nelements)
+        print('%-16s %14s %10s %8s' % ('cards', 'write_card (s)', 'bulk (s)', 'speedup'))
+        for name, (dt_write_card, dt_bulk) in times.items():
+            print('%-16s %14.2f %10.2f %7.1fx' % (
+                name, dt_write_card, dt_bulk, dt_write_card / dt_bulk))
+        return
+
+    if bdf_filenames and bdf_filenames[0] == '--equivalence':
+        nnodes_list = [int(nnodes) for nnodes in bdf_filenames[1:]]
+        if not nnodes_list:
+            nnodes_list = [1000000, 10000000]
+        times = benchmark_equivalence(nnodes_list)
+        print('%-24s %10s %10s %10s' % ('nodes', 'time (s)', 'peak MB', 'nmerged'))
+        for name, (dt, peak_nbytes, nmerged) in times.items():
+            print('%-24s %10.2f %10.1f %10i' % (name, dt, peak_nbytes / 1024**2, nmerged))
+        return
+
+    if bdf_filenames:
+        log = SimpleLogger(level='error')
+        cards = {card_name: [] for card_name in CARD_PARSERS}
+        for bdf_filename in bdf_filenames:
+            cards_lines, unused_baror = get_cards_lines(bdf_filename, log=log)
+            for card_name, card_lines_list in cards_lines.items():
+                cards[card_name].extend(card_lines_list)
+        format_cards = {'bdf' : cards}
+    else:
+        format_cards = {card_format: get_benchmark_cards(card_format=card_format)
+                        for card_format in ['small', 'large', 'free']}
+
+    print('%-6s %-8s %8s %14s %14s %8s' % (
+        'format', 'card', 'ncards', 'add_card', 'columns', 'speedup'))
+    for card_format, cards in format_cards.items():
+        times = benchmark_card_parsers(cards)
+        for card_name, (ncards, dt_add_card, dt_columns) in times.items():
+            print('%-6s %-8s %8i %11.2f us %11.2f us %7.1fx' % (
+                card_format, card_name, ncards, dt_add_card / ncards * 1e6,
+                dt_columns / ncards * 1e6, dt_add_card / dt_columns))
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -3,6 +3,7 @@ import unittest
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, GRID
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 
 pkg_path = pyNastran.__path__[0]
 mesh_utils_path = os.path.join(pkg_path, 'bdf', 'mesh_utils', 'test')
@@ -131,6 +132,81 @@ class TestOpenMDAO(unittest.TestCase):
         model.update_card('GRID', 57, 4, 14.) # y
         str(node)
 
+    def test_openmdao_dirty_xref(self):
+        """only the updated/replaced cards are relinked"""
+        bdf_filename = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model = BDF(debug=False)
+        model.read_bdf(bdf_filename)
+        assert model._is_xref
+        assert len(model._xref_dirty) == 0
+
+        # updated in place
+        model.update_card('PSHELL', 2, 2, 10)  # mid1
+        model.update_card('PSHELL', 2, 3, 0.25)  # t
+        assert dict(model._xref_dirty) == {'properties' : {2}}, model._xref_dirty
+        assert len(model._xref_replaced) == 0
+        model.cross_reference(dirty_only=True)
+        assert model.properties[2].mid1_ref is model.materials[10]
+        assert len(model._xref_dirty) == 0
+
+        # replaced
+        replace_model = BDF(debug=False)
+        replace_model.add_pshell(3, mid1=2, t=0.5, mid2=None, mid3=None)
+        pshell = model.properties[3]
+        model.replace_cards(replace_model)
+        assert dict(model._xref_replaced) == {'properties' : {3}}, model._xref_replaced
+        assert model.elements[5].pid_ref is pshell
+        model.cross_reference(dirty_only=True)
+        assert model.elements[5].pid_ref is model.properties[3]
+        assert model.elements[6].pid_ref is model.properties[3]
+        assert model.elements[3].pid_ref is model.properties[2]
+
+        replace_model = BDF(debug=False)
+        replace_model.add_mat1(2, 3.0e7, None, 0.3)
+        mat1 = model.materials[2]
+        model.replace_cards(replace_model)
+        model.cross_reference(dirty_only=True)
+        assert model.properties[3].mid1_ref is not mat1
+        assert model.properties[3].mid1_ref is model.materials[2]
+        mass = mass_properties(model)[0]
+
+        model2 = BDF(debug=False)
+        model2.read_bdf(bdf_filename, xref=False)
+        model2.update_card('PSHELL', 2, 2, 10)
+        model2.update_card('PSHELL', 2, 3, 0.25)
+        model2.properties[3] = model.properties[3]
+        model2.materials[2] = model.materials[2]
+        model2.cross_reference()
+        assert mass == mass_properties(model2)[0]
+
+        # a new node relinks the model
+        model.add_grid(1000, [0., 0., 0.])
+        model.cross_reference(dirty_only=True)
+        assert model.nodes[1000].cp_ref is model.coords[0]
+
+        model.uncross_reference()
+        assert not model._is_xref
+        model.update_card('PSHELL', 2, 3, 0.3)
+        assert len(model._xref_dirty) == 0
+
+    def test_openmdao_dirty_xref_array_store(self):
+        """only the elements of a replaced property are relinked"""
+        bdf_filename = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model = BDF(debug=False)
+        model.read_bdf(bdf_filename, xref=False, array_store=True)
+        model.safe_cross_reference()
+        assert model._is_xref
+        model.elements._proxies.clear()
+
+        replace_model = BDF(debug=False)
+        replace_model.add_pshell(3, mid1=2, t=0.5, mid2=None, mid3=None)
+        model.replace_cards(replace_model)
+        model.cross_reference(dirty_only=True)
+        eids = sorted(model.elements._proxies)
+        assert eids == [eid for eid, elem in model.elements.items() if elem.pid == 3], eids
+        for eid in eids:
+            assert model.elements[eid].pid_ref is model.properties[3]
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -2,10 +2,18 @@ import os
 import unittest
 from io import StringIO
 
+import numpy as np
+
 from cpylog import get_logger
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.errors import DuplicateIDsError
 from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.array_store import NodeStore, ElementStore
+from pyNastran.bdf.bdf_interface.write_mesh_bulk import get_cards_text, write_card_dict
+from pyNastran.bdf.bdf_interface.write_mesh_parallel import _split_cards_by_file
+from pyNastran.bdf.bdf_interface.columnar_cards import (
+    parse_card_columns, read_card_columns, get_columns_from_cards)
 from pyNastran.bdf.bdf_interface.include_file import (
     split_filename_into_tokens, get_include_filename,
     PurePosixPath, PureWindowsPath,
@@ -513,6 +521,321 @@ class TestReadWrite(unittest.TestCase):
         model.read_bdf(bdf_filename)
         assert len(model.elements) == 0, len(model.elements)
 
+    def test_read_lazy(self):
+        """tests the nodes/elements/... are parsed when they're used"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, validate=False, xref=False, log=log)
+        model_lazy = read_bdf(bdf_filename, validate=False, xref=False, log=log, lazy=True)
+        assert 'elements' not in model_lazy.__dict__
+        assert 'CQUAD4' not in model_lazy.card_count
+
+        # only the CQUAD4s are parsed
+        eids = model_lazy.get_card_ids_by_card_types(['CQUAD4'])
+        assert eids == model.get_card_ids_by_card_types(['CQUAD4']), eids
+        assert 'CTRIA3' not in model_lazy.card_count
+        assert 'elements' not in model_lazy.__dict__
+
+        assert list(model_lazy.nodes) == list(model.nodes)
+        # the CQUAD4s were parsed first
+        assert sorted(model_lazy.elements) == sorted(model.elements)
+        assert 'materials' in dir(model_lazy)
+        model_lazy.load_lazy_cards()
+        assert model_lazy._lazy_cards is None
+        assert model_lazy.card_count == model.card_count
+
+        model.cross_reference()
+        model_lazy.cross_reference()
+        assert model_lazy.get_bdf_stats() == model.get_bdf_stats()
+        with self.assertRaises(NotImplementedError):
+            read_bdf(bdf_filename, xref=False, save_file_structure=True, log=log, lazy=True)
+
+    def test_read_parallel(self):
+        """tests the multi-process card parser matches the serial parser"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf'),
+            os.path.join(MODEL_PATH, 'aero', 'f16_ma41.bdf'),  # zona
+        ]
+        for bdf_filename in bdf_filenames:
+            model = read_bdf(bdf_filename, validate=False, xref=False, log=log)
+            model_parallel = read_bdf(bdf_filename, validate=False, xref=False, log=log,
+                                      nworkers=2)
+            assert model_parallel.card_count == model.card_count
+            assert model_parallel._type_to_id_map == model._type_to_id_map
+            for name in ['nodes', 'elements', 'properties', 'materials', 'coords']:
+                objs = getattr(model, name)
+                objs_parallel = getattr(model_parallel, name)
+                assert list(objs_parallel) == list(objs), name
+                for key, obj in objs.items():
+                    assert str(objs_parallel[key]) == str(obj), (name, key)
+
+        bdf_filename = os.path.join(TEST_PATH, 'duplicates.bdf')
+        with self.assertRaises(DuplicateIDsError):
+            read_bdf(bdf_filename, xref=False, log=log, nworkers=2)
+
+    def test_read_array_store(self):
+        """tests the array backed nodes/elements match the card objects"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        model_array = read_bdf(bdf_filename, log=log, array_store=True)
+        assert isinstance(model_array.nodes, NodeStore)
+        assert isinstance(model_array.elements, ElementStore)
+        assert sorted(model_array.elements) == sorted(model.elements)
+        assert model_array.get_bdf_stats() == model.get_bdf_stats()
+
+        out = model.get_displacement_index_xyz_cp_cd()
+        out_array = model_array.get_displacement_index_xyz_cp_cd()
+        for values, values_array in zip(out[2:], out_array[2:]):
+            assert np.array_equal(values, values_array)
+        assert np.allclose(model.get_xyz_in_coord_array()[1],
+                           model_array.get_xyz_in_coord_array()[1])
+
+        output = model.get_elements_properties_nodes_by_element_type()
+        output_array = model_array.get_elements_properties_nodes_by_element_type()
+        assert sorted(output) == sorted(output_array)
+        for etype, arrays in output.items():
+            isort = np.argsort(arrays[0])
+            for values, values_array in zip(arrays, output_array[etype]):
+                assert np.array_equal(values[isort], values_array), etype
+
+        nid_to_eids_map = model.get_node_id_to_element_ids_map()
+        nid_to_eids_map_array = model_array.get_node_id_to_element_ids_map()
+        assert sorted(nid_to_eids_map) == list(nid_to_eids_map_array)
+        for nid, eids in nid_to_eids_map.items():
+            assert sorted(eids) == sorted(nid_to_eids_map_array[nid]), nid
+
+        # the proxies write to the arrays
+        nid = min(model_array.nodes)
+        node = model_array.nodes[nid]
+        assert node is model_array.nodes[nid]
+        node.xyz[2] += 1.
+        assert model_array.nodes.xyz[0, 2] == node.xyz[2]
+        model.nodes[nid].xyz[2] += 1.
+
+        eid = model_array.get_card_ids_by_card_types(['CQUAD4'])['CQUAD4'][0]
+        model_array.elements[eid].pid = 42
+        model.elements[eid].pid = 42
+        model.elements[eid].pid_ref = None
+        model_array.elements[eid].pid_ref = None
+        assert str(model_array.elements[eid]) == str(model.elements[eid])
+
+        bdf_file = StringIO()
+        bdf_file_array = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_array.write_bdf(bdf_file_array, close=False)
+        assert bdf_file_array.getvalue() == bdf_file.getvalue()
+
+        model_array.nodes = model_array.nodes.to_dict()
+        model_array.elements = model_array.elements.to_dict()
+        assert str(model_array.nodes[nid]) == str(model.nodes[nid])
+        with self.assertRaises(NotImplementedError):
+            read_bdf(bdf_filename, xref=False, save_file_structure=True, log=log,
+                     array_store=True)
+
+    def test_snapshot(self):
+        """tests save_snapshot/load_snapshot"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        snapshot_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.snap')
+        model = read_bdf(bdf_filename, log=log)
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+
+        model.save_snapshot(snapshot_filename)
+        for mmap in [True, False]:
+            model2 = BDF(log=log)
+            model2.load_snapshot(snapshot_filename, mmap=mmap)
+            assert isinstance(model2.nodes, NodeStore)
+            assert isinstance(model2.elements, ElementStore)
+            assert model2.spcadds[2][0].sets == [1, 3]
+            bdf_file2 = StringIO()
+            model2.write_bdf(bdf_file2, close=False)
+            assert bdf_file2.getvalue() == bdf_file.getvalue()
+
+            # the arrays are copy-on-write
+            model2.cross_reference()
+            nid = min(model2.nodes)
+            model2.nodes[nid].xyz = [1., 2., 3.]
+            assert np.array_equal(model2.nodes.xyz[0], [1., 2., 3.])
+            model2.uncross_reference()
+
+        # saving an array store model
+        model2.save_snapshot(snapshot_filename)
+        model3 = BDF(log=log)
+        model3.load_snapshot(snapshot_filename)
+        assert np.array_equal(model3.nodes.xyz[0], [1., 2., 3.])
+        os.remove(snapshot_filename)
+
+        with self.assertRaises(RuntimeError):
+            model3.load_snapshot(bdf_filename)
+
+    def test_write_cards_bulk(self):
+        """tests the bulk writer matches write_card"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., -0., 1e-9], cp=1, cd=2)
+        model.add_grid(3, [1.123456789, 2.e10, -3.25], ps='123', seid=4)
+        model.add_grid(4, [1., 1., 0.], comment='grid')
+        model.add_grid(5, [0., 1., 1.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_cquad4(11, 1, [1, 2, 3, 4], T1=1., T2=1., T3=1., T4=1.)
+        model.add_cquad4(12, 1, [1, 2, 3, 4], theta_mcid=0)
+        model.add_cquad4(13, 1, [1, 2, 3, 4], theta_mcid=2, zoffset=0.1)
+        model.add_cquad4(14, 1, [1, 2, 3, 4], theta_mcid=45., tflag=1, T3=0.5)
+        model.add_cquad4(15, 1, [1, 2, 3, 4], zoffset=-0.25, comment='quad')
+        model.add_ctria3(20, 1, [1, 2, 3])
+        model.add_ctria3(21, 1, [1, 2, 3], theta_mcid=3, T2=2.)
+        model.add_ctria3(22, 1, [1, 2, 3], zoffset=1.5)
+        model.add_ctetra(30, 2, [1, 2, 3, 4])
+        model.add_ctetra(31, 2, [1, 2, 3, 4, 5, None, 7, 8, None, 10])
+        model.add_chexa(32, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(33, 2, [1, 2, 3, 4, 5, 6, 7, 8] + [None] * 11 + [20])
+        model.add_cbar(40, 3, [1, 2], [0., 1., 0.], None)
+        model.add_cbar(41, 3, [1, 2], None, 5, offt='GOO', pa=123, wa=[0., 0., 0.1])
+        model.add_rbe2(50, 1, '123456', [2, 3, 4])
+        model.add_rbe2(51, 1, '123', [5], alpha=1.e-5)
+        model.add_force(60, 1, 100., [1., 0., 0.])
+        model.add_force(60, 2, -1.5e7, [0., 0.5, 1.], cid=1)
+        model.add_pload4(70, [10], [1., 1., 1., 1.], cid=None)
+        model.add_pload4(70, [10, 11, 12, 13], [1., 2., 1., 1.], cid=None)
+        model.add_pload4(70, [10], [1., 1., 1., 1.], nvector=[1., 0., 0.])
+
+        card_dicts = [model.nodes, model.elements, model.rigid_elements]
+        cards_list = [[card for unused_id, card in sorted(cards.items())]
+                      for cards in card_dicts]
+        cards_list.append(model.loads[60] + model.loads[70])
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            for cards in cards_list:
+                texts = [card.write_card(size, is_double) for card in cards]
+                assert get_cards_text(cards, size, is_double) == texts, (size, is_double)
+
+        # the arrays of a NodeStore/ElementStore
+        model.build_array_store()
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            for cards in card_dicts:
+                bdf_file = StringIO()
+                write_card_dict(bdf_file, cards, size, is_double)
+                text = ''.join(card.write_card(size, is_double)
+                               for unused_id, card in sorted(cards.items()))
+                assert bdf_file.getvalue() == text, (size, is_double)
+
+    def test_write_bdf_nworkers(self):
+        """tests write_bdf/write_bdfs with worker processes match a serial write"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model = read_bdf(bdf_filename, log=log)
+        for size, interspersed in [(8, False), (16, True)]:
+            bdf_file1 = StringIO()
+            bdf_file2 = StringIO()
+            model.write_bdf(bdf_file1, size=size, interspersed=interspersed, close=False)
+            model.write_bdf(bdf_file2, size=size, interspersed=interspersed, close=False,
+                            nworkers=2)
+            assert bdf_file2.getvalue() == bdf_file1.getvalue()
+
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'iSat_launch_100Hz.dat')
+        model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+        out_filenames1 = {}
+        out_filenames2 = {}
+        for filename in model.active_filenames:
+            dirname, basename = os.path.split(filename)
+            out_filenames1[filename] = os.path.join(dirname, 'out1_' + basename)
+            out_filenames2[filename] = os.path.join(dirname, 'out2_' + basename)
+        model.write_bdfs(out_filenames1, relative_dirname='')
+        model.write_bdfs(out_filenames2, relative_dirname='', nworkers=2)
+        for filename in model.active_filenames:
+            with open(out_filenames1[filename], 'r') as bdf_file1:
+                lines1 = bdf_file1.read().replace('out1_', 'out2_')
+            with open(out_filenames2[filename], 'r') as bdf_file2:
+                lines2 = bdf_file2.read()
+            assert lines1 == lines2, filename
+            os.remove(out_filenames1[filename])
+            os.remove(out_filenames2[filename])
+
+        # a worker only gets the cards of its file
+        file_cards, names = _split_cards_by_file(model)
+        assert 'nodes' in names and 'elements' in names, names
+        nelements = 0
+        for ifile, cards in file_cards.items():
+            for elem in cards.get('elements', {}).values():
+                assert elem.ifile == ifile
+            nelements += len(cards.get('elements', {}))
+        assert nelements == len(model.elements)
+
+    def test_read_card_columns(self):
+        """tests the columnar card parsers match the card objects"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model = read_bdf(bdf_filename, validate=False, xref=False, log=log)
+        card_columns = read_card_columns(bdf_filename, log=log)
+        assert sorted(card_columns) == ['CBAR', 'CHEXA', 'CQUAD4', 'CTRIA3', 'GRID', 'RBE2']
+
+        cards = {
+            'GRID' : list(model.nodes.values()),
+            'RBE2' : list(model.rigid_elements.values()),
+        }
+        for elem in model.elements.values():
+            cards.setdefault(elem.type.replace('CHEXA8', 'CHEXA'), []).append(elem)
+        for card_name, columns in card_columns.items():
+            columns_expected = get_columns_from_cards(card_name, cards[card_name])
+            assert list(columns) == list(columns_expected), card_name
+            for name, values in columns.items():
+                is_float = values.dtype.kind == 'f'
+                assert np.array_equal(values, columns_expected[name], equal_nan=is_float), (
+                    card_name, name)
+
+    def test_parse_card_columns(self):
+        """tests the small, large and free field formats of the columnar card parsers"""
+        cards_lines = [
+            ['GRID           1       0      1.      2.      3.'],
+            ['GRID*                  2               1             1.0            -2.0',
+             '*                     3.               2             321'],
+            ['GRID,3,,1.-3,2.D+2,,,123456'],
+            ['GRID\t4\t\t1.0\t2.0\t3.0'],
+        ]
+        columns = parse_card_columns('GRID', cards_lines)
+        assert np.array_equal(columns['nid'], [1, 2, 3, 4])
+        assert np.array_equal(columns['cp'], [0, 1, 0, 0])
+        assert np.array_equal(columns['cd'], [0, 2, 0, 0])
+        assert np.array_equal(columns['ps'], [0, 123, 123456, 0])
+        assert np.allclose(columns['xyz'], [[1., 2., 3.], [1., -2., 3.],
+                                            [1e-3, 200., 0.], [1., 2., 3.]])
+
+        cards_lines = [
+            ['CQUAD4         1       2       1       2       3       4      3'],
+            ['CQUAD4,2,,1,2,3,4,30.,0.1', ',,1,0.5'],
+        ]
+        columns = parse_card_columns('CQUAD4', cards_lines)
+        assert np.array_equal(columns['pid'], [2, 2])
+        assert np.array_equal(columns['mcid'], [3, -1])
+        assert np.array_equal(columns['theta'], [0., 30.])
+        assert np.array_equal(columns['tflag'], [0, 1])
+        assert np.array_equal(columns['thickness'], [[np.nan] * 4, [0.5, np.nan, np.nan, np.nan]],
+                              equal_nan=True)
+
+        cards_lines = [
+            ['RBE2,1,10,123,11,12,13,14,15', ',16,17'],
+            ['RBE2,2,20,123456,21,1.0-6'],
+        ]
+        columns = parse_card_columns('RBE2', cards_lines)
+        assert np.array_equal(columns['ngm'], [7, 1])
+        assert np.array_equal(columns['gm'], [11, 12, 13, 14, 15, 16, 17, 21])
+        assert np.array_equal(columns['alpha'], [0., 1e-6])
+
+        columns = parse_card_columns('PLOAD4', [['PLOAD4,1,10,2.0'],
+                                                ['PLOAD4,1,20,3.0,,,,THRU,30']])
+        assert np.array_equal(columns['eid2'], [10, 30])
+        assert np.array_equal(columns['pressures'], [[2.] * 4, [3.] * 4])
+        assert np.array_equal(columns['cid'], [-1, -1])
+
+        # the errors match the card class
+        with self.assertRaises(SyntaxError):
+            parse_card_columns('GRID', [['GRID,1,,1,2.,3.']])
+        with self.assertRaises(RuntimeError):
+            parse_card_columns('CBAR', [['CBAR,1,1,1,2,0.,0.,0.']])
+
     def test_solid_shell_bar_buckling(self):
         bdf_filename = os.path.join(ROOT_PATH, '..', 'models',
                                     'sol_101_elements', 'buckling_solid_shell_bar.bdf')
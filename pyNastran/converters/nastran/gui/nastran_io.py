@@ -71,7 +71,7 @@ from pyNastran.bdf.cards.elements.solid import (
     CPYRAM5, CPYRAM13,
 )
 from pyNastran.bdf.mesh_utils.delete_bad_elements import (
-    tri_quality, quad_quality, get_min_max_theta)
+    tri_quality, quad_quality, get_min_max_theta, element_quality_arrays)
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids_all
 from pyNastran.bdf.mesh_utils.forces_moments import get_load_arrays, get_pressure_array
 from pyNastran.bdf.mesh_utils.mpc_dependency import get_mpc_node_ids
@@ -4869,6 +4869,10 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
         #print("map_elements...")
         eid_to_nid_map = self.eid_to_nid_map
         eid_map = self.gui.eid_map
+
+        # the quality of the shells/solids is calculated after the loop
+        # quality_inodes[etype] = [(i, n1, n2, ...), ...]
+        quality_inodes = defaultdict(list)
         for (eid, element) in sorted(elements.items()):
             eid_map[eid] = i
             if i % 5000 == 0 and i > 0:
@@ -4884,6 +4888,7 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 # continue
 
             pid = np.nan
+            is_quality_deferred = False
             dideal_thetai = np.nan
             min_thetai = np.nan
             max_thetai = np.nan
@@ -4911,12 +4916,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                         nid_to_pid_map[nid].append(pid)
 
                 n1, n2, n3 = [nid_map[nid] for nid in node_ids]
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                out = tri_quality(p1, p2, p3)
-                (areai, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+                quality_inodes['CTRIA3'].append((i, n1, n2, n3))
+                is_quality_deferred = True
 
                 elem.GetPointIds().SetId(0, n1)
                 elem.GetPointIds().SetId(1, n2)
@@ -4943,12 +4944,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                     elem = vtkTriangle()
 
                 n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                out = tri_quality(p1, p2, p3)
-                (areai, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+                quality_inodes['CTRIA3'].append((i, n1, n2, n3))
+                is_quality_deferred = True
                 elem.GetPointIds().SetId(0, n1)
                 elem.GetPointIds().SetId(1, n2)
                 elem.GetPointIds().SetId(2, n3)
@@ -4983,12 +4980,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 n1 = nid_map[node_ids[0]]
                 n2 = nid_map[node_ids[2]]
                 n3 = nid_map[node_ids[4]]
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                out = tri_quality(p1, p2, p3)
-                (areai, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
+                quality_inodes['CTRIA3'].append((i, n1, n2, n3))
+                is_quality_deferred = True
                 elem.GetPointIds().SetId(0, n1)
                 elem.GetPointIds().SetId(1, n2)
                 elem.GetPointIds().SetId(2, n3)
@@ -5016,13 +5009,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                     #print('nid_map = %s' % nid_map)
                     raise
                     #continue
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                p4 = xyz_cid0[n4, :]
-                out = quad_quality(element, p1, p2, p3, p4)
-                (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+                quality_inodes['CQUAD4'].append((i, n1, n2, n3, n4))
+                is_quality_deferred = True
 
                 elem = vtkQuad()
                 elem.GetPointIds().SetId(0, n1)
@@ -5044,13 +5032,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 self.eid_to_nid_map[eid] = node_ids[:4]
 
                 n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                p4 = xyz_cid0[n4, :]
-                out = quad_quality(element, p1, p2, p3, p4)
-                (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+                quality_inodes['CQUAD4'].append((i, n1, n2, n3, n4))
+                is_quality_deferred = True
                 if None not in node_ids:
                     elem = vtkQuadraticQuad()
                     elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
@@ -5079,13 +5062,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 self.eid_to_nid_map[eid] = node_ids[:4]
 
                 n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
-                p1 = xyz_cid0[n1, :]
-                p2 = xyz_cid0[n2, :]
-                p3 = xyz_cid0[n3, :]
-                p4 = xyz_cid0[n4, :]
-                out = quad_quality(element, p1, p2, p3, p4)
-                (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-                 min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
+                quality_inodes['CQUAD4'].append((i, n1, n2, n3, n4))
+                is_quality_deferred = True
                 if None not in node_ids:
                     elem = vtk.vtkBiQuadraticQuad()
                     elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
@@ -5114,8 +5092,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
                 grid.InsertNextCell(10, elem.GetPointIds())
                 #elem_nid_map = {nid:nid_map[nid] for nid in node_ids[:4]}
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
+                quality_inodes['CTETRA'].append([i] + [nid_map[nid] for nid in node_ids[:4]])
+                is_quality_deferred = True
 
             elif isinstance(element, CTETRA10):
                 node_ids = element.node_ids
@@ -5139,8 +5117,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
                 elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
                 grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
+                quality_inodes['CTETRA'].append([i] + [nid_map[nid] for nid in node_ids[:4]])
+                is_quality_deferred = True
 
             elif isinstance(element, CPENTA6):
                 elem = vtkWedge()
@@ -5156,8 +5134,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
                 elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
                 grid.InsertNextCell(13, elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
+                quality_inodes['CPENTA'].append([i] + [nid_map[nid] for nid in node_ids[:6]])
+                is_quality_deferred = True
 
             elif isinstance(element, CPENTA15):
                 node_ids = element.node_ids
@@ -5186,8 +5164,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
                 elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
                 grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
+                quality_inodes['CPENTA'].append([i] + [nid_map[nid] for nid in node_ids[:6]])
+                is_quality_deferred = True
 
             elif isinstance(element, (CHEXA8, CIHEX1)):
                 node_ids = element.node_ids
@@ -5205,8 +5183,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
                 elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
                 grid.InsertNextCell(12, elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
+                quality_inodes['CHEXA'].append([i] + [nid_map[nid] for nid in node_ids[:8]])
+                is_quality_deferred = True
 
             elif isinstance(element, (CHEXA20, CIHEX2)):
                 node_ids = element.node_ids
@@ -5244,8 +5222,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
                 elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
                 grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
+                quality_inodes['CHEXA'].append([i] + [nid_map[nid] for nid in node_ids[:8]])
+                is_quality_deferred = True
 
             elif isinstance(element, CPYRAM5):
                 node_ids = element.node_ids
@@ -5261,8 +5239,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
                 # etype = 14
                 grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
+                quality_inodes['CPYRAM'].append([i] + [nid_map[nid] for nid in node_ids[:5]])
+                is_quality_deferred = True
             elif isinstance(element, CPYRAM13):
                 node_ids = element.node_ids
                 pid = element.Pid()
@@ -5290,8 +5268,8 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
                 elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
                 grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-                min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
-                    _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
+                quality_inodes['CPYRAM'].append([i] + [nid_map[nid] for nid in node_ids[:5]])
+                is_quality_deferred = True
 
             elif etype in ('CBUSH', 'CBUSH1D', 'CFAST',
                            'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
@@ -5626,7 +5604,7 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 pids[i] = pid
                 pids_dict[eid] = pid
 
-            if np.isnan(max_thetai) and etype not in NO_THETA:
+            if np.isnan(max_thetai) and etype not in NO_THETA and not is_quality_deferred:
                 print('eid=%s theta=%s...setting to 360. deg' % (eid, max_thetai))
                 print(element.rstrip())
                 if isinstance(element.nodes[0], integer_types):
@@ -5653,6 +5631,19 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
 
         nelements = i
         self.gui.nelements = nelements
+        quality = {
+            'area' : area,
+            'min_interior_angle' : min_interior_angle,
+            'max_interior_angle' : max_interior_angle,
+            'dideal_theta' : dideal_theta,
+            'max_skew_angle' : max_skew_angle,
+            'max_warp_angle' : max_warp_angle,
+            'max_aspect_ratio' : max_aspect_ratio,
+            'area_ratio' : area_ratio,
+            'taper_ratio' : taper_ratio,
+            'min_edge_length' : min_edge_length,
+        }
+        _fill_element_quality(quality_inodes, xyz_cid0, quality)
         #print('nelements=%s pids=%s' % (nelements, list(pids)))
         pids = pids[:nelements]
 
@@ -6436,6 +6427,33 @@ def _build_sort1_table(key_itime, keys_map, header_dict,
     #print('form_results =', form_results)
     return form
 
+def _fill_element_quality(quality_inodes: Dict[str, List[Any]], xyz_cid0: np.ndarray,
+                          quality: Dict[str, np.ndarray]) -> None:
+    """
+    Fills the quality of the shells/solids that were collected by
+    ``_map_elements1_quality`` with the vectorized quality engine
+
+    Parameters
+    ----------
+    quality_inodes : Dict[etype] = [(i, n1, n2, ...), ...]
+        the element index and the node indices of the corner nodes
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the global xyz locations
+    quality : Dict[name] = (nelements, ) float ndarray
+        the quality arrays to fill
+
+    """
+    for etype, inodes in quality_inodes.items():
+        inodes = np.array(inodes, dtype='int32')
+        ielements = inodes[:, 0]
+        qualityi = element_quality_arrays(etype, inodes[:, 1:], xyz_cid0)
+
+        # a degenerate element doesn't have an angle
+        max_theta = qualityi['max_interior_angle']
+        max_theta[np.isnan(max_theta)] = 2 * np.pi
+        for name, values in quality.items():
+            values[ielements] = qualityi[name]
+
 def _build_normals_quality(settings: Settings,
                            model: BDF, eid_map, nelements: int, cases, form0, icase: int,
                            xyz_cid0,
@@ -3,10 +3,20 @@ Defines:
  - FortranFormat
 
 """
+from typing import Optional
 from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 #from pyNastran.op2.errors import FortranMarkerError, SortCodeError
 
+# these tables are always fully parsed
+# PVT/PVTS - we want to know what the PARAM cards are,
+#            so we can determine the NXVER
+FULLY_PARSED_TABLES = {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}
+
+# the table 3 parameters that a table 4 parser deletes (e.g., ogs),
+# which single_pass=True needs again for read_mode=2
+TABLE3_DELETED_KEYS = ('ogs', )
+
 
 class FortranFormat:
     """defines basic methods for reading Fortran formatted data files"""
@@ -74,10 +84,17 @@ class FortranFormat:
         op2_reader = self.op2_reader
         #datai = b''
         n = 0
-        if self.read_mode == 2:
+        result_sizer = self._result_sizer
+        if result_sizer is not None and result_sizer.is_active:
+            data, ndata = op2_reader._read_results_record_ndata()
+            n = self._read_record_single_pass(
+                table4_parser, data, ndata, record_len,
+                skip_data=self.table_name not in FULLY_PARSED_TABLES)
+
+        elif self.read_mode == 2:
             self.ntotal = 0
 
-            data, ndata = op2_reader._read_record_ndata()
+            data, ndata = op2_reader._read_results_record_ndata()
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -88,10 +105,7 @@ class FortranFormat:
 
             #n = op2_reader._skip_record()
             #n = table4_parser(datai, 300000)
-            if self.table_name in {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}:
-                # these tables are always fully parsed
-                # PVT/PVTS - we want to know what the PARAM cards are,
-                #            so we can determine the NXVER
+            if self.table_name in FULLY_PARSED_TABLES:
                 data, ndata = op2_reader._read_record_ndata()
             else:
                 data, ndata = op2_reader._skip_record_ndata()
@@ -110,6 +124,63 @@ class FortranFormat:
         self._cleanup_data_members()
         return n
 
+    def _read_record_single_pass(self, table4_parser, data, ndata: int,
+                                 record_len: Optional[int], skip_data: bool=True) -> int:
+        """
+        Counts a record with read_mode=1, grows the arrays and then fills
+        the record with read_mode=2 (single_pass=True)
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        data : bytes
+            the record
+        ndata : int
+            the length of the record
+        record_len : int / None
+            int : the length of the record block, which is used to size
+                  the vectorized results
+            None : the record isn't a vectorized result (e.g., no num_wide)
+        skip_data : bool; default=True
+            read_mode=1 gets data=None like a skipped record does
+
+        Returns
+        -------
+        n : int
+            the number of bytes that have been read
+
+        """
+        result_sizer = self._result_sizer
+        attrs = {key: self.__dict__[key] for key in TABLE3_DELETED_KEYS
+                 if key in self.__dict__}
+        n = table4_parser(None if skip_data else data, ndata)
+        if not isinstance(n, integer_types):
+            msg = 'n is not an integer; table_name=%s n=%s table4_parser=%s' % (
+                self.table_name, n, table4_parser)
+            raise TypeError(msg)
+        if record_len is not None:
+            self._init_vector_counter(record_len)
+        result_sizer.grow()
+
+        # some parsers delete the table 3 parameters (e.g., ogs)
+        for key, value in attrs.items():
+            if key not in self.__dict__:
+                setattr(self, key, value)
+
+        self.read_mode = 2
+        try:
+            if record_len is not None:
+                self.ntotal = 0
+            n = table4_parser(data, ndata)
+            assert isinstance(n, integer_types), self.table_name
+            if record_len is not None:
+                self._reset_vector_counter()
+        finally:
+            self.read_mode = 1
+        result_sizer.check_fill()
+        return n
+
     def _reset_vector_counter(self) -> None:
         """
         if reading the data
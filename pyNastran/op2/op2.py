@@ -5,17 +5,23 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=None,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            single_pass=False, use_index=False, use_mmap=False,
+            load_as_h5=False, memmap_dirname=None, nworkers=1)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
    - combine_results(combine=True)
    - create_objects_from_matrices()
+   - iter_results(op2_filename=None, result_types=None, subcases=None, combine=True,
+                  skip_undefined_matrices=True, encoding=None, use_mmap=False)
    - object_attributes(mode='public', keys_to_skip=None, filter_properties=False)
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=None,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, single_pass=False,
+              use_index=False, use_mmap=False, load_as_h5=False, memmap_dirname=None,
+              nworkers=1)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -25,7 +31,7 @@ from __future__ import annotations
 import sys
 from collections import defaultdict
 from pickle import load, dump, dumps
-from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Tuple, Iterator, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -41,6 +47,7 @@ from pyNastran.op2.errors import (SortCodeError, DeviceCodeError,
 from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.out_of_core import MemmapFile
 from pyNastran.op2.op2_interface.transforms import (
     transform_displacement_to_global, transform_gpforce_to_globali)
 from pyNastran.utils import check_path
@@ -500,7 +507,13 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=None,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 single_pass: bool=False,
+                 use_index: bool=False,
+                 use_mmap: bool=False,
+                 load_as_h5: bool=False,
+                 memmap_dirname: Optional[str]=None,
+                 nworkers: int=1) -> None:
         """
         Starts the OP2 file reading
 
@@ -512,15 +525,44 @@ class OP2(OP2_Scalar, OP2Writer):
             True : objects are isubcase based
             False : objects are (isubcase, subtitle) based;
                     will be used for superelements regardless of the option
-        #load_as_h5 : default=False
-            #loads the op2 as an h5 file to save memory
-            #stores the result.element/data attributes in h5 format
         build_dataframe : bool (default=None -> True if in iPython, False otherwise)
             builds a pandas DataFrame for op2 objects
         skip_undefined_matrices : bool; default=False
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        single_pass : bool; default=False
+            False : the whole file is read twice (read_mode=1 sizes the
+                    arrays and read_mode=2 fills them)
+            True : each table is sized and filled before moving on to the
+                   next table, so the file is only streamed once
+        use_index : bool; default=False
+            uses/writes a sidecar index (op2_filename + '.idx') with the
+            byte offsets of the tables, subtables and records, so the Fortran
+            markers don't have to be walked, the tables without any requested
+            results/subcases are skipped and the reader seeks directly to the
+            subtables of the requested subcases.  The index is written on the first
+            read that has all the results/subcases and is rebuilt if the size
+            or modification time of the OP2 changes.
+        use_mmap : bool; default=False
+            memory maps the OP2, so the results records are parsed directly
+            from the file instead of being copied into bytes objects first
+        load_as_h5 : bool; default=False
+            stores the result.data arrays out-of-core, so results that are
+            larger than the available memory can be read.  The arrays are
+            chunked (by time step) HDF5 datasets in op2_filename.h5, which
+            requires h5py.  Also enabled by setting ``model.load_as_h5 = True``.
+        memmap_dirname : str; default=None
+            stores the result.data arrays out-of-core as memory mapped
+            (np.memmap) .npy files in this directory instead of an h5 file;
+            implies load_as_h5=True
+        nworkers : int; default=1
+            the number of processes that read the results tables.  The
+            model reads the geometry/matrix/eigenvalue tables and the
+            results tables are split across the workers, so this helps
+            for OP2s with many large results tables.  Starting the workers
+            has some overhead, so it's slower for small OP2s.  Not used
+            with load_as_h5 or a debug_file.
 
         """
         if op2_filename:
@@ -531,6 +573,46 @@ class OP2(OP2_Scalar, OP2Writer):
             if ipython_info():
                 build_dataframe = True
 
+        self._set_read_options(encoding, skip_undefined_matrices)
+        self.log.debug('combine=%s' % combine)
+
+        load_as_h5 = load_as_h5 or memmap_dirname is not None
+        if hasattr(self, 'load_as_h5'):
+            load_as_h5 = load_as_h5 or self.load_as_h5
+
+        if nworkers > 1 and (load_as_h5 or self.debug_file is not None):
+            self.log.warning('nworkers=%s is not supported with load_as_h5/debug_file; '
+                             'using nworkers=1' % nworkers)
+            nworkers = 1
+
+        self._use_index = use_index
+        self._use_mmap = use_mmap
+        try:
+            if nworkers > 1:
+                self._read_op2_parallel(op2_filename, mode, nworkers, single_pass)
+            elif single_pass:
+                self._read_op2_single_pass(op2_filename, load_as_h5, mode, memmap_dirname)
+            else:
+                self._read_op2_two_pass(op2_filename, load_as_h5, mode, memmap_dirname)
+        except FileNotFoundError:
+            raise
+        except:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        finally:
+            self._use_index = False
+            self._use_mmap = False
+        self._save_op2_index()
+        self._finalize()
+        if build_dataframe:
+            self.build_dataframe()
+        self.create_objects_from_matrices()
+        self.combine_results(combine=combine)
+        self.log.debug('finished reading op2')
+
+    def _set_read_options(self, encoding: Optional[str],
+                          skip_undefined_matrices: bool) -> None:
+        """sets up the reader before the file is opened"""
         if encoding is None:
             encoding = sys.getdefaultencoding()
         self.encoding = encoding
@@ -538,40 +620,174 @@ class OP2(OP2_Scalar, OP2Writer):
         self.skip_undefined_matrices = skip_undefined_matrices
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
-        self.log.debug('combine=%s' % combine)
-        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
         self.read_mode = 1
         self._close_op2 = False
 
-        load_as_h5 = False
-        if hasattr(self, 'load_as_h5'):
-            load_as_h5 = self.load_as_h5
-
+    def _read_op2_two_pass(self, op2_filename: Optional[str],
+                           load_as_h5: bool, mode: Optional[str],
+                           memmap_dirname: Optional[str]=None) -> None:
+        """reads the whole file to size the arrays and then again to fill them"""
+        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
+        # get GUI object names, build objects, but don't read data
+        table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
+                                          load_as_h5=load_as_h5, mode=mode,
+                                          memmap_dirname=memmap_dirname)
+        self.table_names = table_names
+
+        # TODO: stuff to figure out objects
+        # TODO: stuff to show gui of table names
+        # TODO: clear out objects the user doesn't want
+        self.read_mode = 2
+        self._close_op2 = True
+        self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
+        _create_hdf5_info(self.op2_reader.h5_file, self)
+        OP2_Scalar.read_op2(self, op2_filename=self.op2_filename,
+                            load_as_h5=load_as_h5, mode=mode)
+
+    def _read_op2_single_pass(self, op2_filename: Optional[str],
+                              load_as_h5: bool, mode: Optional[str],
+                              memmap_dirname: Optional[str]=None) -> None:
+        """sizes and fills each table before moving on to the next table"""
+        self.log.debug('-------- reading op2 with single_pass=True --------')
+        self._single_pass = True
+        self._close_op2 = True
         try:
-            # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
-                                              load_as_h5=load_as_h5, mode=mode)
-            self.table_names = table_names
-
-            # TODO: stuff to figure out objects
-            # TODO: stuff to show gui of table names
-            # TODO: clear out objects the user doesn't want
-            self.read_mode = 2
-            self._close_op2 = True
-            self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-            _create_hdf5_info(self.op2_reader.h5_file, self)
-            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+                                              load_as_h5=load_as_h5, mode=mode,
+                                              memmap_dirname=memmap_dirname)
+        finally:
+            self._single_pass = False
+        self.table_names = table_names
+        if load_as_h5:
+            # the op2_reader is gone, so we use the model's h5_file
+            _create_hdf5_info(self.h5_file, self)
+
+    def _read_op2_parallel(self, op2_filename: Optional[str], mode: Optional[str],
+                           nworkers: int, single_pass: bool) -> None:
+        """reads the results tables with a pool of worker processes"""
+        from pyNastran.op2.op2_interface.op2_parallel import (
+            get_worker_settings, read_results_tables_parallel)
+        self.log.debug('-------- reading op2 with nworkers=%s --------' % nworkers)
+        settings = get_worker_settings(self, single_pass=single_pass,
+                                       use_mmap=self._use_mmap)
+        results_tables, table_ends, table_counts = self._read_op2_skip_results(
+            op2_filename, mode)
+        read_results_tables_parallel(self, results_tables, table_ends, table_counts,
+                                     nworkers, settings)
+
+    def _read_op2_skip_results(self, op2_filename: Optional[str],
+                               mode: Optional[str]) -> Tuple[List[Tuple[bytes, int, int]],
+                                                             Dict[int, int], Dict[int, int]]:
+        """
+        Reads the non-results tables and skips the results tables
+
+        Returns
+        -------
+        results_tables : List[(table_name, start, end), ...]
+            the byte range of each results table
+        table_ends : Dict[int, int]
+            start -> end byte of every table
+        table_counts : Dict[int, int]
+            start -> the optimization count of each results table
+
+        """
+        self._results_table_ranges = []
+        self._table_ends = {}
+        self._table_counts = {}
+        try:
+            self._read_op2_single_pass(op2_filename, False, mode)
+            results_tables = self._results_table_ranges
+            table_ends = self._table_ends
+            table_counts = self._table_counts
+        finally:
+            self._results_table_ranges = None
+            self._table_ends = None
+            self._table_counts = None
+        return results_tables, table_ends, table_counts
+
+    def iter_results(self, op2_filename: Optional[str]=None,
+                     result_types: Optional[List[str]]=None,
+                     subcases: Optional[List[int]]=None,
+                     combine: bool=True,
+                     skip_undefined_matrices: bool=True,
+                     encoding: Optional[str]=None,
+                     use_mmap: bool=False) -> Iterator[Tuple[Any, Any]]:
+        """
+        Reads the results one subcase at a time, so only the results of a
+        single subcase of a table (e.g., OUGV1, OES1X) are in memory.  Each
+        results table is read straight from its offset one record at a time
+        and the results of a subcase are yielded once the table moves on to
+        the next subcase.  The results of a table that shows up more than
+        once (e.g., SOL 200 design cycles) are yielded once the last
+        occurrence of the table is read.  A result object is released once
+        the consumer is done with it, so it's not stored in the model
+        (e.g., model.displacements is empty).
+
+        The model reads the non-results tables (e.g., eigenvalues, matrices)
+        like ``read_op2``.
+
+        Parameters
+        ----------
+        op2_filename : str (default=None -> popup)
+            the op2_filename
+        result_types : List[str] / str; default=None -> all
+            the result types to read (see ``set_results``)
+        subcases : List[int, ...] / int; default=None -> all subcases
+            the subcases to read
+        combine : bool; default=True
+            see ``read_op2``; the keys are combined one subcase at a time
+        skip_undefined_matrices : bool; default=True
+             True : prevents matrix reading crashes
+        encoding : str; default=None -> system default
+            the unicode encoding
+        use_mmap : bool; default=False
+            memory maps the OP2 (see ``read_op2``)
+
+        Yields
+        ------
+        key : int / tuple
+            the subcase key (e.g., model.displacements[key])
+        result : varies
+            the result object (e.g., RealDisplacementArray); the result type
+            (e.g., 'displacements', 'stress.cquad4_stress') is result.result_name
+
+        Examples
+        --------
+        >>> model = OP2()
+        >>> max_von_mises = {}
+        >>> for key, result in model.iter_results(op2_filename, result_types='stress'):
+        ...     if result.is_von_mises:
+        ...         max_von_mises[(result.result_name, key)] = result.data[:, :, -1].max()
+
+        """
+        from pyNastran.op2.op2_interface.op2_parallel import (
+            get_worker_settings, iter_worker_results)
+        if op2_filename:
+            check_path(op2_filename, name='op2_filename')
+        if result_types is not None:
+            self.set_results(result_types)
+        if subcases is not None:
+            self.set_subcases(subcases)
+
+        self._set_read_options(encoding, skip_undefined_matrices)
+        self._use_mmap = use_mmap
+        try:
+            settings = get_worker_settings(self, use_mmap=use_mmap)
+            results_tables, unused_table_ends, table_counts = self._read_op2_skip_results(
+                op2_filename, self.mode)
         except FileNotFoundError:
             raise
         except:
             OP2_Scalar.close_op2(self, force=True)
             raise
+        finally:
+            self._use_mmap = False
         self._finalize()
-        if build_dataframe:
-            self.build_dataframe()
         self.create_objects_from_matrices()
         self.combine_results(combine=combine)
-        self.log.debug('finished reading op2')
+
+        yield from iter_worker_results(self.op2_filename, settings, results_tables,
+                                       table_counts, combine)
 
     def create_objects_from_matrices(self) -> None:
         """
@@ -1221,7 +1437,13 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=None,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             single_pass: bool=False,
+             use_index: bool=False,
+             use_mmap: bool=False,
+             load_as_h5: bool=False,
+             memmap_dirname: Optional[str]=None,
+             nworkers: int=1) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1254,6 +1476,27 @@ def read_op2(op2_filename: Optional[str]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    single_pass : bool; default=False
+        True : size and fill each table before moving on to the next
+               table, so the file is only streamed once
+        False : read the whole file to size the arrays and then again
+                to fill them
+    use_index : bool; default=False
+        uses/writes a sidecar index (op2_filename + '.idx') with the byte
+        offsets of the tables, subtables and records, so re-opening the file
+        skips the tables that don't have any of the requested results/subcases
+        and seeks directly to the subtables of the requested subcases
+    use_mmap : bool; default=False
+        memory maps the OP2, so the results records are parsed directly
+        from the file instead of being copied into bytes objects first
+    load_as_h5 : bool; default=False
+        stores the result.data arrays out-of-core as chunked HDF5 datasets
+        in op2_filename.h5 (requires h5py)
+    memmap_dirname : str; default=None
+        stores the result.data arrays out-of-core as memory mapped .npy
+        files in this directory; implies load_as_h5=True
+    nworkers : int; default=1
+        the number of processes that read the results tables
 
     Returns
     -------
@@ -1275,7 +1518,9 @@ def read_op2(op2_filename: Optional[str]=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, single_pass=single_pass, use_index=use_index,
+                   use_mmap=use_mmap, load_as_h5=load_as_h5, memmap_dirname=memmap_dirname,
+                   nworkers=nworkers)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -1290,10 +1535,8 @@ def read_op2(op2_filename: Optional[str]=None,
 
 def _create_hdf5_info(h5_file, op2_model):
     """exports the h5 info group"""
-    load_as_h5 = False
-    if hasattr(op2_model, 'load_as_h5'):
-        load_as_h5 = op2_model.load_as_h5
-    if not load_as_h5:
+    if h5_file is None or isinstance(h5_file, MemmapFile):
+        # load_as_h5=False or the results are memory mapped
         return
     from pyNastran.op2.op2_interface.hdf5_interface import create_info_group
     create_info_group(h5_file, op2_model)
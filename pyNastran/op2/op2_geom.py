@@ -334,12 +334,16 @@ class OP2Geom(BDF, OP2GeomCommon):
         return True
 
     def read_op2(self, op2_filename=None, combine=True,
-                 build_dataframe=None, skip_undefined_matrices=False, encoding=None):
+                 build_dataframe=None, skip_undefined_matrices=False, encoding=None,
+                 single_pass=False, use_index=False, use_mmap=False,
+                 load_as_h5=False, memmap_dirname=None, nworkers=1):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, single_pass=single_pass, use_index=use_index,
+                     use_mmap=use_mmap, load_as_h5=load_as_h5,
+                     memmap_dirname=memmap_dirname, nworkers=nworkers)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
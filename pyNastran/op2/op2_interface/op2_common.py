@@ -1299,6 +1299,77 @@ class OP2Common(Op2Codes, F06Writer):
                 times = floats[:, 0]
             obj._times = times
 
+    def obj_set_element(self, obj, ielement, ielement2, data, nelements):
+        """
+        Sets the element ids of a vectorized element table with 1 row
+        per element
+
+        SORT1:
+          A record is a single time/frequency/mode, so the element ids are
+          read from the first column on the first time step.
+        SORT2:
+          A record is a single element, so the element id is the
+          nonlinear_factor and the first column is the time/frequency/mode.
+          Like the unvectorized add_sort1 call, the last time of the record
+          is stored.
+
+        """
+        if self.sort_method == 1:
+            if obj.itime == 0:
+                ints = np.frombuffer(data, dtype=self.idtype8).reshape(nelements, self.num_wide).copy()
+                eids = ints[:, 0] // 10
+                assert eids.min() > 0, eids.min()
+                obj.element[ielement:ielement2] = eids
+            return
+
+        eid = self.nonlinear_factor
+        assert eid > 0, self.code_information()
+        obj.element[ielement:ielement2] = eid
+        obj._times[obj.itime] = self._get_sort2_times(data, nelements)[-1]
+
+    def _get_sort2_times(self, data, nelements):
+        """gets the times/frequencies/modes from the first column of a SORT2 record"""
+        dtype = self.idtype8 if self._analysis_code_fmt == b'i' else self.fdtype8
+        return np.frombuffer(data, dtype=dtype).reshape(nelements, self.num_wide)[:, 0]
+
+    def get_record_eids(self, ints):
+        """
+        Gets the element id of each row of a vectorized element table
+        (see ``obj_set_element``)
+
+        Parameters
+        ----------
+        ints : (nelements, num_wide) int ndarray
+            the record
+
+        """
+        if self.sort_method == 1:
+            eids = ints[:, 0] // 10
+        else:
+            eids = np.full(ints.shape[0], self.nonlinear_factor, dtype=ints.dtype)
+        assert eids.min() > 0, eids.min()
+        return eids
+
+    def obj_set_time(self, obj, dt, data, nelements):
+        """
+        Sets the time of a vectorized element table; a SORT2 record
+        stores the last time of the record (see ``obj_set_element``)
+        """
+        if self.sort_method == 1:
+            obj._times[obj.itime] = dt
+        else:
+            obj._times[obj.itime] = self._get_sort2_times(data, nelements)[-1]
+
+    def obj_set_element_cid(self, obj, eids, cids):
+        """
+        Sets the element/coordinate system ids of a vectorized solid
+        element table, which wrap like the unvectorized add_eid_sort1 call
+        """
+        ielements = (obj.ielement + np.arange(len(eids))) % obj.nelements
+        obj.element_cid[ielements, 0] = eids
+        obj.element_cid[ielements, 1] = cids
+        obj.ielement = ielements[-1] + 1
+
     def _read_complex_table_sort1_mag(self, data, is_vectorized, nnodes, result_name, flag):
         if self.is_debug_file:
             self.binary_debug.write('  _read_complex_table_sort1_mag\n')
@@ -1616,6 +1687,15 @@ class OP2Common(Op2Codes, F06Writer):
         assert self.log is not None
 
         code = self._get_code()
+
+        # single_pass=True; the object is counted and then filled, so the
+        # fill state is swapped out before the data code is updated
+        result_sizer = self._result_sizer
+        is_sizing = (result_sizer is not None and result_sizer.is_active and
+                     self.read_mode == 1)
+        if is_sizing and code in storage_obj:
+            result_sizer.start(storage_obj[code])
+
         #print('code =', code)
         if hasattr(self, 'isubcase'):
             if self.code in storage_obj:
@@ -1670,6 +1750,9 @@ class OP2Common(Op2Codes, F06Writer):
                 storage_obj[code] = self.obj
         assert self.obj.table_name is not None, self.data_code
 
+        if is_sizing:
+            result_sizer.start(self.obj)
+
     def _get_code(self):
         """
         The code is a the way you access something like self.displacements.
@@ -0,0 +1,312 @@
+"""
+Defines the OP2 sidecar index, which stores the byte offsets of the
+tables/subtables/records in an OP2, so the file can be re-opened without
+walking every Fortran marker.  Defines:
+
+ - OP2Index(op2_filename)
+   - load(idx_filename, op2_filename)
+   - save(idx_filename)
+   - is_valid(op2_filename)
+   - add_table(table_name, start, end)
+   - add_subtable(start, isubtable, isubcase, dt)
+   - add_subtables_end(end)
+   - add_record(start, end, ndata)
+   - get_record(start)
+   - get_next_subtable(start, valid_subcases)
+   - set_result_names(op2)
+   - get_table_isubcases(start)
+   - is_table_skippable(table_name, start, op2)
+
+The index is an uncompressed npz file with the arrays:
+
+ - version, op2_size, op2_mtime : the OP2 the index was built for
+ - table_names, table_starts, table_ends : the start/end byte of each table
+ - subtable_starts, subtable_isubtables, subtable_isubcases, subtable_dts :
+       the start byte, subtable marker (e.g., -3), subcase id and
+       time/frequency/mode (dt=nan for static) of each table3 record
+ - subtable_ends : the byte after the last subtable of each results table
+ - record_starts, record_ends, record_ndatas : the start/end byte and data
+       length of each table3/table4 record
+ - result_table_names, result_names : the result types that each results
+       table creates
+
+The subtable offsets let a read of a subset of the subcases seek from a
+table3 record of an unwanted subcase straight to the next wanted one.
+
+"""
+from __future__ import annotations
+import os
+import zipfile
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Tuple, Set, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+INDEX_VERSION = 2
+
+
+class OP2Index:
+    """Stores the byte offsets of the tables, subtables and records in an OP2"""
+    def __init__(self, op2_filename: str) -> None:
+        """
+        Creates an empty index
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 the index is built for
+
+        """
+        stat = os.stat(op2_filename)
+        self.op2_size = stat.st_size
+        self.op2_mtime = stat.st_mtime
+
+        #: True : the index was loaded from a file and may be used to skip data
+        #: False : the index is being built
+        self.is_loaded = False
+
+        #: [(table_name, start, end), ...]
+        self.tables = []  # type: List[Tuple[str, int, int]]
+
+        #: start -> (isubtable, isubcase, dt)
+        self.subtables = {}  # type: Dict[int, Tuple[int, int, Optional[float]]]
+
+        #: the byte after the last subtable of each results table
+        self.subtable_ends = []  # type: List[int]
+
+        #: start -> (end, ndata)
+        self.records = {}  # type: Dict[int, Tuple[int, int]]
+
+        #: table_name -> [result_name, ...]
+        self.result_names = {}  # type: Dict[str, List[str]]
+
+        # table start -> (table_name, end)
+        self._table_map = {}  # type: Dict[int, Tuple[str, int]]
+        self._subtable_starts = []  # type: List[int]
+
+    def is_valid(self, op2_filename: str) -> bool:
+        """is the index consistent with the OP2's size and modification time?"""
+        stat = os.stat(op2_filename)
+        return self.op2_size == stat.st_size and self.op2_mtime == stat.st_mtime
+
+    def add_table(self, table_name: bytes, start: int, end: int) -> None:
+        """stores the start/end byte of a table"""
+        table_name_str = table_name.decode('latin1')
+        if start not in self._table_map:
+            self.tables.append((table_name_str, start, end))
+        self._table_map[start] = (table_name_str, end)
+
+    def add_subtable(self, start: int, isubtable: int, isubcase: int, dt: Any) -> None:
+        """stores the subtable marker, subcase and time/frequency/mode of a table3 record"""
+        if dt is not None:
+            # dt is None for static results and nan/an array for some odd tables
+            dt = float(dt) if np.ndim(dt) == 0 else np.nan
+            if np.isnan(dt):
+                dt = None
+        self.subtables[start] = (int(isubtable), int(isubcase), dt)
+
+    def add_subtables_end(self, end: int) -> None:
+        """stores the byte after the last subtable of a table"""
+        if not self.subtable_ends or self.subtable_ends[-1] != end:
+            self.subtable_ends.append(end)
+
+    def add_record(self, start: int, end: int, ndata: int) -> None:
+        """stores the start/end byte and data length of a record"""
+        self.records[start] = (end, ndata)
+
+    def get_record(self, start: int) -> Optional[Tuple[int, int]]:
+        """gets the (end, ndata) of the record that starts at a byte"""
+        return self.records.get(start)
+
+    def get_next_subtable(self, start: int,
+                          valid_subcases: Set[int]) -> Optional[Tuple[int, int]]:
+        """
+        Finds where to go from a table3 record of a subcase that isn't
+        being read
+
+        Parameters
+        ----------
+        start : int
+            the start byte of the table3 record
+        valid_subcases : Set[int]
+            the subcases that are being read
+
+        Returns
+        -------
+        subtable : (start, isubtable) / None
+            (start, isubtable) : the start byte and subtable marker of the next
+                table3 record in the table with a valid subcase; isubtable=0
+                (and start is the end of the subtables) if there isn't one
+            None : the record isn't indexed or its subcase is valid
+
+        """
+        subtable = self.subtables.get(start)
+        if subtable is None or subtable[1] in valid_subcases:
+            return None
+
+        ends = self.subtable_ends
+        iend = bisect_right(ends, start)
+        if iend == len(ends):
+            return None
+        end = ends[iend]
+
+        starts = self._subtable_starts
+        i = bisect_right(starts, start)
+        while i < len(starts) and starts[i] < end:
+            isubtable, isubcase, unused_dt = self.subtables[starts[i]]
+            if isubcase in valid_subcases:
+                return starts[i], isubtable
+            i += 1
+        return end, 0
+
+    def set_result_names(self, op2: OP2) -> None:
+        """finds the results types that each table created"""
+        result_names = {}  # type: Dict[str, Set[str]]
+        for result_name in op2.get_table_types():
+            results = op2.get_result(result_name)
+            if not isinstance(results, dict):
+                continue
+            for obj in results.values():
+                table_name = getattr(obj, 'table_name', None)
+                if table_name is None:
+                    continue
+                if isinstance(table_name, bytes):
+                    table_name = table_name.decode('latin1')
+                result_names.setdefault(table_name, set()).add(result_name)
+        self.result_names = {table_name: sorted(names)
+                             for table_name, names in result_names.items()}
+
+    def get_table_isubcases(self, start: int) -> Set[int]:
+        """gets the subcases in the table that starts at a byte"""
+        unused_table_name, end = self._table_map[start]
+        starts = self._subtable_starts
+        i = bisect_left(starts, start)
+        isubcases = set()
+        while i < len(starts) and starts[i] < end:
+            isubcases.add(self.subtables[starts[i]][1])
+            i += 1
+        return isubcases
+
+    def get_table_end(self, table_name: bytes, start: int) -> Optional[int]:
+        """gets the end byte of the table that starts at a byte"""
+        table = self._table_map.get(start)
+        if table is None or table[0] != table_name.decode('latin1'):
+            return None
+        return table[1]
+
+    def is_table_skippable(self, table_name: bytes, start: int, op2: OP2) -> bool:
+        """
+        Can the table be skipped because none of its results or subcases
+        were requested?
+
+        Tables that don't create any indexed result objects are never skipped.
+        """
+        if self.get_table_end(table_name, start) is None:
+            return False
+
+        result_names = self.result_names.get(table_name.decode('latin1'), [])
+        if not result_names:
+            return False
+        if not any(op2._results.is_saved(result_name) for result_name in result_names):
+            return True
+
+        if not op2.is_all_subcases:
+            isubcases = self.get_table_isubcases(start)
+            if isubcases and not isubcases.intersection(op2.valid_subcases):
+                return True
+        return False
+
+    def save(self, idx_filename: str) -> None:
+        """writes the index to an npz file"""
+        subtable_starts = sorted(self.subtables)
+        subtables = [self.subtables[start] for start in subtable_starts]
+        record_starts = sorted(self.records)
+        records = [self.records[start] for start in record_starts]
+        result_names = [(table_name, result_name)
+                        for table_name, names in sorted(self.result_names.items())
+                        for result_name in names]
+
+        arrays = {
+            'version' : np.array(INDEX_VERSION),
+            'op2_size' : np.array(self.op2_size, dtype='int64'),
+            'op2_mtime' : np.array(self.op2_mtime, dtype='float64'),
+            'table_names' : np.array([table[0] for table in self.tables], dtype='U8'),
+            'table_starts' : np.array([table[1] for table in self.tables], dtype='int64'),
+            'table_ends' : np.array([table[2] for table in self.tables], dtype='int64'),
+            'subtable_starts' : np.array(subtable_starts, dtype='int64'),
+            'subtable_isubtables' : np.array([subtable[0] for subtable in subtables],
+                                             dtype='int32'),
+            'subtable_isubcases' : np.array([subtable[1] for subtable in subtables],
+                                            dtype='int32'),
+            'subtable_dts' : np.array([np.nan if subtable[2] is None else subtable[2]
+                                       for subtable in subtables], dtype='float64'),
+            'subtable_ends' : np.array(self.subtable_ends, dtype='int64'),
+            'record_starts' : np.array(record_starts, dtype='int64'),
+            'record_ends' : np.array([record[0] for record in records], dtype='int64'),
+            'record_ndatas' : np.array([record[1] for record in records], dtype='int64'),
+            'result_table_names' : np.array([names[0] for names in result_names], dtype='U8'),
+            'result_names' : np.array([names[1] for names in result_names], dtype='U'),
+        }
+        # a file object, so numpy doesn't add .npz to the filename
+        with open(idx_filename, 'wb') as idx_file:
+            np.savez(idx_file, **arrays)
+
+    @classmethod
+    def load(cls, idx_filename: str, op2_filename: str) -> Optional[OP2Index]:
+        """
+        Loads an index
+
+        Returns
+        -------
+        index : OP2Index / None
+            None : the index doesn't exist, is out of date or is corrupt
+
+        """
+        if not os.path.exists(idx_filename):
+            return None
+        try:
+            with np.load(idx_filename, allow_pickle=False) as npz:
+                data = {key: npz[key] for key in npz.files}
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # an older json index or a corrupt file
+            return None
+
+        index = cls(op2_filename)
+        if 'version' not in data or int(data['version']) != INDEX_VERSION:
+            return None
+        if int(data['op2_size']) != index.op2_size or float(data['op2_mtime']) != index.op2_mtime:
+            return None
+
+        for table_name, start, end in zip(data['table_names'].tolist(),
+                                          data['table_starts'].tolist(),
+                                          data['table_ends'].tolist()):
+            index.tables.append((table_name, start, end))
+            index._table_map[start] = (table_name, end)
+
+        dts = [None if np.isnan(dt) else dt for dt in data['subtable_dts'].tolist()]
+        index.subtables = {
+            start: (isubtable, isubcase, dt) for start, isubtable, isubcase, dt in zip(
+                data['subtable_starts'].tolist(), data['subtable_isubtables'].tolist(),
+                data['subtable_isubcases'].tolist(), dts)}
+        index.subtable_ends = data['subtable_ends'].tolist()
+        index.records = dict(zip(data['record_starts'].tolist(),
+                                 zip(data['record_ends'].tolist(),
+                                     data['record_ndatas'].tolist())))
+        for table_name, result_name in zip(data['result_table_names'].tolist(),
+                                           data['result_names'].tolist()):
+            index.result_names.setdefault(table_name, []).append(result_name)
+        index._subtable_starts = data['subtable_starts'].tolist()
+        index.is_loaded = True
+        return index
+
+    def __repr__(self) -> str:
+        msg = 'OP2Index(ntables=%s, nsubtables=%s, nrecords=%s)' % (
+            len(self.tables), len(self.subtables), len(self.records))
+        return msg
+
+
+def get_idx_filename(op2_filename: str) -> str:
+    """gets the sidecar index filename for an OP2"""
+    return op2_filename + '.idx'
@@ -0,0 +1,574 @@
+"""
+Defines the multi-process OP2 reader that is used by
+``read_op2(nworkers=N)``.  Defines:
+
+ - read_results_tables_parallel(model, results_tables, table_ends, table_counts,
+                                nworkers, settings)
+ - read_worker_model(op2_filename, settings, table_starts, table_ends, table_counts)
+ - iter_worker_results(op2_filename, settings, results_tables, table_counts, combine)
+ - get_worker_settings(model, single_pass=False, use_mmap=False)
+ - group_tables(results_tables)
+ - split_tables(results_tables, nworkers)
+ - get_shared_tables(worker_table_keys)
+
+The model reads the non-results tables (geometry, matrices, eigenvalues,
+R1TABRG, ...) and skips the results tables, which finds the byte range of
+each table.  The results tables are split across the workers, which each
+read the OP2 and skip every table that they don't read with a single seek.
+The optimization count of each results table, which is set by the skipped
+R1TABRG tables, is passed to the workers.
+The result objects are pickled back and added to the model in the same
+order that the serial reader creates them, so the model is then
+finalized/combined like a serial read.
+
+The serial reader adds every table that maps to the same result (e.g.,
+the same subcase) to a single result object.  When those tables were read
+by different workers, they're read again by a single worker, so the
+result is filled the same way.
+
+``OP2.iter_results`` reads the results tables in the current process.  It
+seeks straight to each results table and reads it one record at a time
+(like ``read_op2(single_pass=True)``), so the results of a subcase are
+yielded once the table moves on to the next subcase.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Set, Iterator, Optional, Any, TYPE_CHECKING
+
+from cpylog import get_logger
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.single_pass import ResultSizer
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+
+#: the table3 info that the serial reader keeps from the last results table
+HEADER_ATTRIBUTES = ['title']
+
+
+class OP2Worker(OP2):
+    """reads a subset of the results tables in an OP2"""
+    def __init__(self, table_starts: Set[int], table_ends: Dict[int, int],
+                 table_counts: Dict[int, int], **kwargs: Any) -> None:
+        """
+        Parameters
+        ----------
+        table_starts : Set[int]
+            the start byte of the results tables to read
+        table_ends : Dict[int, int]
+            start -> end byte of the tables, so the tables that were read
+            by the model or belong to the other workers are skipped with
+            a single seek
+        table_counts : Dict[int, int]
+            start -> the optimization count of the results tables
+
+        """
+        OP2.__init__(self, **kwargs)
+        self._table_starts = table_starts
+        self._table_ends = table_ends
+        self._table_counts = table_counts
+        self._table_start = None
+
+        #: table start -> [(result_name, key), ...] created by the table
+        self.table_result_keys = {}  # type: Dict[int, List[Tuple[str, Any]]]
+
+        #: table start -> {(result_name, key), ...} that the table adds to
+        self.table_keys = {}  # type: Dict[int, Set[Tuple[str, Any]]]
+
+    def _read_table(self, table_name: bytes) -> None:
+        """reads the table or skips the tables that aren't read by this worker"""
+        n0 = self.n
+        if n0 not in self._table_starts:
+            end = self._table_ends.get(n0)
+            if end is not None:
+                self.op2_reader._goto(end)
+            elif self._is_results_table(table_name):
+                self.op2_reader._skip_table(table_name, warn=False)
+            else:
+                OP2._read_table(self, table_name)
+            return
+
+        self._count = self._table_counts[n0]
+        if self.read_mode == 2 or n0 in self.table_result_keys:
+            OP2._read_table(self, table_name)
+            return
+
+        # the result objects are created with read_mode=1
+        keys0 = set(self._get_result_keys())
+        self._table_start = n0
+        self.table_keys[n0] = set()
+        try:
+            OP2._read_table(self, table_name)
+        finally:
+            self._table_start = None
+        self.table_result_keys[n0] = [key for key in self._get_result_keys()
+                                      if key not in keys0]
+        self.table_keys[n0].update(self.table_result_keys[n0])
+
+    def create_transient_object(self, result_name, storage_obj, class_obj,
+                                is_cid=False, debug=False):
+        """tracks the results that the table adds to"""
+        OP2.create_transient_object(self, result_name, storage_obj, class_obj,
+                                    is_cid=is_cid, debug=debug)
+        if self._table_start is not None and self.code in storage_obj:
+            self.table_keys[self._table_start].add((result_name, self.code))
+
+    def _get_result_keys(self) -> List[Tuple[str, Any]]:
+        """gets the (result_name, key) of every result object in the order they were created"""
+        keys = []
+        for result_name in self.get_table_types():
+            results = self.get_result(result_name)
+            if isinstance(results, dict):
+                keys.extend((result_name, key) for key in results)
+        return keys
+
+
+class OP2Streamer(OP2Worker):
+    """reads the results tables from their offsets and yields the results by subcase"""
+    def __init__(self, table_counts: Dict[int, int], **kwargs: Any) -> None:
+        """
+        Parameters
+        ----------
+        table_counts : Dict[int, int]
+            start -> the optimization count of the results tables
+
+        """
+        OP2Worker.__init__(self, set(), {}, table_counts, **kwargs)
+
+        #: the (result_name, key) of the table that's being read (in the
+        #: order they were created); None if the results aren't tracked
+        self._stream_keys = None  # type: Optional[Dict[Tuple[str, Any], None]]
+
+        #: the subcase of the last record
+        self._isubcase = None
+
+        #: the subcases that are done
+        self._finished_subcases = []  # type: List[int]
+
+    def create_transient_object(self, result_name, storage_obj, class_obj,
+                                is_cid=False, debug=False):
+        """tracks the results and the subcase of the table that's being read"""
+        OP2Worker.create_transient_object(self, result_name, storage_obj, class_obj,
+                                          is_cid=is_cid, debug=debug)
+        if self._stream_keys is None or self.code not in storage_obj:
+            return
+        self._stream_keys[(result_name, self.code)] = None
+        isubcase = self.code[0]
+        if isubcase != self._isubcase:
+            # the records of a subcase are together, so the last subcase is done
+            if self._isubcase is not None:
+                self._finished_subcases.append(self._isubcase)
+            self._isubcase = isubcase
+
+    def iter_results_tables(self, op2_filename: str,
+                            results_tables: List[Tuple[bytes, int, int]],
+                            combine: bool) -> Iterator[Tuple[Any, Any]]:
+        """
+        Reads the results tables one record at a time and yields the
+        results of each subcase once they're done.  The results of a table
+        that shows up more than once (e.g., SOL 200 design cycles) are
+        yielded as the last occurrence of the table is read.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 to read
+        results_tables : List[(table_name, start, end), ...]
+            the byte range of each results table
+        combine : bool
+            see ``read_op2``; the keys of each subcase are combined
+
+        Yields
+        ------
+        key : int / tuple
+            the subcase key
+        result : varies
+            the result object
+
+        """
+        self.op2_filename = op2_filename
+        self.read_mode = 1
+        self._create_binary_debug()
+        self._setup_op2()
+        op2_reader = self.op2_reader
+        op2_reader.read_nastran_version(self.mode)
+
+        last_starts = {table_name: start for table_name, start, unused_end in results_tables}
+        table_keys = defaultdict(dict)  # type: Dict[bytes, Dict[Tuple[str, Any], None]]
+        self._result_sizer = ResultSizer()
+        try:
+            for table_name, start, unused_end in results_tables:
+                is_last = start == last_starts[table_name]
+                stream_keys = table_keys[table_name]
+                self._stream_keys = stream_keys
+                self._isubcase = None
+                self._finished_subcases = []
+
+                op2_reader._goto(start)
+                self._count = self._table_counts[start]
+                self.table_name = table_name
+                keys0 = set(self._get_result_keys())
+                self._result_sizer.is_active = True
+                for unused_isubtable in op2_reader.iter_results_table():
+                    if is_last and self._finished_subcases:
+                        isubcases = set(self._finished_subcases)
+                        self._finished_subcases = []
+                        keys = [key for key in stream_keys if key[1][0] in isubcases]
+                        for key in keys:
+                            del stream_keys[key]
+                        yield from self._pop_results(keys, combine)
+                self._result_sizer.is_active = False
+
+                # some results aren't created by create_transient_object
+                for key in self._get_result_keys():
+                    if key not in keys0:
+                        stream_keys[key] = None
+                if is_last:
+                    yield from self._pop_results(list(table_keys.pop(table_name)), combine)
+        finally:
+            self._result_sizer = None
+            self._stream_keys = None
+            try:
+                self.f.close()
+            except BufferError:
+                # a result still references a memory mapped record
+                pass
+
+    def _pop_results(self, keys: List[Tuple[str, Any]],
+                     combine: bool) -> List[Tuple[Any, Any]]:
+        """
+        Removes a set of results from the model and finalizes/combines them
+        like ``read_op2`` does
+
+        Returns
+        -------
+        results : List[(key, result), ...]
+            the finalized results
+
+        """
+        objs = []
+        for result_name, key in keys:
+            obj = self.get_result(result_name).pop(key, None)
+            if obj is None:
+                continue
+            self._result_sizer.pop(obj)
+            objs.append((result_name, key, obj))
+
+        # the results that are still being read are left out of the combine
+        current = []
+        for result_name, key in self._get_result_keys():
+            current.append((result_name, key, self.get_result(result_name).pop(key)))
+
+        result_names = []
+        for result_name, key, obj in objs:
+            if hasattr(obj, 'finalize'):
+                obj.finalize()
+            self.get_result(result_name)[key] = obj
+            if result_name not in result_names:
+                result_names.append(result_name)
+        self.subcase_key = defaultdict(list)
+        self.combine_results(combine=combine)
+
+        results = []
+        for result_name in result_names:
+            slot = self.get_result(result_name)
+            for key in list(slot):
+                results.append((key, slot.pop(key)))
+
+        for result_name, key, obj in current:
+            self.get_result(result_name)[key] = obj
+        return results
+
+
+def get_worker_settings(model: OP2_Scalar, single_pass: bool=False,
+                        use_mmap: bool=False) -> Dict[str, Any]:
+    """
+    Gets the read options that the workers need.  The reader deletes some
+    of these (e.g., _results) once it's done, so this is called first.
+    """
+    settings = {
+        'mode' : model.mode,
+        'log_level' : getattr(model.log, 'level', 'warning'),
+        'saved' : set(model._results.saved),
+        'subcases' : None if model.is_all_subcases else sorted(model.valid_subcases),
+        'use_vector' : model.use_vector,
+        'encoding' : model.encoding,
+        'skip_undefined_matrices' : model.skip_undefined_matrices,
+        'additional_matrices' : getattr(model, 'additional_matrices', {}),
+        'single_pass' : single_pass,
+        'use_mmap' : use_mmap,
+    }
+    return settings
+
+
+def group_tables(results_tables: List[Tuple[bytes, int, int]]) -> List[List[Tuple[bytes, int, int]]]:
+    """
+    Groups the occurrences of each results table (in the order the tables
+    first show up).  A table that shows up more than once (e.g., transient
+    restarts, SOL 200 design cycles) may add to the same result objects,
+    so the occurrences have to be read together.
+
+    Parameters
+    ----------
+    results_tables : List[(table_name, start, end), ...]
+        the byte range of each results table
+
+    Returns
+    -------
+    table_groups : List[List[(table_name, start, end), ...]]
+        the occurrences of each table
+
+    """
+    table_groups = {}  # type: Dict[bytes, List[Tuple[bytes, int, int]]]
+    for table in results_tables:
+        table_groups.setdefault(table[0], []).append(table)
+    return list(table_groups.values())
+
+
+def split_tables(results_tables: List[Tuple[bytes, int, int]],
+                 nworkers: int) -> List[List[Tuple[bytes, int, int]]]:
+    """
+    Splits the results tables across the workers, so each worker has about
+    the same number of bytes to read (largest first).  All the occurrences
+    of a table go to the same worker (see ``group_tables``).
+
+    Parameters
+    ----------
+    results_tables : List[(table_name, start, end), ...]
+        the byte range of each results table
+    nworkers : int
+        the number of workers
+
+    Returns
+    -------
+    worker_tables : List[List[(table_name, start, end), ...]]
+        the tables for each worker; empty workers are removed
+
+    """
+    groups = sorted(group_tables(results_tables), key=_get_nbytes, reverse=True)
+
+    worker_tables = [[] for unused_i in range(nworkers)]
+    worker_nbytes = [0] * nworkers
+    for tables in groups:
+        iworker = worker_nbytes.index(min(worker_nbytes))
+        worker_tables[iworker].extend(tables)
+        worker_nbytes[iworker] += _get_nbytes(tables)
+    return [sorted(tables, key=lambda table: table[1])
+            for tables in worker_tables if tables]
+
+
+def _get_nbytes(tables: List[Tuple[bytes, int, int]]) -> int:
+    """gets the size of a set of tables"""
+    return sum(end - start for unused_table_name, start, end in tables)
+
+
+def _set_worker_settings(model: OP2Worker, settings: Dict[str, Any]) -> None:
+    """sets the read options of a worker (see ``get_worker_settings``)"""
+    model.set_subcases(settings['subcases'])
+    model._results.saved = settings['saved']
+    model.use_vector = settings['use_vector']
+    model.additional_matrices = settings['additional_matrices']
+
+    model._set_read_options(settings['encoding'], settings['skip_undefined_matrices'])
+    model._use_mmap = settings['use_mmap']
+
+
+def read_worker_model(op2_filename: str, settings: Dict[str, Any],
+                      table_starts: Set[int], table_ends: Dict[int, int],
+                      table_counts: Dict[int, int]) -> OP2Worker:
+    """
+    Reads a subset of the results tables into a new model.  The model is
+    not finalized/combined.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    settings : Dict[str, Any]
+        see ``get_worker_settings``
+    table_starts : Set[int]
+        the start byte of the results tables to read
+    table_ends : Dict[int, int]
+        start -> end byte of the tables
+    table_counts : Dict[int, int]
+        start -> the optimization count of the results tables
+
+    """
+    log = get_logger(level=settings['log_level'])
+    model = OP2Worker(table_starts, table_ends, table_counts,
+                      log=log, debug=False, mode=settings['mode'])
+    _set_worker_settings(model, settings)
+    if settings['single_pass']:
+        model._read_op2_single_pass(op2_filename, False, settings['mode'])
+    else:
+        model._read_op2_two_pass(op2_filename, False, settings['mode'])
+    return model
+
+
+def iter_worker_results(op2_filename: str, settings: Dict[str, Any],
+                        results_tables: List[Tuple[bytes, int, int]],
+                        table_counts: Dict[int, int],
+                        combine: bool) -> Iterator[Tuple[Any, Any]]:
+    """
+    Reads the results tables in the current process and yields the results
+    of each subcase once they're done (see ``OP2Streamer``)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    settings : Dict[str, Any]
+        see ``get_worker_settings``
+    results_tables : List[(table_name, start, end), ...]
+        the byte range of each results table
+    table_counts : Dict[int, int]
+        start -> the optimization count of the results tables
+    combine : bool
+        see ``read_op2``
+
+    """
+    log = get_logger(level=settings['log_level'])
+    model = OP2Streamer(table_counts, log=log, debug=False, mode=settings['mode'])
+    _set_worker_settings(model, settings)
+    yield from model.iter_results_tables(op2_filename, results_tables, combine)
+
+
+def get_shared_tables(worker_table_keys: List[Dict[int, Set[Tuple[str, Any]]]]) -> List[Set[int]]:
+    """
+    Finds the results tables that add to the same result as a table that
+    was read by another worker.  The serial reader adds these tables to a
+    single result object, so they have to be read together.
+
+    Parameters
+    ----------
+    worker_table_keys : List[Dict[table_start, Set[(result_name, key), ...]]]
+        the results that each table adds to for each worker
+
+    Returns
+    -------
+    shared_tables : List[Set[int]]
+        the start byte of each set of tables that have to be read together
+
+    """
+    parents = {}  # type: Dict[int, int]
+    def _find(start: int) -> int:
+        while parents[start] != start:
+            parents[start] = parents[parents[start]]
+            start = parents[start]
+        return start
+
+    iworkers = {}  # type: Dict[int, int]
+    key_starts = {}  # type: Dict[Tuple[str, Any], int]
+    for iworker, table_keys in enumerate(worker_table_keys):
+        for start in table_keys:
+            parents[start] = start
+            iworkers[start] = iworker
+        for start, keys in table_keys.items():
+            for key in keys:
+                start0 = key_starts.setdefault(key, start)
+                parents[_find(start)] = _find(start0)
+
+    tables = {}  # type: Dict[int, Set[int]]
+    for start in parents:
+        tables.setdefault(_find(start), set()).add(start)
+    shared_tables = [starts for starts in tables.values()
+                     if len({iworkers[start] for start in starts}) > 1]
+    return shared_tables
+
+
+def _read_results_tables(op2_filename: str, settings: Dict[str, Any],
+                         table_starts: Set[int], table_ends: Dict[int, int],
+                         table_counts: Dict[int, int]) -> Tuple[List[Tuple[int, str, Any, Any]],
+                                                              Dict[int, Set[Tuple[str, Any]]],
+                                                              Dict[str, Any]]:
+    """
+    Reads a subset of the results tables (the worker process)
+
+    Returns
+    -------
+    results : List[(table_start, result_name, key, obj), ...]
+        the result objects in the order they were created
+    table_keys : Dict[table_start, Set[(result_name, key), ...]]
+        the results that each table adds to
+    header : Dict[str, Any]
+        the title of the last table
+
+    """
+    model = read_worker_model(op2_filename, settings, table_starts, table_ends,
+                              table_counts)
+    results = []
+    for table_start, keys in model.table_result_keys.items():
+        for result_name, key in keys:
+            obj = model.get_result(result_name).get(key)
+            if obj is not None:
+                results.append((table_start, result_name, key, obj))
+    header = {name: getattr(model, name) for name in HEADER_ATTRIBUTES
+              if getattr(model, name, None) is not None}
+    return results, model.table_keys, header
+
+
+def read_results_tables_parallel(model: OP2_Scalar,
+                                 results_tables: List[Tuple[bytes, int, int]],
+                                 table_ends: Dict[int, int], table_counts: Dict[int, int],
+                                 nworkers: int, settings: Dict[str, Any]) -> None:
+    """
+    Reads the results tables with a pool of worker processes and adds the
+    result objects to the model
+
+    Parameters
+    ----------
+    model : OP2
+        the model that has read the non-results tables
+    results_tables : List[(table_name, start, end), ...]
+        the byte range of each results table
+    table_ends : Dict[int, int]
+        start -> end byte of every table
+    table_counts : Dict[int, int]
+        start -> the optimization count of each results table
+    nworkers : int
+        the number of worker processes
+    settings : Dict[str, Any]
+        see ``get_worker_settings``
+
+    """
+    worker_tables = split_tables(results_tables, nworkers)
+    if not worker_tables:
+        return
+
+    model.log.debug('reading %i results tables with %i workers' % (
+        len(results_tables), len(worker_tables)))
+    with ProcessPoolExecutor(max_workers=len(worker_tables)) as executor:
+        futures = [executor.submit(_read_results_tables, model.op2_filename, settings,
+                                   {start for unused_table_name, start, unused_end in tables},
+                                   table_ends, table_counts)
+                   for tables in worker_tables]
+        worker_results = [future.result() for future in futures]
+
+        # the tables that add to the same result are read again by a single worker
+        shared_tables = get_shared_tables(
+            [table_keys for unused_results, table_keys, unused_header in worker_results])
+        if shared_tables:
+            model.log.debug('rereading %i sets of results tables that share results' % (
+                len(shared_tables)))
+            futures = [executor.submit(_read_results_tables, model.op2_filename, settings,
+                                       table_starts, table_ends, table_counts)
+                       for table_starts in shared_tables]
+            shared_results = [future.result() for future in futures]
+
+    # the worker with the last results table has the final header
+    ilast = max(range(len(worker_tables)), key=lambda i: worker_tables[i][-1][1])
+    unused_results, unused_table_keys, header = worker_results[ilast]
+    for name, value in header.items():
+        setattr(model, name, value)
+
+    # the objects are added in the order the serial reader creates them
+    shared_starts = {start for table_starts in shared_tables for start in table_starts}
+    results = [result for results, unused_table_keys, unused_header in worker_results
+               for result in results if result[0] not in shared_starts]
+    if shared_tables:
+        results += [result for results, unused_table_keys, unused_header in shared_results
+                    for result in results]
+    results.sort(key=lambda result: result[0])
+    for unused_table_start, result_name, key, obj in results:
+        model.get_result(result_name)[key] = obj
@@ -39,6 +39,7 @@ Defines various tables that don't fit in other sections:
     - _skip_table_helper(self)
     - _print_month(self, month, day, year, zero, one)
     - read_results_table(self)
+    - iter_results_table(self)
 
 """
 from __future__ import annotations
@@ -47,7 +48,7 @@ import sys
 from copy import deepcopy
 from itertools import count
 from struct import unpack, Struct, error as struct_error
-from typing import Tuple, Optional, TYPE_CHECKING
+from typing import Tuple, Union, Optional, Iterator, TYPE_CHECKING
 
 import numpy as np
 import scipy  # type: ignore
@@ -67,6 +68,7 @@ from pyNastran.op2.result_objects.design_response import (
     FlutterResponse, FractionalMassResponse, Convergence, Desvars, DSCMCOL)
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
+    from pyNastran.op2.op2_interface.op2_index import OP2Index
 
 IS_TESTING = True
 
@@ -103,6 +105,16 @@ class OP2Reader:
 
         self.op2 = op2  # type: OP2
 
+        #: the sidecar index with the table/record offsets (or None)
+        self.op2_index = None  # type: Optional[OP2Index]
+
+        #: the OP2 is memory mapped (op2.f is an mmap), so the results
+        #: records are returned as views into the file instead of copies
+        self.use_mmap = False
+
+        #: the number of record bytes that were copied out of the file
+        self.nbytes_copied = 0
+
         self.mapped_tables = {
             b'GPL' : self.read_gpl,
             b'GPLS' : self.read_gpls,
@@ -4062,6 +4074,8 @@ class OP2Reader:
                 # record = records[0] + records[1]
             # else:
             record = b''.join(records)
+            self.nbytes_copied += nrecord
+        self.nbytes_copied += nrecord
         return record, nrecord
 
     def _read_record_ndata8(self, debug=True, macro_rewind=False) -> Tuple[bytes, int]:
@@ -4105,6 +4119,62 @@ class OP2Reader:
                 # record = records[0] + records[1]
             # else:
             record = b''.join(records)
+            self.nbytes_copied += nrecord
+        self.nbytes_copied += nrecord
+        return record, nrecord
+
+    def _read_results_record_ndata(self) -> Tuple[Union[bytes, bytearray, memoryview], int]:
+        """
+        Reads a table4 results record and the length of the record
+
+        When the OP2 is memory mapped, a single block record is a memoryview
+        into the file and the blocks of a multi-block record are copied
+        into one preallocated buffer, so the parsers can ``frombuffer``
+        the data without the intermediate bytes objects.
+
+        """
+        if not self.use_mmap or self.is_debug_file:
+            return self._read_record_ndata()
+
+        op2 = self.op2
+        mmap_file = op2.f
+        struct_i = op2.struct_i
+        if self.size == 4:
+            struct_marker = struct_i
+        else:
+            struct_marker = op2.struct_q
+
+        # walk the [4, marker, 4] [ndata, data, ndata] blocks
+        n = op2.n
+        marker0, = struct_marker.unpack_from(mmap_file, n + 4)
+        blocks = []
+        nrecord = 0
+        marker = marker0
+        while marker > 0:
+            n += self.size + 8
+            ndata, = struct_i.unpack_from(mmap_file, n)
+            blocks.append((n + 4, ndata))
+            nrecord += ndata
+            n += ndata + 8
+            marker, = struct_marker.unpack_from(mmap_file, n + 4)
+
+        if marker0 * self.size != blocks[0][1]:
+            raise FortranMarkerError('markers0=%s*%s len(record)=%s; table_name=%r' % (
+                marker0, self.size, blocks[0][1], op2.table_name))
+
+        view = memoryview(mmap_file)
+        if len(blocks) == 1:
+            i0, ndata = blocks[0]
+            record = view[i0:i0 + ndata]
+        else:
+            record = bytearray(nrecord)
+            i = 0
+            for i0, ndata in blocks:
+                record[i:i + ndata] = view[i0:i0 + ndata]
+                i += ndata
+            self.nbytes_copied += nrecord
+        del view
+        self._goto(n)
         return record, nrecord
 
     def _read_block_ndata4(self):
@@ -4556,6 +4626,8 @@ class OP2Reader:
             a record of None indicates a skipped block
 
         """
+        if self._goto_record_end() is not None:
+            return None
         unused_markers0 = self.get_nmarkers(1, rewind=False)
         record = self._skip_block()
 
@@ -4568,6 +4640,10 @@ class OP2Reader:
         return record
 
     def _skip_record_ndata(self, debug=True, macro_rewind=False):
+        if not macro_rewind:
+            ndata = self._goto_record_end()
+            if ndata is not None:
+                return None, ndata
         if self.size == 4:
             return self._skip_record_ndata4(debug=debug, macro_rewind=macro_rewind)
         return self._skip_record_ndata8(debug=debug, macro_rewind=macro_rewind)
@@ -4653,6 +4729,11 @@ class OP2Reader:
             self.binary_debug.write('_get_record_length\n')
         len_record = 0
         n0 = op2.n
+        op2_index = self.op2_index
+        if op2_index is not None and op2_index.is_loaded:
+            record = op2_index.get_record(n0)
+            if record is not None:
+                return record[1]
         markers0 = self.get_nmarkers(1, rewind=False)
         if self.is_debug_file:
             self.binary_debug.write('  markers0=%s\n' % markers0)
@@ -4673,9 +4754,34 @@ class OP2Reader:
             unused_record = self._skip_block()
             len_record += op2.n - n - 8  # -8 is for the block
             markers1 = self.get_nmarkers(1, rewind=True)
+
+        if op2_index is not None and not op2_index.is_loaded and self.read_mode == 1:
+            op2_index.add_record(n0, op2.n, len_record)
         self._goto(n0)
         return len_record
 
+    def _goto_record_end(self) -> Optional[int]:
+        """
+        Uses the index to jump to the end of the record that starts at
+        the current position
+
+        Returns
+        -------
+        ndata : int / None
+            int : the length of the record's data
+            None : the record isn't indexed; the position is unchanged
+
+        """
+        op2_index = self.op2_index
+        if op2_index is None or not op2_index.is_loaded:
+            return None
+        record = op2_index.get_record(self.op2.n)
+        if record is None:
+            return None
+        end, ndata = record
+        self._goto(end)
+        return ndata
+
     def _skip_block(self):
         """
         Skips a block following a pattern of:
@@ -4745,8 +4851,26 @@ class OP2Reader:
         else:
             self.read_results_table8()
 
+    def iter_results_table(self) -> Iterator[int]:
+        """Reads a results table and yields after each subtable (see ``iter_subtables``)"""
+        if self.size == 4:
+            self._read_results_table_header4()
+        else:
+            self._read_results_table_header8()
+        yield from self.iter_subtables()
+
     def read_results_table4(self):
         """Reads a results table"""
+        self._read_results_table_header4()
+        self._read_subtables()
+
+    def read_results_table8(self):
+        """Reads a results table"""
+        self._read_results_table_header8()
+        self._read_subtables()
+
+    def _read_results_table_header4(self):
+        """Reads the header of a results table"""
         op2 = self.op2
         if self.is_debug_file:
             self.binary_debug.write('read_results_table - %s\n' % op2.table_name)
@@ -4764,10 +4888,9 @@ class OP2Reader:
 
         subtable_name = self.get_subtable_name4(op2, data, ndata)
         op2.subtable_name = subtable_name
-        self._read_subtables()
 
-    def read_results_table8(self):
-        """Reads a results table"""
+    def _read_results_table_header8(self):
+        """Reads the header of a results table"""
         op2 = self.op2
         if self.is_debug_file:
             self.binary_debug.write('read_results_table - %s\n' % op2.table_name)
@@ -4786,7 +4909,28 @@ class OP2Reader:
         subtable_name = self.get_subtable_name8(op2, data, ndata)
         subtable_name = reshape_bytes_block(subtable_name)
         op2.subtable_name = subtable_name
-        self._read_subtables()
+
+    def skip_results_table(self):
+        """
+        Skips a results table, but reads the table header (e.g., the date)
+        like ``read_results_table``
+        """
+        op2 = self.op2
+        op2.table_name = self._read_table_name(rewind=False)
+        if self.size == 4:
+            self.read_markers([-1])
+            unused_data = self._read_record()
+            self.read_3_markers([-2, 1, 0])
+            data, ndata = self._read_record_ndata()
+            op2.subtable_name = self.get_subtable_name4(op2, data, ndata)
+        else:
+            self.read_markers8([-1])
+            unused_data = self._read_record()
+            self.read_markers8([-2, 1, 0])
+            data, ndata = self._read_record_ndata8()
+            subtable_name = self.get_subtable_name8(op2, data, ndata)
+            op2.subtable_name = reshape_bytes_block(subtable_name)
+        self._skip_subtables()
 
     def get_subtable_name8(self, op2, data: bytes, ndata: int) -> bytes:
         if ndata == 16: # 8*2
@@ -4909,6 +5053,15 @@ class OP2Reader:
 
     def _read_subtables(self):
         """reads a series of subtables"""
+        for unused_isubtable in self.iter_subtables():
+            pass
+
+    def iter_subtables(self) -> Iterator[int]:
+        """
+        Reads a series of subtables and yields the subtable number (e.g., -3
+        for the first table 3) after each subtable is read, so the results
+        may be used as they're read
+        """
         # this parameters is used for numpy streaming
         op2 = self.op2
         op2._table4_count = 0
@@ -4959,6 +5112,8 @@ class OP2Reader:
 
         # while the subtables aren't done
         while markers[0] != 0:
+            if self._goto_valid_subtable():
+                break
             op2.is_start_of_subtable = True
             if self.is_debug_file:
                 self.binary_debug.write('***isubtable = %i\n' % op2.isubtable)
@@ -4968,6 +5123,7 @@ class OP2Reader:
                 print('failed reading %s isubtable=%s' % (op2.table_name, op2.isubtable))
                 raise
             #force_table4 = self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            yield op2.isubtable
             op2.isubtable -= 1
 
             iloc = op2.f.tell()
@@ -4997,10 +5153,41 @@ class OP2Reader:
         if self.is_debug_file:
             self.binary_debug.write('breaking on marker=%r\n' % str(markers))
 
+        op2_index = self.op2_index
+        if op2_index is not None and not op2_index.is_loaded and self.read_mode == 1:
+            op2_index.add_subtables_end(op2.n)
+
         # we've finished reading all subtables, but have one last marker to read
         self.read_markers([0])
         op2._finish()
 
+    def _goto_valid_subtable(self) -> bool:
+        """
+        Uses the index to jump from a table3 record of a subcase that isn't
+        being read to the next table3 record of a subcase that is
+
+        Returns
+        -------
+        is_done : bool
+            True : there are no more subtables to read; the position is
+                   the end of the subtables
+            False : the position is the table3/table4 record to read
+
+        """
+        op2 = self.op2
+        op2_index = self.op2_index
+        if op2_index is None or not op2_index.is_loaded or op2.is_all_subcases:
+            return False
+        subtable = op2_index.get_next_subtable(op2.n, op2.valid_subcases)
+        if subtable is None:
+            return False
+        n, isubtable = subtable
+        self._goto(n)
+        if isubtable == 0:
+            return True
+        op2.isubtable = isubtable
+        return False
+
     def _read_subtable_3_4(self, table3_parser, table4_parser, passer) -> Optional[bool]:
         """
         Reads a series of subtable 3/4
@@ -5027,6 +5214,7 @@ class OP2Reader:
         op2 = self.op2
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
+        n0 = op2.n
         # this is the length of the current record inside table3/table4
         record_len = self._get_record_length()
         if self.is_debug_file:
@@ -5057,6 +5245,12 @@ class OP2Reader:
                     if op2.table_name in oes_nl:
                         update_op2_datacode(op2, data_code_old)
 
+                        result_sizer = op2._result_sizer
+                        if result_sizer is not None and result_sizer.is_active:
+                            op2._read_record_single_pass(table4_parser, data, ndata, record_len,
+                                                         skip_data=False)
+                            return False
+
                         n = table4_parser(data, ndata)
                         #print(data_code_old)
                         if not isinstance(n, integer_types):
@@ -5079,6 +5273,11 @@ class OP2Reader:
                         #print('except...')
                         return False
                     raise RuntimeError(op2.code_information())
+                op2_index = self.op2_index
+                if (op2_index is not None and not op2_index.is_loaded and
+                        self.read_mode == 1 and getattr(op2, 'isubcase', None) is not None):
+                    op2_index.add_subtable(n0, op2.isubtable, op2.isubcase,
+                                           getattr(op2, 'nonlinear_factor', None))
                 #if hasattr(op2, 'isubcase'):
                     #print("code = ", op2._get_code())
         else:
@@ -5091,7 +5290,12 @@ class OP2Reader:
                     unused_n = op2._read_subtable_results(table4_parser, record_len)
                 else:
                     data, ndata = self._read_record_ndata()
-                    unused_n = table4_parser(data, ndata)
+                    result_sizer = op2._result_sizer
+                    if result_sizer is not None and result_sizer.is_active:
+                        unused_n = op2._read_record_single_pass(table4_parser, data, ndata, None,
+                                                                skip_data=False)
+                    else:
+                        unused_n = table4_parser(data, ndata)
                     if IS_TESTING:
                         self._run_checks(table4_parser)
                 #del n
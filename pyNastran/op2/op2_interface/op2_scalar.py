@@ -42,9 +42,10 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
 
 """
 import os
+import mmap
 from struct import Struct, unpack
 from collections import defaultdict
-from typing import List, Tuple, Dict, Union, Any
+from typing import List, Tuple, Dict, Union, Optional, Any
 
 from numpy import array
 import numpy as np
@@ -53,6 +54,9 @@ from cpylog import get_logger
 from pyNastran import is_release, __version__
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, mapfmt, reshape_bytes_block
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_idx_filename
+from pyNastran.op2.op2_interface.out_of_core import MemmapFile
+from pyNastran.op2.op2_interface.single_pass import ResultSizer
 from pyNastran.bdf.cards.params import PARAM
 
 #============================
@@ -529,6 +533,25 @@ class OP2_Scalar(LAMA, ONR, OGPF,
 
         self.is_vectorized = False
         self._close_op2 = True
+        self._single_pass = False
+
+        #: single_pass=True : grows the results as the records are read
+        self._result_sizer = None
+        self._use_index = False
+        self._use_mmap = False
+        self._op2_index = None
+
+        #: nworkers>1 : [(table_name, start, end), ...] of the skipped results
+        #: tables, which are read by the worker processes (see op2_parallel)
+        self._results_table_ranges = None
+
+        #: nworkers>1 : start -> end byte of every table, so the worker
+        #: processes skip the tables they don't read with a single seek
+        self._table_ends = None
+
+        #: nworkers>1 : start -> the optimization count (_count) of each
+        #: skipped results table, which is set by the R1TABRG tables
+        self._table_counts = None
 
         self.result_names = set()
 
@@ -1504,7 +1527,8 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.is_debug_file, self.binary_debug = create_binary_debug(
             self.op2_filename, self.debug_file, self.log)
 
-    def read_op2(self, op2_filename=None, combine=False, load_as_h5=False, h5_file=None, mode=None):
+    def read_op2(self, op2_filename=None, combine=False, load_as_h5=False, h5_file=None,
+                 mode=None, memmap_dirname=None):
         """
         Starts the OP2 file reading
 
@@ -1523,6 +1547,10 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         h5_file : h5File; default=None
             None : ???
             h5File : ???
+        memmap_dirname : str; default=None
+            None : the load_as_h5 results are stored in op2_filename.h5
+            str : the load_as_h5 results are stored as memory mapped
+                  .npy files in this directory
 
         +--------------+-----------------------+
         | op2_filename | Description           |
@@ -1540,10 +1568,14 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.h5_filename = fname + '.h5'
 
         self.op2_reader.load_as_h5 = load_as_h5
-        if load_as_h5:
+        if load_as_h5 and self.op2_reader.h5_file is None:
+            # the file is shared by the array sizing/filling passes
             h5_file = None
-            import h5py
-            self.h5_file = h5py.File(self.h5_filename, 'w')
+            if memmap_dirname is not None:
+                self.h5_file = MemmapFile(memmap_dirname)
+            else:
+                import h5py
+                self.h5_file = h5py.File(self.h5_filename, 'w')
             self.op2_reader.h5_file = self.h5_file
 
         self._count = 0
@@ -1561,6 +1593,8 @@ class OP2_Scalar(LAMA, ONR, OGPF,
                 if os.path.getsize(op2_filename) == 0:
                     raise IOError('op2_filename=%r is empty.' % op2_filename)
                 raise IOError('op2_filename=%r is not a binary OP2.' % op2_filename)
+            self._op2_index = self._load_op2_index(op2_filename)
+            self.op2_reader.op2_index = self._op2_index
 
         self._create_binary_debug()
         self._setup_op2()
@@ -1594,6 +1628,47 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         #self.remove_unpickable_data()
         return table_names
 
+    def _load_op2_index(self, op2_filename: str) -> Optional[OP2Index]:
+        """
+        Loads the sidecar index or starts building a new one
+
+        Returns
+        -------
+        op2_index : OP2Index / None
+            None : use_index=False or the binary debug file is being written
+            OP2Index : is_loaded=True if the index was loaded from the file
+
+        """
+        if not self._use_index or self.debug_file is not None:
+            return None
+        idx_filename = get_idx_filename(op2_filename)
+        op2_index = OP2Index.load(idx_filename, op2_filename)
+        if op2_index is not None:
+            self.log.debug('loaded %r' % idx_filename)
+            return op2_index
+
+        # we can only build the index when everything is being read
+        is_all_results = self._results.saved == self._results.allowed
+        is_parallel = self._results_table_ranges is not None
+        if not(self.is_all_subcases and is_all_results) or is_parallel:
+            return None
+        return OP2Index(op2_filename)
+
+    def _save_op2_index(self) -> None:
+        """writes the sidecar index if it was built during this read"""
+        op2_index = self._op2_index
+        self._op2_index = None
+        if op2_index is None or op2_index.is_loaded:
+            return
+        op2_index.set_result_names(self)
+        idx_filename = get_idx_filename(self.op2_filename)
+        try:
+            op2_index.save(idx_filename)
+        except OSError:
+            self.log.warning('cannot write %r' % idx_filename)
+            return
+        self.log.debug('wrote %r' % idx_filename)
+
     def close_op2(self, force=True):
         """closes the OP2 and debug file"""
         if self.is_debug_file:
@@ -1605,7 +1680,12 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             if self.f is not None:
                 # can happen if:
                 #  - is ascii file
-                self.f.close()
+                try:
+                    self.f.close()
+                except BufferError:
+                    # a result still references a memory mapped record,
+                    # so the map is closed when the result is deleted
+                    pass
             del self.binary_debug
             del self.f
             self._cleanup_data_members()
@@ -1629,7 +1709,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             'apply_symmetry',
             'words', 'device_code', 'table_name', '_count', 'additional_matrices',
             # 350
-            'data_names', '_close_op2',
+            'data_names', '_close_op2', '_deferred_tables',
             'op2_reader',
             # 74
             'generalized_tables',
@@ -1663,6 +1743,10 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
             self.f = open(self.op2_filename, 'rb')
+            if self._use_mmap:
+                with self.f as op2_file:
+                    self.f = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.op2_reader.use_mmap = True
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -1726,6 +1810,9 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         op2_reader = self.op2_reader
         table_names = []
         self.table_count = defaultdict(int)
+        self._deferred_tables = []
+        if self._single_pass:
+            self._result_sizer = ResultSizer()
         while table_name is not None:
             self.table_count[table_name] += 1
             table_names.append(table_name)
@@ -1737,63 +1824,162 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             if is_release:
                 self.log.debug('  table_name=%r' % table_name)
 
-            self.table_name = table_name
-            #if 0:
-                #op2_reader._skip_table(table_name)
-            #else:
-            #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                op2_reader.mapped_tables[table_name]()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                op2_reader.read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                op2_reader.read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                op2_reader.read_matrix(table_name)
+            n0 = self.n
+            op2_index = op2_reader.op2_index
+            if (op2_index is not None and op2_index.is_loaded and
+                    self._is_results_table(table_name) and
+                    op2_index.is_table_skippable(table_name, n0, self)):
+                # none of the results/subcases in the table were requested
+                op2_reader._goto(op2_index.get_table_end(table_name, n0))
+            elif self._results_table_ranges is not None and self._is_results_table(table_name):
+                # nworkers>1; the results table is read by a worker process
+                op2_reader.skip_results_table()
+                if self.read_mode == 1:
+                    self._results_table_ranges.append((table_name, n0, self.n))
+                    self._table_counts[n0] = self._count
+            elif self._single_pass:
+                self._read_table_single_pass(table_name)
             else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    'Invalid Table = %r\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % (
-                        table_name)
-                )
-                raise NotImplementedError(msg)
+                self._read_table(table_name)
+
+            if op2_index is not None and not op2_index.is_loaded and self.read_mode == 1:
+                op2_index.add_table(table_name, n0, self.n)
+            if self._table_ends is not None:
+                self._table_ends[n0] = self.n
 
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
+        if self._single_pass:
+            self._result_sizer.finalize()
+            self._result_sizer = None
+
+            # the deferred tables are read with the same information
+            # the 2nd pass of the two pass reader has
+            self.table_names = table_names
+            self._read_deferred_tables()
         return table_names
 
+    def _read_table(self, table_name: bytes) -> None:
+        """
+        Reads a single geometry/result/matrix table with the current read_mode
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        op2_reader = self.op2_reader
+        self.table_name = table_name
+        #if 0:
+            #op2_reader._skip_table(table_name)
+        #else:
+        #print(table_name, table_name in op2_reader.mapped_tables)
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            op2_reader.mapped_tables[table_name]()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            op2_reader.read_matrix(table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            op2_reader.read_matrix(table_name)
+        elif table_name.strip() in self.additional_matrices:
+            op2_reader.read_matrix(table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                'Invalid Table = %r\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % (
+                    table_name)
+            )
+            raise NotImplementedError(msg)
+
+    def _is_results_table(self, table_name: bytes) -> bool:
+        """is the table read by ``OP2Reader.read_results_table``?"""
+        op2_reader = self.op2_reader
+        is_results_table = (
+            table_name not in self.generalized_tables and
+            table_name not in op2_reader.mapped_tables and
+            table_name not in GEOM_TABLES and
+            table_name not in MATRIX_TABLES and
+            table_name in RESULT_TABLES)
+        return is_results_table
+
+    def _read_table_single_pass(self, table_name: bytes) -> None:
+        """
+        Sizes and fills a results table as it's read.
+
+        Each record of a results table is read once and is counted with
+        read_mode=1 and then filled with read_mode=2.  The arrays are built
+        the first time a result is seen and are grown as the records are
+        counted (see ``ResultSizer``), so tables that show up more than
+        once (e.g., SOL 200 design cycles) are never re-read.
+
+        Tables that are not results tables (e.g., geometry, R1TABRG, OGPWG)
+        may accumulate data across multiple occurrences of the table, so
+        only read_mode=1 is run now; read_mode=2 is run on those (small)
+        tables by ``_read_deferred_tables`` once the file has been scanned.
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        n0 = self.f.tell()
+        self.read_mode = 1
+        if not self._is_results_table(table_name):
+            self._read_table(table_name)
+            self._deferred_tables.append((table_name, n0))
+            return
+
+        result_sizer = self._result_sizer
+        result_sizer.is_active = True
+        try:
+            self._read_table(table_name)
+        finally:
+            result_sizer.is_active = False
+
+    def _read_deferred_tables(self) -> None:
+        """runs read_mode=2 on the tables that were skipped by the single pass reader"""
+        op2_reader = self.op2_reader
+        n_end = self.f.tell()
+        self.read_mode = 2
+        for table_name, n in self._deferred_tables:
+            op2_reader._goto(n)
+            self._read_table(table_name)
+        self._deferred_tables = []
+        op2_reader._goto(n_end)
+
     def set_additional_generalized_tables_to_read(self, tables):
         """
         Adds methods to call a generalized table.
@@ -0,0 +1,201 @@
+"""
+Defines the out-of-core storage of the result ``data`` arrays that is
+used by ``read_op2(load_as_h5=True)``.  Defines:
+
+ - MemmapFile(dirname)
+   - create_group(name)
+   - create_dataset(name, shape=None, dtype=None, data=None, chunks=None)
+ - create_out_of_core_data(obj)
+ - take_ntotal(obj, i)
+ - resize_out_of_core(obj, name, array, shape)
+ - get_chunks(shape, dtype, nbytes_max=2**20)
+
+The results are either stored as chunked datasets in an h5py.File or as
+memory mapped .npy files (np.memmap), so they are written to the disk as
+the OP2 is read and may be sliced lazily by time step/element afterwards.
+
+"""
+from __future__ import annotations
+import os
+import re
+from typing import Tuple, Dict, Union, Optional, Any
+
+import numpy as np
+
+
+class MemmapGroup:
+    """
+    Stores the result arrays as memory mapped .npy files in a directory
+
+    This supports the subset of the h5py.Group interface that the results
+    use, so a MemmapFile may be used as the ``h5_file``.
+    """
+    def __init__(self, dirname: str) -> None:
+        """
+        Parameters
+        ----------
+        dirname : str
+            the directory to write the .npy files to; created if it doesn't exist
+
+        """
+        os.makedirs(dirname, exist_ok=True)
+        self.dirname = dirname
+        self._groups = {}  # type: Dict[str, MemmapGroup]
+        self._datasets = {}  # type: Dict[str, np.memmap]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._groups or name in self._datasets
+
+    def __getitem__(self, name: str) -> Union[MemmapGroup, np.memmap]:
+        if name in self._groups:
+            return self._groups[name]
+        return self._datasets[name]
+
+    def create_group(self, name: str) -> MemmapGroup:
+        """creates a sub-directory"""
+        if name in self:
+            raise ValueError('%r already exists in %r' % (name, self.dirname))
+        group = MemmapGroup(os.path.join(self.dirname, _get_path_name(name)))
+        self._groups[name] = group
+        return group
+
+    def create_dataset(self, name: str, shape: Optional[Tuple[int, ...]]=None,
+                       dtype: Any=None, data: Any=None, chunks: Any=None) -> np.memmap:
+        """
+        Creates an array that's backed by a .npy file, which may be
+        reloaded with ``np.load(filename, mmap_mode='r')``
+
+        Parameters
+        ----------
+        name : str
+            the name of the array
+        shape / dtype : Tuple[int, ...] / np.dtype; default=None
+            the shape/type of a zeroed array
+        data : np.ndarray; default=None
+            the initial values of the array (overwrites shape/dtype)
+        chunks : varies
+            unused; the OS pages the array
+
+        """
+        if name in self:
+            raise ValueError('%r already exists in %r' % (name, self.dirname))
+        if data is not None:
+            data = np.asarray(data)
+            shape = data.shape
+            dtype = data.dtype
+        if int(np.prod(shape)) == 0:
+            # an empty file can't be memory mapped
+            array = np.zeros(shape, dtype=dtype)
+        else:
+            filename = os.path.join(self.dirname, _get_path_name(name) + '.npy')
+            array = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=shape)
+            if data is not None:
+                array[...] = data
+        self._datasets[name] = array
+        return array
+
+    def __repr__(self) -> str:
+        return '%s(dirname=%r, ngroups=%s, ndatasets=%s)' % (
+            self.__class__.__name__, self.dirname, len(self._groups), len(self._datasets))
+
+
+class MemmapFile(MemmapGroup):
+    """the np.memmap version of the h5py.File that is used by load_as_h5"""
+    def close(self) -> None:
+        """the arrays are closed when they're deleted"""
+        pass
+
+
+def _get_path_name(name: str) -> str:
+    """the group names (e.g., "Subcase=(1, 1, 1, 0, 0, '', '')") aren't valid filenames"""
+    return re.sub(r'[^\w.=+-]+', '_', name).strip('_')
+
+
+def create_out_of_core_data(obj: Any) -> None:
+    """
+    Replaces the in-memory ``data`` array of a newly built result with an
+    out-of-core array of the same shape/dtype.
+
+    The array from ``obj.build()`` is never filled, so its pages are never
+    touched; the parsers then fill the out-of-core array one time step at
+    a time.  Results that already store their data in the h5_file are
+    skipped.
+    """
+    data = getattr(obj, 'data', None)
+    h5_file = obj.h5_file
+    if h5_file is None or type(data) is not np.ndarray or data.size == 0:
+        return
+
+    group = obj._get_result_group()
+    obj.data = group.create_dataset(
+        'data', shape=data.shape, dtype=data.dtype,
+        chunks=get_chunks(data.shape, data.dtype))
+
+
+def take_ntotal(obj: Any, i: np.ndarray) -> Any:
+    """
+    Gets ``obj.data[:, i, :]``, which is used to remove the unused
+    CBEAM stations
+
+    An out-of-core array is copied to a new out-of-core array one time
+    step at a time, so it's never fully loaded.
+    """
+    data = obj.data
+    if type(data) is np.ndarray:
+        return data[:, i, :]
+    if len(i) == data.shape[1]:
+        return data
+
+    shape = (data.shape[0], len(i)) + tuple(data.shape[2:])
+    group = obj._get_result_group()
+    data2 = group.create_dataset('data', shape=shape, dtype=data.dtype,
+                                 chunks=get_chunks(shape, data.dtype))
+    for itime in range(shape[0]):
+        data2[itime, ...] = data[itime, ...][i, ...]
+    return data2
+
+
+def resize_out_of_core(obj: Any, name: str, array: Any,
+                       shape: Tuple[int, ...]) -> Any:
+    """
+    Copies the overlapping part of an out-of-core array to a new
+    out-of-core array, which is used to grow/trim the arrays of
+    ``read_op2(single_pass=True)``
+
+    The array is copied one time step at a time, so it's never fully loaded.
+    """
+    group = obj._get_result_group()
+    array2 = group.create_dataset(name, shape=shape, dtype=array.dtype,
+                                  chunks=get_chunks(shape, array.dtype))
+    index = tuple(slice(0, min(n0, n)) for n0, n in zip(array.shape[1:], shape[1:]))
+    if len(index) == 0:
+        n = min(array.shape[0], shape[0])
+        array2[:n] = array[:n]
+        return array2
+    for itime in range(min(array.shape[0], shape[0])):
+        array2[(itime, ) + index] = array[(itime, ) + index]
+    return array2
+
+
+def get_chunks(shape: Tuple[int, ...], dtype: Any,
+               nbytes_max: int=2**20) -> Tuple[int, ...]:
+    """
+    Gets the HDF5 chunk shape, which is a single time step that is split
+    into chunks of ~nbytes_max, so slicing by time step is fast
+
+    Parameters
+    ----------
+    shape : Tuple[int, ...]
+        the shape of the data array; (ntimes, ntotal, nresults)
+    dtype : np.dtype
+        the type of the data array
+    nbytes_max : int; default=2**20 (1 MB)
+        the approximate maximum size of a chunk
+
+    """
+    itemsize = np.dtype(dtype).itemsize
+    if len(shape) == 1:
+        return (max(1, min(shape[0], nbytes_max // itemsize)), )
+    nbytes_row = itemsize * int(np.prod(shape[2:]))
+    nrows = max(1, min(shape[1], nbytes_max // nbytes_row))
+    return (1, nrows) + tuple(shape[2:])
@@ -0,0 +1,361 @@
+"""
+Defines the array growing that is used by ``read_op2(single_pass=True)``.
+Defines:
+
+ - ResultSizer()
+   - start(obj)
+   - grow()
+   - check_fill()
+   - finalize()
+   - pop(obj)
+
+The two pass reader sizes the results by walking the whole file with
+read_mode=1 and then builds the arrays and fills them on a second walk
+with read_mode=2.  The single pass reader reads each results record once
+and runs both modes on the in-memory record:
+
+ 1. read_mode=1 counts the record, which updates the sizing counters
+    (e.g., ntimes, nelements, _ntotals) of the result
+ 2. the arrays are built the first time the result is seen; when the
+    counters outgrow the capacity of the arrays, they're grown to fit
+    about twice as many records
+ 3. read_mode=2 fills the record
+
+A result stores both the counters of the first pass and the fill state
+of the second pass in the same attributes, so the sizing counters are
+swapped in for step 1 and the fill state is swapped back in for step 3.
+The arrays are trimmed to their final size once the file has been read.
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Set, Tuple, Any
+
+import numpy as np
+
+from pyNastran.op2.op2_interface.out_of_core import resize_out_of_core
+
+
+class ResultSizer:
+    """grows the vectorized results as the records are read"""
+    def __init__(self):
+        #: is a results table being read
+        self.is_active = False
+
+        #: id(obj) -> SizeState
+        self._states = {}  # type: Dict[int, SizeState]
+
+        #: the results that were counted by the current record
+        self._sized = []  # type: List[SizeState]
+
+        #: the results that are being filled by the current record
+        self._filled = []  # type: List[SizeState]
+
+    def start(self, obj: Any) -> None:
+        """
+        Swaps in the sizing counters of a result before it's counted by
+        read_mode=1.  This is called every time read_mode=1 gets a result
+        (see ``create_transient_object``).
+        """
+        state = self._states.get(id(obj))
+        if state is None:
+            if not(hasattr(obj, 'build') and hasattr(obj, 'is_built')) or obj.is_built:
+                return
+            state = SizeState(obj)
+            self._states[id(obj)] = state
+        elif obj.is_built and state.filled is None:
+            state.filled = {key: getattr(obj, key) for key in state.size}
+            state.arrays = {key: getattr(obj, key) for key in state.array_names}
+            for key, value in state.size.items():
+                setattr(obj, key, value)
+
+        if state not in self._sized:
+            self._sized.append(state)
+
+    def grow(self) -> None:
+        """
+        Swaps the fill state back in after read_mode=1 and grows the arrays
+        to fit the counted record
+        """
+        for state in self._sized:
+            obj = state.obj
+            if not obj.is_built:
+                # the result is built by read_mode=2
+                state.set_size(obj)
+            elif state.filled is not None:
+                state.size = {key: getattr(obj, key) for key in state.size}
+                for key, value in state.filled.items():
+                    setattr(obj, key, value)
+
+                # read_mode=1 may overwrite an array with a data_code value
+                # (e.g., element_type), which doesn't happen once the two
+                # pass reader has built the result
+                for key, value in state.arrays.items():
+                    setattr(obj, key, value)
+                state.filled = None
+                state.arrays = {}
+                state.grow()
+            state.before = {key: _copy_value(getattr(obj, key, None))
+                            for key in state.keys - state.fill_keys}
+        self._filled = self._sized
+        self._sized = []
+
+    def check_fill(self) -> None:
+        """finds the counters that are changed by read_mode=2"""
+        for state in self._filled:
+            state.check_fill()
+        self._filled = []
+
+    def finalize(self) -> None:
+        """trims the arrays to their final size"""
+        for state in self._states.values():
+            if state.obj.is_built and state.built:
+                state.grow(trim=True)
+        self._states = {}
+
+    def pop(self, obj: Any) -> None:
+        """trims the arrays of a result that's done and stops growing it"""
+        state = self._states.pop(id(obj), None)
+        if state is not None and obj.is_built and state.built:
+            state.grow(trim=True)
+
+
+class SizeState:
+    """the sizing/fill state of a result"""
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+        #: the counters of the new result
+        self.init = get_counters(obj)
+
+        #: the counters that are changed by read_mode=1 or build()
+        self.keys = set()  # type: Set[str]
+
+        #: the counters that are changed by read_mode=2
+        self.fill_keys = set()  # type: Set[str]
+
+        #: the read_mode=1 counters
+        self.size = {}  # type: Dict[str, Any]
+
+        #: the read_mode=1 counters of the first record
+        self.first = {}  # type: Dict[str, Any]
+
+        #: the read_mode=1 counters that the arrays have room for
+        self.capacity = None
+
+        #: the number of values of each counter list that fit the capacity
+        self.nfit = {}  # type: Dict[str, int]
+
+        #: the attributes of the result before it's built
+        self.template = {}  # type: Dict[str, Any]
+
+        #: the read_mode=2 counters, while the read_mode=1 counters are swapped in
+        self.filled = None
+
+        #: the arrays of the result, while the read_mode=1 counters are swapped in
+        self.arrays = {}  # type: Dict[str, Any]
+
+        #: the names of the arrays that build() creates
+        self.array_names = []  # type: List[str]
+
+        #: the counters before read_mode=2
+        self.before = {}  # type: Dict[str, Any]
+
+        #: has the first build been checked
+        self.built = False
+
+    def set_size(self, obj: Any) -> None:
+        """stores the counters/attributes that the result will be built with"""
+        size = get_counters(obj)
+        self.keys = {key for key, value in size.items()
+                     if key not in self.init or _is_changed(self.init[key], value)}
+        self.size = size
+        self.first = {key: _copy_value(value) for key, value in size.items()}
+        self.template = dict(obj.__dict__)
+
+    def check_fill(self) -> None:
+        """finds the counters that are changed by read_mode=2"""
+        obj = self.obj
+        if not obj.is_built:
+            return
+        if not self.built:
+            # the result was just built; build() and read_mode=2 changed the
+            # counters, so we compare against a result that's only built
+            self.built = True
+            self.array_names = [key for key, value in obj.__dict__.items()
+                                if hasattr(value, 'shape') and not isinstance(value, np.generic)]
+            counters = get_counters(obj)
+            probe = build_probe(obj, self.template, self.size)
+            for key, value in counters.items():
+                if key in self.size and not _is_changed(self.size[key], value):
+                    continue
+                self.keys.add(key)
+                if _is_changed(getattr(probe, key, None), value):
+                    self.fill_keys.add(key)
+            self.size = {key: self.size[key] for key in self.keys if key in self.size}
+            self.set_capacity({key: _copy_value(value) for key, value in self.size.items()})
+            return
+
+        for key, value in self.before.items():
+            if _is_changed(value, getattr(obj, key, None)):
+                self.fill_keys.add(key)
+
+    def grow(self, trim: bool=False) -> None:
+        """
+        Grows the arrays to fit the read_mode=1 counters and updates the
+        counters that build() sets
+
+        The arrays are only grown when the counters outgrow the capacity,
+        so most records don't build a probe.  The new capacity extrapolates
+        the counters to about twice as many records.
+
+        Parameters
+        ----------
+        trim : bool; default=False
+            False : the arrays are grown to the capacity when the
+                    counters don't fit
+            True : the arrays are trimmed to the size build() gives
+
+        """
+        if not trim and self.is_fit():
+            return
+
+        obj = self.obj
+        size = self.size if trim else self._get_capacity()
+        probe = build_probe(obj, self.template, size)
+        for name, array in probe.__dict__.items():
+            if not isinstance(array, np.ndarray):
+                continue
+            array0 = getattr(obj, name, None)
+            if array0 is None or not hasattr(array0, 'shape') or array0.ndim != array.ndim:
+                continue
+            shape = _get_shape(array0.shape, array.shape, trim)
+            if shape != array0.shape:
+                setattr(obj, name, _resize_array(obj, name, array0, shape))
+
+        for key in self.keys - self.fill_keys:
+            if key in probe.__dict__:
+                setattr(obj, key, _copy_value(probe.__dict__[key]))
+        self.set_capacity(size)
+
+    def set_capacity(self, capacity: Dict[str, Any]) -> None:
+        """stores the read_mode=1 counters that the arrays have room for"""
+        self.capacity = capacity
+        self.nfit = {key: len(value) for key, value in self.size.items()
+                     if isinstance(value, list)}
+
+    def is_fit(self) -> bool:
+        """are the read_mode=1 counters within the capacity"""
+        capacity = self.capacity
+        if capacity is None:
+            return False
+        for key, value in self.size.items():
+            capacity_i = capacity.get(key)
+            if isinstance(value, list) and isinstance(capacity_i, list):
+                # read_mode=1 appends to the lists (e.g., _ntotals), so only
+                # the values since the last record are checked
+                n0 = self.nfit[key]
+                n = len(value)
+                if n > len(capacity_i) or not all(
+                        _is_fit(value_i, capacity_ii)
+                        for value_i, capacity_ii in zip(value[n0:], capacity_i[n0:n])):
+                    return False
+                self.nfit[key] = n
+            elif not _is_fit(value, capacity_i):
+                return False
+        return True
+
+    def _get_capacity(self) -> Dict[str, Any]:
+        """
+        Extrapolates the read_mode=1 counters, so the counted part (what
+        was added after the first record) is doubled
+        """
+        capacity = {}
+        for key, value in self.size.items():
+            first = self.first.get(key)
+            if isinstance(value, list) and isinstance(first, list):
+                value = value + value[len(first):]
+            elif _is_int(value) and _is_int(first) and value > first:
+                value = 2 * value - first
+            capacity[key] = _copy_value(value)
+        return capacity
+
+
+def get_counters(obj: Any) -> Dict[str, Any]:
+    """gets the int/list attributes of a result"""
+    counters = {}
+    for key, value in obj.__dict__.items():
+        if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+            counters[key] = value
+        elif isinstance(value, list):
+            counters[key] = list(value)
+    return counters
+
+
+def build_probe(obj: Any, template: Dict[str, Any], size: Dict[str, Any]) -> Any:
+    """
+    Builds a copy of an unbuilt result with a set of read_mode=1 counters.
+    The arrays are zeroed and aren't filled, so the memory isn't touched.
+    """
+    probe = obj.__class__.__new__(obj.__class__)
+    probe.__dict__.update(template)
+    for key, value in size.items():
+        setattr(probe, key, _copy_value(value))
+    probe.is_built = False
+    probe.load_as_h5 = False
+    probe.build()
+    return probe
+
+
+def _get_shape(shape0: Tuple[int, ...], shape: Tuple[int, ...],
+               trim: bool) -> Tuple[int, ...]:
+    """gets the shape of the grown/trimmed array"""
+    if trim:
+        return shape
+    return tuple(max(n0, n) for n0, n in zip(shape0, shape))
+
+
+def _resize_array(obj: Any, name: str, array: Any, shape: Tuple[int, ...]) -> Any:
+    """copies the overlapping part of an array to a new array"""
+    if type(array) is not np.ndarray:
+        return resize_out_of_core(obj, name, array, shape)
+
+    index = tuple(slice(0, min(n0, n)) for n0, n in zip(array.shape, shape))
+    if all(n <= n0 for n0, n in zip(array.shape, shape)):
+        return array[index].copy()
+    array2 = np.zeros(shape, dtype=array.dtype)
+    array2[index] = array[index]
+    return array2
+
+
+def _copy_value(value: Any) -> Any:
+    """copies the lists, so they're not shared by the sizing/fill states"""
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _is_int(value: Any) -> bool:
+    """is the counter an integer"""
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
+def _is_fit(value: Any, capacity: Any) -> bool:
+    """is a read_mode=1 counter within the capacity"""
+    if _is_int(value) and _is_int(capacity):
+        return value <= capacity
+    if isinstance(value, list) and isinstance(capacity, list):
+        return len(value) <= len(capacity) and all(
+            _is_fit(value_i, capacity_i) for value_i, capacity_i in zip(value, capacity))
+    return not _is_changed(value, capacity)
+
+
+def _is_changed(value1: Any, value2: Any) -> bool:
+    """compares two counters"""
+    if type(value1) is not type(value2) and not (
+            isinstance(value1, (int, np.integer)) and isinstance(value2, (int, np.integer))):
+        return True
+    try:
+        return bool(value1 != value2)
+    except ValueError:
+        # a list with arrays
+        return True
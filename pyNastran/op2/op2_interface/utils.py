@@ -1,6 +1,7 @@
 from itertools import count
 from typing import List, Any
 import numpy as np
+from pyNastran.op2.op2_interface.out_of_core import create_out_of_core_data
 
 
 def build_obj(obj):
@@ -10,6 +11,8 @@ def build_obj(obj):
     """
     if not obj.is_built:
         obj.build()
+        if getattr(obj, 'load_as_h5', False):
+            create_out_of_core_data(obj)
 
 def apply_mag_phase(floats: Any, is_magnitude_phase: bool,
                     isave1: List[int], isave2: List[int]) -> Any:
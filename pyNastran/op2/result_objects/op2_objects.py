@@ -172,8 +172,11 @@ class ScalarObject(BaseScalarObject):
         # length of each time step
         self._ntotals = []
 
-        self.load_as_h5 = False
-        self.h5_file = None
+        if not hasattr(self, 'h5_file'):
+            # the stress/strain classes are initialized twice, but the
+            # load_as_h5/h5_file keys are popped on the first call
+            self.load_as_h5 = False
+            self.h5_file = None
         if 'load_as_h5' in data_code:
             self.load_as_h5 = data_code['load_as_h5']
             del data_code['load_as_h5']
@@ -270,7 +273,15 @@ class ScalarObject(BaseScalarObject):
             subcase_group = self.h5_file[case_name]
         else:
             subcase_group = self.h5_file.create_group(case_name)
-        group = subcase_group.create_group(self.result_name)
+
+        # the result may be stored more than once (e.g., a table that's
+        # split into 2 objects or an array that's been resized)
+        group_name = self.result_name
+        i = 1
+        while group_name in subcase_group:
+            group_name = '%s_%i' % (self.result_name, i)
+            i += 1
+        group = subcase_group.create_group(group_name)
         return group
 
     def _get_code(self) -> Tuple[int, int, int, int, int, str, str]:
@@ -295,7 +306,10 @@ class ScalarObject(BaseScalarObject):
         try:
             sort_method, unused_is_real, unused_is_random = self._table_specs()
         except:
-            sort_method = get_sort_method_from_table_name(self.table_name)
+            table_name = self.table_name
+            if isinstance(table_name, str):
+                table_name = table_name.encode('latin1')
+            sort_method = get_sort_method_from_table_name(table_name)
         #is_sort1 = self.table_name.endswith('1')
         #is_sort1 = self.is_sort1  # uses the sort_bits
         assert sort_method in [1, 2], 'sort_method=%r\n%s' % (sort_method, self.code_information())
@@ -1522,7 +1522,7 @@ class OEF(OP2Common):
                 self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1530,11 +1530,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
@@ -1570,7 +1566,7 @@ class OEF(OP2Common):
                 self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1578,11 +1574,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 5).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 5)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial_force, torque]
                 #(eid_device, axial_real, torque_real, axial_imag, torque_imag) = out
@@ -1857,7 +1849,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1865,11 +1857,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #(eid_device, force)
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
@@ -1904,7 +1892,7 @@ class OEF(OP2Common):
                 self.binary_debug.write('  #elementi = [eid_device, force]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1912,11 +1900,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 3).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 3)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[spring_force]
                 real_imag = apply_mag_phase(floats, is_magnitude_phase, 1, 2)
@@ -1969,7 +1953,7 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1977,11 +1961,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #(eid_device, axial, torque)
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
@@ -2017,7 +1997,7 @@ class OEF(OP2Common):
                 self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2025,11 +2005,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial_force, torque]
                 #(eid_device, axial_real, torque_real, axial_imag, torque_imag) = out
@@ -2110,7 +2086,7 @@ class OEF(OP2Common):
 
             obj = self.obj
             #return nelements * self.num_wide * 4
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized and (self.sort_method == 1 or self.is_sort1):
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2118,21 +2094,28 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 9)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 9)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
-            # elif self.use_vector and is_vectorized and self.sort_method == 1:
+            elif self.use_vector and is_vectorized:
+                # a SORT2 record is a single element, so the rows are the times (see add_sort2)
+                n = nelements * ntotal
+                itime = obj.ielement
+                itime2 = itime + nelements
+
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 9)
+                obj._times[itime:itime2] = self._get_sort2_times(data, nelements)
+                obj.element[obj.itime] = self.nonlinear_factor
+
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                obj.data[itime:itime2, obj.itime, :] = floats[:, 1:]
+                obj.ielement = itime2
             else:
                 n = oef_cbar_real(self, data, obj, nelements, ntotal)
         elif result_type == 1 and self.num_wide == 17: # imag
-            # TODO: vectorize
             ntotal = 68 * self.factor  # 17*4
             nelements = ndata // ntotal
             assert ndata % ntotal == 0
@@ -2143,7 +2126,23 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            n = oef_cbar_imag(self, data, obj, nelements, ntotal, is_magnitude_phase)
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
+
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 17).copy()
+                obj._times[obj.itime] = dt
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
+
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
+                isave2 = [9, 10, 11, 12, 13, 14, 15, 16]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+            else:
+                n = oef_cbar_imag(self, data, obj, nelements, ntotal, is_magnitude_phase)
         else:
             raise RuntimeError(self.code_information())
             #print(self.table_name)
@@ -2175,7 +2174,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2183,11 +2182,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
@@ -2256,18 +2251,14 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 9)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 9)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[ielement:ielement2] = eids
+                self.obj_set_element(obj, ielement, ielement2, data, nelements)
 
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                 obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
@@ -2295,7 +2286,7 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
@@ -2304,11 +2295,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 17).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 17)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                 isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
@@ -2415,22 +2402,22 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 nlayers = nelements * nnodes_all
                 n = nelements * self.num_wide * 4
 
                 istart = obj.itotal
                 iend = istart + nlayers
-                obj._times[obj.itime] = dt
+                self.obj_set_time(obj, dt, data, nelements)
 
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide_real).copy()
                     # Nastran makes this a 4 for CQUAD4s instead
                     # of 0 like the bilinear stress element...
                     ints[:, 2] = 0
 
                     nids = ints[:, 2:].reshape(nlayers, 9)[:, 0]
-                    eids = ints[:, 0] // 10
+                    eids = self.get_record_eids(ints)
                     eids2 = vstack([eids] * nnodes_all).T.ravel()
                     obj.element_node[istart:iend, 0] = eids2
                     obj.element_node[istart:iend, 1] = nids
@@ -2444,10 +2431,10 @@ class OEF(OP2Common):
                 n44 = 44 * self.factor
                 n36 = 36 * self.factor
                 if self.size == 4:
-                    fmt1 = self._endian + b'i4si8f'  # 8+36
+                    fmt1 = self._endian + self._analysis_code_fmt + b'4si8f'  # 8+36
                     fmt2 = self._endian + b'i8f' # 36
                 else:
-                    fmt1 = self._endian + b'q8sq8d'
+                    fmt1 = self._endian + mapfmt(self._analysis_code_fmt, self.size) + b'8sq8d'
                     fmt2 = self._endian + b'q8d'
                 s1 = Struct(fmt1)
                 s2 = Struct(fmt2)
@@ -2686,7 +2673,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2694,11 +2681,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 # [f41, f21, f12, f32, f23, f43, f34, f14, kf1,
                 #  s12, kf2, s23, kf3, s34, kf4, s41]
@@ -2745,7 +2728,7 @@ class OEF(OP2Common):
                 #self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2753,11 +2736,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 33).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 33)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[f41r, f21r, f12r, f32r, f23r, f43r, f34r, f14r
                 # kf1r, s12r, kf2r, s23r, kf3r, s34r, kf4r, s41r
@@ -2852,7 +2831,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2860,11 +2839,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 # [hopa, bmu, bmv, tm, su, sv]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
@@ -2909,7 +2884,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2917,11 +2892,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 # [fx, sfy, sfz, u, v, w, sv, sw]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
@@ -2969,20 +2940,19 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15).copy()
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15).copy()
-                    eids = ints[:, 0] // 10
+                    eids = self.get_record_eids(ints)
                     nids_a = ints[:, 1]
                     nids_b = ints[:, 8]
-                    assert eids.min() > 0, eids.min()
                     obj.element_node[itotal:itotal2, 0] = eids
                     obj.element_node[itotal:itotal2, 1] = nids_a
                     obj.element_node[itotal:itotal2, 2] = nids_b
@@ -3160,7 +3130,7 @@ class OEF(OP2Common):
                 #self.binary_debug.write('  cap = %i  # assume 1 cap when there could have been multiple\n' % ndata)
                 #self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -3173,11 +3143,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial_force, torque]
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
@@ -3215,7 +3181,7 @@ class OEF(OP2Common):
                 #self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -3223,11 +3189,7 @@ class OEF(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 16).copy()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 16)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[xaccr, yaccr, zaccr, xvelr, yvelr, zvelr, pressure,
                 # xacci, yacci, zacci, xveli, yveli, zveli]
@@ -3334,7 +3296,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -3345,15 +3307,13 @@ class OEF(OP2Common):
                 istart = obj.itotal
                 iend = istart + nelements
                 obj._times[obj.itime] = dt
-
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real).copy()
-                    eids = ints[:, 0] // 10
-                    obj.element[istart:iend] = eids
+                self.obj_set_element(obj, istart, iend, data, nelements)
                 results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                 #[fx, fy, fz, mx, my, mz]
                 obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
+                obj.itotal = iend
+                obj.ielement = iend
             else:
                 s = Struct(self._endian + self._analysis_code_fmt + b'6f')
                 for unused_i in range(nelements):
@@ -3367,7 +3327,6 @@ class OEF(OP2Common):
                     obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
                     n += ntotal
         elif result_type == 1 and self.num_wide == 13:  # imag
-            # TODO: vectorize
             ntotal = 52  # 13*4
             nelements = ndata // ntotal
             #result_name = prefix + 'cbush_force' + postfix
@@ -3376,38 +3335,53 @@ class OEF(OP2Common):
             if auto_return:
                 return nelements * self.num_wide * 4, None, None
 
-            s = Struct(self._endian + self._analysis_code_fmt + b'12f')
-
             obj = self.obj
-            for unused_i in range(nelements):
-                edata = data[n:n + 52]
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
 
-                out = s.unpack(edata)
-                if self.is_debug_file:
-                    self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                (eid_device,
-                 fxr, fyr, fzr, mxr, myr, mzr,
-                 fxi, fyi, fzi, mxi, myi, mzi) = out
-                eid, dt = get_eid_dt_from_eid_device(
-                    eid_device, self.nonlinear_factor, self.sort_method)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13).copy()
+                obj._times[obj.itime] = dt
+                self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
-                if is_magnitude_phase:
-                    fx = polar_to_real_imag(fxr, fxi)
-                    mx = polar_to_real_imag(mxr, mxi)
-                    fy = polar_to_real_imag(fyr, fyi)
-                    my = polar_to_real_imag(myr, myi)
-                    fz = polar_to_real_imag(fzr, fzi)
-                    mz = polar_to_real_imag(mzr, mzi)
-                else:
-                    fx = complex(fxr, fxi)
-                    mx = complex(mxr, mxi)
-                    fy = complex(fyr, fyi)
-                    my = complex(myr, myi)
-                    fz = complex(fzr, fzi)
-                    mz = complex(mzr, mzi)
-
-                obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                n += ntotal
+                #[fx, fy, fz, mx, my, mz]
+                isave1 = [1, 2, 3, 4, 5, 6]
+                isave2 = [7, 8, 9, 10, 11, 12]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+            else:
+                s = Struct(self._endian + self._analysis_code_fmt + b'12f')
+                for unused_i in range(nelements):
+                    edata = data[n:n + 52]
+
+                    out = s.unpack(edata)
+                    if self.is_debug_file:
+                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                    (eid_device,
+                     fxr, fyr, fzr, mxr, myr, mzr,
+                     fxi, fyi, fzi, mxi, myi, mzi) = out
+                    eid, dt = get_eid_dt_from_eid_device(
+                        eid_device, self.nonlinear_factor, self.sort_method)
+
+                    if is_magnitude_phase:
+                        fx = polar_to_real_imag(fxr, fxi)
+                        mx = polar_to_real_imag(mxr, mxi)
+                        fy = polar_to_real_imag(fyr, fyi)
+                        my = polar_to_real_imag(myr, myi)
+                        fz = polar_to_real_imag(fzr, fzi)
+                        mz = polar_to_real_imag(mzr, mzi)
+                    else:
+                        fx = complex(fxr, fxi)
+                        mx = complex(mxr, mxi)
+                        fy = complex(fyr, fyi)
+                        my = complex(myr, myi)
+                        fz = complex(fzr, fzi)
+                        mz = complex(mzr, mzi)
+
+                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                    n += ntotal
         #elif self.format_code == 2 and self.num_wide == 7:
             #self.log.warning(self.code_information())
         else:
@@ -3463,65 +3437,44 @@ class OEF(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0: ## TODO: vectorize
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
-                n = nelements * ntotal
-
-                istart = obj.itotal
-                iend = istart + nelements
-                obj._times[obj.itime] = dt
-
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    eids = ints[:, 0] // 10
-                    obj.element_node[istart:iend] = eids_nids
-                results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-
-                #[fx, fy, fz, mx, my, mz]
-                obj.data[obj.itime, istart:iend, :] = results[:, 1:].copy()
+            # 6+n*13
+            if self.size == 4:
+                s1 = Struct(self._endian + b'3i4s2i') # 6
             else:
-                # 6+n*13
-                if self.size == 4:
-                    s1 = Struct(self._endian + b'3i4s2i') # 6
-                else:
-                    s1 = Struct(self._endian + b'3q8s2q') # 6
-                s2 = Struct(mapfmt(self._endian + b'i3f3i5fi', self.size)) # 13
-                ntotal1 = 24 * self.factor # 6*4
-                ntotal2 = 52 * self.factor # 13*4
-                for unused_i in range(nelements):
-                    edata = data[n:n+ntotal1]
-                    n += ntotal1
+                s1 = Struct(self._endian + b'3q8s2q') # 6
+            s2 = Struct(mapfmt(self._endian + b'i3f3i5fi', self.size)) # 13
+            ntotal1 = 24 * self.factor # 6*4
+            ntotal2 = 52 * self.factor # 13*4
+            for unused_i in range(nelements):
+                edata = data[n:n+ntotal1]
+                n += ntotal1
 
-                    out = s1.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
-                            etype, self.element_type, str(out)))
-                    (eid_device, parent, coord, icord, theta, _) = out
+                out = s1.unpack(edata)
+                if self.is_debug_file:
+                    self.binary_debug.write('OEF_Force_%s-%s - %s\n' % (
+                        etype, self.element_type, str(out)))
+                (eid_device, parent, coord, icord, theta, _) = out
 
-                    eid, dt = get_eid_dt_from_eid_device(
-                        eid_device, self.nonlinear_factor, self.sort_method)
+                eid, dt = get_eid_dt_from_eid_device(
+                    eid_device, self.nonlinear_factor, self.sort_method)
 
-                    #vugrids = []
-                    #forces = []
-                    for unused_j in range(nnodes):
-                        edata = data[n:n+ntotal2]
-                        n += ntotal2
-                        out = s2.unpack(edata)
-                        if self.is_debug_file:
-                            self.binary_debug.write('%s\n' % (str(out)))
-                        (vugrid, mfx, mfy, mfxy, unused_ai, unused_bi, unused_ci, bmx, bmy,
-                         bmxy, syz, szx, unused_di) = out
-                        #out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                        obj.add_sort1(dt, eid, parent, coord, icord, theta,
-                                      vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
-                        #vugrids.append(vugrid)
-                        #forces.append(out2)
-                    #data_in = [vugrid,mfx,mfy,mfxy,a,b,c,bmx,bmy,bmxy,syz,szx,d]
-                    #obj.add_sort1(dt, eid, parent, coord, icord, theta, vugrids, forces)
+                #vugrids = []
+                #forces = []
+                for unused_j in range(nnodes):
+                    edata = data[n:n+ntotal2]
+                    n += ntotal2
+                    out = s2.unpack(edata)
+                    if self.is_debug_file:
+                        self.binary_debug.write('%s\n' % (str(out)))
+                    (vugrid, mfx, mfy, mfxy, unused_ai, unused_bi, unused_ci, bmx, bmy,
+                     bmxy, syz, szx, unused_di) = out
+                    #out2 = (vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
+                    obj.add_sort1(dt, eid, parent, coord, icord, theta,
+                                  vugrid, mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx)
+                    #vugrids.append(vugrid)
+                    #forces.append(out2)
+                #data_in = [vugrid,mfx,mfy,mfxy,a,b,c,bmx,bmy,bmxy,syz,szx,d]
+                #obj.add_sort1(dt, eid, parent, coord, icord, theta, vugrids, forces)
 
         elif self.format_code in [2, 3] and self.num_wide == numwide_imag:  # imag
             if self._results.is_not_saved(result_name):
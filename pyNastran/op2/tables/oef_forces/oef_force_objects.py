@@ -8,6 +8,7 @@ import numpy as np
 from numpy import zeros, searchsorted, allclose
 
 from pyNastran.utils.numpy_utils import integer_types, float_types
+from pyNastran.op2.op2_interface.out_of_core import take_ntotal
 from pyNastran.op2.result_objects.op2_objects import BaseElement, get_times_dtype
 from pyNastran.f06.f06_formatting import (
     write_floats_13e, write_floats_12e,
@@ -1254,7 +1255,7 @@ class RealCBeamForceArray(RealForceObject):
         #self.nelements = len(self.element) // 11
         self.element = self.element[i]
         self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.data = take_ntotal(self, i)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
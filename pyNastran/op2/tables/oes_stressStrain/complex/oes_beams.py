@@ -4,6 +4,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.out_of_core import take_ntotal
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
@@ -92,7 +93,7 @@ class ComplexBeamArray(OES_Object):
         self.nelements = len(inonzero)
         self.element_node = self.element_node[inonzero, :]
         self.sd = self.sd[inonzero]
-        self.data = self.data[:, inonzero, :]
+        self.data = take_ntotal(self, inonzero)
 
     def _build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1902,7 +1902,7 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -1949,7 +1949,7 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None, self.code_information()
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2054,7 +2054,7 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2099,7 +2099,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2154,7 +2154,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CROD random SORT%s' % self.sort_method)
                 n = nelements * ntotal
@@ -2218,7 +2218,6 @@ class OES(OP2Common):
 
         slot = self.get_result(result_name)
         if result_type == 0 and self.num_wide == 111:  # real
-            # TODO: vectorize
             ntotal = 444 * self.factor # 44 + 10*40  (11 nodes)
 
             if self.is_stress:
@@ -2237,8 +2236,33 @@ class OES(OP2Common):
 
             ntotal = self.num_wide * 4 * self.factor
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-real not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 111)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 10).copy()
+
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 111)
+                    eids = self.get_record_eids(ints)
+                    eids2 = array([eids] * 11, dtype=self.idtype8).T.ravel()
+                    ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+
+                    nids = ints2[:, 0]
+                    obj.element_node[itotal:itotal2, 0] = eids2
+                    obj.element_node[itotal:itotal2, 1] = nids
+
+                #  0    1   2  3  4  5  6     7     8    9
+                # grid, sd, c, d, e, f, smax, smin, mst, msc
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                obj.xxb[itotal:itotal2] = floats2[:, 1]
+
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CBEAM real SORT%s' % self.sort_method)
@@ -2307,7 +2331,6 @@ class OES(OP2Common):
                                           is_magnitude_phase)
 
         elif result_type == 2 and self.num_wide == 67: # random
-            # TODO: vectorize
             ntotal = 268 # 1 + 11*6  (11 nodes)
 
             if self.is_stress:
@@ -2327,8 +2350,33 @@ class OES(OP2Common):
             nnodes = 10  # 11-1
             ntotal = self.num_wide * 4
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-random not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 67)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 6).copy()
+
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 67)
+                    eids = self.get_record_eids(ints)
+                    eids2 = array([eids] * 11, dtype='int32').T.ravel()
+                    ints2 = ints[:, 1:].reshape(nelements * 11, 6)
+
+                    nids = ints2[:, 0]
+                    obj.element_node[itotal:itotal2, 0] = eids2
+                    obj.element_node[itotal:itotal2, 1] = nids
+
+                #  0    1   2  3  4  5
+                # grid, sd, c, d, e, f
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                obj.xxb[itotal:itotal2] = floats2[:, 1]
+
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CBEAM random SORT%s' % self.sort_method)
@@ -2386,7 +2434,7 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2426,7 +2474,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2472,7 +2520,7 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -2549,7 +2597,7 @@ class OES(OP2Common):
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -2595,7 +2643,7 @@ class OES(OP2Common):
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.itotal
                 itotal2 = itotal + nelements
@@ -2650,16 +2698,10 @@ class OES(OP2Common):
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
-                n = nelements * self.num_wide * 4
-
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
                 obj._times[obj.itime] = dt
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
@@ -2667,9 +2709,9 @@ class OES(OP2Common):
 
                 #[s1a, s2a, s3a, s4a, axial,
                 # s1b, s2b, s3b, s4b]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
-                obj.itotal = ielement2
-                obj.ielement = ielement2
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector and obj.itime == 0:  # pragma: no cover
                     self.log.debug('vectorize CBAR random SORT%s' % self.sort_method)
@@ -2793,13 +2835,12 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
-                itotal = obj.ielement
-                itotali = obj.itotal + nelements
-                itotal2 = obj.itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes_expected
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
                     # (eid_device, cid, abcd, nnodes)
                     ints = frombuffer(data, dtype=self.idtype8).copy()
                     try:
@@ -2809,16 +2850,14 @@ class OES(OP2Common):
                         msg += 'nelements=%s numwide_real=%s nelements*numwide=%s' % (
                             nelements, numwide_real, nelements * numwide_real)
                         raise ValueError(msg)
-                    eids = ints1[:, 0] // 10
+                    eids = self.get_record_eids(ints1)
                     cids = ints1[:, 1]
                     #nids = ints1[:, 4]
-                    assert eids.min() > 0, eids.min()
                     obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
                     ints2 = ints1[:, 4:].reshape(nelements * nnodes_expected, 21)
                     grid_device = ints2[:, 0]#.reshape(nelements, nnodes_expected)
 
                     #print('%s-grid_device=%s' % (self.element_name, grid_device))
-                    unused_grid_device2 = repeat(grid_device, nnodes_expected)
                     try:
                         obj.element_node[itotal:itotal2, 1] = grid_device
                     except ValueError:
@@ -2828,8 +2867,7 @@ class OES(OP2Common):
                         #msg += 'nids=%s' % nids
                         raise ValueError(msg)
                     #self.log.debug(f'cids = {np.unique(cids)}')
-                    obj.element_cid[itotal:itotali, 0] = eids
-                    obj.element_cid[itotal:itotali, 1] = cids
+                    self.obj_set_element_cid(obj, eids, cids)
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, numwide_real)[:, 4:]
                 # 1     9    15   2    10   16  3   11  17   8
@@ -2855,7 +2893,6 @@ class OES(OP2Common):
                 obj.data[obj.itime, itotal:itotal2, :6] = floats1[:, [1, 9, 15, 2, 10, 16]]
                 obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
                 obj.itotal = itotal2
-                obj.ielement = itotali
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CSolid real SORT%s' % self.sort_method)
@@ -3034,68 +3071,26 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                itotali = obj.itotal + nelements
-                itotal2 = obj.itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    # (eid_device, cid, abcd, nnodes)
-                    ints = frombuffer(data, dtype=self.idtype).copy()
-                    try:
-                        ints1 = ints.reshape(nelements, numwide_real)
-                    except ValueError:
-                        msg = 'ints.shape=%s; size=%s ' % (str(ints.shape), ints.size)
-                        msg += 'nelements=%s numwide_real=%s nelements*numwide=%s' % (
-                            nelements, numwide_real, nelements * numwide_real)
-                        raise ValueError(msg)
-                    eids = ints1[:, 0] // 10
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes_expected
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    # (eid_device, cid, abcd, grid)
+                    ints1 = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_random)
+                    eids = self.get_record_eids(ints1)
                     cids = ints1[:, 1]
-                    #nids = ints1[:, 4]
-                    assert eids.min() > 0, eids.min()
                     obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
-                    ints2 = ints1[:, 4:].reshape(nelements * nnodes_expected, 21)
-                    grid_device = ints2[:, 0]#.reshape(nelements, nnodes_expected)
-
-                    #print('%s-grid_device=%s' % (self.element_name, grid_device))
-                    unused_grid_device2 = repeat(grid_device, nnodes_expected)
-                    try:
-                        obj.element_node[itotal:itotal2, 1] = grid_device
-                    except ValueError:
-                        msg = '%s; nnodes=%s\n' % (self.element_name, nnodes_expected)
-                        msg += 'itotal=%s itotal2=%s\n' % (itotal, itotal2)
-                        msg += 'grid_device.shape=%s; size=%s\n' % (str(grid_device.shape), grid_device.size)
-                        #msg += 'nids=%s' % nids
-                        raise ValueError(msg)
-                    obj.element_cid[itotal:itotali, 0] = eids
-                    obj.element_cid[itotal:itotali, 1] = cids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
-                # 1     9    15   2    10   16  3   11  17   8
-                #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
-                #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
-                #(grid_device,
-                    #sxx, sxy, s1, a1, a2, a3, pressure, svm,
-                    #syy, syz, s2, b1, b2, b3,
-                    #szz, sxz, s3, c1, c2, c3)
-                floats1 = floats.reshape(nelements * nnodes_expected, 21)#[:, 1:] # drop grid_device
-
-                # o1/o2/o3 is not max/mid/min.  They are not consistently ordered, so we force it.
-                max_mid_min = np.vstack([
-                    floats1[:, 3],
-                    floats1[:, 11],
-                    floats1[:, 17],
-                ]).T
-                max_mid_min.sort(axis=1)
-                assert max_mid_min.shape == (nelements * nnodes_expected, 3), max_mid_min.shape
-                obj.data[obj.itime, itotal:itotal2, 6:9] = max_mid_min[:, [2, 1, 0]]
+                    ints2 = ints1[:, 4:].reshape(nelements * nnodes_expected, 7)
+                    obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
+                    self.obj_set_element_cid(obj, eids, cids)
 
-                #obj.data[obj.itime, itotal:itotal2, :] = floats1[:, isave]
-                obj.data[obj.itime, itotal:itotal2, :6] = floats1[:, [1, 9, 15, 2, 10, 16]]
-                obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
+                #(grid_device, sxx, syy, szz, txy, tyz, txz)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_random)[:, 4:]
+                floats1 = floats.reshape(nelements * nnodes_expected, 7)
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = itotali
             else:
                 if is_vectorized and self.use_vector and obj.itime == 0:  # pragma: no cover
                     self.log.debug('vectorize CSolid random SORT%s' % self.sort_method)
@@ -4652,19 +4647,18 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
                 itotal = obj.itotal
                 itotal2 = itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype8)
                     ints1 = ints.reshape(nelements, numwide_real)
-                    eids = ints1[:, 0] // 10
+                    eids = self.get_record_eids(ints1)
                     eids = np.vstack([eids, eids]).T.ravel()
-                    assert eids.min() > 0, eids.min()
                     obj.element_node[itotal:itotal2, 0] = eids
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, numwide_real)[:, 1:]
@@ -4784,92 +4778,7 @@ class OES(OP2Common):
             obj = self.obj
             assert obj.is_built is True, obj.is_built
             if self.use_vector and is_vectorized:
-                n = nelements * ntotal
-                itotal = obj.itotal
-                itotal2 = itotal + nelements * 2
-
-                if self.sort_method == 1:
-                    ielement = obj.ielement
-                    ielement2 = ielement + nelements
-
-                    obj._times[obj.itime] = dt
-                    if obj.itime == 0:
-                        ints = frombuffer(data, dtype=self.idtype)
-                        ints1 = ints.reshape(nelements, 9)
-                        eids = ints1[:, 0] // 10
-                        assert eids.min() > 0, eids.min()
-                        #print(eids)
-                        eids2 = np.vstack([eids, eids]).T.ravel()
-                        #print(eids2)
-
-                        # TODO: what about layer 1/2?
-                        #print(self.code_information())
-                        #print(f'eids.shape={eids.shape} obj.element_node.shape={obj.element_node.shape}')
-                        obj.element_node[itotal:itotal2, 0] = eids2
-
-                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
-                    #fd1, sx1, sy1, txy1, fd2, fx2, fy2, txy2
-                    floats2 = floats.reshape(nelements * nnodes_expected, 8)
-
-                    #[eid_device, fd1, sx1, sy1, txy1,
-                    #             fd2, sx2, sy2, txy2,]
-                    nf2 = floats2.shape[0]
-                    floats3 = floats2.reshape(nf2*2, 4)
-
-                    obj.fiber_curvature[itotal:itotal2] = floats3[:, 0].copy()
-                    obj.data[obj.itime, itotal:itotal2, :] = floats3[:, 1:].copy()
-                    obj.itotal = itotal2
-                    obj.ielement = ielement2
-
-                elif self.sort_method == 2 and self._analysis_code_fmt == b'f':
-                    ielement = obj.itime
-                    ie_upper = 2 * ielement
-                    ie_lower = 2 * ielement + 1
-
-                    obj.element_node[ie_upper, 0] = dt
-                    obj.element_node[ie_lower, 0] = dt
-                    #obj._times[obj.itime] = dt
-
-                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)# [:, 1:]
-                    # itime is actually ielement
-                    # we grab the element id from the ints for all times
-                    if self._analysis_code_fmt == b'i' and obj.itime == 0:
-                        print('analysis_code ', self.analysis_code, self._analysis_code_fmt)
-                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
-                        eids = ints[:, 0] // 10
-                        #nids = np.zeros(len(eids), dtype='int32')
-                        print(eids)
-                        #eids = np.vstack([eids, nids]).T.ravel()
-                        #print(eids.shape)
-                        #print(eids)
-                        #print(obj.element)
-                        #assert eids.min() > 0, eids.min()
-                        #obj.element[itotal:itotal2, 0] = eids
-                        obj._times[itotal:itotal2] = eids
-                        aaa
-                    elif self._analysis_code_fmt == b'f' and obj.itime == 0:
-                        #print(floats[:, 0])
-                        #print(floats[:, 0].shape, obj._times.shape)
-                        obj._times[itotal:itotal2] = floats[:, 0]
-
-                    floats1 = floats[:, 1:]
-                    #print(floats1)
-                    #print(floats1.shape)
-                    #fd, sx, sy, txy,
-                    floats2 = floats1.reshape(nelements * nnodes_expected, 8)
-                    nf2 = floats2.shape[0]
-                    # reshape it into 2 layers
-                    floats3 = floats2.reshape(nf2*2, 4)
-                    # we only need to grab the first two fiber/curvature values
-                    # as they're duplicated many times for the same element
-                    obj.fiber_curvature[2*obj.itime:2*obj.itime+2] = floats3[:2, 0].copy()
-                    # we apply the data across 2 rows because we have 2 layers
-                    obj.data[:, ie_upper, :] = floats3[::2, 1:].copy()
-                    obj.data[:, ie_lower, :] = floats3[1::2, 1:].copy()
-                else:
-                    raise NotImplementedError(self.code_information())
-                obj.itotal = itotal2
-                #obj.ielement = ielement2
+                n = oes_plate_random_9_vector(self, data, obj, nelements, ntotal, dt)
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CQUAD4-33 random numwide=9 SORT%s' % self.sort_method)
@@ -4913,32 +4822,8 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
-                itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
-                obj.itotal = itotal2
-                obj.ielement = ielement2
+            if self.use_vector and is_vectorized:
+                n = oes_plate_random_11_vector(self, data, obj, nelements, ntotal, dt)
             else:
                 n = oes_cquad4_33_random_11(self, data, obj, nelements, ntotal)
 
@@ -5255,32 +5140,8 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
-                itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
-                obj.itotal = itotal2
-                obj.ielement = ielement2
+            if self.use_vector and is_vectorized:
+                n = oes_plate_random_11_vector(self, data, obj, nelements, ntotal, dt)
             else:
                 if is_vectorized and self.use_vector and obj.itime == 0:  # pragma: no cover
                     self.log.debug('vectorize CTRIA3 random numwide=11 SORT%s' % self.sort_method)
@@ -5316,32 +5177,8 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
-                itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
-                obj.itotal = itotal2
-                obj.ielement = ielement2
+            if self.use_vector and is_vectorized:
+                n = oes_plate_random_9_vector(self, data, obj, nelements, ntotal, dt)
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CTRIA3 random2 SORT%s' % self.sort_method)
@@ -5460,7 +5297,7 @@ class OES(OP2Common):
 
             obj = self.obj
             #print('dt=%s, itime=%s' % (obj.itime, dt))
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -5471,15 +5308,15 @@ class OES(OP2Common):
 
                 istart = obj.itotal
                 iend = istart + nlayers
-                obj._times[obj.itime] = dt
+                self.obj_set_time(obj, dt, data, nelements)
 
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide_real)
                     ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all).copy()
                     ints1[:, 0] = 0.
                     nids = ints1.ravel()
 
-                    eids = ints[:, 0] // 10
+                    eids = self.get_record_eids(ints)
                     eids2 = array([eids] * (nnodes_all * 2), dtype=self.idtype8).T.ravel()
                     nids2 = vstack([nids, nids]).T.ravel()
                     obj.element_node[istart:iend, 0] = eids2
@@ -5650,44 +5487,45 @@ class OES(OP2Common):
 
             obj = self.obj
             #print('dt=%s, itime=%s' % (obj.itime, dt))
-            if self.use_vector and is_vectorized and 0:
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
-                n = nelements * self.num_wide * 4
-
-                istart = obj.itotal
-                iend = istart + nlayers
-                obj._times[obj.itime] = dt
-
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all).copy()
-                    ints1[:, 0] = 0.
-                    nids = ints1.ravel()
-
-                    eids = ints[:, 0] // 10
-                    eids2 = array([eids] * (nnodes_all * 2), dtype='int32').T.ravel()
-                    nids2 = vstack([nids, nids]).T.ravel()
-                    obj.element_node[istart:iend, 0] = eids2
-                    obj.element_node[istart:iend, 1] = nids2
-                    #assert obj.element_node[:iend, 0].min() > 0, eids2
-                    if obj.nonlinear_factor is not None:
-                        float_mask = np.arange(nelements * numwide_real, dtype=np.int32).reshape(nelements, numwide_real)
-                        float_mask1 = float_mask[:, 2:].reshape(nlayers // 2, 17)[:, 1:].reshape(nlayers, 8)
-                        obj.float_mask = float_mask1
-
-                if obj.nonlinear_factor is not None:
-                    results = frombuffer(data, dtype=self.fdtype)[obj.float_mask].copy()
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_random)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_random)
+
+                # (grid, fd1, sx1, sy1, txy1, fd2, sx2, sy2, txy2) for the center and nodes
+                nids = ints[:, 2:].reshape(nelements, nnodes_all, 9)[:, :, 0].copy()
+                nids[:, 0] = 0  # center
+                floats1 = floats[:, 2:].reshape(nelements, nnodes_all, 9)[:, :, 1:]
+                floats1 = floats1.reshape(nelements, nnodes_all * 2, 4)
+                if self.sort_method == 1:
+                    itotal = obj.itotal
+                    itotal2 = itotal + nlayers
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        eids = self.get_record_eids(ints)
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_all * 2)
+                        obj.element_node[itotal:itotal2, 1] = repeat(nids.ravel(), 2)
+                    floats2 = floats1.reshape(nlayers, 4)
+                    obj.fiber_curvature[itotal:itotal2] = floats2[:, 0]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
+                    obj.itotal = itotal2
                 else:
-                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-                    floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
-                    results = floats1[:, 1:].reshape(nlayers, 8).copy()
-
-                #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-                obj.data[obj.itime, istart:iend, :] = results
+                    # a record is an element (itime), so we fill the times of
+                    # the layers of the element (see add_sort2)
+                    eid = self.nonlinear_factor
+                    assert eid > 0, self.code_information()
+                    itime = obj.ielement // nnodes_all
+                    itime2 = itime + nelements
+                    ibase = 2 * nnodes_all * obj.itime
+                    ibase2 = ibase + 2 * nnodes_all
+                    obj._times[itime:itime2] = self._get_sort2_times(data, nelements)
+                    if itime == 0:
+                        obj.element_node[ibase:ibase2, 0] = eid
+                        obj.element_node[ibase:ibase2, 1] = repeat(nids[0, :], 2)
+                        obj.fiber_curvature[ibase:ibase2] = floats1[0, :, 0]
+                    obj.data[itime:itime2, ibase:ibase2, :] = floats1[:, :, 1:]
+                    obj.itotal += nlayers
+                    obj.ielement += nelements * nnodes_all
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CQUAD4-144/CQUAD8... random SORT%s' % self.sort_method)
@@ -5800,7 +5638,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 ielement = obj.ielement
@@ -6003,16 +5841,20 @@ class OES(OP2Common):
                 self.binary_debug.write('  element1 = [eid_device, layer, o1, o2, t12, t1z, t2z, angle, major, minor, ovm)]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 istart = obj.itotal
                 iend = istart + nelements
-                obj._times[obj.itime] = dt
+                if self.sort_method == 1:
+                    obj._times[obj.itime] = dt
+                else:
+                    # the time of the first layer (see add_new_eid_sort1)
+                    obj._times[obj.itime] = self._get_sort2_times(data, nelements)[0]
 
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11).copy()
-                    eids = ints[:, 0] // 10
+                    eids = self.get_record_eids(ints)
                     nids = ints[:, 1]
                     obj.element_layer[istart:iend, 0] = eids
                     obj.element_layer[istart:iend, 1] = nids
@@ -6368,52 +6210,40 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            nnodes_all = 4
-            if self.use_vector and is_vectorized and 0:
-                n = nelements * ntotal
-                itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_all
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
-
-                numwide_imag = 37
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
-                floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 9).copy()
-
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag)
-                    ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 9).copy()
-                    eids = ints[:, 0] // 10
-                    ints[:, 0] = 0
-                    nids = ints1[:, 0]
-                    eids2 = np.vstack([eids] * nnodes_all).T.ravel()
-                    assert eids.min() > 0, eids.min()
-                    obj.element_node[itotal:itotal2, 0] = eids2
-                    obj.element_node[itotal:itotal2, 1] = nids
+            ntotal1 = 40 * self.factor
+            ntotal2 = 36 * self.factor
+            s1 = Struct(self._endian + mapfmt(self._analysis_code_fmt + b'i8f', self.size)) # 10*4 = 40
+            s2 = Struct(self._endian + mapfmt(b'i8f', self.size))  #  9*4 = 36
 
-                # [loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi]
-                isave1 = [1, 3, 5, 7]
-                isave2 = [2, 4, 6, 9]
-                real_imag = apply_mag_phase(floats1, is_magnitude_phase, isave1, isave2)
+            for unused_i in range(nelements):
+                out = s1.unpack(data[n:n + ntotal1])
+                (eid_device, loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
+                eid, dt = get_eid_dt_from_eid_device(
+                    eid_device, self.nonlinear_factor, self.sort_method)
+                if self.is_debug_file:
+                    self.binary_debug.write('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
+                #print('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
 
-                obj.data[obj.itime, itotal:itotal2, :] = real_imag
-                obj.itotal = itotal2
-                obj.ielement = ielement2
-            else:
-                ntotal1 = 40 * self.factor
-                ntotal2 = 36 * self.factor
-                s1 = Struct(self._endian + mapfmt(self._analysis_code_fmt + b'i8f', self.size)) # 10*4 = 40
-                s2 = Struct(self._endian + mapfmt(b'i8f', self.size))  #  9*4 = 36
+                if is_magnitude_phase:
+                    rs = polar_to_real_imag(rsr, rsi)
+                    azs = polar_to_real_imag(azsr, azsi)
+                    As = polar_to_real_imag(Asr, Asi)
+                    ss = polar_to_real_imag(ssr, ssi)
+                else:
+                    rs = complex(rsr, rsi)
+                    azs = complex(azsr, azsi)
+                    As = complex(Asr, Asi)
+                    ss = complex(ssr, ssi)
+                obj.add_new_eid_sort1(dt, eid, loc, rs, azs, As, ss)
 
-                for unused_i in range(nelements):
-                    out = s1.unpack(data[n:n + ntotal1])
-                    (eid_device, loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
-                    eid, dt = get_eid_dt_from_eid_device(
-                        eid_device, self.nonlinear_factor, self.sort_method)
+                n += ntotal1
+                for unused_j in range(3):
+                    out = s2.unpack(data[n:n + ntotal2])
+                    (loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
                     if self.is_debug_file:
-                        self.binary_debug.write('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
-                    #print('CTRIAX6-53 eid=%i\n    %s\n' % (eid, str(out)))
+                        self.binary_debug.write('    %s\n' % (str(out)))
+                    #print("eid=%s loc=%s rs=%s azs=%s as=%s ss=%s" % (
+                        #eid, loc, rs, azs, As, ss))
 
                     if is_magnitude_phase:
                         rs = polar_to_real_imag(rsr, rsi)
@@ -6425,29 +6255,8 @@ class OES(OP2Common):
                         azs = complex(azsr, azsi)
                         As = complex(Asr, Asi)
                         ss = complex(ssr, ssi)
-                    obj.add_new_eid_sort1(dt, eid, loc, rs, azs, As, ss)
-
-                    n += ntotal1
-                    for unused_j in range(3):
-                        out = s2.unpack(data[n:n + ntotal2])
-                        (loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
-                        if self.is_debug_file:
-                            self.binary_debug.write('    %s\n' % (str(out)))
-                        #print("eid=%s loc=%s rs=%s azs=%s as=%s ss=%s" % (
-                            #eid, loc, rs, azs, As, ss))
-
-                        if is_magnitude_phase:
-                            rs = polar_to_real_imag(rsr, rsi)
-                            azs = polar_to_real_imag(azsr, azsi)
-                            As = polar_to_real_imag(Asr, Asi)
-                            ss = polar_to_real_imag(ssr, ssi)
-                        else:
-                            rs = complex(rsr, rsi)
-                            azs = complex(azsr, azsi)
-                            As = complex(Asr, Asi)
-                            ss = complex(ssr, ssi)
-                        obj.add_sort1(dt, eid, loc, rs, azs, As, ss)
-                        n += ntotal2  # 4*8
+                    obj.add_sort1(dt, eid, loc, rs, azs, As, ss)
+                    n += ntotal2  # 4*8
         else:  # pragma: no cover
             raise RuntimeError(self.code_information())
             #msg = self.code_information()
@@ -6489,7 +6298,7 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
             obj = self.obj
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 istart = obj.ielement
@@ -6529,7 +6338,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
@@ -6665,7 +6474,7 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 itotal = obj.itotal
@@ -7005,25 +6814,21 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1 and 0:
-                n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                ielement2 = obj.itotal + nelements
-                itotal2 = ielement2
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
-                itime = obj.itime
-                obj._times[itime] = dt
-                if itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
-
-                #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 2
+                self.obj_set_time(obj, dt, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 21)
+                    eids = self.get_record_eids(ints)
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+                    obj.element_node[itotal:itotal2, 1] = ints[:, 1:].reshape(nelements * 2, 10)[:, 0]
+
+                #[angle, sc, sd, se, sf, omax, omin, mst, msc]
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 21)
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].reshape(nelements * 2, 10)[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 ntotali = 40
                 struct1 = Struct(self._endian + self._analysis_code_fmt)
@@ -7158,25 +6963,20 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1 and 0:
-                n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                ielement2 = obj.itotal + nelements
-                itotal2 = ielement2
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
-                itime = obj.itime
-                obj._times[itime] = dt
-                if itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
-                    eids = ints[:, 0] // 10
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
-
-                #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 2
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                eids = self.get_record_eids(ints)
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+                obj.element_node[itotal:itotal2, 1] = ints[:, 1:].reshape(nelements * 2, 6)[:, 0]
+
+                #[angle, sxc, sxd, sxe, sxf]
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)[:, 1:].reshape(nelements * 2, 6)
+                obj.angle[itotal:itotal2] = floats[:, 1]
+                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 ntotali = 24
                 struct1 = Struct(self._endian + self._analysis_code_fmt)
@@ -7237,7 +7037,7 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
 
                 ielement = obj.ielement
@@ -7404,7 +7204,7 @@ class OES(OP2Common):
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
             obj = self.obj
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -7835,13 +7635,6 @@ class OES(OP2Common):
             #msg = 'sort1 Type=%s num=%s' % (self.element_name, self.element_type)
             #return self._not_implemented_or_skip(data, ndata, msg)
 
-    def obj_set_element(self, obj, ielement, ielement2, data, nelements):
-        if obj.itime == 0:
-            ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, self.num_wide).copy()
-            eids = ints[:, 0] // 10
-            assert eids.min() > 0, eids.min()
-            obj.element[ielement:ielement2] = eids
-
 
 def oes_quad4_33_complex_17(self, data: bytes,
                             obj: Union[ComplexPlateStressArray, ComplexPlateStrainArray],
@@ -8541,6 +8334,62 @@ def oes_ctria3_random_11(self, data: bytes,
             n += ntotal
     return n
 
+def oes_plate_random_9_vector(self, data: bytes,
+                              obj: Union[RandomPlateStressArray, RandomPlateStrainArray],
+                              nelements: int, ntotal: int, dt) -> int:
+    """vectorized version of oes_quad4_33_random_9/oes_ctria3_random_9"""
+    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
+    #fd, sx, sy, txy
+    floats1 = floats[:, 1:].reshape(nelements * 2, 4)
+    if self.sort_method == 1:
+        itotal = obj.itotal
+        itotal2 = itotal + nelements * 2
+        obj._times[obj.itime] = dt
+        if obj.itime == 0:
+            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
+            eids = self.get_record_eids(ints)
+            obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+        obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+        obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
+        obj.itotal = itotal2
+    else:
+        # a record is an element (itime), so we fill the times of the
+        # upper/lower layers of the element (see add_sort2)
+        eid = self.nonlinear_factor
+        assert eid > 0, self.code_information()
+        itime = obj.ielement
+        itime2 = itime + nelements
+        ie_upper = 2 * obj.itime
+        obj._times[itime:itime2] = self._get_sort2_times(data, nelements)
+        if itime == 0:
+            obj.element_node[ie_upper:ie_upper+2, 0] = eid
+            obj.fiber_curvature[ie_upper:ie_upper+2] = floats1[:2, 0]
+        obj.data[itime:itime2, ie_upper, :] = floats1[::2, 1:]
+        obj.data[itime:itime2, ie_upper+1, :] = floats1[1::2, 1:]
+        obj.itotal += nelements * 2
+        obj.ielement = itime2
+    return nelements * ntotal
+
+def oes_plate_random_11_vector(self, data: bytes,
+                               obj: Union[RandomPlateStressArray, RandomPlateStrainArray],
+                               nelements: int, ntotal: int, dt) -> int:
+    """vectorized version of oes_cquad4_33_random_11/oes_ctria3_random_11"""
+    itotal = obj.itotal
+    itotal2 = itotal + nelements * 2
+    self.obj_set_time(obj, dt, data, nelements)
+    if obj.itime == 0 or self.sort_method == 2:
+        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
+        eids = self.get_record_eids(ints)
+        obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+
+    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)[:, 1:]
+    #fd, sx, sy, txy, ovm
+    floats1 = floats.reshape(nelements * 2, 5)
+    obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+    obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
+    obj.itotal = itotal2
+    return nelements * ntotal
+
 def oes_cquad4_144_real(self, data, ndata, obj: RealPlateStrainArray,
                         ntotal: int, nelements: int, nnodes: int, dt) -> int:
     n = 0
@@ -4,6 +4,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.out_of_core import take_ntotal
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
@@ -95,7 +96,7 @@ class RandomBeamArray(OES_Object):
         i = np.union1d(i_sd_zero, i_node_zero)
         #self.element = self.element[i]
         self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.data = take_ntotal(self, i)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
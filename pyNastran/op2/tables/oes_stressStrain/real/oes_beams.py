@@ -5,6 +5,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.out_of_core import take_ntotal
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
@@ -114,7 +115,7 @@ class RealBeamArray(OES_Object):
         i = np.union1d(i_sd_zero, i_node_zero)
         #self.element = self.element[i]
         self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.data = take_ntotal(self, i)
         self.xxb = self.xxb[i]
 
     def build_dataframe(self):
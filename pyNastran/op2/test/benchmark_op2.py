@@ -0,0 +1,306 @@
+"""
+Benchmarks the OP2 reader options on one or more OP2 files::
+
+    python -m pyNastran.op2.test.benchmark_op2 model1.op2 model2.op2
+
+If no files are given, the OP2s in the models directory are used.
+
+The two pass reader walks the file twice, so the single pass reader only
+pays off when the OP2 is larger than the OS file cache (the 2nd walk of
+the two pass reader has to go back to the disk).  On small files that are
+already in the cache, the two are about the same speed.  The large file
+case writes a transient OP2 with many small records and drops the file
+cache before every walk of the file, which is what happens when the OP2
+doesn't fit in the cache; the bytes read from the disk are reported.
+
+The parallel reader (nworkers=4) starts a pool of processes for every
+file, so it's slower for small files; it pays off for OP2s with several
+large results tables.
+
+The bytes copied out of the file (per GB of OP2) and the peak traced
+memory are also reported for the standard and memory mapped readers.
+
+"""
+import os
+import sys
+import glob
+import time
+import tempfile
+import tracemalloc
+from typing import List, Dict, Tuple, Callable, Optional
+
+import numpy as np
+
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+TRANSIENT_OP2 = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+
+
+def _read_two_pass(op2_filename: str, log: SimpleLogger) -> OP2:
+    model = OP2(log=log, debug=False)
+    model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True)
+    return model
+
+def _read_single_pass(op2_filename: str, log: SimpleLogger) -> OP2:
+    model = OP2(log=log, debug=False)
+    model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                   single_pass=True)
+    return model
+
+def _read_two_pass_index(op2_filename: str, log: SimpleLogger) -> OP2:
+    model = OP2(log=log, debug=False)
+    model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                   use_index=True)
+    return model
+
+def _read_two_pass_mmap(op2_filename: str, log: SimpleLogger) -> OP2:
+    model = OP2(log=log, debug=False)
+    model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                   use_mmap=True)
+    return model
+
+def _read_parallel(op2_filename: str, log: SimpleLogger) -> OP2:
+    model = OP2(log=log, debug=False)
+    model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                   nworkers=4)
+    return model
+
+READERS = {
+    'two_pass' : _read_two_pass,
+    'single_pass' : _read_single_pass,
+    'index' : _read_two_pass_index,
+    'mmap' : _read_two_pass_mmap,
+    'parallel' : _read_parallel,
+}
+
+
+def _drop_file_cache(op2_filename: str) -> None:
+    """asks the OS to drop the cached pages for a file (linux only)"""
+    if not hasattr(os, 'posix_fadvise'):  # pragma: no cover
+        return
+    with open(op2_filename, 'rb') as op2_file:
+        os.posix_fadvise(op2_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _get_disk_read_bytes() -> Optional[int]:
+    """gets the bytes that this process has read from the disk (linux only)"""
+    io_filename = '/proc/self/io'
+    if not os.path.exists(io_filename):  # pragma: no cover
+        return None
+    with open(io_filename, 'r') as io_file:
+        for line in io_file:
+            if line.startswith('read_bytes:'):
+                return int(line.split()[1])
+    return None  # pragma: no cover
+
+
+class _UncachedOP2(OP2):
+    """drops the file cache before every walk of the file"""
+    def _read_tables(self, table_name: bytes) -> List[bytes]:
+        _drop_file_cache(self.op2_filename)
+        return OP2._read_tables(self, table_name)
+
+
+def benchmark_op2(op2_filenames: List[str],
+                  readers: Dict[str, Callable[[str, SimpleLogger], OP2]]=None,
+                  nrepeat: int=3) -> Dict[str, float]:
+    """
+    Times the OP2 readers
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the files to read
+    readers : Dict[name] = func(op2_filename, log); default=None -> READERS
+        the reader functions to compare
+    nrepeat : int; default=3
+        the best time of nrepeat reads is kept
+
+    Returns
+    -------
+    times : Dict[name] = dt
+        the total time (in seconds) per reader
+
+    """
+    if readers is None:
+        readers = READERS
+    log = SimpleLogger(level='error')
+    times = {name: 0. for name in readers}
+    for op2_filename in op2_filenames:
+        try:
+            _read_two_pass(op2_filename, log)
+        except Exception:  # pragma: no cover
+            # not supported by the reader
+            continue
+        for name, func in readers.items():
+            dts = []
+            for unused_i in range(nrepeat):
+                _drop_file_cache(op2_filename)
+                t0 = time.perf_counter()
+                func(op2_filename, log)
+                dts.append(time.perf_counter() - t0)
+            times[name] += min(dts)
+    return times
+
+
+def write_large_op2(op2_filename: str, nnodes: int=250, ntimes: int=4000) -> None:
+    """
+    Writes a transient displacement OP2 with one (small) record per time step
+
+    Parameters
+    ----------
+    op2_filename : str
+        the file to write
+    nnodes : int; default=250
+        the number of nodes
+    ntimes : int; default=4000
+        the number of time steps
+
+    """
+    log = SimpleLogger(level='error')
+    model = OP2(log=log, debug=False)
+    model.set_results('displacements')
+    model.read_op2(TRANSIENT_OP2, build_dataframe=False)
+    disp = next(iter(model.displacements.values()))
+
+    node_gridtype = np.ones((nnodes, 2), dtype=disp.node_gridtype.dtype)
+    node_gridtype[:, 0] = np.arange(1, nnodes + 1)
+    times = np.arange(ntimes, dtype=disp._times.dtype) * 0.01
+    disp.node_gridtype = node_gridtype
+    disp._times = times
+    disp.dts = times.tolist()
+    disp.data = np.random.random((ntimes, nnodes, 6)).astype(disp.data.dtype)
+    disp.ntimes = ntimes
+    disp.ntotal = nnodes
+    model.write_op2(op2_filename, post=-1, endian=b'<')
+
+
+def benchmark_op2_large(op2_filename: str, nrepeat: int=3) -> Dict[str, Tuple[float, int]]:
+    """
+    Times the two pass and single pass readers on an OP2 that is read as
+    if it were larger than the OS file cache (the cache is dropped before
+    every walk of the file)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the file to read (see ``write_large_op2``)
+    nrepeat : int; default=3
+        the best time of nrepeat reads is kept
+
+    Returns
+    -------
+    times : Dict[name] = (dt, nbytes_read)
+        dt : float
+            the time (in seconds)
+        nbytes_read : int / None
+            the bytes read from the disk by a read; None if unknown
+
+    """
+    log = SimpleLogger(level='error')
+    times = {}
+    for name, single_pass in [('two_pass', False), ('single_pass', True)]:
+        dts = []
+        nbytes_read = None
+        for unused_i in range(nrepeat):
+            nbytes0 = _get_disk_read_bytes()
+            t0 = time.perf_counter()
+            model = _UncachedOP2(log=log, debug=False)
+            model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                           single_pass=single_pass)
+            dts.append(time.perf_counter() - t0)
+            if nbytes0 is not None:
+                nbytes_read = _get_disk_read_bytes() - nbytes0
+        times[name] = (min(dts), nbytes_read)
+    return times
+
+
+def benchmark_op2_copies(op2_filenames: List[str]) -> Dict[str, Tuple[float, int]]:
+    """
+    Counts the record bytes that are copied out of the file by the
+    standard and memory mapped readers
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the files to read
+
+    Returns
+    -------
+    copies : Dict[name] = (nbytes_per_gb, peak_memory)
+        nbytes_per_gb : float
+            the bytes copied per GB of OP2
+        peak_memory : int
+            the largest peak traced memory (in bytes) of a single read
+
+    """
+    log = SimpleLogger(level='error')
+    use_mmaps = {'two_pass' : False, 'mmap' : True}
+    nbytes_file = 0
+    nbytes_copied = {name: 0 for name in use_mmaps}
+    peak_memory = {name: 0 for name in use_mmaps}
+    for op2_filename in op2_filenames:
+        try:
+            _read_two_pass(op2_filename, log)
+        except Exception:  # pragma: no cover
+            # not supported by the reader
+            continue
+        nbytes_file += os.path.getsize(op2_filename)
+        for name, use_mmap in use_mmaps.items():
+            model = OP2(log=log, debug=False)
+            op2_reader = model.op2_reader
+            tracemalloc.start()
+            model.read_op2(op2_filename, build_dataframe=False, skip_undefined_matrices=True,
+                           use_mmap=use_mmap)
+            unused_current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            nbytes_copied[name] += op2_reader.nbytes_copied
+            peak_memory[name] = max(peak_memory[name], peak)
+
+    ngb = max(nbytes_file, 1) / 1024**3
+    copies = {name: (nbytes_copied[name] / ngb, peak_memory[name])
+              for name in use_mmaps}
+    return copies
+
+
+def main(argv=None):  # pragma: no cover
+    """runs the benchmark"""
+    if argv is None:
+        argv = sys.argv
+    op2_filenames = argv[1:]
+    if not op2_filenames:
+        op2_filenames = sorted(glob.glob(os.path.join(MODEL_PATH, '**', '*.op2'), recursive=True))
+    times = benchmark_op2(op2_filenames)
+    for op2_filename in op2_filenames:
+        idx_filename = op2_filename + '.idx'
+        if os.path.exists(idx_filename):
+            os.remove(idx_filename)
+    dt_ref = times['two_pass']
+    for name, dt in times.items():
+        print('%-12s %8.3f sec (%.2fx)' % (name, dt, dt_ref / dt))
+
+    copies = benchmark_op2_copies(op2_filenames)
+    for name, (nbytes_per_gb, peak_memory) in copies.items():
+        print('%-12s %8.3f GB copied/GB of OP2; peak traced memory=%.1f MB' % (
+            name, nbytes_per_gb / 1024**3, peak_memory / 1024**2))
+
+    with tempfile.TemporaryDirectory() as dirname:
+        op2_filename = os.path.join(dirname, 'large.op2')
+        write_large_op2(op2_filename)
+        nbytes_file = os.path.getsize(op2_filename)
+        times_large = benchmark_op2_large(op2_filename)
+    dt_ref = times_large['two_pass'][0]
+    print('large OP2 (%.1f MB; uncached):' % (nbytes_file / 1024**2))
+    for name, (dt, nbytes_read) in times_large.items():
+        msg = '%-12s %8.3f sec (%.2fx)' % (name, dt, dt_ref / dt)
+        if nbytes_read is not None:
+            msg += '; %.1f MB read from disk' % (nbytes_read / 1024**2)
+        print(msg)
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -1,5 +1,7 @@
 """various OP2 tests"""
 import os
+import shutil
+from collections import defaultdict
 import unittest
 import getpass
 
@@ -28,6 +30,11 @@ import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
 from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.op2_index import OP2Index
+from pyNastran.op2.op2_interface.op2_parallel import split_tables, get_shared_tables, OP2Streamer
+from pyNastran.op2.op2_interface.op2_reader import OP2Reader
+from pyNastran.op2.op2_interface.out_of_core import MemmapFile
+from pyNastran.op2.op2_interface import single_pass
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
 
@@ -1421,6 +1428,312 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_read_op2_single_pass(self):
+        """tests the single pass reader matches the two pass reader"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+
+            # repeated OUGV1, R1TABRG, HISADD tables
+            os.path.join(MODEL_PATH, 'sol200', 'model_200.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2 = read_op2(op2_filename, log=log, debug=False)
+            op2_single = read_op2(op2_filename, log=log, debug=False, single_pass=True)
+            op2.assert_op2_equal(op2_single, stop_on_failure=True)
+            assert op2.table_names == op2_single.table_names
+            assert list(op2.displacements) == list(op2_single.displacements)
+
+        # each results record is read once, even for the repeated tables
+        op2_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.op2')
+        op2_single = OP2(debug=False, log=log)
+        read_record = op2_single._read_record_single_pass
+        nreads = defaultdict(int)
+        def _read_record_single_pass(*args, **kwargs):
+            nreads[op2_single.f.tell()] += 1
+            return read_record(*args, **kwargs)
+        op2_single._read_record_single_pass = _read_record_single_pass
+        op2_single.read_op2(op2_filename, single_pass=True)
+        assert len(nreads) > 0
+        assert max(nreads.values()) == 1, nreads
+        op2.assert_op2_equal(op2_single, stop_on_failure=True)
+
+        # the arrays are only grown when the counters outgrow them
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2_single = OP2(debug=False, log=log)
+        read_record = op2_single._read_record_single_pass
+        nrecords = [0]
+        def _read_record_single_pass(*args, **kwargs):
+            nrecords[0] += 1
+            return read_record(*args, **kwargs)
+        op2_single._read_record_single_pass = _read_record_single_pass
+
+        nprobes = [0]
+        build_probe = single_pass.build_probe
+        def _build_probe(*args):
+            nprobes[0] += 1
+            return build_probe(*args)
+        single_pass.build_probe = _build_probe
+        try:
+            op2_single.read_op2(op2_filename, single_pass=True)
+        finally:
+            single_pass.build_probe = build_probe
+        assert 0 < nprobes[0] < nrecords[0] // 2, 'nprobes=%s nrecords=%s' % (
+            nprobes[0], nrecords[0])
+        op2 = read_op2(op2_filename, log=log, debug=False)
+        op2.assert_op2_equal(op2_single, stop_on_failure=True)
+
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        op2 = OP2Geom(debug=False, log=log)
+        op2.read_op2(op2_filename)
+        op2_single = OP2Geom(debug=False, log=log)
+        op2_single.read_op2(op2_filename, single_pass=True)
+        op2.assert_op2_equal(op2_single, stop_on_failure=True)
+        assert op2.get_bdf_stats() == op2_single.get_bdf_stats()
+
+    def test_read_op2_index(self):
+        """tests the sidecar index gives the same results"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        idx_filename = op2_filename + '.idx'
+        if os.path.exists(idx_filename):
+            os.remove(idx_filename)
+
+        op2 = read_op2(op2_filename, log=log, debug=False)
+        op2_index = read_op2(op2_filename, log=log, debug=False, use_index=True)
+        assert os.path.exists(idx_filename)
+        op2.assert_op2_equal(op2_index, stop_on_failure=True)
+
+        op2_index = OP2Index.load(idx_filename, op2_filename)
+        assert op2_index.is_loaded
+        assert 'displacements' in op2_index.result_names['OUGV1'], op2_index.result_names
+        str(op2_index)
+
+        # the index is used to skip the tables we don't want
+        op2 = read_op2(op2_filename, log=log, debug=False,
+                       include_results='displacements')
+        op2_index = read_op2(op2_filename, log=log, debug=False,
+                             include_results='displacements', use_index=True)
+        op2.assert_op2_equal(op2_index, stop_on_failure=True)
+        assert len(op2_index.displacements) == 1
+        assert len(op2_index.cquad4_stress) == 0
+
+        # the OP2 changed, so the index is out of date
+        os.utime(op2_filename)
+        assert OP2Index.load(idx_filename, op2_filename) is None
+        os.remove(idx_filename)
+
+    def test_read_op2_index_subcases(self):
+        """tests the sidecar index seeks to the subtables of the requested subcases"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'unit', 'pload4', 'cquad4.op2')
+        idx_filename = op2_filename + '.idx'
+        if os.path.exists(idx_filename):
+            os.remove(idx_filename)
+
+        read_op2(op2_filename, log=log, debug=False, use_index=True)
+        op2_index = OP2Index.load(idx_filename, op2_filename)
+        assert op2_index.is_loaded
+        isubcases = {subtable[1] for subtable in op2_index.subtables.values()}
+        assert {1, 2, 6}.issubset(isubcases), isubcases
+
+        jumps = []
+        goto_valid_subtable = OP2Reader._goto_valid_subtable
+        def _goto_valid_subtable(op2_reader):
+            n0 = op2_reader.op2.n
+            is_done = goto_valid_subtable(op2_reader)
+            if op2_reader.op2.n != n0:
+                jumps.append((n0, op2_reader.op2.n))
+            return is_done
+
+        for subcases in ([2], [1, 6]):
+            op2 = read_op2(op2_filename, log=log, debug=False, subcases=subcases)
+            OP2Reader._goto_valid_subtable = _goto_valid_subtable
+            try:
+                op2_index = read_op2(op2_filename, log=log, debug=False,
+                                     subcases=subcases, use_index=True)
+            finally:
+                OP2Reader._goto_valid_subtable = goto_valid_subtable
+            op2.assert_op2_equal(op2_index, stop_on_failure=True)
+            assert sorted(op2_index.displacements) == subcases, op2_index.displacements.keys()
+            assert len(jumps) > 0
+            del jumps[:]
+        os.remove(idx_filename)
+
+    def test_read_op2_mmap(self):
+        """tests the memory mapped reader matches the standard reader"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            # single and multi-block records
+            os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2 = read_op2(op2_filename, log=log, debug=False)
+            op2_mmap = OP2(log=log, debug=False)
+            op2_reader = op2_mmap.op2_reader
+            op2_mmap.read_op2(op2_filename, use_mmap=True)
+            op2.assert_op2_equal(op2_mmap, stop_on_failure=True)
+            assert op2_reader.use_mmap
+            assert op2_reader.nbytes_copied < os.path.getsize(op2_filename)
+
+        op2_mmap = read_op2(op2_filenames[0], log=log, debug=False,
+                            single_pass=True, use_mmap=True)
+        op2.assert_op2_equal(op2_mmap, stop_on_failure=True)
+
+    def test_read_op2_memmap(self):
+        """tests the out-of-core (np.memmap) results match the in-memory results"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            # real, complex, random
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'random', 'random_test_bar_plus_tri.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            memmap_dirname = os.path.splitext(op2_filename)[0] + '_memmap'
+            op2 = read_op2(op2_filename, log=log, debug=False)
+            op2_memmap = read_op2(op2_filename, log=log, debug=False,
+                                  memmap_dirname=memmap_dirname)
+            op2.assert_op2_equal(op2_memmap, stop_on_failure=True)
+
+            nresults = 0
+            for result_name in op2_memmap.get_table_types():
+                results = op2_memmap.get_result(result_name)
+                if not isinstance(results, dict):
+                    continue
+                for result in results.values():
+                    if isinstance(getattr(result, 'data', None), np.ndarray):
+                        assert isinstance(result.data, np.memmap), result_name
+                        nresults += 1
+            assert nresults > 0, op2_filename
+            assert isinstance(op2_memmap.h5_file, MemmapFile)
+            str(op2_memmap.h5_file)
+            del op2_memmap
+            shutil.rmtree(memmap_dirname)
+
+    def test_read_op2_parallel(self):
+        """tests the multi-process reader matches the serial reader"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            # repeated OUGV1 tables that fill the same result
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+
+            # repeated OUGV1, R1TABRG, HISADD tables
+            os.path.join(MODEL_PATH, 'sol200', 'model_200.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2 = read_op2(op2_filename, log=log, debug=False)
+            op2_parallel = read_op2(op2_filename, log=log, debug=False, nworkers=3)
+            op2.assert_op2_equal(op2_parallel, stop_on_failure=True)
+            assert op2.table_names == op2_parallel.table_names
+            assert op2.date == op2_parallel.date
+            assert op2.title == op2_parallel.title
+            assert list(op2.displacements) == list(op2_parallel.displacements)
+
+        op2 = read_op2(op2_filenames[0], log=log, debug=False, subcases=[1],
+                       include_results='stress')
+        op2_parallel = read_op2(op2_filenames[0], log=log, debug=False, subcases=[1],
+                                include_results='stress', nworkers=2, single_pass=True)
+        op2.assert_op2_equal(op2_parallel, stop_on_failure=True)
+        assert len(op2_parallel.cquad4_stress) == 1
+        assert len(op2_parallel.displacements) == 0
+
+        results_tables = [(b'OUGV1', 0, 10), (b'OES1X1', 10, 110),
+                          (b'OUGV1', 110, 120), (b'OEF1X', 120, 170)]
+        worker_tables = split_tables(results_tables, 3)
+        assert worker_tables == [
+            [(b'OES1X1', 10, 110)],
+            [(b'OEF1X', 120, 170)],
+            [(b'OUGV1', 0, 10), (b'OUGV1', 110, 120)],
+        ], worker_tables
+        assert len(split_tables(results_tables, 8)) == 3
+
+        # tables that add to the same result in different workers are read together
+        worker_table_keys = [
+            {0: {('displacements', 1)}, 110: {('displacements', 2)}},
+            {10: {('cquad4_stress', 1)}, 200: {('displacements', 2), ('cquad4_force', 2)}},
+            {120: {('cquad4_force', 2)}, 300: {('cquad4_force', 3)}},
+        ]
+        assert get_shared_tables(worker_table_keys) == [{110, 120, 200}]
+        assert get_shared_tables(worker_table_keys[:1]) == []
+
+    def test_iter_results(self):
+        """tests the results may be streamed one table at a time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, log=log, debug=False)
+
+        op2_iter = OP2(log=log, debug=False)
+        nresults = 0
+        for key, result in op2_iter.iter_results(op2_filename):
+            assert result == op2.get_result(result.result_name)[key], (result.result_name, key)
+            nresults += 1
+        assert nresults == 25, nresults
+        assert len(op2_iter.displacements) == 0
+        assert len(op2_iter.cquad4_stress) == 0
+        assert op2_iter.table_names == op2.table_names
+
+        op2_iter = OP2(log=log, debug=False)
+        results = list(op2_iter.iter_results(op2_filename, result_types='stress', subcases=[1]))
+        assert len(results) == 8, results
+        result_names = {result.result_name for unused_key, result in results}
+        assert 'cquad4_stress' in result_names, result_names
+        assert 'stress.ctetra_stress' in result_names, result_names
+
+        # the first subcase is yielded before the rest of the table is read
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'gpst17.op2')
+        op2 = read_op2(op2_filename, log=log, debug=False, combine=False)
+        positions = []
+        pop_results = OP2Streamer._pop_results
+        def _pop_results(streamer, keys, combine):
+            positions.append((streamer.table_name, streamer.f.tell()))
+            return pop_results(streamer, keys, combine)
+
+        OP2Streamer._pop_results = _pop_results
+        try:
+            op2_iter = OP2(log=log, debug=False)
+            nresults = 0
+            for key, result in op2_iter.iter_results(op2_filename, combine=False):
+                assert result == op2.get_result(result.result_name)[key], (result.result_name, key)
+                nresults += 1
+        finally:
+            OP2Streamer._pop_results = pop_results
+        assert nresults == 16, nresults
+        assert positions[0][0] == positions[1][0] == b'BOUGV1', positions
+        assert positions[0][1] < positions[1][1], positions
+
+    def test_read_op2_vectorized(self):
+        """tests the vectorized SORT2/complex/multi-node results match the unvectorized results"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            # SORT2 random; CELAS, CROD, CBAR, CBUSH, CBEAM, plates
+            os.path.join(MODEL_PATH, 'other', 'ofprand1.op2'),
+            # SORT1 real CBEAM
+            os.path.join(MODEL_PATH, 'beam_modes', 'beam_modes_m1.op2'),
+            # complex (magnitude/phase) CBAR/CBUSH forces
+            os.path.join(MODEL_PATH, 'freq_sine', 'good_sine.op2'),
+            os.path.join(MODEL_PATH, 'other', 'sdbush01.op2'),
+            os.path.join(MODEL_PATH, 'elements', 'freq_elements2.op2'),
+            # SORT2 real; CHEXA, CQUAD4 (corner), CBEAM, CBEND, nodal shell forces
+            os.path.join(MODEL_PATH, 'other', 'tr1091x.op2'),
+            # SORT2 composite shells
+            os.path.join(MODEL_PATH, 'other', 'trncomp12.op2'),
+            # SORT1/SORT2 random plates
+            os.path.join(MODEL_PATH, 'random', 'rms_tri_oesrmx1.op2'),
+            # complex CTRIAX6
+            os.path.join(MODEL_PATH, 'other', 'dbxdra2.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2_scalar = OP2(log=log, debug=False)
+            op2_scalar.use_vector = False
+            with np.errstate(under='ignore'):
+                # the grid point forces cast tiny doubles to float32
+                op2 = read_op2(op2_filename, log=log, debug=False)
+                op2_scalar.read_op2(op2_filename)
+            op2.assert_op2_equal(op2_scalar, stop_on_failure=True)
+
     def test_op2_solid_bending_01(self):
         log = get_logger(level='warning')
         folder = os.path.join(MODEL_PATH, 'solid_bending')